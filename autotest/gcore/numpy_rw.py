@@ -768,6 +768,155 @@ def test_numpy_rw_gdal_array_openarray_permissions():
         assert ds.GetRasterBand(1).Fill(1) != 0
     assert ds.GetRasterBand(1).Checksum()  == 0
 
+###############################################################################
+# Test gdal_array.iter_windows()
+
+
+def test_numpy_rw_iter_windows():
+
+    if gdaltest.numpy_drv is None:
+        pytest.skip()
+
+    import numpy
+    from osgeo import gdal_array
+
+    img = numpy.random.randint(0, 255, size=(3, 40, 50)).astype('uint8')
+    ds = gdal.GetDriverByName('GTiff').Create('/vsimem/iter_windows.tif', 50, 40, 3,
+                                              options=['TILED=YES', 'BLOCKXSIZE=16', 'BLOCKYSIZE=16'])
+    for i in range(3):
+        ds.GetRasterBand(i + 1).WriteArray(img[i])
+
+    # Full width strips of whole blocks
+    band = ds.GetRasterBand(1)
+    res = numpy.zeros((40, 50), numpy.uint8)
+    windows = []
+    for (xoff, yoff, xsize, ysize), ar in gdal_array.iter_windows(band, max_bytes=50 * 32):
+        assert ar.shape == (ysize, xsize)
+        res[yoff:yoff + ysize, xoff:xoff + xsize] = ar
+        windows.append((xoff, yoff, xsize, ysize))
+    assert windows == [(0, 0, 50, 32), (0, 32, 50, 8)]
+    assert numpy.all(res == img[0])
+
+    # Blocks within a sub-window
+    windows = [w for w, _ in gdal_array.iter_windows(band, window=(10, 5, 30, 30), max_bytes=16 * 16)]
+    assert windows[0] == (10, 5, 6, 11)
+    assert windows[1] == (16, 5, 16, 11)
+    assert windows[-1] == (32, 32, 8, 3)
+
+    # Full width strips of a sub-window whose offset is not a multiple of
+    # the block size: window edges are still on block boundaries
+    windows = [w for w, _ in gdal_array.iter_windows(band, window=(10, 5, 30, 30), max_bytes=30 * 32)]
+    assert windows == [(10, 5, 30, 27), (10, 32, 30, 3)]
+    windows = [w for w, _ in gdal_array.iter_windows(band, window=(10, 5, 30, 30), max_bytes=30 * 16)]
+    assert windows == [(10, 5, 30, 11), (10, 16, 30, 16), (10, 32, 30, 3)]
+
+    # Not aligned on blocks
+    windows = [w for w, _ in gdal_array.iter_windows(band, max_bytes=50 * 3, align_to_blocks=False)]
+    assert windows[0] == (0, 0, 50, 3)
+    assert windows[-1] == (0, 39, 50, 1)
+
+    # Overlap, and buffer reuse
+    previous = None
+    for (xoff, yoff, xsize, ysize), ar in gdal_array.iter_windows(band, max_bytes=16 * 16, overlap=2):
+        assert numpy.all(ar == img[0][yoff:yoff + ysize, xoff:xoff + xsize])
+        if previous is not None:
+            assert numpy.shares_memory(ar, previous)
+        previous = ar
+    assert (xoff, yoff, xsize, ysize) == (46, 30, 4, 10)
+
+    previous = None
+    for _, ar in gdal_array.iter_windows(band, max_bytes=16 * 16, buf_obj_reuse=False):
+        if previous is not None:
+            assert not numpy.shares_memory(ar, previous)
+        previous = ar
+
+    # Dataset, band and pixel interleaving
+    res = numpy.zeros((3, 40, 50), numpy.uint8)
+    for (xoff, yoff, xsize, ysize), ar in gdal_array.iter_windows(ds, max_bytes=3 * 16 * 16, prefetch=True):
+        assert ar.shape == (3, ysize, xsize)
+        res[:, yoff:yoff + ysize, xoff:xoff + xsize] = ar
+    assert numpy.all(res == img)
+
+    res = numpy.zeros((40, 50, 3), numpy.uint8)
+    for (xoff, yoff, xsize, ysize), ar in gdal_array.iter_windows(ds, max_bytes=3 * 16 * 16, interleave='pixel'):
+        assert ar.shape == (ysize, xsize, 3)
+        res[yoff:yoff + ysize, xoff:xoff + xsize, :] = ar
+    assert numpy.all(res == numpy.dstack(img))
+
+    with pytest.raises(ValueError):
+        next(gdal_array.iter_windows(band, window=(40, 0, 20, 10)))
+
+    ds = None
+    gdal.Unlink('/vsimem/iter_windows.tif')
+
+###############################################################################
+# Test gdal_array.BufferPool and ReadAsArray(buf_pool=)
+
+
+def test_numpy_rw_buffer_pool():
+
+    if gdaltest.numpy_drv is None:
+        pytest.skip()
+
+    import numpy
+    from osgeo import gdal_array
+
+    ds = gdal.Open('data/rgbsmall.tif')
+    band = ds.GetRasterBand(1)
+    pool = gdal_array.BufferPool(max_arrays_per_shape=1)
+
+    ar = band.ReadAsArray(0, 0, 10, 5, buf_pool=pool)
+    assert ar.shape == (5, 10)
+    assert numpy.all(ar == band.ReadAsArray(0, 0, 10, 5))
+    pool.release(ar)
+    ar2 = band.ReadAsArray(10, 5, 10, 5, buf_pool=pool)
+    assert ar2 is ar
+    assert numpy.all(ar2 == band.ReadAsArray(10, 5, 10, 5))
+
+    # Not released: a new array is allocated
+    ar3 = band.ReadAsArray(10, 5, 10, 5, buf_pool=pool)
+    assert ar3 is not ar2
+    pool.release(ar2)
+    pool.release(ar3)
+    assert band.ReadAsArray(0, 0, 10, 5, buf_pool=pool) is ar2
+
+    ar = ds.ReadAsArray(0, 0, 10, 5, buf_pool=pool)
+    assert ar.shape == (3, 5, 10)
+    pool.release(ar)
+    assert ds.ReadAsArray(0, 0, 10, 5, buf_pool=pool) is ar
+    pool.release(ar)
+    ar2 = ds.ReadAsArray(0, 0, 10, 5, buf_pool=pool, buf_type=gdal.GDT_Float32)
+    assert ar2 is not ar
+    assert ar2.dtype == numpy.float32
+
+    pool.release(ar)
+    pool.clear()
+    assert ds.ReadAsArray(0, 0, 10, 5, buf_pool=pool) is not ar
+
+    ds = gdal.GetDriverByName('MEM').Create('', 1, 1, options=['PIXELTYPE=SIGNEDBYTE'])
+    band = ds.GetRasterBand(1)
+    assert band.ReadAsArray().dtype == numpy.int8
+
+    # The read data type follows changes of the dataset
+    ds = gdal.GetDriverByName('MEM').Create('', 2, 1)
+    band = ds.GetRasterBand(1)
+    band.Fill(1)
+    assert ds.ReadAsArray().dtype == numpy.uint8
+    assert band.ReadAsArray().dtype == numpy.uint8
+    ds.AddBand(gdal.GDT_Float32)
+    ds.GetRasterBand(2).Fill(1.5)
+    ar = ds.ReadAsArray()
+    assert ar.dtype == numpy.float32
+    assert ar.shape == (2, 1, 2)
+    assert numpy.all(ar[1] == 1.5)
+    band.SetMetadataItem('PIXELTYPE', 'SIGNEDBYTE', 'IMAGE_STRUCTURE')
+    assert band.ReadAsArray().dtype == numpy.int8
+
+    # Data types are resolved once per object and band count
+    assert ds._gdal_array_read_types[(None, 1)] == (gdal.GDT_Byte, numpy.uint8)
+    assert ds._gdal_array_read_types[(None, 2)] == (gdal.GDT_Float32, numpy.float32)
+    assert band._gdal_array_read_types[(None, 1)] == (gdal.GDT_Byte, numpy.uint8)
+
 
 def test_numpy_rw_cleanup():
     gdaltest.numpy_drv = None
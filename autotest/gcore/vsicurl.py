@@ -465,6 +465,32 @@ def test_vsicurl_no_size_in_HEAD():
 ###############################################################################
 
 
+def test_vsicurl_range_server():
+
+    if not gdaltest.built_against_curl():
+        pytest.skip()
+
+    gdal.VSICurlClearCache()
+    with gdaltest.config_option('GDAL_DISABLE_READDIR_ON_OPEN', 'EMPTY_DIR'):
+        with webserver.range_server('data', latency=0.01, bandwidth=1e7) as (handler, port):
+            ds = gdal.Open('/vsicurl/http://127.0.0.1:%d/byte.tif' % port)
+            assert ds is not None
+            assert ds.GetRasterBand(1).Checksum() == 4672
+            ds = None
+
+            stats = handler.stats()
+            assert stats['request_count'] >= 1
+            assert stats['bytes_sent'] > 0
+
+            gdal.VSICurlClearCache()
+            handler.reset_counters()
+            assert gdal.VSIStatL('/vsicurl/http://127.0.0.1:%d/i_do_not_exist.tif' % port) is None
+            assert handler.stats()['request_count'] >= 1
+    gdal.VSICurlClearCache()
+
+###############################################################################
+
+
 def test_vsicurl_stop_webserver():
 
     if gdaltest.webserver_port == 0:
@@ -841,6 +841,109 @@ def test_vrtderived_15():
     return ret
 
 
+###############################################################################
+# Test running pixel functions in worker processes
+
+
+def test_vrtderived_python_process_mode():
+
+    try:
+        import numpy
+        numpy.ones
+        from multiprocessing import shared_memory
+        del shared_memory
+    except (ImportError, AttributeError):
+        pytest.skip()
+
+    module_vrt = """<VRTDataset rasterXSize="200" rasterYSize="100">
+  <VRTRasterBand dataType="Byte" band="1" subClass="VRTDerivedRasterBand">
+    <PixelFunctionType>vrtderived.one_pix_func</PixelFunctionType>
+    <PixelFunctionLanguage>Python</PixelFunctionLanguage>
+  </VRTRasterBand>
+</VRTDataset>
+"""
+    inline_vrt = """<VRTDataset rasterXSize="20" rasterYSize="20">
+  <VRTRasterBand dataType="Float32" band="1" subClass="VRTDerivedRasterBand">
+    <PixelFunctionType>add_k</PixelFunctionType>
+    <PixelFunctionLanguage>Python</PixelFunctionLanguage>
+    <PixelFunctionArguments k="2"/>
+    <PixelFunctionCode><![CDATA[
+def add_k(in_ar, out_ar, xoff, yoff, xsize, ysize, raster_xsize, raster_ysize, r, gt, **kwargs):
+    out_ar[:] = in_ar[0] + float(kwargs['k'])
+]]>
+    </PixelFunctionCode>
+    <SimpleSource>
+      <SourceFilename relativeToVRT="0">data/byte.tif</SourceFilename>
+      <SourceBand>1</SourceBand>
+    </SimpleSource>
+  </VRTRasterBand>
+</VRTDataset>
+"""
+
+    with gdaltest.config_options({'GDAL_VRT_ENABLE_PYTHON': 'YES',
+                                  'GDAL_VRT_PYTHON_EXECUTION_MODE': 'PROCESS',
+                                  'GDAL_VRT_PYTHON_NUM_PROCESSES': '2'}):
+        ds = gdal.Open(module_vrt)
+        assert ds.GetRasterBand(1).ComputeRasterMinMax() == (1, 1)
+        ds = None
+
+        ds = gdal.Open(inline_vrt)
+        got = ds.GetRasterBand(1).ReadAsArray()
+        ds = None
+
+    ref = gdal.Open('data/byte.tif').ReadAsArray()
+    assert numpy.array_equal(got, ref + 2)
+
+###############################################################################
+# Test that the arrays wrapping the buffers are reused between calls
+
+def test_vrtderived_python_array_cache():
+
+    try:
+        import numpy
+        numpy.ones
+    except (ImportError, AttributeError):
+        pytest.skip()
+
+    vrt = """<VRTDataset rasterXSize="20" rasterYSize="20">
+  <VRTRasterBand dataType="Float32" band="1" subClass="VRTDerivedRasterBand">
+    <PixelFunctionType>sum_neighbours</PixelFunctionType>
+    <PixelFunctionLanguage>Python</PixelFunctionLanguage>
+    <BufferRadius>1</BufferRadius>
+    <PixelFunctionCode><![CDATA[
+def sum_neighbours(in_ar, out_ar, xoff, yoff, xsize, ysize, raster_xsize, raster_ysize, r, gt, **kwargs):
+    out_ar[:] = in_ar[0]
+    out_ar[1:-1,1:-1] += in_ar[0][0:-2,1:-1] + in_ar[0][2:,1:-1]
+    in_ar[0][:] = 255 # must not leak into the next call
+]]>
+    </PixelFunctionCode>
+    <SimpleSource>
+      <SourceFilename relativeToVRT="0">data/byte.tif</SourceFilename>
+      <SourceBand>1</SourceBand>
+    </SimpleSource>
+  </VRTRasterBand>
+</VRTDataset>
+"""
+
+    def read_windows(cache_arrays):
+        with gdaltest.config_options({'GDAL_VRT_ENABLE_PYTHON': 'YES',
+                                      'GDAL_VRT_PYTHON_CACHE_ARRAYS': cache_arrays}):
+            ds = gdal.Open(vrt)
+        band = ds.GetRasterBand(1)
+        got = [band.ReadAsArray(x, y, 10, 10) for y in (0, 10) for x in (0, 10)]
+        got.append(band.ReadAsArray(0, 0, 20, 20))
+        counters = [int(band.GetMetadataItem(item, '_DEBUG_')) for item in
+                    ('PYTHON_CALLS', 'PYTHON_ARRAY_CACHE_HITS', 'PYTHON_ARRAY_CACHE_MISSES')]
+        return got, counters
+
+    got, counters = read_windows('YES')
+    assert counters == [5, 3, 2]
+    ref, counters = read_windows('NO')
+    assert counters == [5, 0, 0]
+    for a, b in zip(got, ref):
+        assert numpy.array_equal(a, b)
+    assert numpy.array_equal(got[-1][5:10, 5:10], got[0][5:10, 5:10])
+
 ###############################################################################
 # Cleanup.
 
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This code is in the public domain, so as to serve as a template for
+# real-world plugins.
+
+# gdal: DRIVER_NAME = "DUMMYRASTER"
+# gdal: DRIVER_SUPPORTED_API_VERSION = [1]
+# gdal: DRIVER_DCAP_RASTER = "YES"
+# gdal: DRIVER_DMD_LONGNAME = "my super raster plugin"
+
+import array
+
+from gdal_python_driver import BaseDriver, BaseRasterDataset, BaseRasterBand
+
+WIDTH = 10
+HEIGHT = 7
+BLOCK_SIZE = 4
+
+
+class ByteBand(BaseRasterBand):
+    """ Returns a new object for each block. Edge blocks are returned
+        without their padding. """
+
+    def __init__(self, ds):
+        self.ds = ds
+        self.data_type = 'Byte'
+        self.block_x_size = BLOCK_SIZE
+        self.block_y_size = BLOCK_SIZE
+        self.nodata = 255
+
+    def read_block(self, x, y):
+        self.ds.counters['read_block'] += 1
+        xoff = x * BLOCK_SIZE
+        yoff = y * BLOCK_SIZE
+        xsize = min(BLOCK_SIZE, WIDTH - xoff)
+        ysize = min(BLOCK_SIZE, HEIGHT - yoff)
+        return bytearray([(i + j * WIDTH) % 256
+                          for j in range(yoff, yoff + ysize)
+                          for i in range(xoff, xoff + xsize)])
+
+
+class UInt16Band(BaseRasterBand):
+    """ Writes blocks directly into the GDAL block cache, and serves
+        multi-block requests with read_window() """
+
+    def __init__(self, ds):
+        self.ds = ds
+        self.data_type = 'UInt16'
+        self.block_x_size = BLOCK_SIZE
+        self.block_y_size = BLOCK_SIZE
+
+    @staticmethod
+    def _values(xoff, yoff, xsize, ysize):
+        return array.array('H', [min(i, WIDTH - 1) * 100 + min(j, HEIGHT - 1)
+                                 for j in range(yoff, yoff + ysize)
+                                 for i in range(xoff, xoff + xsize)])
+
+    def read_block_into(self, x, y, buf):
+        self.ds.counters['read_block_into'] += 1
+        values = self._values(x * BLOCK_SIZE, y * BLOCK_SIZE,
+                              BLOCK_SIZE, BLOCK_SIZE)
+        # array.array.tobytes() does not exist in Python 2
+        buf[:] = values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+    def read_window(self, xoff, yoff, xsize, ysize):
+        self.ds.counters['read_window'] += 1
+        return self._values(xoff, yoff, xsize, ysize)
+
+
+class Dataset(BaseRasterDataset):
+
+    thread_safe = True
+
+    def __init__(self):
+        self.counters = {'read_block': 0,
+                         'read_block_into': 0,
+                         'read_window': 0}
+        self.raster_x_size = WIDTH
+        self.raster_y_size = HEIGHT
+        self.geotransform = [2, 0.5, 0, 49, 0, -0.5]
+        self.srs = 'EPSG:4326'
+        self.bands = [ByteBand(self), UInt16Band(self)]
+
+    def metadata(self, domain):
+        if domain == 'COUNTERS':
+            return dict((k, str(v)) for k, v in self.counters.items())
+        return None
+
+
+class Driver(BaseDriver):
+
+    def identify(self, filename, first_bytes, open_flags, open_options={}):
+        return filename == 'DUMMYRASTER:'
+
+    def open(self, filename, first_bytes, open_flags, open_options={}):
+        if not self.identify(filename, first_bytes, open_flags):
+            return None
+        return Dataset()
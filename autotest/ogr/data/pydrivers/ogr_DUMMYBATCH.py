@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This code is in the public domain, so as to serve as a template for
+# real-world plugins.
+
+# gdal: DRIVER_NAME = "DUMMYBATCH"
+# gdal: DRIVER_SUPPORTED_API_VERSION = [1]
+# gdal: DRIVER_DCAP_VECTOR = "YES"
+# gdal: DRIVER_DMD_LONGNAME = "my super plugin with feature batches"
+
+import array
+import struct
+
+from gdal_python_driver import BaseDriver, BaseDataset, BaseLayer
+
+
+class Layer(BaseLayer):
+    def __init__(self):
+        self.name = 'my_layer'
+        self.fields = [{'name': 'int32Field', 'type': 'Integer'},
+                       {'name': 'int64Field', 'type': 'Integer64'},
+                       {'name': 'realField', 'type': 'Real'},
+                       {'name': 'intAsRealField', 'type': 'Real'},
+                       {'name': 'strField', 'type': 'String'}]
+        self.geometry_fields = [{'name': 'geomField',
+                                 'type': 'Point',
+                                 'srs': 'EPSG:4326'}]
+        self.count = 5
+        self.batch_size = 2
+
+    # Used instead of __iter__()
+    def feature_batches(self):
+        for start in range(0, self.count, self.batch_size):
+            n = min(self.batch_size, self.count - start)
+            wkb = bytearray()
+            offsets = [0]
+            for i in range(start, start + n):
+                # Null geometry for the second feature
+                if i != 1:
+                    wkb += struct.pack('<BIdd', 1, 1, i, 49)
+                offsets.append(len(wkb))
+            yield {'length': n,
+                   'ids': array.array('q', range(start + 1, start + n + 1)),
+                   'styles': ['PEN(c:#FF0000)' if i == 0 else None for i in range(start, start + n)],
+                   'fields': {
+                       'int32Field': array.array('i', [i + 2 for i in range(start, start + n)]),
+                       'int64Field': [1234567890123] * n,
+                       'realField': array.array('d', [i + 0.5 for i in range(start, start + n)]),
+                       'intAsRealField': array.array('h', range(start, start + n)),
+                       'strField': ['foo' if i != 2 else None for i in range(start, start + n)],
+                       'unknownField': [0] * n},
+                   # int64Field left unset for the fourth feature
+                   'fields_set': {'int64Field': array.array('B', [i != 3 for i in range(start, start + n)])},
+                   'geometry_fields': {'geomField': (wkb, array.array('l', offsets))}}
+
+
+class InvalidWkbLayer(BaseLayer):
+    def __init__(self):
+        self.name = 'invalid_wkb'
+        self.fields = [{'name': 'id', 'type': 'Integer'}]
+        self.geometry_fields = [{'name': 'geomField', 'type': 'Point'}]
+
+    def feature_batches(self):
+        # Truncated WKB for the first feature
+        wkb = b'\x01\x01\x00' + struct.pack('<BIdd', 1, 1, 2, 49)
+        yield {'length': 2,
+               'ids': [1, 2],
+               'fields': {'id': [1, 2]},
+               'geometry_fields': {'geomField': (wkb, [0, 3, len(wkb)])}}
+
+
+class Dataset(BaseDataset):
+
+    def __init__(self, filename):
+        self.layers = [Layer(), InvalidWkbLayer()]
+
+
+class Driver(BaseDriver):
+
+    def identify(self, filename, first_bytes, open_flags, open_options={}):
+        return filename == 'DUMMYBATCH:'
+
+    def open(self, filename, first_bytes, open_flags, open_options={}):
+        if not self.identify(filename, first_bytes, open_flags):
+            return None
+        return Dataset(filename)
@@ -693,6 +693,46 @@ def test_ogr_basic_feature_iterator():
     assert count == 10
 
 
+def test_ogr_basic_layer_iter():
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test')
+    lyr.CreateField(ogr.FieldDefn('int', ogr.OFTInteger))
+    lyr.CreateField(ogr.FieldDefn('real', ogr.OFTReal))
+    lyr.CreateField(ogr.FieldDefn('str', ogr.OFTString))
+    for i in range(3):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        f['int'] = i
+        if i != 1:
+            f['real'] = i + 0.5
+        f['str'] = 'foo%d' % i
+        f.SetGeometry(ogr.CreateGeometryFromWkt('POINT (%d %d)' % (i, i)))
+        lyr.CreateFeature(f)
+    lyr.SetIgnoredFields(['str'])
+
+    rows = list(lyr.iter(columns=['real', 0], geometry=False))
+    assert rows == [(0.5, 0), (None, 1), (2.5, 2)]
+
+    rows = list(lyr.iter(fid=True, named=True))
+    assert rows[2].fid == 2
+    assert rows[2].int == 2
+    assert rows[2].str == 'foo2'
+    assert rows[2].geometry.ExportToWkt() == 'POINT (2 2)'
+
+    wkts = [row[1].ExportToWkt() for row in lyr.iter(columns=['int'], reuse=True)]
+    assert wkts == ['POINT (0 0)', 'POINT (1 1)', 'POINT (2 2)']
+
+    # Previously ignored fields are restored
+    assert lyr.GetLayerDefn().GetFieldDefn(2).IsIgnored()
+    assert not lyr.GetLayerDefn().GetFieldDefn(1).IsIgnored()
+    assert not lyr.GetLayerDefn().IsGeometryIgnored()
+
+    with pytest.raises(KeyError):
+        list(lyr.iter(columns=['nonexistent']))
+    with pytest.raises(ValueError):
+        list(lyr.iter(named=True, reuse=True))
+
+
 def test_ogr_basic_dataset_copy_layer_dst_srswkt():
 
     ds = ogr.GetDriverByName('Memory').CreateDataSource('')
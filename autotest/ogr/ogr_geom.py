@@ -3412,3 +3412,177 @@ def test_ogr_geom_removeLowerDimensionSubGeoms(input_wkt, expected_wkt):
     g = ogr.CreateGeometryFromWkt(input_wkt)
     g = g.RemoveLowerDimensionSubGeoms()
     assert g.ExportToIsoWkt() == expected_wkt
+
+###############################################################################
+# Test Geometry.SetPointsFromBuffer()
+
+
+def test_ogr_geom_setpointsfrombuffer():
+
+    import array
+
+    g = ogr.Geometry(ogr.wkbLineString)
+    assert g.SetPointsFromBuffer(array.array('d', [1, 2, 3, 4])) == 0
+    assert g.ExportToIsoWkt() == 'LINESTRING (1 2,3 4)'
+
+    assert g.SetPointsFromBuffer(array.array('d', [1, 2, 3, 4, 5, 6]), bHasZ=True) == 0
+    assert g.ExportToIsoWkt() == 'LINESTRING Z (1 2 3,4 5 6)'
+
+    assert g.SetPointsFromBuffer(array.array('d', [1, 2, 3, 4]), bHasZ=True, bHasM=True) == 0
+    assert g.ExportToIsoWkt() == 'LINESTRING ZM (1 2 3 4)'
+
+    assert g.SetPointsFromBuffer(b'') == 0
+    assert g.ExportToIsoWkt() == 'LINESTRING EMPTY'
+
+    g = ogr.Geometry(ogr.wkbPoint)
+    assert g.SetPointsFromBuffer(array.array('d', [1, 2, 3]), bHasM=True) == 0
+    assert g.ExportToIsoWkt() == 'POINT M (1 2 3)'
+
+    with gdaltest.error_handler():
+        assert g.SetPointsFromBuffer(array.array('d', [1, 2, 3, 4])) != 0
+        assert g.SetPointsFromBuffer(b'123') != 0
+        g = ogr.Geometry(ogr.wkbPolygon)
+        assert g.SetPointsFromBuffer(array.array('d', [1, 2])) != 0
+
+###############################################################################
+# Test NumPy based coordinate access
+
+
+def test_ogr_geom_flat_coordinates():
+
+    numpy = pytest.importorskip('numpy')
+
+    g = ogr.CreateGeometryFromWkt('LINESTRING Z (1 2 3,4 5 6)')
+    coords = g.GetPointsAsArray()
+    assert coords.dtype == numpy.float64
+    assert coords.tolist() == [[1, 2, 3], [4, 5, 6]]
+
+    assert ogr.CreateGeometryFromWkt('POINT EMPTY').GetPointsAsArray().shape == (0, 2)
+    assert ogr.CreateGeometryFromWkt('POINT M (1 2 3)').GetPointsAsArray().tolist() == [[1, 2, 3]]
+
+    ring = ogr.Geometry(ogr.wkbLinearRing)
+    ring.SetPointsFromArray(numpy.array([[0, 0], [0, 1], [1, 1], [0, 0]]))
+    assert ring.GetPointCount() == 4
+    assert ring.GetPointsAsArray().tolist() == [[0, 0], [0, 1], [1, 1], [0, 0]]
+
+    g = ogr.Geometry(ogr.wkbLineString)
+    g.SetMeasured(True)
+    g.SetPointsFromArray([[1, 2, 3]])
+    assert g.ExportToIsoWkt() == 'LINESTRING M (1 2 3)'
+
+    with pytest.raises(ValueError):
+        ogr.CreateGeometryFromWkt('POLYGON ((0 0,0 1,1 1,0 0))').GetPointsAsArray()
+    with pytest.raises(ValueError):
+        g.SetPointsFromArray([1, 2])
+
+    wkt = 'MULTIPOLYGON (((0 0,0 10,10 10,0 0),(1 1,1 2,2 2,1 1)),((20 20,20 30,30 30,20 20)))'
+    coords, ring_offsets, part_offsets = ogr.CreateGeometryFromWkt(wkt).GetFlatCoordinates()
+    assert coords.shape == (12, 2)
+    assert ring_offsets.tolist() == [0, 4, 8, 12]
+    assert part_offsets.tolist() == [0, 2, 3]
+
+    g = ogr.Geometry(ogr.wkbMultiPolygon)
+    g.SetFlatCoordinates(coords, ring_offsets, part_offsets)
+    assert g.ExportToIsoWkt() == wkt
+
+    for wkt in ['POINT (1 2)',
+                'LINESTRING ZM (1 2 3 4,5 6 7 8)',
+                'CIRCULARSTRING (0 0,1 1,2 0)',
+                'POLYGON Z ((0 0 1,0 1 2,1 1 3,0 0 1))',
+                'MULTIPOINT ((1 2),(3 4))',
+                'MULTILINESTRING ((1 2,3 4),(5 6,7 8,9 10))',
+                'MULTIPOLYGON EMPTY']:
+        src = ogr.CreateGeometryFromWkt(wkt)
+        g = ogr.Geometry(src.GetGeometryType())
+        g.SetFlatCoordinates(*src.GetFlatCoordinates())
+        assert g.ExportToIsoWkt() == wkt, wkt
+
+    with pytest.raises(ValueError):
+        ogr.CreateGeometryFromWkt('GEOMETRYCOLLECTION (POINT (1 2))').GetFlatCoordinates()
+
+###############################################################################
+# Test batch WKB functions
+
+
+def test_ogr_geom_wkb_batch():
+
+    wkts = ['POINT (1 2)',
+            None,
+            'LINESTRING Z (1 2 3,4 5 6)',
+            'POLYGON ((0 0,0 1,1 1,0 0))',
+            'CIRCULARSTRING M (0 0 1,1 1 2,2 0 3)']
+    geoms = [ogr.CreateGeometryFromWkt(wkt) if wkt else None for wkt in wkts]
+
+    wkb, offsets = ogr.ExportGeometriesToWkb(geoms)
+    assert len(offsets) == len(geoms) + 1
+    assert offsets[0] == 0 and offsets[-1] == len(wkb)
+    assert offsets[1] == offsets[2]
+    assert wkb[offsets[2]:offsets[3]] == geoms[2].ExportToIsoWkb(ogr.wkbNDR)
+
+    assert ogr.ExportGeometriesToWkb([]) == (b'', [0])
+
+    sr = osr.SpatialReference()
+    sr.ImportFromEPSG(4326)
+    got = ogr.CreateGeometriesFromWkb(wkb, offsets, reference=sr)
+    assert [g.ExportToIsoWkt() if g else None for g in got] == wkts
+    assert got[0].GetSpatialReference().IsSame(sr)
+
+    # Offsets may be any sequence of integers
+    import array
+    got = ogr.CreateGeometriesFromWkb(bytearray(wkb), array.array('q', offsets[2:4]))
+    assert len(got) == 1 and got[0].ExportToIsoWkt() == wkts[2]
+
+    assert ogr.CreateGeometriesFromWkb(b'', [0]) == []
+
+    with gdaltest.error_handler():
+        assert not ogr.CreateGeometriesFromWkb(wkb, [])
+        assert not ogr.CreateGeometriesFromWkb(wkb, [0, len(wkb) + 1])
+        assert not ogr.CreateGeometriesFromWkb(wkb, [offsets[1], offsets[0]])
+        assert not ogr.CreateGeometriesFromWkb(b'\x01\x01\x00\x00\x00', [0, 5])
+
+    with pytest.raises(TypeError):
+        ogr.ExportGeometriesToWkb([geoms[0], 'POINT (1 2)'])
+
+###############################################################################
+# Test Layer.ExportGeometriesToWkb() and Layer.CreateFeaturesFromWkb()
+
+
+def test_ogr_geom_layer_wkb_batch():
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test')
+    lyr.CreateField(ogr.FieldDefn('foo'))
+
+    wkts = ['POINT (1 2)', None, 'LINESTRING (1 2,3 4)']
+    wkb, offsets = ogr.ExportGeometriesToWkb(
+        [ogr.CreateGeometryFromWkt(wkt) if wkt else None for wkt in wkts])
+    assert lyr.CreateFeaturesFromWkb(wkb, offsets) == 0
+    assert lyr.GetFeatureCount() == 3
+
+    got = []
+    for f in lyr:
+        g = f.GetGeometryRef()
+        got.append(g.ExportToIsoWkt() if g else None)
+    assert got == wkts
+
+    assert lyr.ExportGeometriesToWkb() == (wkb, offsets)
+
+    lyr.SetSpatialFilterRect(2.5, 3.5, 5, 5)
+    wkb2, offsets2 = lyr.ExportGeometriesToWkb()
+    lyr.SetSpatialFilter(None)
+    assert offsets2 == [0, offsets[3] - offsets[2]]
+    assert wkb2 == wkb[offsets[2]:]
+
+    with gdaltest.error_handler():
+        assert lyr.CreateFeaturesFromWkb(wkb, offsets, geom_field=1) != 0
+        # No partial batch on failure
+        assert lyr.ExportGeometriesToWkb(geom_field=1) is None
+
+    used_exceptions_before = ogr.GetUseExceptions()
+    ogr.UseExceptions()
+    try:
+        with pytest.raises(RuntimeError):
+            lyr.ExportGeometriesToWkb(geom_field=1)
+    finally:
+        if used_exceptions_before == 0:
+            ogr.DontUseExceptions()
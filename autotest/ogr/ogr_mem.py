@@ -615,5 +615,116 @@ def test_ogr_mem_17():
     f = ds.GetNextFeature(include_layer=False)
     assert f is not None
 
-
-
+###############################################################################
+# Test GetArrowStream()
+
+
+def test_ogr_mem_arrow_stream_capsule():
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test')
+    stream = lyr.GetArrowStream()
+    assert 'arrow_array_stream' in repr(stream)
+    assert 'arrow_array_stream' in repr(lyr.__arrow_c_stream__())
+    with pytest.raises(NotImplementedError):
+        lyr.__arrow_c_stream__(requested_schema='foo')
+    del stream
+
+
+def test_ogr_mem_arrow_stream_pyarrow():
+
+    pa = pytest.importorskip('pyarrow')
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test', geom_type=ogr.wkbPoint)
+    lyr.CreateField(ogr.FieldDefn('int', ogr.OFTInteger))
+    fld_defn = ogr.FieldDefn('bool', ogr.OFTInteger)
+    fld_defn.SetSubType(ogr.OFSTBoolean)
+    lyr.CreateField(fld_defn)
+    lyr.CreateField(ogr.FieldDefn('int64', ogr.OFTInteger64))
+    lyr.CreateField(ogr.FieldDefn('real', ogr.OFTReal))
+    lyr.CreateField(ogr.FieldDefn('str', ogr.OFTString))
+    lyr.CreateField(ogr.FieldDefn('date', ogr.OFTDate))
+    lyr.CreateField(ogr.FieldDefn('datetime', ogr.OFTDateTime))
+    lyr.CreateField(ogr.FieldDefn('intlist', ogr.OFTIntegerList))
+    lyr.CreateField(ogr.FieldDefn('strlist', ogr.OFTStringList))
+    for i in range(5):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        f['int'] = i
+        f['bool'] = i % 2
+        f['int64'] = 1234567890123 + i
+        f['real'] = i + 0.5
+        if i != 2:
+            f['str'] = 'foo%d' % i
+        f['date'] = '2020/01/%02d' % (i + 1)
+        f['datetime'] = '1970/01/01 00:00:%02d.5+01' % i
+        f.SetFieldIntegerList(lyr.GetLayerDefn().GetFieldIndex('intlist'), [i] * i)
+        f.SetFieldStringList(lyr.GetLayerDefn().GetFieldIndex('strlist'), ['a', 'bc'])
+        if i != 3:
+            f.SetGeometry(ogr.CreateGeometryFromWkt('POINT(%d %d)' % (i, i)))
+        lyr.CreateFeature(f)
+
+    table = lyr.GetArrowStreamAsPyArrow().read_all()
+    assert table.num_rows == 5
+    assert table.schema.names == ['OGC_FID', 'int', 'bool', 'int64', 'real', 'str',
+                                  'date', 'datetime', 'intlist', 'strlist',
+                                  'wkb_geometry']
+    assert table.schema.field('OGC_FID').type == pa.int64()
+    assert table.schema.field('int').type == pa.int32()
+    assert table.schema.field('bool').type == pa.bool_()
+    assert table.schema.field('real').type == pa.float64()
+    assert table.schema.field('str').type == pa.string()
+    assert table.schema.field('date').type == pa.date32()
+    assert table.schema.field('datetime').type == pa.timestamp('ms')
+    assert table.schema.field('intlist').type == pa.list_(pa.int32())
+    assert table.schema.field('wkb_geometry').type == pa.binary()
+    assert table.schema.field('wkb_geometry').metadata == {b'ARROW:extension:name': b'ogc.wkb'}
+    d = table.to_pydict()
+    assert d['OGC_FID'] == [0, 1, 2, 3, 4]
+    assert d['bool'] == [False, True, False, True, False]
+    assert d['int64'][4] == 1234567890127
+    assert d['str'] == ['foo0', 'foo1', None, 'foo3', 'foo4']
+    assert str(d['date'][0]) == '2020-01-01'
+    assert str(d['datetime'][1]) == '1969-12-31 23:00:01.500000'
+    assert d['intlist'][3] == [3, 3, 3]
+    assert d['strlist'][0] == ['a', 'bc']
+    assert d['wkb_geometry'][3] is None
+    assert ogr.CreateGeometryFromWkb(d['wkb_geometry'][1]).ExportToWkt() == 'POINT (1 1)'
+
+    # Batch size
+    reader = lyr.GetArrowStreamAsPyArrow(['MAX_FEATURES_IN_BATCH=2', 'INCLUDE_FID=NO'])
+    batches = [batch for batch in reader]
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert 'OGC_FID' not in batches[0].schema.names
+
+    # Ignored fields and filters
+    lyr.SetIgnoredFields(['str', 'date', 'datetime', 'intlist', 'strlist', 'bool'])
+    lyr.SetAttributeFilter('int >= 1')
+    lyr.SetSpatialFilterRect(0.5, 0.5, 2.5, 2.5)
+    table = lyr.GetArrowStreamAsPyArrow().read_all()
+    assert table.schema.names == ['OGC_FID', 'int', 'int64', 'real', 'wkb_geometry']
+    assert table.to_pydict()['int'] == [1, 2]
+
+
+def test_ogr_mem_arrow_stream_dataset_closed():
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test')
+    lyr.CreateFeature(ogr.Feature(lyr.GetLayerDefn()))
+
+    # Releasing the stream after the dataset is closed must not crash
+    stream = lyr.GetArrowStream()
+    lyr = None
+    ds = None
+    del stream
+
+    pa = pytest.importorskip('pyarrow')
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test')
+    lyr.CreateFeature(ogr.Feature(lyr.GetLayerDefn()))
+    reader = lyr.GetArrowStreamAsPyArrow()
+    lyr = None
+    ds = None
+    with pytest.raises(pa.ArrowException, match='has been destroyed'):
+        reader.read_all()
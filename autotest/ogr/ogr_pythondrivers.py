@@ -28,6 +28,9 @@
 # DEALINGS IN THE SOFTWARE.
 ###############################################################################
 
+import os
+import shutil
+import struct
 
 import gdaltest
 from osgeo import gdal
@@ -95,6 +98,149 @@ def test_pythondrivers_test_dummy():
     lyr.SetSpatialFilter(None)
 
 
+def test_pythondrivers_test_dummy_batch():
+    ds = ogr.Open('DUMMYBATCH:')
+    assert ds
+    lyr = ds.GetLayer(0)
+    assert lyr.GetLayerDefn().GetFieldCount() == 5
+    for _ in range(2):
+        count = 0
+        for f in lyr:
+            assert f.GetFID() == count + 1
+            assert f['int32Field'] == count + 2
+            if count == 3:
+                assert not f.IsFieldSet('int64Field')
+            else:
+                assert f['int64Field'] == 1234567890123
+            assert f.GetStyleString() == ('PEN(c:#FF0000)' if count == 0 else None)
+            assert f['realField'] == count + 0.5
+            assert f['intAsRealField'] == count
+            if count == 2:
+                assert f.IsFieldNull('strField')
+            else:
+                assert f['strField'] == 'foo'
+            if count == 1:
+                assert f.GetGeometryRef() is None
+            else:
+                assert f.GetGeometryRef().ExportToWkt() == 'POINT (%d 49)' % count
+                assert f.GetGeometryRef().GetSpatialReference().GetAuthorityCode(None) == '4326'
+            count += 1
+        assert count == 5
+
+    lyr.SetAttributeFilter('int32Field = 4')
+    assert [f.GetFID() for f in lyr] == [3]
+    lyr.SetAttributeFilter(None)
+
+    lyr.SetSpatialFilterRect(0.5, 48, 3.5, 50)
+    assert [f.GetFID() for f in lyr] == [3, 4]
+    lyr.SetSpatialFilter(None)
+
+    # Invalid WKB: the geometry is ignored with a warning
+    lyr = ds.GetLayerByName('invalid_wkb')
+    gdal.ErrorReset()
+    with gdaltest.error_handler():
+        f = lyr.GetNextFeature()
+    assert f.GetFID() == 1
+    assert f.GetGeometryRef() is None
+    assert 'Invalid WKB' in gdal.GetLastErrorMsg()
+    f = lyr.GetNextFeature()
+    assert f.GetGeometryRef().ExportToWkt() == 'POINT (2 49)'
+
+
+def test_pythondrivers_passthrough_batch_and_iterator():
+
+    # Compare the features returned by the feature_batches() method of the
+    # PASSTHROUGH example driver with the ones of its feature iterator, on a
+    # layer with unset fields and style strings
+    with open('../../gdal/examples/pydrivers/ogr_PASSTHROUGH.py') as f:
+        src = f.read()
+    tmpdir = 'tmp/pydrivers_passthrough'
+    os.makedirs(tmpdir)
+    with open(tmpdir + '/ogr_PASSTHROUGH.py', 'w') as f:
+        f.write(src)
+    with open(tmpdir + '/ogr_PASSTHROUGHITER.py', 'w') as f:
+        f.write(src.replace('PASSTHROUGH', 'PASSTHROUGHITER').replace(
+            'def feature_batches(', 'def _feature_batches('))
+
+    gdal.FileFromMemBuffer('/vsimem/passthrough.geojson', """{
+"type": "FeatureCollection",
+"features": [
+{ "type": "Feature", "properties": { "int": 1, "str": "foo", "style": "PEN(c:#FF0000)" }, "geometry": { "type": "Point", "coordinates": [ 2, 49 ] } },
+{ "type": "Feature", "properties": { "str": "bar" }, "geometry": null },
+{ "type": "Feature", "properties": { "int": 3, "style": "BRUSH(fc:#00FF00)" }, "geometry": { "type": "Point", "coordinates": [ 3, 50 ] } }
+]}""")
+    gdal.FileFromMemBuffer('/vsimem/passthrough.vrt', """<OGRVRTDataSource>
+    <OGRVRTLayer name="test">
+        <SrcDataSource>/vsimem/passthrough.geojson</SrcDataSource>
+        <Style>style</Style>
+    </OGRVRTLayer>
+</OGRVRTDataSource>""")
+
+    def get_features(filename):
+        ds = ogr.Open(filename)
+        assert ds
+        lyr = ds.GetLayer(0)
+        ret = []
+        for f in lyr:
+            g = f.GetGeometryRef()
+            ret.append((f.GetFID(), f.GetStyleString(),
+                        [(f.IsFieldSet(i), f.IsFieldNull(i), f.GetField(i))
+                         for i in range(f.GetFieldCount())],
+                        g.ExportToWkt() if g else None))
+        return ret
+
+    try:
+        with gdaltest.config_option('GDAL_PYTHON_DRIVER_PATH', tmpdir):
+            gdal.AllRegister()
+        assert ogr.GetDriverByName('PASSTHROUGH')
+        assert ogr.GetDriverByName('PASSTHROUGHITER')
+
+        expected = get_features('/vsimem/passthrough.vrt')
+        assert [f[1] for f in expected] == ['PEN(c:#FF0000)', None, 'BRUSH(fc:#00FF00)']
+        assert not expected[1][2][0][0]
+        assert get_features('PASSTHROUGHITER:/vsimem/passthrough.vrt') == expected
+        assert get_features('PASSTHROUGH:/vsimem/passthrough.vrt') == expected
+    finally:
+        with gdaltest.config_option('GDAL_SKIP', 'PASSTHROUGH PASSTHROUGHITER'):
+            gdal.AllRegister()
+        gdal.Unlink('/vsimem/passthrough.geojson')
+        gdal.Unlink('/vsimem/passthrough.vrt')
+        shutil.rmtree(tmpdir)
+
+
+def test_pythondrivers_test_dummy_raster():
+    ds = gdal.Open('DUMMYRASTER:')
+    assert ds
+    assert ds.GetDriver().ShortName == 'DUMMYRASTER'
+    assert ds.RasterXSize == 10
+    assert ds.RasterYSize == 7
+    assert ds.RasterCount == 2
+    assert ds.GetGeoTransform() == (2, 0.5, 0, 49, 0, -0.5)
+    assert ds.GetSpatialRef().GetAuthorityCode(None) == '4326'
+
+    band = ds.GetRasterBand(1)
+    assert band.DataType == gdal.GDT_Byte
+    assert band.GetBlockSize() == [4, 4]
+    assert band.GetNoDataValue() == 255
+    expected = struct.pack('B' * 70, *[i + j * 10 for j in range(7) for i in range(10)])
+    assert band.ReadRaster() == expected
+    assert band.ReadRaster(8, 5, 2, 2) == struct.pack('BBBB', 58, 59, 68, 69)
+
+    band = ds.GetRasterBand(2)
+    assert band.DataType == gdal.GDT_UInt16
+    assert band.GetNoDataValue() is None
+    # Single block: read_block_into()
+    assert struct.unpack('H' * 4, band.ReadRaster(1, 1, 2, 2)) == (101, 201, 102, 202)
+    # Several blocks: read_window(), with data type conversion
+    data = band.ReadRaster(2, 3, 6, 2, buf_type=gdal.GDT_Float32)
+    assert struct.unpack('f' * 12, data) == tuple(
+        float(i * 100 + j) for j in (3, 4) for i in range(2, 8))
+    counters = ds.GetMetadata('COUNTERS')
+    assert counters['read_block'] == '6'
+    assert counters['read_block_into'] == '1'
+    assert counters['read_window'] == '1'
+
+
 def test_pythondrivers_missing_metadata():
     count_before = gdal.GetDriverCount()
     with gdaltest.config_option('GDAL_PYTHON_DRIVER_PATH', 'data/pydrivers/missingmetadata'):
@@ -138,6 +284,8 @@ def test_pythondrivers_missing_identify():
 
 
 def test_pythondrivers_cleanup():
-    with gdaltest.config_option('GDAL_SKIP', 'DUMMY'):
+    with gdaltest.config_option('GDAL_SKIP', 'DUMMY DUMMYBATCH DUMMYRASTER'):
         gdal.AllRegister()
     assert not ogr.GetDriverByName('DUMMY')
+    assert not ogr.GetDriverByName('DUMMYBATCH')
+    assert not gdal.GetDriverByName('DUMMYRASTER')
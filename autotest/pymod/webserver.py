@@ -32,9 +32,20 @@ try:
     from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 except ImportError:
     from http.server import BaseHTTPRequestHandler, HTTPServer
-from threading import Thread
+try:
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from socketserver import ThreadingMixIn
+try:
+    from urllib import unquote
+except ImportError:
+    from urllib.parse import unquote
+from threading import Lock, Thread
 
 import contextlib
+import os
+import random
+import re
 import time
 import sys
 from sys import version_info
@@ -110,6 +121,138 @@ class FileHandler(object):
             request.wfile.write(filedata[start:end])
 
 
+class RangeFileHandler(object):
+    """
+    Serve the files of a local directory, with support for range requests.
+
+    Each response is delayed by latency seconds, plus a random value in
+    [-jitter, jitter], and its body is sent at no more than bandwidth bytes
+    per second (per request), to simulate a remote server. Requests and sent
+    bytes are counted. Meant to be used with a threaded server (see launch()),
+    so that concurrent requests are served concurrently.
+    """
+
+    CHUNK_SIZE = 65536
+
+    def __init__(self, root_dir, latency=0, jitter=0, bandwidth=None):
+        self.root_dir = os.path.abspath(root_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.lock = Lock()
+        self.reset_counters()
+
+    def reset_counters(self):
+        with self.lock:
+            self.request_count = 0
+            self.bytes_sent = 0
+            # List of (method, path, start, end) with end included, or
+            # start = end = None for requests without range
+            self.requests = []
+
+    def stats(self):
+        """Return a dictionary with the request and byte counters"""
+        with self.lock:
+            return {'request_count': self.request_count,
+                    'head_count': len([r for r in self.requests if r[0] == 'HEAD']),
+                    'get_count': len([r for r in self.requests if r[0] == 'GET']),
+                    'range_count': len([r for r in self.requests if r[2] is not None]),
+                    'bytes_sent': self.bytes_sent}
+
+    def final_check(self):
+        pass
+
+    def _filename(self, request):
+        path = unquote(request.path.split('?')[0])
+        filename = os.path.normpath(os.path.join(self.root_dir, path.lstrip('/')))
+        if not filename.startswith(self.root_dir + os.sep) or not os.path.isfile(filename):
+            return None
+        return filename
+
+    def _wait(self):
+        delay = self.latency
+        if self.jitter:
+            delay += random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _count(self, method, path, start, end, nbytes):
+        with self.lock:
+            self.request_count += 1
+            self.bytes_sent += nbytes
+            self.requests.append((method, path, start, end))
+
+    def do_HEAD(self, request):
+        self._wait()
+        filename = self._filename(request)
+        self._count('HEAD', request.path, None, None, 0)
+        if filename is None:
+            request.send_response(404)
+            request.end_headers()
+            return
+        request.send_response(200)
+        request.send_header('Content-Length', os.path.getsize(filename))
+        request.send_header('Accept-Ranges', 'bytes')
+        request.end_headers()
+
+    def do_GET(self, request):
+        self._wait()
+        filename = self._filename(request)
+        if filename is None:
+            self._count('GET', request.path, None, None, 0)
+            request.send_response(404)
+            request.end_headers()
+            return
+
+        size = os.path.getsize(filename)
+        start = None
+        end = None
+        if 'Range' in request.headers:
+            res = re.search(r'bytes=(\d*)-(\d*)', request.headers['Range'])
+            if res:
+                if res.group(1):
+                    start = int(res.group(1))
+                    end = int(res.group(2)) if res.group(2) else size - 1
+                elif res.group(2):
+                    # Suffix range: last N bytes
+                    start = max(0, size - int(res.group(2)))
+                    end = size - 1
+        if start is not None and start >= size:
+            self._count('GET', request.path, start, end, 0)
+            request.send_response(416)
+            request.send_header('Content-Range', 'bytes */%d' % size)
+            request.end_headers()
+            return
+
+        if start is None:
+            request.send_response(200)
+            offset, length = 0, size
+        else:
+            end = min(end, size - 1)
+            request.send_response(206)
+            request.send_header('Content-Range', 'bytes %d-%d/%d' % (start, end, size))
+            offset, length = start, end - start + 1
+        request.send_header('Content-Length', length)
+        request.send_header('Accept-Ranges', 'bytes')
+        request.end_headers()
+
+        sent = 0
+        begin = time.time()
+        with open(filename, 'rb') as f:
+            f.seek(offset)
+            while sent < length:
+                data = f.read(min(self.CHUNK_SIZE, length - sent))
+                if not data:
+                    break
+                request.wfile.write(data)
+                sent += len(data)
+                if self.bandwidth:
+                    delay = begin + float(sent) / self.bandwidth - time.time()
+                    if delay > 0:
+                        time.sleep(delay)
+        self._count('GET', request.path, start, end, sent)
+
+
 class SequentialHandler(object):
     def __init__(self):
         self.req_count = 0
@@ -353,17 +496,23 @@ class GDAL_HttpServer(HTTPServer):
         self.stop_requested = False
 
 
+class GDAL_ThreadingHttpServer(ThreadingMixIn, GDAL_HttpServer):
+    """Server handling each request in a new thread"""
+    daemon_threads = True
+
+
 class GDAL_ThreadedHttpServer(Thread):
 
-    def __init__(self, handlerClass=None):
+    def __init__(self, handlerClass=None, threaded=False):
         Thread.__init__(self)
         ok = False
         self.server = 0
         if handlerClass is None:
             handlerClass = GDAL_Handler
+        serverClass = GDAL_ThreadingHttpServer if threaded else GDAL_HttpServer
         for port in range(8080, 8100):
             try:
-                self.server = GDAL_HttpServer(('', port), handlerClass)
+                self.server = serverClass(('', port), handlerClass)
                 self.server.port = port
                 ok = True
                 break
@@ -406,7 +555,7 @@ class GDAL_ThreadedHttpServer(Thread):
         self.stop()
 
 
-def launch(fork_process=None, handler=None):
+def launch(fork_process=None, handler=None, threaded=False):
     if handler is not None:
         if fork_process:
             raise Exception('fork_process = True incompatible with custom handler')
@@ -418,7 +567,7 @@ def launch(fork_process=None, handler=None):
         try:
             if handler is None:
                 handler = GDAL_Handler
-            server = GDAL_ThreadedHttpServer(handler)
+            server = GDAL_ThreadedHttpServer(handler, threaded=threaded)
             server.start_and_wait_ready()
             return (server, server.getPort())
         except:
@@ -445,6 +594,23 @@ def launch(fork_process=None, handler=None):
     return (process, port)
 
 
+@contextlib.contextmanager
+def range_server(root_dir, latency=0, jitter=0, bandwidth=None):
+    """
+    Start a threaded server serving root_dir with a RangeFileHandler, and
+    yield (handler, port)
+    """
+    handler = RangeFileHandler(root_dir, latency=latency, jitter=jitter, bandwidth=bandwidth)
+    process, port = launch(handler=DispatcherHttpHandler, threaded=True)
+    if port == 0:
+        raise Exception('could not start server')
+    try:
+        with install_http_handler(handler):
+            yield handler, port
+    finally:
+        server_stop(process, port)
+
+
 def server_stop(process, port):
 
     if isinstance(process, GDAL_ThreadedHttpServer):
@@ -115,9 +115,7 @@ def test_gdal2tiles_py_resampling_option():
         'antialias', 'mode', 'max', 'min', 'med', 'q1', 'q3']
     try:
         from PIL import Image
-        import numpy
-        import osgeo.gdal_array as gdalarray
-        del Image, numpy, gdalarray
+        del Image
     except ImportError:
         # 'antialias' resampling is not available
         resampling_list.remove('antialias')
@@ -416,6 +414,17 @@ def test_exclude_transparent_tiles():
         assert ['22705.png'] == dir_files, \
             ('Generated empty tiles for row 21900: %s' % dir_files)
 
+        # The transparent tiles are recorded as processed with --resume
+        shutil.rmtree(output_folder)
+        test_py_scripts.run_py_script_as_external_script(
+            script_path,
+            'gdal2tiles',
+            '-x -z 14-16 --resume data/test_gdal2tiles_exclude_transparent.tif %s' % output_folder)
+        with open(os.path.join(output_folder, 'gdal2tiles.manifest')) as f:
+            recorded = set(tuple(int(v) for v in line.split()) for line in f)
+        assert [t for t in recorded if t[:2] == (15, 21898)]
+        assert not os.listdir(os.path.join(output_folder, '15', '21898'))
+
     finally:
         shutil.rmtree(output_folder)
 
@@ -539,3 +548,98 @@ def test_gdal2tiles_py_mapml():
 
     shutil.rmtree('tmp/out_gdal2tiles_mapml', ignore_errors=True)
     gdal.Unlink('tmp/byte_CBM.tif')
+
+
+def _list_tiles(folder):
+    tiles = []
+    for root, _, files in os.walk(folder):
+        tiles += [os.path.relpath(os.path.join(root, f), folder) for f in files if f.endswith('.png')]
+    return sorted(tiles)
+
+
+def test_gdal2tiles_py_metatile():
+
+    script_path = test_py_scripts.get_py_script('gdal2tiles')
+    if script_path is None:
+        pytest.skip()
+
+    shutil.rmtree('tmp/out_gdal2tiles_smallworld', ignore_errors=True)
+    shutil.rmtree('tmp/out_gdal2tiles_smallworld_metatile', ignore_errors=True)
+
+    resampling_list = ['near', 'average', 'cubic', 'antialias']
+    try:
+        from PIL import Image
+        del Image
+    except ImportError:
+        resampling_list.remove('antialias')
+
+    for resampling in resampling_list:
+        test_py_scripts.run_py_script_as_external_script(
+            script_path,
+            'gdal2tiles',
+            '-q -z 0-3 --xyz -r %s ../gdrivers/data/small_world.tif tmp/out_gdal2tiles_smallworld' % resampling)
+
+        test_py_scripts.run_py_script_as_external_script(
+            script_path,
+            'gdal2tiles',
+            '-q -z 0-3 --xyz -r %s --metatile 4 --processes=2 ../gdrivers/data/small_world.tif '
+            'tmp/out_gdal2tiles_smallworld_metatile' % resampling)
+
+        tiles = _list_tiles('tmp/out_gdal2tiles_smallworld')
+        assert tiles
+        assert _list_tiles('tmp/out_gdal2tiles_smallworld_metatile') == tiles
+
+        # Same tile content, but at the borders of the source pixels
+        ds_ref = gdal.Open('tmp/out_gdal2tiles_smallworld/3/4/2.png')
+        ds = gdal.Open('tmp/out_gdal2tiles_smallworld_metatile/3/4/2.png')
+        assert ds.RasterCount == ds_ref.RasterCount
+        for i in range(ds.RasterCount):
+            ref = ds_ref.GetRasterBand(i + 1).ComputeRasterMinMax()
+            got = ds.GetRasterBand(i + 1).ComputeRasterMinMax()
+            assert abs(ref[0] - got[0]) <= 8 and abs(ref[1] - got[1]) <= 8
+        ds = None
+        ds_ref = None
+
+        shutil.rmtree('tmp/out_gdal2tiles_smallworld', ignore_errors=True)
+        shutil.rmtree('tmp/out_gdal2tiles_smallworld_metatile', ignore_errors=True)
+
+
+def test_gdal2tiles_py_resume_manifest():
+
+    script_path = test_py_scripts.get_py_script('gdal2tiles')
+    if script_path is None:
+        pytest.skip()
+
+    out_dir = 'tmp/out_gdal2tiles_smallworld_resume'
+    manifest = os.path.join(out_dir, 'gdal2tiles.manifest')
+    shutil.rmtree(out_dir, ignore_errors=True)
+
+    test_py_scripts.run_py_script_as_external_script(
+        script_path,
+        'gdal2tiles',
+        '-q -z 0-2 ../gdrivers/data/small_world.tif %s' % out_dir)
+
+    tiles = _list_tiles(out_dir)
+    # The manifest is only written with --resume
+    assert not os.path.exists(manifest)
+
+    # Without manifest, the existing tiles are found by scanning the output directory
+    os.unlink(os.path.join(out_dir, '1', '0', '0.png'))
+
+    test_py_scripts.run_py_script_as_external_script(
+        script_path,
+        'gdal2tiles',
+        '-q -z 0-2 --resume ../gdrivers/data/small_world.tif %s' % out_dir)
+
+    assert _list_tiles(out_dir) == tiles
+    with open(manifest) as f:
+        assert len(f.readlines()) == len(tiles)
+
+    # A run without --resume removes the manifest
+    test_py_scripts.run_py_script_as_external_script(
+        script_path,
+        'gdal2tiles',
+        '-q -z 0-2 ../gdrivers/data/small_world.tif %s' % out_dir)
+    assert not os.path.exists(manifest)
+
+    shutil.rmtree(out_dir, ignore_errors=True)
@@ -0,0 +1,107 @@
+#!/usr/bin/env pytest
+# -*- coding: utf-8 -*-
+###############################################################################
+# $Id$
+#
+# Project:  GDAL/OGR Test Suite
+# Purpose:  gdal_cp.py testing
+#
+###############################################################################
+# SPDX-License-Identifier: MIT
+###############################################################################
+
+import os
+import shutil
+import sys
+
+from osgeo import gdal
+
+import gdaltest
+import test_py_scripts
+import webserver
+import pytest
+
+###############################################################################
+
+
+def run_gdal_cp(argv):
+    script_path = test_py_scripts.get_py_script('gdal_cp')
+    if script_path is None:
+        pytest.skip()
+
+    saved_syspath = sys.path
+    sys.path.append(script_path)
+    try:
+        import gdal_cp
+    except ImportError:
+        sys.path = saved_syspath
+        pytest.fail()
+
+    sys.path = saved_syspath
+
+    return gdal_cp.gdal_cp(argv)
+
+
+def read_file(filename):
+    f = gdal.VSIFOpenL(filename, 'rb')
+    assert f is not None, filename
+    gdal.VSIFSeekL(f, 0, 2)
+    size = gdal.VSIFTellL(f)
+    gdal.VSIFSeekL(f, 0, 0)
+    data = gdal.VSIFReadL(1, size, f)
+    gdal.VSIFCloseL(f)
+    return data
+
+###############################################################################
+# Recursive copy with -j, with files smaller and larger than the part size
+
+
+def test_gdal_cp_py_parallel_recursive():
+
+    files = {'a.bin': b'a' * 10,
+             'sub/b.bin': bytes(bytearray(range(256))) * 1000,
+             'sub/subsub/c.bin': b'c' * 1000001,
+             'sub/empty.bin': b''}
+    for name, content in files.items():
+        gdal.FileFromMemBuffer('/vsimem/gdal_cp_src/' + name, content)
+
+    try:
+        ret = run_gdal_cp(['', '-j', '4', '-part_size', '100000', '-r',
+                           '/vsimem/gdal_cp_src', '/vsimem/gdal_cp_dst'])
+        assert ret == 0
+        for name, content in files.items():
+            assert read_file('/vsimem/gdal_cp_dst/' + name) == content, name
+    finally:
+        gdal.RmdirRecursive('/vsimem/gdal_cp_src')
+        gdal.RmdirRecursive('/vsimem/gdal_cp_dst')
+
+###############################################################################
+# Copy of a remote file, split in byte ranges copied concurrently
+
+
+def test_gdal_cp_py_parallel_ranges_from_http():
+
+    if not gdaltest.built_against_curl():
+        pytest.skip()
+
+    tmpdir = 'tmp/gdal_cp_http'
+    os.makedirs(tmpdir)
+    content = os.urandom(1000000)
+    with open(tmpdir + '/src.bin', 'wb') as f:
+        f.write(content)
+
+    try:
+        gdal.VSICurlClearCache()
+        with webserver.range_server(tmpdir, latency=0.01) as (handler, port):
+            ret = run_gdal_cp(['', '-j', '4', '-part_size', '100000',
+                               '/vsicurl/http://127.0.0.1:%d/src.bin' % port,
+                               tmpdir + '/dst.bin'])
+            stats = handler.stats()
+        assert ret == 0
+        with open(tmpdir + '/dst.bin', 'rb') as f:
+            assert f.read() == content
+        assert len([r for r in handler.requests if r[0] == 'GET']) >= 5
+        assert stats['bytes_sent'] >= len(content)
+    finally:
+        gdal.VSICurlClearCache()
+        shutil.rmtree(tmpdir)
@@ -29,6 +29,7 @@
 # DEALINGS IN THE SOFTWARE.
 ###############################################################################
 
+import json
 import sys
 from osgeo import gdal
 
@@ -233,3 +234,36 @@ def test_gdal_ls_py_8():
     assert ret_str.find('-r--r--r--  1 unknown unknown        24576 2007-03-29 00:00 /vsicurl/ftp://download.osgeo.org/gdal/data/aig/nzdem/info/arc0002r.001') != -1
 
     assert ret_str.find('-r--r--r--  1 unknown unknown        24576 2007-03-29 12:20 /vsizip//vsicurl/ftp://download.osgeo.org/gdal/data/aig/nzdem.zip/nzdem/info/arc0002r.001') != -1
+
+###############################################################################
+# Concurrent recursive listing and JSON output
+
+
+def test_gdal_ls_py_concurrent_json():
+
+    files = ['a/a1/x.txt', 'a/y.txt', 'b/z.txt', 'c/c1/c2/w.txt', 'v.txt']
+    for dirname in ['', 'a', 'a/a1', 'b', 'c', 'c/c1', 'c/c1/c2']:
+        gdal.Mkdir('/vsimem/gdal_ls/' + dirname, 0o755)
+    for name in files:
+        gdal.FileFromMemBuffer('/vsimem/gdal_ls/' + name, 'x' * len(name))
+
+    try:
+        ref = run_gdal_ls(['', '-R', '/vsimem/gdal_ls'])
+        assert run_gdal_ls(['', '-R', '-j', '4', '/vsimem/gdal_ls']) == ref
+        for name in files:
+            assert '/vsimem/gdal_ls/' + name in ref
+
+        ret_str = run_gdal_ls(['', '-R', '-j', '4', '-json', '-depth', '2',
+                               '/vsimem/gdal_ls'])
+        entries = [json.loads(line) for line in ret_str.splitlines()]
+        assert [e['name'] for e in entries] == [
+            '/vsimem/gdal_ls/a/', '/vsimem/gdal_ls/a/a1/', '/vsimem/gdal_ls/a/y.txt',
+            '/vsimem/gdal_ls/b/', '/vsimem/gdal_ls/b/z.txt',
+            '/vsimem/gdal_ls/c/', '/vsimem/gdal_ls/c/c1/',
+            '/vsimem/gdal_ls/v.txt']
+        assert entries[2] == {'name': '/vsimem/gdal_ls/a/y.txt', 'type': 'file',
+                              'size': len('a/y.txt'), 'mtime': entries[2]['mtime'],
+                              'depth': 1}
+        assert entries[0]['type'] == 'directory'
+    finally:
+        gdal.RmdirRecursive('/vsimem/gdal_ls')
@@ -1382,5 +1382,35 @@ def test_ogr2ogr_py_46():
     gdal.Unlink('tmp/test_ogr2ogr_45.gml')
     gdal.Unlink('tmp/test_ogr2ogr_45.xsd')
 
+###############################################################################
+# Test -pipeline
+
+
+def test_ogr2ogr_py_pipeline():
+
+    script_path = test_py_scripts.get_py_script('ogr2ogr')
+    if script_path is None:
+        pytest.skip()
 
+    try:
+        os.stat('tmp/poly_pipeline.shp')
+        ogr.GetDriverByName('ESRI Shapefile').DeleteDataSource('tmp/poly_pipeline.shp')
+    except OSError:
+        pass
+
+    test_py_scripts.run_py_script(script_path, 'ogr2ogr', '-pipeline 3 -preserve_fid -t_srs EPSG:4326 tmp/poly_pipeline.shp ../ogr/data/poly.shp')
+
+    src_ds = ogr.Open('../ogr/data/poly.shp')
+    src_lyr = src_ds.GetLayer(0)
+    ds = ogr.Open('tmp/poly_pipeline.shp')
+    lyr = ds.GetLayer(0)
+    assert lyr.GetFeatureCount() == 10
+    assert str(lyr.GetSpatialRef()).find('1984') != -1
+    for src_f, f in zip(src_lyr, lyr):
+        assert f.GetFID() == src_f.GetFID()
+        assert f.GetField('PRFEDEA') == src_f.GetField('PRFEDEA')
+        assert f.GetGeometryRef().GetEnvelope() != src_f.GetGeometryRef().GetEnvelope()
+    ds = None
+    src_ds = None
 
+    ogr.GetDriverByName('ESRI Shapefile').DeleteDataSource('tmp/poly_pipeline.shp')
@@ -347,6 +347,63 @@ def test_ogrmerge_12():
     gdal.Unlink('tmp/tmp.json')
     gdal.Unlink('tmp/out.vrt')
 
+###############################################################################
+# Test -native in -single mode
+
 
+def test_ogrmerge_13():
+    script_path = test_py_scripts.get_py_script('ogrmerge')
+    if script_path is None:
+        pytest.skip()
+
+    test_py_scripts.run_py_script(script_path, 'ogrmerge',
+                                  '-native -j 2 -gt 5 -single -o tmp/out.shp '
+                                  '../ogr/data/poly.shp ../ogr/data/poly.shp '
+                                  '../ogr/data/shp/testpoly.shp '
+                                  '-src_layer_field_name source')
+
+    ds = ogr.Open('tmp/out.shp')
+    lyr = ds.GetLayer(0)
+    assert lyr.GetFeatureCount() == 34
+    assert lyr.GetLayerDefn().GetFieldIndex('source') == 0
+    assert lyr.GetLayerDefn().GetFieldIndex('EAS_ID') >= 0
+    sources = {}
+    for f in lyr:
+        sources[f['source']] = sources.get(f['source'], 0) + 1
+        assert f.GetGeometryRef() is not None
+    assert sources == {'poly': 20, 'testpoly': 14}
+
+    lyr.SetAttributeFilter("source = 'poly' AND EAS_ID = 170")
+    assert lyr.GetFeatureCount() == 2
+    ds = None
+
+    ogr.GetDriverByName('ESRI Shapefile').DeleteDataSource('tmp/out.shp')
 
+###############################################################################
+# Test -native in default mode, with -t_srs and -append
+
+
+def test_ogrmerge_14():
+    script_path = test_py_scripts.get_py_script('ogrmerge')
+    if script_path is None:
+        pytest.skip()
+
+    test_py_scripts.run_py_script(script_path, 'ogrmerge',
+                                  '-native -f "ESRI Shapefile" -o tmp/out_native '
+                                  '../ogr/data/poly.shp ../ogr/data/shp/testpoly.shp '
+                                  '-t_srs EPSG:4326')
+    test_py_scripts.run_py_script(script_path, 'ogrmerge',
+                                  '-native -append -o tmp/out_native '
+                                  '../ogr/data/poly.shp -t_srs EPSG:4326')
+
+    ds = ogr.Open('tmp/out_native')
+    assert ds.GetLayerCount() == 2
+    lyr = ds.GetLayerByName('poly')
+    assert lyr.GetFeatureCount() == 20
+    assert lyr.GetSpatialRef().GetAuthorityCode(None) == '4326'
+    minx, maxx, miny, maxy = lyr.GetExtent()
+    assert -180 <= minx <= maxx <= 180 and -90 <= miny <= maxy <= 90
+    assert ds.GetLayerByName('testpoly').GetFeatureCount() == 14
+    ds = None
 
+    ogr.GetDriverByName('ESRI Shapefile').DeleteDataSource('tmp/out_native')
@@ -125,6 +125,51 @@ class Layer(BaseLayer):
         for f in self.gdal_layer:
             yield self._translate_feature(f)
 
+    def feature_batches(self):
+        # Used by GDAL instead of __iter__() when defined. Transmitting
+        # features by batches of columns, with geometries as WKB, avoids
+        # building a dictionary and WKT strings for each feature.
+        layer_defn = self.gdal_layer.GetLayerDefn()
+        field_names = [layer_defn.GetFieldDefn(i).GetName()
+                       for i in range(layer_defn.GetFieldCount())]
+        geom_field_names = [layer_defn.GetGeomFieldDefn(i).GetName()
+                            for i in range(layer_defn.GetGeomFieldCount())]
+        batch_size = 1000
+
+        self.gdal_layer.ResetReading()
+        while True:
+            ids = []
+            styles = []
+            columns = [[] for _ in field_names]
+            columns_set = [[] for _ in field_names]
+            wkbs = [bytearray() for _ in geom_field_names]
+            offsets = [[0] for _ in geom_field_names]
+            while len(ids) < batch_size:
+                ogr_f = self.gdal_layer.GetNextFeature()
+                if ogr_f is None:
+                    break
+                ids.append(ogr_f.GetFID())
+                styles.append(ogr_f.GetStyleString())
+                for i, column in enumerate(columns):
+                    column.append(ogr_f.GetField(i))
+                    columns_set[i].append(ogr_f.IsFieldSet(i))
+                for i, wkb in enumerate(wkbs):
+                    g = ogr_f.GetGeomFieldRef(i)
+                    if g:
+                        wkb += g.ExportToIsoWkb()
+                    offsets[i].append(len(wkb))
+            if not ids:
+                return
+            yield {'length': len(ids),
+                   'ids': ids,
+                   'styles': styles,
+                   'fields': dict(zip(field_names, columns)),
+                   'fields_set': dict(zip(field_names, columns_set)),
+                   'geometry_fields': dict(zip(geom_field_names,
+                                               zip(wkbs, offsets)))}
+            if len(ids) < batch_size:
+                return
+
     def feature_by_id(self, fid):
         ogr_f = self.gdal_layer.GetFeature(fid)
         if not ogr_f:
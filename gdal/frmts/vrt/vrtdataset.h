@@ -764,6 +764,9 @@ class CPL_DLL VRTDerivedRasterBand CPL_NON_FINAL: public VRTSourcedRasterBand
                                         int nMaskFlagStop,
                                         double* pdfDataPct) override;
 
+    virtual const char *GetMetadataItem( const char * pszName,
+                                         const char * pszDomain = "" ) override;
+
     static CPLErr AddPixelFunction( const char *pszFuncName,
                                     GDALDerivedPixelFunc pfnPixelFunc );
     static GDALDerivedPixelFunc GetPixelFunction( const char *pszFuncName );
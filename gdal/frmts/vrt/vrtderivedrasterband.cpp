@@ -35,6 +35,7 @@
 #include "gdalpython.h"
 
 #include <algorithm>
+#include <chrono>
 #include <map>
 #include <vector>
 #include <utility>
@@ -62,6 +63,102 @@ static std::map<CPLString, GDALDerivedPixelFunc> osMapPixelFunction;
 #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
 #define PyBUF_FULL (PyBUF_INDIRECT | PyBUF_WRITABLE | PyBUF_FORMAT)
 
+/************************************************************************/
+/*                     Process pool execution mode                      */
+/************************************************************************/
+
+// Python code appended to the code of the band module when
+// GDAL_VRT_PYTHON_EXECUTION_MODE=PROCESS. GDALMakeProcessPoolFunction()
+// returns a callable with the signature of pixel functions, that copies the
+// input and output arrays into shared memory segments, and runs the user
+// function on them in a pool of worker processes shared by all bands. The
+// calling thread waits for the result without holding the GIL, so that reads
+// from several threads are processed concurrently.
+// The code run by workers is passed as a string to the exec() builtin, since
+// the module of the band cannot be imported by the workers.
+static const char szProcessPoolCode[] =
+"_GDAL_VRT_WORKER_CODE = '''\n"
+"import importlib, sys, types, numpy\n"
+"from multiprocessing import shared_memory\n"
+"state = sys.modules.get('_gdal_vrt_worker')\n"
+"if state is None:\n"
+"    state = types.ModuleType('_gdal_vrt_worker')\n"
+"    state.funcs = {}\n"
+"    sys.modules['_gdal_vrt_worker'] = state\n"
+"func = state.funcs.get(job_func)\n"
+"if func is None:\n"
+"    module_name, func_name, code = job_func\n"
+"    if module_name:\n"
+"        func = getattr(importlib.import_module(module_name), func_name)\n"
+"    else:\n"
+"        ns = {'__name__': '_gdal_vrt_worker_code'}\n"
+"        exec(compile(code, '<VRT pixel function>', 'exec'), ns)\n"
+"        func = ns[func_name]\n"
+"    state.funcs[job_func] = func\n"
+"shms = [shared_memory.SharedMemory(name=name) for name, _, _ in job_arrays]\n"
+"try:\n"
+"    arrays = [numpy.ndarray(shape, dtype=dtype, buffer=shm.buf)\n"
+"              for shm, (_, dtype, shape) in zip(shms, job_arrays)]\n"
+"    func(tuple(arrays[1:]), arrays[0], *job_args, **job_kwargs)\n"
+"finally:\n"
+"    arrays = None\n"
+"    for shm in shms:\n"
+"        try:\n"
+"            shm.close()\n"
+"        except BufferError:\n"
+"            pass\n"
+"'''\n"
+"\n"
+"def GDALMakeProcessPoolFunction(module_name, func_name, code, nworkers, executable):\n"
+"    import os, sys, threading, types\n"
+"    from multiprocessing import shared_memory\n"
+"    state = sys.modules.get('_gdal_vrt_process_pool')\n"
+"    if state is None:\n"
+"        state = types.ModuleType('_gdal_vrt_process_pool')\n"
+"        state.pool = None\n"
+"        state.lock = threading.Lock()\n"
+"        sys.modules['_gdal_vrt_process_pool'] = state\n"
+"    if not executable:\n"
+"        executable = sys.executable\n"
+"        if not executable or not os.path.basename(executable).lower().startswith('python'):\n"
+"            raise RuntimeError('The Python interpreter to use for worker processes '\n"
+"                               'cannot be determined. Set GDAL_VRT_PYTHON_EXECUTABLE')\n"
+"\n"
+"    def get_pool():\n"
+"        with state.lock:\n"
+"            if state.pool is None:\n"
+"                import concurrent.futures, multiprocessing\n"
+"                ctx = multiprocessing.get_context('spawn')\n"
+"                ctx.set_executable(executable)\n"
+"                state.pool = concurrent.futures.ProcessPoolExecutor(\n"
+"                    nworkers, mp_context=ctx)\n"
+"            return state.pool\n"
+"\n"
+"    job_func = (module_name, func_name, code)\n"
+"\n"
+"    def run(in_ar, out_ar, *args, **kwargs):\n"
+"        shms = []\n"
+"        views = []\n"
+"        try:\n"
+"            job_arrays = []\n"
+"            for a in (out_ar,) + tuple(in_ar):\n"
+"                shm = shared_memory.SharedMemory(create=True, size=max(1, a.nbytes))\n"
+"                shms.append(shm)\n"
+"                views.append(numpy.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf))\n"
+"                views[-1][...] = a\n"
+"                job_arrays.append((shm.name, a.dtype.str, a.shape))\n"
+"            get_pool().submit(exec, _GDAL_VRT_WORKER_CODE,\n"
+"                              {'job_func': job_func, 'job_arrays': job_arrays,\n"
+"                               'job_args': args, 'job_kwargs': kwargs}).result()\n"
+"            out_ar[...] = views[0]\n"
+"        finally:\n"
+"            del views[:]\n"
+"            for shm in shms:\n"
+"                shm.close()\n"
+"                shm.unlink()\n"
+"\n"
+"    return run\n";
+
 /************************************************************************/
 /*                        GDALCreateNumpyArray()                        */
 /************************************************************************/
@@ -146,8 +243,38 @@ class VRTDerivedRasterBandPrivateData
         bool      m_bPythonInitializationSuccess;
         bool      m_bExclusiveLock;
         bool      m_bFirstTime;
+        bool      m_bProcessMode;
         std::vector< std::pair<CPLString,CPLString> > m_oFunctionArgs{};
 
+        // Python objects that do not change from one call to another
+        PyObject* m_poKwargs;
+        PyObject* m_poRasterXSize;
+        PyObject* m_poRasterYSize;
+        PyObject* m_poBufferRadius;
+        PyObject* m_poGeoTransform;
+        double    m_adfGeoTransform[6];
+
+        // Source buffers, temporary destination buffer and their numpy
+        // wrappers, kept from one call to the next one as long as the
+        // buffer dimensions and data types do not change.
+        bool      m_bCacheArrays;
+        bool      m_bCacheInUse;
+        int       m_nCacheXSize;
+        int       m_nCacheYSize;
+        GDALDataType m_eCacheSrcType;
+        GDALDataType m_eCacheDataType;
+        std::vector<void*> m_apCacheBuffers{};
+        PyObject* m_poCacheInputArrays;
+        GByte*    m_pabyCacheTmpBuffer;
+        PyObject* m_poCacheTmpArray;
+
+        // Counters, reported in the _DEBUG_ metadata domain
+        GIntBig   m_nPythonCalls;
+        GIntBig   m_nArrayCacheHits;
+        GIntBig   m_nArrayCacheMisses;
+        double    m_dfPythonTime;
+        CPLString m_osDebugValue{};
+
         VRTDerivedRasterBandPrivateData():
             m_osLanguage("C"),
             m_nBufferRadius(0),
@@ -156,17 +283,136 @@ class VRTDerivedRasterBandPrivateData
             m_bPythonInitializationDone(false),
             m_bPythonInitializationSuccess(false),
             m_bExclusiveLock(false),
-            m_bFirstTime(true)
+            m_bFirstTime(true),
+            m_bProcessMode(false),
+            m_poKwargs(nullptr),
+            m_poRasterXSize(nullptr),
+            m_poRasterYSize(nullptr),
+            m_poBufferRadius(nullptr),
+            m_poGeoTransform(nullptr),
+            m_bCacheArrays(CPLTestBool(
+                CPLGetConfigOption("GDAL_VRT_PYTHON_CACHE_ARRAYS", "YES"))),
+            m_bCacheInUse(false),
+            m_nCacheXSize(0),
+            m_nCacheYSize(0),
+            m_eCacheSrcType(GDT_Unknown),
+            m_eCacheDataType(GDT_Unknown),
+            m_poCacheInputArrays(nullptr),
+            m_pabyCacheTmpBuffer(nullptr),
+            m_poCacheTmpArray(nullptr),
+            m_nPythonCalls(0),
+            m_nArrayCacheHits(0),
+            m_nArrayCacheMisses(0),
+            m_dfPythonTime(0.0)
         {
+            for( int i = 0; i < 6; i++ )
+                m_adfGeoTransform[i] = 0.0;
         }
 
         virtual ~VRTDerivedRasterBandPrivateData()
         {
+            if( m_nPythonCalls )
+            {
+                CPLDebug("VRT", "Python pixel function: " CPL_FRMT_GIB
+                         " calls, %.3f s, array cache: " CPL_FRMT_GIB
+                         " hits, " CPL_FRMT_GIB " misses",
+                         m_nPythonCalls, m_dfPythonTime,
+                         m_nArrayCacheHits, m_nArrayCacheMisses);
+            }
+            if( m_bPythonInitializationSuccess )
+            {
+                GIL_Holder oHolder(false);
+                ReleaseCachedArrays();
+                PyObject* apoObjects[] = { m_poKwargs, m_poRasterXSize,
+                                           m_poRasterYSize, m_poBufferRadius,
+                                           m_poGeoTransform };
+                for( PyObject* poObj: apoObjects )
+                {
+                    if( poObj )
+                        Py_DecRef(poObj);
+                }
+            }
+            FreeCachedBuffers();
             if( m_poGDALCreateNumpyArray )
                 Py_DecRef(m_poGDALCreateNumpyArray);
             if( m_poUserFunction )
                 Py_DecRef(m_poUserFunction);
         }
+
+        // Must be called with the GIL held.
+        void ReleaseCachedArrays()
+        {
+            if( m_poCacheInputArrays )
+                Py_DecRef(m_poCacheInputArrays);
+            m_poCacheInputArrays = nullptr;
+            if( m_poCacheTmpArray )
+                Py_DecRef(m_poCacheTmpArray);
+            m_poCacheTmpArray = nullptr;
+        }
+
+        void FreeCachedBuffers()
+        {
+            for( void* pBuffer: m_apCacheBuffers )
+                VSIFree(pBuffer);
+            m_apCacheBuffers.clear();
+            VSIFree(m_pabyCacheTmpBuffer);
+            m_pabyCacheTmpBuffer = nullptr;
+            m_nCacheXSize = 0;
+            m_nCacheYSize = 0;
+        }
+
+        /** Returns source buffers of the requested dimensions from the
+         * cache, (re)allocating them if needed. Returns nullptr if the
+         * cache cannot be used. */
+        void** AcquireCachedBuffers( int nXSize, int nYSize,
+                                     GDALDataType eSrcType,
+                                     GDALDataType eDataType,
+                                     int nSources )
+        {
+            if( !m_bCacheArrays || m_bCacheInUse ||
+                !EQUAL(m_osLanguage, "Python") || nSources == 0 )
+                return nullptr;
+            const size_t nBufferSize =
+                static_cast<size_t>(nXSize) * nYSize *
+                                        GDALGetDataTypeSizeBytes(eSrcType);
+            // Do not keep around large buffers
+            if( nBufferSize > MAX_CACHED_BUFFER_SIZE / nSources )
+                return nullptr;
+            if( nXSize == m_nCacheXSize && nYSize == m_nCacheYSize &&
+                eSrcType == m_eCacheSrcType && eDataType == m_eCacheDataType &&
+                static_cast<size_t>(nSources) == m_apCacheBuffers.size() )
+            {
+                m_nArrayCacheHits++;
+            }
+            else
+            {
+                m_nArrayCacheMisses++;
+                if( m_poCacheInputArrays || m_poCacheTmpArray )
+                {
+                    GIL_Holder oHolder(false);
+                    ReleaseCachedArrays();
+                }
+                FreeCachedBuffers();
+                for( int i = 0; i < nSources; i++ )
+                {
+                    void* pBuffer = VSI_MALLOC_VERBOSE(nBufferSize);
+                    if( pBuffer == nullptr )
+                    {
+                        FreeCachedBuffers();
+                        return nullptr;
+                    }
+                    m_apCacheBuffers.push_back(pBuffer);
+                }
+                m_nCacheXSize = nXSize;
+                m_nCacheYSize = nYSize;
+                m_eCacheSrcType = eSrcType;
+                m_eCacheDataType = eDataType;
+            }
+            m_bCacheInUse = true;
+            return &m_apCacheBuffers[0];
+        }
+
+        static constexpr size_t MAX_CACHED_BUFFER_SIZE = 64 * 1024 * 1024;
 };
 
 /************************************************************************/
@@ -612,14 +858,26 @@ bool VRTDerivedRasterBand::InitializePython()
     // a numpy array object. We define a Python function to which we pass a
     // Python buffer object.
 
+    // Whether the function should be run by a pool of worker processes
+    const char* pszExecutionMode =
+        CPLGetConfigOption("GDAL_VRT_PYTHON_EXECUTION_MODE", "THREAD");
+    const bool bProcessMode = EQUAL(pszExecutionMode, "PROCESS");
+    if( !bProcessMode && !EQUAL(pszExecutionMode, "THREAD") )
+    {
+        CPLError(CE_Warning, CPLE_NotSupported,
+                 "Unsupported value for GDAL_VRT_PYTHON_EXECUTION_MODE: %s. "
+                 "Using THREAD", pszExecutionMode);
+    }
+
     // We need to build a unique module name, otherwise this will crash in
     // multithreaded use cases.
     CPLString osModuleName( CPLSPrintf("gdal_vrt_module_%p", this) );
     PyObject* poCompiledString = Py_CompileString(
-        ("import numpy\n"
+        (CPLString("import numpy\n"
         "def GDALCreateNumpyArray(buffer, dtype, height, width):\n"
         "    return numpy.frombuffer(buffer, str(dtype.decode('ascii')))."
                                                 "reshape([height, width])\n"
+        "\n") + (bProcessMode ? szProcessPoolCode : "") +
         "\n" + m_poPrivate->m_osCode).c_str(),
         osModuleName, Py_file_input);
     if( poCompiledString == nullptr || PyErr_Occurred() )
@@ -684,6 +942,47 @@ bool VRTDerivedRasterBand::InitializePython()
         return false;
     }
 
+    if( bProcessMode )
+    {
+        // Replace the user function by a wrapper running it in the workers
+        const char* pszNumProcesses =
+            CPLGetConfigOption("GDAL_VRT_PYTHON_NUM_PROCESSES", "ALL_CPUS");
+        const int nNumProcesses = EQUAL(pszNumProcesses, "ALL_CPUS") ?
+            CPLGetNumCPUs() : std::max(1, atoi(pszNumProcesses));
+        const char* pszExecutable =
+            CPLGetConfigOption("GDAL_VRT_PYTHON_EXECUTABLE", "");
+
+        PyObject* poMakeFunction =
+            PyObject_GetAttrString(poModule, "GDALMakeProcessPoolFunction");
+        if( poMakeFunction == nullptr || PyErr_Occurred() )
+        {
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "%s", GetPyExceptionString().c_str());
+            Py_DecRef(poModule);
+            return false;
+        }
+        PyObject* poArgs = PyTuple_New(5);
+        PyTuple_SetItem(poArgs, 0, PyUnicode_FromString(osPythonModule));
+        PyTuple_SetItem(poArgs, 1, PyUnicode_FromString(osPythonFunction));
+        PyTuple_SetItem(poArgs, 2,
+                        PyUnicode_FromString(m_poPrivate->m_osCode));
+        PyTuple_SetItem(poArgs, 3, PyInt_FromLong(nNumProcesses));
+        PyTuple_SetItem(poArgs, 4, PyUnicode_FromString(pszExecutable));
+        PyObject* poWrapper = PyObject_Call(poMakeFunction, poArgs, nullptr);
+        Py_DecRef(poArgs);
+        Py_DecRef(poMakeFunction);
+        if( poWrapper == nullptr || PyErr_Occurred() )
+        {
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "%s", GetPyExceptionString().c_str());
+            Py_DecRef(poModule);
+            return false;
+        }
+        Py_DecRef(m_poPrivate->m_poUserFunction);
+        m_poPrivate->m_poUserFunction = poWrapper;
+        m_poPrivate->m_bProcessMode = true;
+    }
+
     // Fetch our GDALCreateNumpyArray python function
     m_poPrivate->m_poGDALCreateNumpyArray =
         PyObject_GetAttrString(poModule, "GDALCreateNumpyArray" );
@@ -852,11 +1151,15 @@ CPLErr VRTDerivedRasterBand::IRasterIO( GDALRWFlag eRWFlag,
     }
     const int nExtBufXSize = nBufXSize + 2 * nBufferRadius;
     const int nExtBufYSize = nBufYSize + 2 * nBufferRadius;
-    void **pBuffers
-        = static_cast<void **>( CPLMalloc(sizeof(void *) * nSources) );
+    void **pBuffers = m_poPrivate->AcquireCachedBuffers(
+        nExtBufXSize, nExtBufYSize, eSrcType, eDataType, nSources);
+    const bool bCachedBuffers = pBuffers != nullptr;
+    if( !bCachedBuffers )
+        pBuffers = static_cast<void **>( CPLMalloc(sizeof(void *) * nSources) );
     for( int iSource = 0; iSource < nSources; iSource++ ) {
-        pBuffers[iSource] =
-            VSI_MALLOC3_VERBOSE(nSrcTypeSize, nExtBufXSize, nExtBufYSize);
+        if( !bCachedBuffers )
+            pBuffers[iSource] =
+                VSI_MALLOC3_VERBOSE(nSrcTypeSize, nExtBufXSize, nExtBufYSize);
         if( pBuffers[iSource] == nullptr )
         {
             for (int i = 0; i < iSource; i++) {
@@ -1042,59 +1345,118 @@ CPLErr VRTDerivedRasterBand::IRasterIO( GDALRWFlag eRWFlag,
             nPixelSpace != nBufTypeSize ||
             nLineSpace != static_cast<GSpacing>(nBufTypeSize) * nBufXSize )
         {
-            pabyTmpBuffer = static_cast<GByte*>(VSI_CALLOC_VERBOSE(
-                            static_cast<size_t>(nExtBufXSize) * nExtBufYSize,
-                            GDALGetDataTypeSizeBytes(eDataType)));
-            if( !pabyTmpBuffer )
-                goto end;
+            const size_t nTmpBufferSize =
+                static_cast<size_t>(nExtBufXSize) * nExtBufYSize *
+                                        GDALGetDataTypeSizeBytes(eDataType);
+            if( bCachedBuffers )
+            {
+                if( m_poPrivate->m_pabyCacheTmpBuffer == nullptr )
+                {
+                    m_poPrivate->m_pabyCacheTmpBuffer = static_cast<GByte*>(
+                                        VSI_MALLOC_VERBOSE(nTmpBufferSize));
+                    if( !m_poPrivate->m_pabyCacheTmpBuffer )
+                        goto end;
+                }
+                pabyTmpBuffer = m_poPrivate->m_pabyCacheTmpBuffer;
+                memset(pabyTmpBuffer, 0, nTmpBufferSize);
+            }
+            else
+            {
+                pabyTmpBuffer = static_cast<GByte*>(
+                                        VSI_CALLOC_VERBOSE(1, nTmpBufferSize));
+                if( !pabyTmpBuffer )
+                    goto end;
+            }
         }
+        const bool bCachedTmpBuffer = bCachedBuffers && pabyTmpBuffer;
 
         {
+        // In process mode, jit compilation happens in the workers
         const bool bUseExclusiveLock = m_poPrivate->m_bExclusiveLock ||
                     ( m_poPrivate->m_bFirstTime &&
+                    !m_poPrivate->m_bProcessMode &&
                     m_poPrivate->m_osCode.find("@jit") != std::string::npos);
         m_poPrivate->m_bFirstTime = false;
         GIL_Holder oHolder(bUseExclusiveLock);
 
         // Prepare target numpy array
-        PyObject* poPyDstArray = GDALCreateNumpyArray(
+        PyObject* poPyDstArray = nullptr;
+        if( bCachedTmpBuffer && m_poPrivate->m_poCacheTmpArray )
+        {
+            poPyDstArray = m_poPrivate->m_poCacheTmpArray;
+            Py_IncRef(poPyDstArray);
+        }
+        else
+        {
+            poPyDstArray = GDALCreateNumpyArray(
                                     m_poPrivate->m_poGDALCreateNumpyArray,
                                     pabyTmpBuffer ? pabyTmpBuffer : pData,
                                     eDataType,
                                     nExtBufYSize,
                                     nExtBufXSize);
+            if( poPyDstArray && bCachedTmpBuffer )
+            {
+                Py_IncRef(poPyDstArray);
+                m_poPrivate->m_poCacheTmpArray = poPyDstArray;
+            }
+        }
         if( !poPyDstArray )
         {
-            VSIFree(pabyTmpBuffer);
+            if( !bCachedTmpBuffer )
+                VSIFree(pabyTmpBuffer);
             goto end;
         }
 
         // Wrap source buffers as input numpy arrays
-        PyObject* pyArgInputArray = PyTuple_New(nSources);
-        for( int i = 0; i < nSources; i++ )
+        PyObject* pyArgInputArray = nullptr;
+        if( bCachedBuffers && m_poPrivate->m_poCacheInputArrays )
         {
-            GByte* pabyBuffer = static_cast<GByte*>(pBuffers[i]);
-            PyObject* poPySrcArray = GDALCreateNumpyArray(
-                        m_poPrivate->m_poGDALCreateNumpyArray,
-                        pabyBuffer,
-                        eSrcType,
-                        nExtBufYSize,
-                        nExtBufXSize);
-            CPLAssert(poPySrcArray);
-            PyTuple_SetItem(pyArgInputArray, i, poPySrcArray);
+            pyArgInputArray = m_poPrivate->m_poCacheInputArrays;
+            Py_IncRef(pyArgInputArray);
+        }
+        else
+        {
+            pyArgInputArray = PyTuple_New(nSources);
+            for( int i = 0; i < nSources; i++ )
+            {
+                GByte* pabyBuffer = static_cast<GByte*>(pBuffers[i]);
+                PyObject* poPySrcArray = GDALCreateNumpyArray(
+                            m_poPrivate->m_poGDALCreateNumpyArray,
+                            pabyBuffer,
+                            eSrcType,
+                            nExtBufYSize,
+                            nExtBufXSize);
+                CPLAssert(poPySrcArray);
+                PyTuple_SetItem(pyArgInputArray, i, poPySrcArray);
+            }
+            if( bCachedBuffers )
+            {
+                Py_IncRef(pyArgInputArray);
+                m_poPrivate->m_poCacheInputArrays = pyArgInputArray;
+            }
         }
 
-        // Create arguments
-        PyObject* pyArgs = PyTuple_New(10);
-        PyTuple_SetItem(pyArgs, 0, pyArgInputArray);
-        PyTuple_SetItem(pyArgs, 1, poPyDstArray);
-        PyTuple_SetItem(pyArgs, 2, PyInt_FromLong(nXOff));
-        PyTuple_SetItem(pyArgs, 3, PyInt_FromLong(nYOff));
-        PyTuple_SetItem(pyArgs, 4, PyInt_FromLong(nXSize));
-        PyTuple_SetItem(pyArgs, 5, PyInt_FromLong(nYSize));
-        PyTuple_SetItem(pyArgs, 6, PyInt_FromLong(nRasterXSize));
-        PyTuple_SetItem(pyArgs, 7, PyInt_FromLong(nRasterYSize));
-        PyTuple_SetItem(pyArgs, 8, PyInt_FromLong(nBufferRadius));
+        // Create the Python objects that do not depend on the request
+        if( m_poPrivate->m_poKwargs == nullptr )
+        {
+            m_poPrivate->m_poRasterXSize = PyInt_FromLong(nRasterXSize);
+            m_poPrivate->m_poRasterYSize = PyInt_FromLong(nRasterYSize);
+            m_poPrivate->m_poBufferRadius = PyInt_FromLong(nBufferRadius);
+
+            m_poPrivate->m_poKwargs = PyDict_New();
+            for( size_t i = 0; i < m_poPrivate->m_oFunctionArgs.size(); ++i )
+            {
+                const char* pszKey =
+                    m_poPrivate->m_oFunctionArgs[i].first.c_str();
+                const char* pszValue =
+                    m_poPrivate->m_oFunctionArgs[i].second.c_str();
+                PyObject* poValue =
+                    PyString_FromStringAndSize(pszValue, strlen(pszValue));
+                PyDict_SetItemString(m_poPrivate->m_poKwargs, pszKey,
+                                     poValue);
+                Py_DecRef(poValue);
+            }
+        }
 
         double adfGeoTransform[6];
         adfGeoTransform[0] = 0;
@@ -1105,30 +1467,51 @@ CPLErr VRTDerivedRasterBand::IRasterIO( GDALRWFlag eRWFlag,
         adfGeoTransform[5] = 1;
         if( GetDataset() )
             GetDataset()->GetGeoTransform(adfGeoTransform);
-        PyObject* pyGT = PyTuple_New(6);
-        for(int i = 0; i < 6; i++ )
-            PyTuple_SetItem(pyGT, i, PyFloat_FromDouble(adfGeoTransform[i]));
-        PyTuple_SetItem(pyArgs, 9, pyGT);
+        if( m_poPrivate->m_poGeoTransform == nullptr ||
+            memcmp(adfGeoTransform, m_poPrivate->m_adfGeoTransform,
+                   sizeof(adfGeoTransform)) != 0 )
+        {
+            if( m_poPrivate->m_poGeoTransform )
+                Py_DecRef(m_poPrivate->m_poGeoTransform);
+            m_poPrivate->m_poGeoTransform = PyTuple_New(6);
+            for(int i = 0; i < 6; i++ )
+            {
+                PyTuple_SetItem(m_poPrivate->m_poGeoTransform, i,
+                                PyFloat_FromDouble(adfGeoTransform[i]));
+            }
+            memcpy(m_poPrivate->m_adfGeoTransform, adfGeoTransform,
+                   sizeof(adfGeoTransform));
+        }
 
-        // Prepare kwargs
-        PyObject* pyKwargs = PyDict_New();
-        for( size_t i = 0; i < m_poPrivate->m_oFunctionArgs.size(); ++i )
+        // Create arguments
+        PyObject* pyArgs = PyTuple_New(10);
+        PyTuple_SetItem(pyArgs, 0, pyArgInputArray);
+        PyTuple_SetItem(pyArgs, 1, poPyDstArray);
+        PyTuple_SetItem(pyArgs, 2, PyInt_FromLong(nXOff));
+        PyTuple_SetItem(pyArgs, 3, PyInt_FromLong(nYOff));
+        PyTuple_SetItem(pyArgs, 4, PyInt_FromLong(nXSize));
+        PyTuple_SetItem(pyArgs, 5, PyInt_FromLong(nYSize));
+        PyObject* apoConstantArgs[] = { m_poPrivate->m_poRasterXSize,
+                                        m_poPrivate->m_poRasterYSize,
+                                        m_poPrivate->m_poBufferRadius,
+                                        m_poPrivate->m_poGeoTransform };
+        for( int i = 0; i < 4; i++ )
         {
-            const char* pszKey =
-                m_poPrivate->m_oFunctionArgs[i].first.c_str();
-            const char* pszValue =
-                m_poPrivate->m_oFunctionArgs[i].second.c_str();
-            PyDict_SetItemString(pyKwargs, pszKey,
-                PyString_FromStringAndSize(pszValue, strlen(pszValue)));
+            // PyTuple_SetItem() steals a reference
+            Py_IncRef(apoConstantArgs[i]);
+            PyTuple_SetItem(pyArgs, 6 + i, apoConstantArgs[i]);
         }
 
         // Call user function
+        const auto tStart = std::chrono::steady_clock::now();
         PyObject* pRetValue = PyObject_Call(
                                         m_poPrivate->m_poUserFunction,
-                                        pyArgs, pyKwargs);
+                                        pyArgs, m_poPrivate->m_poKwargs);
+        m_poPrivate->m_dfPythonTime += std::chrono::duration<double>(
+                            std::chrono::steady_clock::now() - tStart).count();
+        m_poPrivate->m_nPythonCalls++;
 
         Py_DecRef(pyArgs);
-        Py_DecRef(pyKwargs);
 
         if( ErrOccurredEmitCPLError() )
         {
@@ -1159,7 +1542,8 @@ CPLErr VRTDerivedRasterBand::IRasterIO( GDALRWFlag eRWFlag,
                               nBufXSize);
             }
 
-            VSIFree(pabyTmpBuffer);
+            if( !bCachedTmpBuffer )
+                VSIFree(pabyTmpBuffer);
         }
     }
     else if( eErr == CE_None && pfnPixelFunc != nullptr ) {
@@ -1170,10 +1554,17 @@ CPLErr VRTDerivedRasterBand::IRasterIO( GDALRWFlag eRWFlag,
     }
 end:
     // Release buffers.
-    for ( int iSource = 0; iSource < nSources; iSource++ ) {
-        VSIFree(pBuffers[iSource]);
+    if( bCachedBuffers )
+    {
+        m_poPrivate->m_bCacheInUse = false;
+    }
+    else
+    {
+        for ( int iSource = 0; iSource < nSources; iSource++ ) {
+            VSIFree(pBuffers[iSource]);
+        }
+        CPLFree(pBuffers);
     }
-    CPLFree(pBuffers);
 
     return eErr;
 }
@@ -1194,6 +1585,36 @@ int  VRTDerivedRasterBand::IGetDataCoverageStatus( int /* nXOff */,
     return GDAL_DATA_COVERAGE_STATUS_UNIMPLEMENTED | GDAL_DATA_COVERAGE_STATUS_DATA;
 }
 
+/************************************************************************/
+/*                          GetMetadataItem()                           */
+/************************************************************************/
+
+const char *VRTDerivedRasterBand::GetMetadataItem( const char * pszName,
+                                                   const char * pszDomain )
+
+{
+    if( pszDomain != nullptr && EQUAL(pszDomain, "_DEBUG_") &&
+        pszName != nullptr )
+    {
+        if( EQUAL(pszName, "PYTHON_CALLS") )
+            m_poPrivate->m_osDebugValue.Printf(CPL_FRMT_GIB,
+                                               m_poPrivate->m_nPythonCalls);
+        else if( EQUAL(pszName, "PYTHON_CALL_TIME") )
+            m_poPrivate->m_osDebugValue.Printf("%.6f",
+                                               m_poPrivate->m_dfPythonTime);
+        else if( EQUAL(pszName, "PYTHON_ARRAY_CACHE_HITS") )
+            m_poPrivate->m_osDebugValue.Printf(CPL_FRMT_GIB,
+                                               m_poPrivate->m_nArrayCacheHits);
+        else if( EQUAL(pszName, "PYTHON_ARRAY_CACHE_MISSES") )
+            m_poPrivate->m_osDebugValue.Printf(CPL_FRMT_GIB,
+                                               m_poPrivate->m_nArrayCacheMisses);
+        else
+            return nullptr;
+        return m_poPrivate->m_osDebugValue.c_str();
+    }
+    return VRTSourcedRasterBand::GetMetadataItem(pszName, pszDomain);
+}
+
 /************************************************************************/
 /*                              XMLInit()                               */
 /************************************************************************/
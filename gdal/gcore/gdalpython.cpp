@@ -122,6 +122,8 @@ namespace GDALPy
     int (*PyBuffer_FillInfo)(Py_buffer *view, PyObject *obj, void *buf,
                                     size_t len, int readonly, int infoflags) = nullptr;
     PyObject* (*PyMemoryView_FromBuffer)(Py_buffer *view) = nullptr;
+    int (*PyObject_GetBuffer)(PyObject *obj, Py_buffer *view, int flags) = nullptr;
+    void (*PyBuffer_Release)(Py_buffer *view) = nullptr;
 
     PyObject* (*Py_InitModule4)(const char*, const PyMethodDef*, const char*, PyObject*, int) = nullptr; // Py2 only
     PyObject * (*PyModule_Create2)(struct PyModuleDef*, int) = nullptr; // Py3
@@ -633,6 +635,8 @@ static bool LoadPythonAPI()
                  "PyBuffer_FillInfo+PyMemoryView_FromBuffer\n");
         return false;
     }
+    LOAD_NOCHECK(libHandle, PyObject_GetBuffer);
+    LOAD_NOCHECK(libHandle, PyBuffer_Release);
     LOAD(libHandle, PyObject_Type);
     LOAD(libHandle, PyObject_IsInstance);
     LOAD(libHandle, PyTuple_New);
@@ -110,6 +110,21 @@ namespace GDALPy
     extern int (*PyBuffer_FillInfo)(Py_buffer *view, PyObject *obj, void *buf,
                                     size_t len, int readonly, int infoflags);
     extern PyObject* (*PyMemoryView_FromBuffer)(Py_buffer *view);
+    extern int (*PyObject_GetBuffer)(PyObject *obj, Py_buffer *view, int flags);
+    extern void (*PyBuffer_Release)(Py_buffer *view);
+
+    // Leading members of the real Py_buffer structure, for buffers filled
+    // by PyObject_GetBuffer()
+    typedef struct
+    {
+        void* buf;
+        PyObject* obj;
+        Py_ssize_t len;
+        Py_ssize_t itemsize;
+        int readonly;
+        int ndim;
+        char* format;
+    } Py_buffer_header;
 
 
     typedef PyObject* (*PyCFunction)(PyObject*, PyObject*, PyObject*);
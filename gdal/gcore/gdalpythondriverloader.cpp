@@ -33,8 +33,11 @@
 #include "gdalpython.h"
 
 #include <algorithm>
+#include <climits>
 #include <memory>
 #include <mutex>
+#include <utility>
+#include <vector>
 
 using namespace GDALPy;
 
@@ -171,6 +174,16 @@ static bool InitializePythonAndLoadGDALPythonDriverModule()
 "   def __init__(self):\n"
 "       pass\n"
 "\n"
+"class BaseRasterBand(object):\n"
+"   def __init__(self):\n"
+"       pass\n"
+"\n"
+"class BaseRasterDataset(BaseDataset):\n"
+"   thread_safe = False\n"
+"\n"
+"   def __init__(self):\n"
+"       pass\n"
+"\n"
 "class BaseDriver(object):\n"
 "   def __init__(self):\n"
 "       pass\n"
@@ -314,6 +327,275 @@ CPLString GetStringRes(PyObject* poObj, const char* pszFunctionName,
     return osRes;
 }
 
+/************************************************************************/
+/*                            PythonTypes                               */
+/************************************************************************/
+
+// Python type objects used to dispatch field values. Must be instantiated
+// and destroyed while holding the GIL.
+struct PythonTypes
+{
+    PyObject* poBool = nullptr;
+    PyObject* poBoolType = nullptr;
+    PyObject* poInt = nullptr;
+    PyObject* poIntType = nullptr;
+    PyObject* poLong = nullptr;
+    PyObject* poLongType = nullptr;
+    PyObject* poFloat = nullptr;
+    PyObject* poFloatType = nullptr;
+
+    PythonTypes()
+    {
+        poBool = PyBool_FromLong(1);
+        poBoolType = PyObject_Type(poBool);
+        poInt = PyInt_FromLong(1);
+        poIntType = PyObject_Type(poInt);
+        poLong = PyLong_FromLongLong(1);
+        poLongType = PyObject_Type(poLong);
+        poFloat = PyFloat_FromDouble(1.0);
+        poFloatType = PyObject_Type(poFloat);
+    }
+
+    ~PythonTypes()
+    {
+        Py_DecRef(poBoolType);
+        Py_DecRef(poBool);
+        Py_DecRef(poIntType);
+        Py_DecRef(poInt);
+        Py_DecRef(poLongType);
+        Py_DecRef(poLong);
+        Py_DecRef(poFloatType);
+        Py_DecRef(poFloat);
+    }
+
+    PythonTypes(const PythonTypes&) = delete;
+    PythonTypes& operator= (const PythonTypes&) = delete;
+};
+
+/************************************************************************/
+/*                       SetFieldFromPyObject()                         */
+/************************************************************************/
+
+static bool SetFieldFromPyObject(OGRFeature* poFeature, int idx,
+                                 PyObject* value, const PythonTypes& oTypes)
+{
+    if( value == Py_None )
+    {
+        poFeature->SetFieldNull(idx);
+    }
+    else if(PyObject_IsInstance(value, oTypes.poLongType) )
+    {
+        poFeature->SetField(idx,
+                static_cast<GIntBig>(PyLong_AsLongLong(value)) );
+    }
+    else if( PyObject_IsInstance(value, oTypes.poBoolType) ||
+             PyObject_IsInstance(value, oTypes.poIntType) )
+    {
+        poFeature->SetField(idx,
+                static_cast<GIntBig>(PyInt_AsLong(value)) );
+    }
+    else if( PyObject_IsInstance(value, oTypes.poFloatType) )
+    {
+        poFeature->SetField(idx, PyFloat_AsDouble(value) );
+    }
+    else if( poFeature->GetFieldDefnRef(idx)->GetType() == OFTBinary )
+    {
+        Py_ssize_t nSize = PyBytes_Size(value);
+        const char* pszBytes = PyBytes_AsString(value);
+        poFeature->SetField(idx, static_cast<int>(nSize), const_cast<GByte*>(
+                reinterpret_cast<const GByte*>(pszBytes)));
+    }
+    else
+    {
+        CPLString osValue = GetString(value);
+        if( ErrOccurredEmitCPLError() )
+        {
+            return false;
+        }
+        poFeature->SetField(idx, osValue);
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                       PythonPluginBatchColumn                        */
+/************************************************************************/
+
+#define PyBUF_FORMAT 0x0004
+#define PyBUF_ND 0x0008
+#define PyBUF_STRIDES (0x0010 | PyBUF_ND)
+#define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
+
+// Column of a feature batch returned by the feature_batches() method of a
+// layer. This is either a one-dimensional object implementing the buffer
+// protocol (NumPy array, array.array, bytes, ...), whose values are read
+// without going through Python objects, or a Python sequence.
+// Must be instantiated and destroyed while holding the GIL.
+class PythonPluginBatchColumn
+{
+        PyObject* m_poSeq = nullptr;
+        Py_buffer m_sBuffer{};
+        bool m_bHasBuffer = false;
+        const GByte* m_pabyData = nullptr;
+        char m_chFormat = 0;
+        size_t m_nItemSize = 0;
+        size_t m_nCount = 0;
+
+        PythonPluginBatchColumn(const PythonPluginBatchColumn&) = delete;
+        PythonPluginBatchColumn& operator= (const PythonPluginBatchColumn&) = delete;
+
+    public:
+        PythonPluginBatchColumn() = default;
+        ~PythonPluginBatchColumn();
+
+        bool Init(PyObject* poObj, const char* pszName);
+
+        size_t GetCount() const { return m_nCount; }
+        bool HasBuffer() const { return m_bHasBuffer; }
+        bool IsBytes() const { return m_bHasBuffer && m_nItemSize == 1; }
+        bool IsInteger() const { return m_chFormat != 'f' && m_chFormat != 'd'; }
+        const GByte* GetData() const { return m_pabyData; }
+
+        GIntBig GetInt64(size_t i) const;
+        double GetDouble(size_t i) const;
+        // Returns a new reference. Only for sequences
+        PyObject* GetItem(size_t i) const
+            { return PySequence_GetItem(m_poSeq, static_cast<Py_ssize_t>(i)); }
+};
+
+/************************************************************************/
+/*                      ~PythonPluginBatchColumn()                      */
+/************************************************************************/
+
+PythonPluginBatchColumn::~PythonPluginBatchColumn()
+{
+    if( m_bHasBuffer )
+        PyBuffer_Release(&m_sBuffer);
+    Py_DecRef(m_poSeq);
+}
+
+/************************************************************************/
+/*                                Init()                                */
+/************************************************************************/
+
+bool PythonPluginBatchColumn::Init(PyObject* poObj, const char* pszName)
+{
+    if( PyObject_GetBuffer != nullptr &&
+        PyObject_GetBuffer(poObj, &m_sBuffer,
+                           PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0 )
+    {
+        m_bHasBuffer = true;
+        const auto psHeader =
+            reinterpret_cast<const Py_buffer_header*>(&m_sBuffer);
+        const char* pszFormat = psHeader->format ? psHeader->format : "B";
+        if( pszFormat[0] == '@' || pszFormat[0] == '=' ||
+            (pszFormat[0] == (CPL_IS_LSB ? '<' : '>')) )
+        {
+            pszFormat ++;
+        }
+        m_chFormat = pszFormat[0];
+        m_nItemSize = static_cast<size_t>(psHeader->itemsize);
+        const bool bFloat = m_chFormat == 'f' || m_chFormat == 'd';
+        if( psHeader->ndim > 1 || m_chFormat == 0 || pszFormat[1] != 0 ||
+            strchr("bBhHiIlLqQ?fd", m_chFormat) == nullptr ||
+            (bFloat && m_nItemSize != 4 && m_nItemSize != 8) ||
+            (!bFloat && m_nItemSize != 1 && m_nItemSize != 2 &&
+             m_nItemSize != 4 && m_nItemSize != 8) )
+        {
+            CPLError(CE_Failure, CPLE_NotSupported,
+                     "Column %s: unsupported buffer of format %s and %d dimension(s)",
+                     pszName, psHeader->format ? psHeader->format : "(null)",
+                     psHeader->ndim);
+            return false;
+        }
+        m_pabyData = static_cast<const GByte*>(psHeader->buf);
+        m_nCount = static_cast<size_t>(psHeader->len) / m_nItemSize;
+        return true;
+    }
+    PyErr_Clear();
+
+    if( !PySequence_Check(poObj) )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "Column %s: sequence or buffer object expected", pszName);
+        return false;
+    }
+    m_nCount = static_cast<size_t>(PySequence_Size(poObj));
+    if( ErrOccurredEmitCPLError() )
+        return false;
+    Py_IncRef(poObj);
+    m_poSeq = poObj;
+    return true;
+}
+
+/************************************************************************/
+/*                              GetInt64()                              */
+/************************************************************************/
+
+template<class T> static T ReadValue(const GByte* pabyData)
+{
+    T val;
+    memcpy(&val, pabyData, sizeof(T));
+    return val;
+}
+
+GIntBig PythonPluginBatchColumn::GetInt64(size_t i) const
+{
+    if( !m_bHasBuffer )
+    {
+        PyObject* poItem = GetItem(i);
+        const GIntBig nVal = poItem ? PyLong_AsLongLong(poItem) : 0;
+        Py_DecRef(poItem);
+        return nVal;
+    }
+
+    const GByte* pabyData = m_pabyData + i * m_nItemSize;
+    switch( m_chFormat )
+    {
+        case 'f':
+            return static_cast<GIntBig>(ReadValue<float>(pabyData));
+        case 'd':
+            return static_cast<GIntBig>(ReadValue<double>(pabyData));
+        case '?':
+            return pabyData[0] != 0;
+        case 'B': case 'H': case 'I': case 'L': case 'Q':
+            switch( m_nItemSize )
+            {
+                case 1: return pabyData[0];
+                case 2: return ReadValue<GUInt16>(pabyData);
+                case 4: return ReadValue<GUInt32>(pabyData);
+                default: return static_cast<GIntBig>(ReadValue<GUInt64>(pabyData));
+            }
+        default:
+            switch( m_nItemSize )
+            {
+                case 1: return ReadValue<signed char>(pabyData);
+                case 2: return ReadValue<GInt16>(pabyData);
+                case 4: return ReadValue<GInt32>(pabyData);
+                default: return ReadValue<GInt64>(pabyData);
+            }
+    }
+}
+
+/************************************************************************/
+/*                             GetDouble()                              */
+/************************************************************************/
+
+double PythonPluginBatchColumn::GetDouble(size_t i) const
+{
+    if( m_bHasBuffer && m_chFormat == 'f' )
+        return ReadValue<float>(m_pabyData + i * m_nItemSize);
+    if( m_bHasBuffer && m_chFormat == 'd' )
+        return ReadValue<double>(m_pabyData + i * m_nItemSize);
+    if( m_bHasBuffer )
+        return static_cast<double>(GetInt64(i));
+
+    PyObject* poItem = GetItem(i);
+    const double dfVal = poItem ? PyFloat_AsDouble(poItem) : 0.0;
+    Py_DecRef(poItem);
+    return dfVal;
+}
+
 /************************************************************************/
 /*                          PythonPluginLayer                           */
 /************************************************************************/
@@ -334,6 +616,28 @@ class PythonPluginLayer final: public OGRLayer
         PyObject* m_pyIterator = nullptr;
         bool m_bStopIteration = false;
 
+        // State of iteration through feature_batches()
+        struct BatchField
+        {
+            int iField = -1;
+            std::unique_ptr<PythonPluginBatchColumn> poValues{};
+            std::unique_ptr<PythonPluginBatchColumn> poSet{};
+        };
+        struct BatchGeomField
+        {
+            int iGeomField = -1;
+            std::unique_ptr<PythonPluginBatchColumn> poWKB{};
+            std::unique_ptr<PythonPluginBatchColumn> poOffsets{};
+        };
+        bool m_bBatchIteration = false;
+        size_t m_nBatchLength = 0;
+        size_t m_iBatchRow = 0;
+        std::unique_ptr<PythonTypes> m_poBatchTypes{};
+        std::unique_ptr<PythonPluginBatchColumn> m_poBatchIds{};
+        std::unique_ptr<PythonPluginBatchColumn> m_poBatchStyles{};
+        std::vector<BatchField> m_aoBatchFields{};
+        std::vector<BatchGeomField> m_aoBatchGeomFields{};
+
         void RefreshHonourFlags();
         void StoreSpatialFilter();
 
@@ -341,6 +645,10 @@ class PythonPluginLayer final: public OGRLayer
         void GetGeomFields();
         OGRFeature* TranslateToOGRFeature(PyObject* poObj);
 
+        bool LoadBatch(PyObject* poBatch);
+        void ReleaseBatch();
+        OGRFeature* GetNextFeatureFromBatch();
+
         PythonPluginLayer(const PythonPluginLayer&) = delete;
         PythonPluginLayer& operator= (const PythonPluginLayer&) = delete;
 
@@ -410,6 +718,8 @@ PythonPluginLayer::PythonPluginLayer(PyObject* poLayer) :
     {
         m_pyFeatureByIdMethod = PyObject_GetAttrString(m_poLayer, "feature_by_id" );
     }
+
+    m_bBatchIteration = PyObject_HasAttrString(m_poLayer, "feature_batches") != 0;
 }
 
 /************************************************************************/
@@ -419,6 +729,7 @@ PythonPluginLayer::PythonPluginLayer(PyObject* poLayer) :
 PythonPluginLayer::~PythonPluginLayer()
 {
     GIL_Holder oHolder(false);
+    ReleaseBatch();
     if( m_poFeatureDefn )
         m_poFeatureDefn->Release();
     Py_DecRef(m_pyFeatureByIdMethod);
@@ -762,14 +1073,7 @@ OGRFeature* PythonPluginLayer::TranslateToOGRFeature(PyObject* poObj)
 
     OGRFeature* poFeature = new OGRFeature(GetLayerDefn());
 
-    PyObject* myBool = PyBool_FromLong(1);
-    PyObject* myBoolType = PyObject_Type(myBool);
-    PyObject* myInt = PyInt_FromLong(1);
-    PyObject* myIntType = PyObject_Type(myInt);
-    PyObject* myLong = PyLong_FromLongLong(1);
-    PyObject* myLongType = PyObject_Type(myLong);
-    PyObject* myFloat = PyFloat_FromDouble(1.0);
-    PyObject* myFloatType = PyObject_Type(myFloat);
+    const PythonTypes oTypes;
 
     auto poFields = PyDict_GetItemString(poObj, "fields");
     auto poGeometryFields = PyDict_GetItemString(poObj, "geometry_fields");
@@ -777,12 +1081,12 @@ OGRFeature* PythonPluginLayer::TranslateToOGRFeature(PyObject* poObj)
     auto poStyleString = PyDict_GetItemString(poObj, "style");
     PyErr_Clear();
 
-    if( poId && PyObject_IsInstance(poId, myLongType) )
+    if( poId && PyObject_IsInstance(poId, oTypes.poLongType) )
     {
         poFeature->SetFID(
                 static_cast<GIntBig>(PyLong_AsLongLong(poId)) );
     }
-    else if( poId && PyObject_IsInstance(poId, myIntType) )
+    else if( poId && PyObject_IsInstance(poId, oTypes.poIntType) )
     {
         poFeature->SetFID(
                 static_cast<GIntBig>(PyInt_AsLong(poId)) );
@@ -845,75 +1149,13 @@ OGRFeature* PythonPluginLayer::TranslateToOGRFeature(PyObject* poObj)
             break;
         }
 
-        if( value == Py_None )
-        {
-            int idx = m_poFeatureDefn->GetFieldIndex(osKey);
-            if( idx >= 0 )
-            {
-                poFeature->SetFieldNull(idx);
-            }
-        }
-        else if(PyObject_IsInstance(value, myLongType) )
-        {
-            int idx = m_poFeatureDefn->GetFieldIndex(osKey);
-            if( idx >= 0 )
-            {
-                poFeature->SetField(idx,
-                        static_cast<GIntBig>(PyLong_AsLongLong(value)) );
-            }
-        }
-        else if( PyObject_IsInstance(value, myBoolType) ||
-                 PyObject_IsInstance(value, myIntType) )
-        {
-            int idx = m_poFeatureDefn->GetFieldIndex(osKey);
-            if( idx >= 0 )
-            {
-                poFeature->SetField(idx,
-                        static_cast<GIntBig>(PyInt_AsLong(value)) );
-            }
-        }
-        else if( PyObject_IsInstance(value, myFloatType) )
-        {
-            int idx = m_poFeatureDefn->GetFieldIndex(osKey);
-            if( idx >= 0 )
-            {
-                poFeature->SetField(idx, PyFloat_AsDouble(value) );
-            }
-        }
-        else
+        const int idx = m_poFeatureDefn->GetFieldIndex(osKey);
+        if( idx >= 0 && !SetFieldFromPyObject(poFeature, idx, value, oTypes) )
         {
-            int idx = m_poFeatureDefn->GetFieldIndex(osKey);
-            if( idx >= 0 &&
-                m_poFeatureDefn->GetFieldDefn(idx)->GetType() == OFTBinary )
-            {
-                Py_ssize_t nSize = PyBytes_Size(value);
-                const char* pszBytes = PyBytes_AsString(value);
-                poFeature->SetField(idx, static_cast<int>(nSize), const_cast<GByte*>(
-                        reinterpret_cast<const GByte*>(pszBytes)));
-                continue;
-            }
-
-            CPLString osValue = GetString(value);
-            if( ErrOccurredEmitCPLError() )
-            {
-                break;
-            }
-            if( idx >= 0 )
-            {
-                poFeature->SetField(idx, osValue);
-            }
+            break;
         }
     }
 
-    Py_DecRef(myBoolType);
-    Py_DecRef(myBool);
-    Py_DecRef(myIntType);
-    Py_DecRef(myInt);
-    Py_DecRef(myLongType);
-    Py_DecRef(myLong);
-    Py_DecRef(myFloatType);
-    Py_DecRef(myFloat);
-
     return poFeature;
 }
 
@@ -958,104 +1200,439 @@ void PythonPluginLayer::ResetReading()
     GIL_Holder oHolder(false);
 
     Py_DecRef(m_pyIterator);
-    m_pyIterator = PyObject_GetIter(m_poLayer);
+    m_pyIterator = nullptr;
+    if( m_bBatchIteration )
+    {
+        ReleaseBatch();
+        PyObject* poMethod = PyObject_GetAttrString(m_poLayer, "feature_batches");
+        PyObject* poBatches = CallPython(poMethod);
+        Py_DecRef(poMethod);
+        if( !ErrOccurredEmitCPLError() )
+            m_pyIterator = PyObject_GetIter(poBatches);
+        Py_DecRef(poBatches);
+    }
+    else
+    {
+        m_pyIterator = PyObject_GetIter(m_poLayer);
+    }
     CPL_IGNORE_RET_VAL(ErrOccurredEmitCPLError());
 }
 
 /************************************************************************/
-/*                          GetNextFeature()                            */
+/*                           ReleaseBatch()                             */
 /************************************************************************/
 
-OGRFeature* PythonPluginLayer::GetNextFeature()
+void PythonPluginLayer::ReleaseBatch()
 {
-    GIL_Holder oHolder(false);
+    // Must be called while holding the GIL
+    m_nBatchLength = 0;
+    m_iBatchRow = 0;
+    m_poBatchIds.reset();
+    m_poBatchStyles.reset();
+    m_aoBatchFields.clear();
+    m_aoBatchGeomFields.clear();
+    m_poBatchTypes.reset();
+}
 
-    if( m_bStopIteration )
-        return nullptr;
+/************************************************************************/
+/*                            LoadBatch()                               */
+/************************************************************************/
 
-    if( m_pyIterator == nullptr )
+bool PythonPluginLayer::LoadBatch(PyObject* poBatch)
+{
+    GetLayerDefn();
+
+    auto poLength = PyDict_GetItemString(poBatch, "length");
+    auto poIds = PyDict_GetItemString(poBatch, "ids");
+    auto poStyles = PyDict_GetItemString(poBatch, "styles");
+    auto poFields = PyDict_GetItemString(poBatch, "fields");
+    auto poFieldsSet = PyDict_GetItemString(poBatch, "fields_set");
+    auto poGeometryFields = PyDict_GetItemString(poBatch, "geometry_fields");
+    PyErr_Clear();
+
+    if( poLength == nullptr )
     {
-        ResetReading();
-        if( m_pyIterator == nullptr )
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "Feature batch should be a dictionary with a 'length' key");
+        return false;
+    }
+    const GIntBig nLength = PyLong_AsLongLong(poLength);
+    if( ErrOccurredEmitCPLError() )
+        return false;
+    if( nLength < 0 )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "Invalid feature batch length: " CPL_FRMT_GIB, nLength);
+        return false;
+    }
+    m_nBatchLength = static_cast<size_t>(nLength);
+    m_poBatchTypes.reset(new PythonTypes());
+
+    if( poIds && poIds != Py_None )
+    {
+        m_poBatchIds.reset(new PythonPluginBatchColumn());
+        if( !m_poBatchIds->Init(poIds, "ids") )
+            return false;
+        if( m_poBatchIds->GetCount() != m_nBatchLength )
         {
-            return nullptr;
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "ids should have %d values", static_cast<int>(m_nBatchLength));
+            return false;
         }
     }
 
-    while( true )
+    if( poStyles && poStyles != Py_None )
     {
-        PyObject* poRet = PyIter_Next(m_pyIterator);
-        if( poRet == nullptr )
+        m_poBatchStyles.reset(new PythonPluginBatchColumn());
+        if( !m_poBatchStyles->Init(poStyles, "styles") )
+            return false;
+        if( m_poBatchStyles->HasBuffer() ||
+            m_poBatchStyles->GetCount() != m_nBatchLength )
         {
-            m_bStopIteration = true;
-            CPL_IGNORE_RET_VAL( ErrOccurredEmitCPLError() );
-            return nullptr;
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "styles should be a sequence of %d values",
+                     static_cast<int>(m_nBatchLength));
+            return false;
         }
+    }
 
-        auto poFeature = TranslateToOGRFeature(poRet);
-        Py_DecRef(poRet);
-        if( poFeature == nullptr )
+    PyObject *key = nullptr;
+    PyObject *value = nullptr;
+    size_t pos = 0;
+    while ( poFields && poFields != Py_None &&
+            PyDict_Next(poFields, &pos, &key, &value))
+    {
+        CPLString osKey = GetString(key);
+        if( ErrOccurredEmitCPLError() )
+            return false;
+        const int idx = m_poFeatureDefn->GetFieldIndex(osKey);
+        if( idx < 0 )
+            continue;
+        BatchField oField;
+        oField.iField = idx;
+        oField.poValues.reset(new PythonPluginBatchColumn());
+        if( !oField.poValues->Init(value, osKey) )
+            return false;
+        if( oField.poValues->GetCount() != m_nBatchLength )
         {
-            return nullptr;
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "Column %s should have %d values",
+                     osKey.c_str(), static_cast<int>(m_nBatchLength));
+            return false;
         }
-
-        if( (m_bIteratorHonourSpatialFilter || m_poFilterGeom == nullptr
-            || FilterGeometry( poFeature->GetGeomFieldRef(m_iGeomFieldFilter) ) )
-            && (m_bIteratorHonourAttributeFilter || m_poAttrQuery == nullptr
-                || m_poAttrQuery->Evaluate( poFeature )) )
+        PyObject* poSet = nullptr;
+        if( poFieldsSet && poFieldsSet != Py_None )
         {
-            return poFeature;
+            poSet = PyDict_GetItemString(poFieldsSet, osKey);
+            PyErr_Clear();
         }
-
-        delete poFeature;
+        if( poSet && poSet != Py_None )
+        {
+            oField.poSet.reset(new PythonPluginBatchColumn());
+            if( !oField.poSet->Init(poSet, osKey) )
+                return false;
+            if( oField.poSet->GetCount() != m_nBatchLength )
+            {
+                CPLError(CE_Failure, CPLE_AppDefined,
+                         "Set mask of column %s should have %d values",
+                         osKey.c_str(), static_cast<int>(m_nBatchLength));
+                return false;
+            }
+        }
+        m_aoBatchFields.emplace_back(std::move(oField));
     }
-}
-
-/************************************************************************/
-/*                         GetLayerDefn()                               */
-/************************************************************************/
-
-OGRFeatureDefn* PythonPluginLayer::GetLayerDefn() 
-{
-    if( m_poFeatureDefn )
-        return m_poFeatureDefn;
 
-    GIL_Holder oHolder(false);
-    m_poFeatureDefn = new OGRFeatureDefn(GetName());
-    m_poFeatureDefn->Reference();
-    m_poFeatureDefn->SetGeomType(wkbNone);
+    pos = 0;
+    while ( poGeometryFields && poGeometryFields != Py_None &&
+            PyDict_Next(poGeometryFields, &pos, &key, &value))
+    {
+        CPLString osKey = GetString(key);
+        if( ErrOccurredEmitCPLError() )
+            return false;
+        const int idx = m_poFeatureDefn->GetGeomFieldIndex(osKey);
+        if( idx < 0 )
+            continue;
+        if( !PySequence_Check(value) || PySequence_Size(value) != 2 )
+        {
+            PyErr_Clear();
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "Geometry column %s should be a (wkb, offsets) tuple",
+                     osKey.c_str());
+            return false;
+        }
+        BatchGeomField oGeomField;
+        oGeomField.iGeomField = idx;
+        oGeomField.poWKB.reset(new PythonPluginBatchColumn());
+        oGeomField.poOffsets.reset(new PythonPluginBatchColumn());
+        PyObject* poWKB = PySequence_GetItem(value, 0);
+        PyObject* poOffsets = PySequence_GetItem(value, 1);
+        const bool bOK = oGeomField.poWKB->Init(poWKB, osKey) &&
+                         oGeomField.poOffsets->Init(poOffsets, osKey);
+        Py_DecRef(poWKB);
+        Py_DecRef(poOffsets);
+        if( !bOK )
+            return false;
+        if( !oGeomField.poWKB->IsBytes() )
+        {
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "Geometry column %s: WKB should be a bytes-like object",
+                     osKey.c_str());
+            return false;
+        }
+        if( oGeomField.poOffsets->GetCount() != m_nBatchLength + 1 )
+        {
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "Geometry column %s should have %d offsets",
+                     osKey.c_str(), static_cast<int>(m_nBatchLength + 1));
+            return false;
+        }
+        m_aoBatchGeomFields.emplace_back(std::move(oGeomField));
+    }
 
-    GetFields();
-    GetGeomFields();
-    return m_poFeatureDefn;
+    return true;
 }
 
 /************************************************************************/
-/*                           GetFields()                                */
+/*                      GetNextFeatureFromBatch()                       */
 /************************************************************************/
 
-void PythonPluginLayer::GetFields()
+OGRFeature* PythonPluginLayer::GetNextFeatureFromBatch()
 {
-    PyObject* poFields = PyObject_GetAttrString(m_poLayer, "fields" );
-    if( ErrOccurredEmitCPLError() )
-        return;
-    if( PyCallable_Check(poFields) )
+    while( m_iBatchRow >= m_nBatchLength )
     {
-        PyObject* poFieldsRes = CallPython(poFields);
-        if (ErrOccurredEmitCPLError())
+        ReleaseBatch();
+        PyObject* poBatch = PyIter_Next(m_pyIterator);
+        if( poBatch == nullptr )
         {
-            Py_DecRef(poFields);
-
-            return;
+            m_bStopIteration = true;
+            CPL_IGNORE_RET_VAL( ErrOccurredEmitCPLError() );
+            return nullptr;
+        }
+        const bool bOK = LoadBatch(poBatch);
+        Py_DecRef(poBatch);
+        if( !bOK )
+        {
+            ReleaseBatch();
+            m_bStopIteration = true;
+            return nullptr;
         }
-        Py_DecRef(poFields);
-        poFields = poFieldsRes;
     }
 
-    size_t nSize = PySequence_Size(poFields);
-    if( ErrOccurredEmitCPLError() )
-    {
-        Py_DecRef(poFields);
+    const size_t iRow = m_iBatchRow;
+    m_iBatchRow ++;
+
+    OGRFeature* poFeature = new OGRFeature(m_poFeatureDefn);
+    if( m_poBatchIds )
+    {
+        poFeature->SetFID(m_poBatchIds->GetInt64(iRow));
+    }
+
+    if( m_poBatchStyles )
+    {
+        PyObject* poStyle = m_poBatchStyles->GetItem(iRow);
+        if( poStyle && poStyle != Py_None )
+        {
+            CPLString osStyle = GetString(poStyle);
+            poFeature->SetStyleString(osStyle);
+        }
+        Py_DecRef(poStyle);
+        if( poStyle == nullptr || ErrOccurredEmitCPLError() )
+        {
+            delete poFeature;
+            m_bStopIteration = true;
+            return nullptr;
+        }
+    }
+
+    for( const auto& oField: m_aoBatchFields )
+    {
+        const int idx = oField.iField;
+        const auto& poColumn = oField.poValues;
+        // A false value of the set mask leaves the field unset
+        if( oField.poSet && oField.poSet->GetInt64(iRow) == 0 )
+        {
+            if( ErrOccurredEmitCPLError() )
+            {
+                delete poFeature;
+                m_bStopIteration = true;
+                return nullptr;
+            }
+            continue;
+        }
+        if( poColumn->HasBuffer() )
+        {
+            if( poColumn->IsInteger() &&
+                m_poFeatureDefn->GetFieldDefn(idx)->GetType() != OFTReal )
+            {
+                poFeature->SetField(idx, poColumn->GetInt64(iRow));
+            }
+            else
+            {
+                poFeature->SetField(idx, poColumn->GetDouble(iRow));
+            }
+        }
+        else
+        {
+            PyObject* poValue = poColumn->GetItem(iRow);
+            const bool bOK = poValue != nullptr &&
+                SetFieldFromPyObject(poFeature, idx, poValue, *m_poBatchTypes);
+            Py_DecRef(poValue);
+            if( !bOK || ErrOccurredEmitCPLError() )
+            {
+                delete poFeature;
+                m_bStopIteration = true;
+                return nullptr;
+            }
+        }
+    }
+
+    for( const auto& oGeomField: m_aoBatchGeomFields )
+    {
+        const GIntBig nStart = oGeomField.poOffsets->GetInt64(iRow);
+        const GIntBig nEnd = oGeomField.poOffsets->GetInt64(iRow + 1);
+        if( nStart < 0 || nEnd < nStart ||
+            static_cast<GUIntBig>(nEnd) > oGeomField.poWKB->GetCount() ||
+            nEnd - nStart > INT_MAX )
+        {
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "Invalid WKB offsets for feature %d of batch",
+                     static_cast<int>(iRow));
+            delete poFeature;
+            m_bStopIteration = true;
+            return nullptr;
+        }
+        if( nEnd == nStart )
+            continue;
+
+        OGRGeometry* poGeom = nullptr;
+        const auto poGeomFieldDefn =
+            m_poFeatureDefn->GetGeomFieldDefn(oGeomField.iGeomField);
+        if( OGRGeometryFactory::createFromWkb(
+                oGeomField.poWKB->GetData() + nStart, nullptr, &poGeom,
+                static_cast<int>(nEnd - nStart)) != OGRERR_NONE ||
+            poGeom == nullptr )
+        {
+            delete poGeom;
+            CPLError(CE_Warning, CPLE_AppDefined,
+                     "Invalid WKB for geometry field %s of feature " CPL_FRMT_GIB
+                     " (row %d of batch). Geometry ignored",
+                     poGeomFieldDefn->GetNameRef(), poFeature->GetFID(),
+                     static_cast<int>(iRow));
+            continue;
+        }
+        poGeom->assignSpatialReference(poGeomFieldDefn->GetSpatialRef());
+        poFeature->SetGeomFieldDirectly(oGeomField.iGeomField, poGeom);
+    }
+
+    return poFeature;
+}
+
+/************************************************************************/
+/*                          GetNextFeature()                            */
+/************************************************************************/
+
+OGRFeature* PythonPluginLayer::GetNextFeature()
+{
+    GIL_Holder oHolder(false);
+
+    if( m_bStopIteration )
+        return nullptr;
+
+    if( m_pyIterator == nullptr )
+    {
+        ResetReading();
+        if( m_pyIterator == nullptr )
+        {
+            return nullptr;
+        }
+    }
+
+    while( true )
+    {
+        OGRFeature* poFeature = nullptr;
+        if( m_bBatchIteration )
+        {
+            poFeature = GetNextFeatureFromBatch();
+            if( poFeature == nullptr )
+            {
+                return nullptr;
+            }
+        }
+        else
+        {
+            PyObject* poRet = PyIter_Next(m_pyIterator);
+            if( poRet == nullptr )
+            {
+                m_bStopIteration = true;
+                CPL_IGNORE_RET_VAL( ErrOccurredEmitCPLError() );
+                return nullptr;
+            }
+
+            poFeature = TranslateToOGRFeature(poRet);
+            Py_DecRef(poRet);
+            if( poFeature == nullptr )
+            {
+                return nullptr;
+            }
+        }
+
+        if( (m_bIteratorHonourSpatialFilter || m_poFilterGeom == nullptr
+            || FilterGeometry( poFeature->GetGeomFieldRef(m_iGeomFieldFilter) ) )
+            && (m_bIteratorHonourAttributeFilter || m_poAttrQuery == nullptr
+                || m_poAttrQuery->Evaluate( poFeature )) )
+        {
+            return poFeature;
+        }
+
+        delete poFeature;
+    }
+}
+
+/************************************************************************/
+/*                         GetLayerDefn()                               */
+/************************************************************************/
+
+OGRFeatureDefn* PythonPluginLayer::GetLayerDefn() 
+{
+    if( m_poFeatureDefn )
+        return m_poFeatureDefn;
+
+    GIL_Holder oHolder(false);
+    m_poFeatureDefn = new OGRFeatureDefn(GetName());
+    m_poFeatureDefn->Reference();
+    m_poFeatureDefn->SetGeomType(wkbNone);
+
+    GetFields();
+    GetGeomFields();
+    return m_poFeatureDefn;
+}
+
+/************************************************************************/
+/*                           GetFields()                                */
+/************************************************************************/
+
+void PythonPluginLayer::GetFields()
+{
+    PyObject* poFields = PyObject_GetAttrString(m_poLayer, "fields" );
+    if( ErrOccurredEmitCPLError() )
+        return;
+    if( PyCallable_Check(poFields) )
+    {
+        PyObject* poFieldsRes = CallPython(poFields);
+        if (ErrOccurredEmitCPLError())
+        {
+            Py_DecRef(poFields);
+
+            return;
+        }
+        Py_DecRef(poFields);
+        poFields = poFieldsRes;
+    }
+
+    size_t nSize = PySequence_Size(poFields);
+    if( ErrOccurredEmitCPLError() )
+    {
+        Py_DecRef(poFields);
 
         return;
     }
@@ -1387,39 +1964,547 @@ char** PythonPluginLayer::GetMetadata(const char* pszDomain)
     return m_oMapMD[pszDomain].List();
 }
 
+/************************************************************************/
+/*                        GetAttrOrMethodRes()                          */
+/************************************************************************/
+
+// Returns a new reference on the value of the pszName attribute of poObj,
+// or on the result of calling it without argument if it is a method.
+// Returns nullptr if the attribute does not exist (without error) or if an
+// exception occurred (with a CPLError()).
+static PyObject* GetAttrOrMethodRes(PyObject* poObj, const char* pszName)
+{
+    if( !PyObject_HasAttrString(poObj, pszName) )
+        return nullptr;
+    PyObject* poAttr = PyObject_GetAttrString(poObj, pszName);
+    if( poAttr == nullptr || ErrOccurredEmitCPLError() )
+        return nullptr;
+    if( !PyCallable_Check(poAttr) )
+        return poAttr;
+    PyObject* poRes = CallPython(poAttr);
+    Py_DecRef(poAttr);
+    if( ErrOccurredEmitCPLError() )
+    {
+        Py_DecRef(poRes);
+        return nullptr;
+    }
+    return poRes;
+}
+
+/************************************************************************/
+/*                         PythonPluginBuffer                           */
+/************************************************************************/
+
+// Read-only access to the content of a Python object implementing the
+// buffer protocol (NumPy array, array.array, bytes, memoryview, ...)
+// Must be instantiated and destroyed while holding the GIL.
+class PythonPluginBuffer
+{
+        Py_buffer m_sBuffer{};
+        bool m_bHasBuffer = false;
+        const GByte* m_pabyData = nullptr;
+        size_t m_nSize = 0;
+
+        PythonPluginBuffer(const PythonPluginBuffer&) = delete;
+        PythonPluginBuffer& operator= (const PythonPluginBuffer&) = delete;
+
+    public:
+        PythonPluginBuffer() = default;
+        ~PythonPluginBuffer();
+
+        bool Init(PyObject* poObj, const char* pszMethodName);
+
+        const GByte* GetData() const { return m_pabyData; }
+        size_t GetSize() const { return m_nSize; }
+};
+
+/************************************************************************/
+/*                        ~PythonPluginBuffer()                         */
+/************************************************************************/
+
+PythonPluginBuffer::~PythonPluginBuffer()
+{
+    if( m_bHasBuffer )
+        PyBuffer_Release(&m_sBuffer);
+}
+
+/************************************************************************/
+/*                                Init()                                */
+/************************************************************************/
+
+bool PythonPluginBuffer::Init(PyObject* poObj, const char* pszMethodName)
+{
+    if( PyObject_GetBuffer != nullptr &&
+        PyObject_GetBuffer(poObj, &m_sBuffer, PyBUF_C_CONTIGUOUS) == 0 )
+    {
+        m_bHasBuffer = true;
+        const auto psHeader =
+            reinterpret_cast<const Py_buffer_header*>(&m_sBuffer);
+        m_pabyData = static_cast<const GByte*>(psHeader->buf);
+        m_nSize = static_cast<size_t>(psHeader->len);
+        return true;
+    }
+    PyErr_Clear();
+
+    // Python 2 str, or objects without support for the buffer protocol
+    const char* pszBytes = PyBytes_AsString(poObj);
+    if( pszBytes == nullptr || PyErr_Occurred() )
+    {
+        PyErr_Clear();
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "%s() should return a C-contiguous object implementing "
+                 "the buffer protocol", pszMethodName);
+        return false;
+    }
+    m_pabyData = reinterpret_cast<const GByte*>(pszBytes);
+    m_nSize = static_cast<size_t>(PyBytes_Size(poObj));
+    return true;
+}
+
+/************************************************************************/
+/*                      CreateWritableMemoryView()                      */
+/************************************************************************/
+
+#define PyBUF_WRITABLE 0x0001
+#define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
+#define PyBUF_FULL (PyBUF_INDIRECT | PyBUF_WRITABLE | PyBUF_FORMAT)
+
+static PyObject* CreateWritableMemoryView(void* pBuffer, size_t nSize)
+{
+    if( PyBuffer_FromReadWriteMemory )
+    {
+        // Python 2
+        return PyBuffer_FromReadWriteMemory(pBuffer, nSize);
+    }
+
+    // Python 3
+    Py_buffer pybuffer;
+    if( PyBuffer_FillInfo(&pybuffer, nullptr, static_cast<char*>(pBuffer),
+                          nSize, 0, PyBUF_FULL) != 0 )
+    {
+        return nullptr;
+    }
+    return PyMemoryView_FromBuffer(&pybuffer);
+}
+
 /************************************************************************/
 /*                         PythonPluginDataset                          */
 /************************************************************************/
 
 class PythonPluginDataset final: public GDALDataset
 {
+        friend class PythonPluginRasterBand;
+
         PyObject* m_poDataset = nullptr;
         std::map<int, std::unique_ptr<OGRLayer>> m_oMapLayer{};
         std::map<CPLString, CPLStringList> m_oMapMD{};
         bool m_bHasLayersMember = false;
+        std::recursive_mutex& m_oPluginMutex;
+        bool m_bThreadSafe = false;
+        bool m_bGeoTransformValid = false;
+        double m_adfGeoTransform[6];
+        OGRSpatialReference m_oSRS{};
 
         PythonPluginDataset(const PythonPluginDataset&) = delete;
         PythonPluginDataset& operator= (const PythonPluginDataset&) = delete;
 
+        void InitRaster();
+
+        // Serializes the calls to the raster methods of the plugin, unless
+        // it declares itself as thread-safe.
+        std::unique_lock<std::recursive_mutex> LockPlugin()
+        {
+            return m_bThreadSafe ?
+                std::unique_lock<std::recursive_mutex>() :
+                std::unique_lock<std::recursive_mutex>(m_oPluginMutex);
+        }
+
     public:
 
-        PythonPluginDataset(GDALOpenInfo *poOpenInfo, PyObject* poDataset);
+        PythonPluginDataset(GDALOpenInfo *poOpenInfo, PyObject* poDataset,
+                            std::recursive_mutex& oPluginMutex);
         ~PythonPluginDataset();
 
         int GetLayerCount() override;
         OGRLayer* GetLayer(int) override;
         char** GetMetadata(const char* pszDomain = "") override;
+
+        CPLErr GetGeoTransform(double* padfTransform) override;
+        const OGRSpatialReference* GetSpatialRef() const override;
 };
 
+/************************************************************************/
+/*                       PythonPluginRasterBand                         */
+/************************************************************************/
+
+class PythonPluginRasterBand final: public GDALRasterBand
+{
+        PyObject* m_poBand = nullptr;
+        bool m_bHasReadBlockInto = false;
+        bool m_bHasReadWindow = false;
+        bool m_bNoDataValueSet = false;
+        double m_dfNoDataValue = 0.0;
+
+        PythonPluginRasterBand(const PythonPluginRasterBand&) = delete;
+        PythonPluginRasterBand& operator= (const PythonPluginRasterBand&) = delete;
+
+        CPLErr ReadWindow(int nXOff, int nYOff, int nXSize, int nYSize,
+                          void* pData, GDALDataType eBufType,
+                          GSpacing nPixelSpace, GSpacing nLineSpace);
+
+    protected:
+        CPLErr IReadBlock(int nBlockXOff, int nBlockYOff,
+                          void* pImage) override;
+        CPLErr IRasterIO(GDALRWFlag eRWFlag,
+                         int nXOff, int nYOff, int nXSize, int nYSize,
+                         void* pData, int nBufXSize, int nBufYSize,
+                         GDALDataType eBufType,
+                         GSpacing nPixelSpace, GSpacing nLineSpace,
+                         GDALRasterIOExtraArg* psExtraArg) override;
+
+    public:
+        PythonPluginRasterBand(PythonPluginDataset* poDSIn, int nBandIn,
+                               PyObject* poBand);
+        ~PythonPluginRasterBand();
+
+        double GetNoDataValue(int* pbSuccess = nullptr) override;
+};
+
+/************************************************************************/
+/*                      PythonPluginRasterBand()                        */
+/************************************************************************/
+
+// Must be called while holding the GIL
+PythonPluginRasterBand::PythonPluginRasterBand(PythonPluginDataset* poDSIn,
+                                               int nBandIn,
+                                               PyObject* poBand) :
+    m_poBand(poBand)
+{
+    poDS = poDSIn;
+    nBand = nBandIn;
+    nRasterXSize = poDSIn->GetRasterXSize();
+    nRasterYSize = poDSIn->GetRasterYSize();
+    eAccess = GA_ReadOnly;
+
+    eDataType = GDT_Byte;
+    PyObject* poDataType = GetAttrOrMethodRes(m_poBand, "data_type");
+    if( poDataType )
+    {
+        const int nDataType = static_cast<int>(PyInt_AsLong(poDataType));
+        if( PyErr_Occurred() )
+        {
+            PyErr_Clear();
+            const CPLString osDataType = GetString(poDataType);
+            if( !ErrOccurredEmitCPLError() )
+            {
+                eDataType = GDALGetDataTypeByName(osDataType);
+                if( eDataType == GDT_Unknown )
+                {
+                    CPLError(CE_Warning, CPLE_AppDefined,
+                             "Band %d: unsupported data_type %s. "
+                             "Using Byte instead",
+                             nBand, osDataType.c_str());
+                    eDataType = GDT_Byte;
+                }
+            }
+        }
+        else if( nDataType > GDT_Unknown && nDataType < GDT_TypeCount )
+        {
+            eDataType = static_cast<GDALDataType>(nDataType);
+        }
+        Py_DecRef(poDataType);
+    }
+
+    nBlockXSize = nRasterXSize;
+    nBlockYSize = 1;
+    PyObject* poBlockXSize = GetAttrOrMethodRes(m_poBand, "block_x_size");
+    if( poBlockXSize )
+    {
+        nBlockXSize = static_cast<int>(PyInt_AsLong(poBlockXSize));
+        Py_DecRef(poBlockXSize);
+    }
+    PyObject* poBlockYSize = GetAttrOrMethodRes(m_poBand, "block_y_size");
+    if( poBlockYSize )
+    {
+        nBlockYSize = static_cast<int>(PyInt_AsLong(poBlockYSize));
+        Py_DecRef(poBlockYSize);
+    }
+    if( ErrOccurredEmitCPLError() || nBlockXSize <= 0 || nBlockYSize <= 0 )
+    {
+        CPLError(CE_Warning, CPLE_AppDefined,
+                 "Band %d: invalid block size. Using scanline blocks instead",
+                 nBand);
+        nBlockXSize = nRasterXSize;
+        nBlockYSize = 1;
+    }
+
+    PyObject* poNoData = GetAttrOrMethodRes(m_poBand, "nodata");
+    if( poNoData )
+    {
+        if( poNoData != Py_None )
+        {
+            m_dfNoDataValue = PyFloat_AsDouble(poNoData);
+            m_bNoDataValueSet = !ErrOccurredEmitCPLError();
+        }
+        Py_DecRef(poNoData);
+    }
+
+    m_bHasReadBlockInto =
+        PyObject_HasAttrString(m_poBand, "read_block_into") != 0;
+    m_bHasReadWindow = PyObject_HasAttrString(m_poBand, "read_window") != 0;
+    if( !m_bHasReadBlockInto &&
+        !PyObject_HasAttrString(m_poBand, "read_block") )
+    {
+        CPLError(CE_Warning, CPLE_AppDefined,
+                 "Band %d: neither read_block() nor read_block_into() "
+                 "is defined", nBand);
+    }
+}
+
+/************************************************************************/
+/*                      ~PythonPluginRasterBand()                       */
+/************************************************************************/
+
+PythonPluginRasterBand::~PythonPluginRasterBand()
+{
+    GIL_Holder oHolder(false);
+    Py_DecRef(m_poBand);
+}
+
+/************************************************************************/
+/*                           GetNoDataValue()                           */
+/************************************************************************/
+
+double PythonPluginRasterBand::GetNoDataValue(int* pbSuccess)
+{
+    if( pbSuccess )
+        *pbSuccess = m_bNoDataValueSet;
+    return m_dfNoDataValue;
+}
+
+/************************************************************************/
+/*                            IReadBlock()                              */
+/************************************************************************/
+
+CPLErr PythonPluginRasterBand::IReadBlock(int nBlockXOff, int nBlockYOff,
+                                          void* pImage)
+{
+    const int nDTSize = GDALGetDataTypeSizeBytes(eDataType);
+    const size_t nBlockBytes =
+        static_cast<size_t>(nBlockXSize) * nBlockYSize * nDTSize;
+
+    auto poGDS = cpl::down_cast<PythonPluginDataset*>(poDS);
+    auto oLock = poGDS->LockPlugin();
+    GIL_Holder oHolder(false);
+
+    PyObject* pyArgs = PyTuple_New(m_bHasReadBlockInto ? 3 : 2);
+    PyTuple_SetItem(pyArgs, 0, PyInt_FromLong(nBlockXOff));
+    PyTuple_SetItem(pyArgs, 1, PyInt_FromLong(nBlockYOff));
+    if( m_bHasReadBlockInto )
+    {
+        // The plugin writes directly into the block cache
+        PyObject* poView = CreateWritableMemoryView(pImage, nBlockBytes);
+        if( poView == nullptr )
+        {
+            Py_DecRef(pyArgs);
+            CPL_IGNORE_RET_VAL( ErrOccurredEmitCPLError() );
+            return CE_Failure;
+        }
+        PyTuple_SetItem(pyArgs, 2, poView);
+    }
+
+    const char* pszMethodName =
+        m_bHasReadBlockInto ? "read_block_into" : "read_block";
+    PyObject* poMethod = PyObject_GetAttrString(m_poBand, pszMethodName);
+    if( poMethod == nullptr || PyErr_Occurred() )
+    {
+        Py_DecRef(pyArgs);
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "%s", GetPyExceptionString().c_str());
+        return CE_Failure;
+    }
+    PyObject* poMethodRes = PyObject_Call(poMethod, pyArgs, nullptr);
+    Py_DecRef(pyArgs);
+    Py_DecRef(poMethod);
+    if( ErrOccurredEmitCPLError() )
+    {
+        Py_DecRef(poMethodRes);
+        return CE_Failure;
+    }
+    if( m_bHasReadBlockInto )
+    {
+        Py_DecRef(poMethodRes);
+        return CE_None;
+    }
+
+    CPLErr eErr = CE_None;
+    {
+        PythonPluginBuffer oBuffer;
+        if( !oBuffer.Init(poMethodRes, pszMethodName) )
+        {
+            eErr = CE_Failure;
+        }
+        else if( oBuffer.GetSize() == nBlockBytes )
+        {
+            memcpy(pImage, oBuffer.GetData(), nBlockBytes);
+        }
+        else
+        {
+            // Right-most and bottom-most blocks may be returned without
+            // their padding.
+            int nXValid = 0;
+            int nYValid = 0;
+            GetActualBlockSize(nBlockXOff, nBlockYOff, &nXValid, &nYValid);
+            const size_t nValidLineBytes =
+                static_cast<size_t>(nXValid) * nDTSize;
+            if( oBuffer.GetSize() != nValidLineBytes * nYValid )
+            {
+                CPLError(CE_Failure, CPLE_AppDefined,
+                         "Band %d: %s(%d, %d) returned " CPL_FRMT_GUIB
+                         " bytes, whereas " CPL_FRMT_GUIB " were expected",
+                         nBand, pszMethodName, nBlockXOff, nBlockYOff,
+                         static_cast<GUIntBig>(oBuffer.GetSize()),
+                         static_cast<GUIntBig>(nBlockBytes));
+                eErr = CE_Failure;
+            }
+            else
+            {
+                memset(pImage, 0, nBlockBytes);
+                const size_t nBlockLineBytes =
+                    static_cast<size_t>(nBlockXSize) * nDTSize;
+                for( int iY = 0; iY < nYValid; iY++ )
+                {
+                    memcpy(static_cast<GByte*>(pImage) + iY * nBlockLineBytes,
+                           oBuffer.GetData() + iY * nValidLineBytes,
+                           nValidLineBytes);
+                }
+            }
+        }
+    }
+    Py_DecRef(poMethodRes);
+    return eErr;
+}
+
+/************************************************************************/
+/*                            ReadWindow()                              */
+/************************************************************************/
+
+CPLErr PythonPluginRasterBand::ReadWindow(int nXOff, int nYOff,
+                                          int nXSize, int nYSize,
+                                          void* pData, GDALDataType eBufType,
+                                          GSpacing nPixelSpace,
+                                          GSpacing nLineSpace)
+{
+    auto poGDS = cpl::down_cast<PythonPluginDataset*>(poDS);
+    auto oLock = poGDS->LockPlugin();
+    GIL_Holder oHolder(false);
+
+    PyObject* poMethod = PyObject_GetAttrString(m_poBand, "read_window");
+    if( poMethod == nullptr || PyErr_Occurred() )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "%s", GetPyExceptionString().c_str());
+        return CE_Failure;
+    }
+    PyObject* pyArgs = PyTuple_New(4);
+    PyTuple_SetItem(pyArgs, 0, PyInt_FromLong(nXOff));
+    PyTuple_SetItem(pyArgs, 1, PyInt_FromLong(nYOff));
+    PyTuple_SetItem(pyArgs, 2, PyInt_FromLong(nXSize));
+    PyTuple_SetItem(pyArgs, 3, PyInt_FromLong(nYSize));
+    PyObject* poMethodRes = PyObject_Call(poMethod, pyArgs, nullptr);
+    Py_DecRef(pyArgs);
+    Py_DecRef(poMethod);
+    if( ErrOccurredEmitCPLError() )
+    {
+        Py_DecRef(poMethodRes);
+        return CE_Failure;
+    }
+
+    CPLErr eErr = CE_None;
+    {
+        PythonPluginBuffer oBuffer;
+        const int nDTSize = GDALGetDataTypeSizeBytes(eDataType);
+        const size_t nLineBytes = static_cast<size_t>(nXSize) * nDTSize;
+        if( !oBuffer.Init(poMethodRes, "read_window") )
+        {
+            eErr = CE_Failure;
+        }
+        else if( oBuffer.GetSize() != nLineBytes * nYSize )
+        {
+            CPLError(CE_Failure, CPLE_AppDefined,
+                     "Band %d: read_window(%d, %d, %d, %d) returned "
+                     CPL_FRMT_GUIB " bytes, whereas " CPL_FRMT_GUIB
+                     " were expected",
+                     nBand, nXOff, nYOff, nXSize, nYSize,
+                     static_cast<GUIntBig>(oBuffer.GetSize()),
+                     static_cast<GUIntBig>(nLineBytes * nYSize));
+            eErr = CE_Failure;
+        }
+        else
+        {
+            for( int iY = 0; iY < nYSize; iY++ )
+            {
+                GDALCopyWords(oBuffer.GetData() + iY * nLineBytes,
+                              eDataType, nDTSize,
+                              static_cast<GByte*>(pData) + iY * nLineSpace,
+                              eBufType, static_cast<int>(nPixelSpace),
+                              nXSize);
+            }
+        }
+    }
+    Py_DecRef(poMethodRes);
+    return eErr;
+}
+
+/************************************************************************/
+/*                             IRasterIO()                              */
+/************************************************************************/
+
+CPLErr PythonPluginRasterBand::IRasterIO(GDALRWFlag eRWFlag,
+                                         int nXOff, int nYOff,
+                                         int nXSize, int nYSize,
+                                         void* pData,
+                                         int nBufXSize, int nBufYSize,
+                                         GDALDataType eBufType,
+                                         GSpacing nPixelSpace,
+                                         GSpacing nLineSpace,
+                                         GDALRasterIOExtraArg* psExtraArg)
+{
+    // Requests at full resolution spanning several blocks are forwarded
+    // in one call to read_window(), if the plugin implements it.
+    if( eRWFlag == GF_Read && m_bHasReadWindow &&
+        nXSize == nBufXSize && nYSize == nBufYSize &&
+        nPixelSpace <= INT_MAX &&
+        (nXOff / nBlockXSize != (nXOff + nXSize - 1) / nBlockXSize ||
+         nYOff / nBlockYSize != (nYOff + nYSize - 1) / nBlockYSize) )
+    {
+        return ReadWindow(nXOff, nYOff, nXSize, nYSize,
+                          pData, eBufType, nPixelSpace, nLineSpace);
+    }
+    return GDALRasterBand::IRasterIO(eRWFlag, nXOff, nYOff, nXSize, nYSize,
+                                     pData, nBufXSize, nBufYSize,
+                                     eBufType, nPixelSpace, nLineSpace,
+                                     psExtraArg);
+}
+
 /************************************************************************/
 /*                         PythonPluginDataset()                        */
 /************************************************************************/
 
 PythonPluginDataset::PythonPluginDataset(GDALOpenInfo *poOpenInfo,
-                                         PyObject* poDataset) :
-    m_poDataset(poDataset)
+                                         PyObject* poDataset,
+                                         std::recursive_mutex& oPluginMutex) :
+    m_poDataset(poDataset),
+    m_oPluginMutex(oPluginMutex)
 {
     SetDescription( poOpenInfo->pszFilename );
+    m_oSRS.SetAxisMappingStrategy(OAMS_TRADITIONAL_GIS_ORDER);
+    m_adfGeoTransform[0] = 0.0;
+    m_adfGeoTransform[1] = 1.0;
+    m_adfGeoTransform[2] = 0.0;
+    m_adfGeoTransform[3] = 0.0;
+    m_adfGeoTransform[4] = 0.0;
+    m_adfGeoTransform[5] = 1.0;
 
     GIL_Holder oHolder(false);
 
@@ -1441,6 +2526,113 @@ PythonPluginDataset::PythonPluginDataset(GDALOpenInfo *poOpenInfo,
         }
         Py_DecRef(poLayers);
     }
+
+    if( PyObject_HasAttrString(m_poDataset, "raster_x_size") )
+        InitRaster();
+}
+
+/************************************************************************/
+/*                            InitRaster()                              */
+/************************************************************************/
+
+// Must be called while holding the GIL
+void PythonPluginDataset::InitRaster()
+{
+    PyObject* poThreadSafe = GetAttrOrMethodRes(m_poDataset, "thread_safe");
+    if( poThreadSafe )
+    {
+        m_bThreadSafe = PyInt_AsLong(poThreadSafe) != 0;
+        CPL_IGNORE_RET_VAL( ErrOccurredEmitCPLError() );
+        Py_DecRef(poThreadSafe);
+    }
+
+    PyObject* poXSize = GetAttrOrMethodRes(m_poDataset, "raster_x_size");
+    PyObject* poYSize = GetAttrOrMethodRes(m_poDataset, "raster_y_size");
+    const int nXSize = poXSize ? static_cast<int>(PyInt_AsLong(poXSize)) : 0;
+    const int nYSize = poYSize ? static_cast<int>(PyInt_AsLong(poYSize)) : 0;
+    Py_DecRef(poXSize);
+    Py_DecRef(poYSize);
+    if( ErrOccurredEmitCPLError() ||
+        !GDALCheckDatasetDimensions(nXSize, nYSize) )
+    {
+        return;
+    }
+    nRasterXSize = nXSize;
+    nRasterYSize = nYSize;
+
+    PyObject* poGT = GetAttrOrMethodRes(m_poDataset, "geotransform");
+    if( poGT && poGT != Py_None )
+    {
+        if( PySequence_Check(poGT) && PySequence_Size(poGT) == 6 )
+        {
+            m_bGeoTransformValid = true;
+            for( int i = 0; i < 6; i++ )
+            {
+                PyObject* poVal = PySequence_GetItem(poGT, i);
+                m_adfGeoTransform[i] = PyFloat_AsDouble(poVal);
+                Py_DecRef(poVal);
+            }
+            if( ErrOccurredEmitCPLError() )
+                m_bGeoTransformValid = false;
+        }
+        else
+        {
+            CPLError(CE_Warning, CPLE_AppDefined,
+                     "geotransform should be a sequence of 6 values");
+        }
+    }
+    Py_DecRef(poGT);
+
+    PyObject* poSRS = GetAttrOrMethodRes(m_poDataset, "srs");
+    if( poSRS && poSRS != Py_None )
+    {
+        const CPLString osSRS = GetString(poSRS);
+        if( !ErrOccurredEmitCPLError() && !osSRS.empty() &&
+            m_oSRS.SetFromUserInput(osSRS) != OGRERR_NONE )
+        {
+            CPLError(CE_Warning, CPLE_AppDefined,
+                     "Cannot interpret srs %s", osSRS.c_str());
+            m_oSRS.Clear();
+        }
+    }
+    Py_DecRef(poSRS);
+
+    PyObject* poBands = GetAttrOrMethodRes(m_poDataset, "bands");
+    if( poBands && PySequence_Check(poBands) )
+    {
+        const int nBandCount = static_cast<int>(PySequence_Size(poBands));
+        for( int i = 0; i < nBandCount; i++ )
+        {
+            // PySequence_GetItem() returns a new reference, owned by the band
+            PyObject* poBand = PySequence_GetItem(poBands, i);
+            SetBand(i + 1, new PythonPluginRasterBand(this, i + 1, poBand));
+        }
+    }
+    else if( poBands )
+    {
+        CPLError(CE_Warning, CPLE_AppDefined,
+                 "bands should be a sequence of band objects");
+    }
+    Py_DecRef(poBands);
+}
+
+/************************************************************************/
+/*                          GetGeoTransform()                           */
+/************************************************************************/
+
+CPLErr PythonPluginDataset::GetGeoTransform(double* padfTransform)
+{
+    memcpy(padfTransform, m_adfGeoTransform, sizeof(m_adfGeoTransform));
+    return m_bGeoTransformValid ? CE_None : CE_Failure;
+}
+
+/************************************************************************/
+/*                           GetSpatialRef()                            */
+/************************************************************************/
+
+const OGRSpatialReference* PythonPluginDataset::GetSpatialRef() const
+{
+    return m_oSRS.IsEmpty() ? nullptr : &m_oSRS;
 }
 
 /************************************************************************/
@@ -1544,6 +2736,8 @@ class PythonPluginDriver: public GDALDriver
         CPLMutex* m_hMutex = nullptr;
         CPLString m_osFilename;
         PyObject* m_poPlugin = nullptr;
+        // Serializes raster calls to plugins that are not thread-safe
+        std::recursive_mutex m_oRasterMutex{};
 
         PythonPluginDriver(const PythonPluginDriver&) = delete;
         PythonPluginDriver& operator= (const PythonPluginDriver&) = delete;
@@ -1762,7 +2956,7 @@ GDALDataset* PythonPluginDriver::Open(GDALOpenInfo *poOpenInfo)
         Py_DecRef(poMethodRes);
         return nullptr;
     }
-    return new PythonPluginDataset(poOpenInfo, poMethodRes);
+    return new PythonPluginDataset(poOpenInfo, poMethodRes, m_oRasterMutex);
 }
 
 /************************************************************************/
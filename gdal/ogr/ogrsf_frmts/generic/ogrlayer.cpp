@@ -39,6 +39,7 @@ CPL_CVSID("$Id$")
 struct OGRLayer::Private
 {
     bool         m_bInFeatureIterator = false;
+    std::shared_ptr<bool> m_poLifetimeToken = std::make_shared<bool>(true);
 };
 
 /************************************************************************/
@@ -100,6 +101,15 @@ OGRLayer::~OGRLayer()
     }
 }
 
+/************************************************************************/
+/*                          GetLifetimeToken()                          */
+/************************************************************************/
+
+std::weak_ptr<bool> OGRLayer::GetLifetimeToken() const
+{
+    return m_poPrivate->m_poLifetimeToken;
+}
+
 /************************************************************************/
 /*                             Reference()                              */
 /************************************************************************/
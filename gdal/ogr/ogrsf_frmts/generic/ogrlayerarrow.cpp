@@ -0,0 +1,925 @@
+/******************************************************************************
+ *
+ * Project:  OpenGIS Simple Features Reference Implementation
+ * Purpose:  Generic implementation of OGRLayer::GetArrowStream()
+ *
+ ******************************************************************************
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a
+ * copy of this software and associated documentation files (the "Software"),
+ * to deal in the Software without restriction, including without limitation
+ * the rights to use, copy, modify, merge, publish, distribute, sublicense,
+ * and/or sell copies of the Software, and to permit persons to whom the
+ * Software is furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included
+ * in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+ * OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+ * THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+ * FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+ * DEALINGS IN THE SOFTWARE.
+ ****************************************************************************/
+
+#include "ogrsf_frmts.h"
+#include "ogr_api.h"
+#include "ogr_recordbatch.h"
+#include "cpl_time.h"
+
+#include <algorithm>
+#include <cerrno>
+#include <cmath>
+#include <cstring>
+#include <limits>
+#include <memory>
+#include <string>
+#include <vector>
+
+CPL_CVSID("$Id$")
+
+constexpr int DEFAULT_MAX_FEATURES_IN_BATCH = 65536;
+
+// Alignment recommended by the Arrow specification
+constexpr size_t ARROW_BUFFER_ALIGNMENT = 64;
+
+/************************************************************************/
+/*                       OGRLayerArrowStreamPrivate                     */
+/************************************************************************/
+
+namespace {
+
+struct OGRLayerArrowStreamPrivate
+{
+    OGRLayer         *poLayer = nullptr;
+    // Expired once poLayer is destroyed, e.g. when its dataset is closed
+    std::weak_ptr<bool> poLayerLifetime{};
+    int               nMaxFeaturesInBatch = DEFAULT_MAX_FEATURES_IN_BATCH;
+    bool              bIncludeFID = true;
+    std::string       osFIDName{};
+    std::vector<int>  anFields{};
+    std::vector<int>  anGeomFields{};
+    std::string       osLastError{};
+};
+
+/************************************************************************/
+/*                          IsLayerAlive()                              */
+/************************************************************************/
+
+bool IsLayerAlive( OGRLayerArrowStreamPrivate* psPrivate )
+{
+    if( psPrivate->poLayerLifetime.expired() )
+    {
+        psPrivate->osLastError =
+            "The layer of the stream has been destroyed, "
+            "probably because its dataset has been closed";
+        return false;
+    }
+    return true;
+}
+
+} // namespace
+
+/************************************************************************/
+/*                          Schema management                           */
+/************************************************************************/
+
+static void OGRArrowReleaseSchema( struct ArrowSchema* schema )
+{
+    for( int64_t i = 0; i < schema->n_children; i++ )
+    {
+        if( schema->children[i]->release )
+            schema->children[i]->release(schema->children[i]);
+        CPLFree(schema->children[i]);
+    }
+    CPLFree(schema->children);
+    CPLFree(const_cast<char*>(schema->format));
+    CPLFree(const_cast<char*>(schema->name));
+    CPLFree(const_cast<char*>(schema->metadata));
+    schema->release = nullptr;
+}
+
+static void OGRArrowInitSchema( struct ArrowSchema* schema,
+                                const char* pszFormat,
+                                const char* pszName,
+                                bool bNullable )
+{
+    memset(schema, 0, sizeof(*schema));
+    schema->format = CPLStrdup(pszFormat);
+    schema->name = CPLStrdup(pszName);
+    schema->flags = bNullable ? ARROW_FLAG_NULLABLE : 0;
+    schema->release = OGRArrowReleaseSchema;
+}
+
+static void OGRArrowAllocChildren( struct ArrowSchema* schema, int nChildren )
+{
+    schema->n_children = nChildren;
+    schema->children = static_cast<struct ArrowSchema**>(
+        CPLCalloc(std::max(nChildren, 1), sizeof(struct ArrowSchema*)));
+    for( int i = 0; i < nChildren; i++ )
+    {
+        schema->children[i] = static_cast<struct ArrowSchema*>(
+            CPLCalloc(1, sizeof(struct ArrowSchema)));
+    }
+}
+
+/* Metadata is encoded as: int32 number of pairs, then for each pair the */
+/* int32 length of the key, the key, the int32 length of the value, and */
+/* the value. */
+static char* OGRArrowEncodeMetadata( const char* pszKey, const char* pszValue )
+{
+    const int32_t nPairs = 1;
+    const int32_t nKeyLen = static_cast<int32_t>(strlen(pszKey));
+    const int32_t nValueLen = static_cast<int32_t>(strlen(pszValue));
+    char* pszMetadata = static_cast<char*>(
+        CPLMalloc(3 * sizeof(int32_t) + nKeyLen + nValueLen));
+    char* pszIter = pszMetadata;
+    memcpy(pszIter, &nPairs, sizeof(int32_t));
+    pszIter += sizeof(int32_t);
+    memcpy(pszIter, &nKeyLen, sizeof(int32_t));
+    pszIter += sizeof(int32_t);
+    memcpy(pszIter, pszKey, nKeyLen);
+    pszIter += nKeyLen;
+    memcpy(pszIter, &nValueLen, sizeof(int32_t));
+    pszIter += sizeof(int32_t);
+    memcpy(pszIter, pszValue, nValueLen);
+    return pszMetadata;
+}
+
+static const char* OGRArrowGetListItemFormat( OGRFieldType eType )
+{
+    switch( eType )
+    {
+        case OFTIntegerList: return "i";
+        case OFTInteger64List: return "l";
+        case OFTRealList: return "g";
+        default: return "u";
+    }
+}
+
+static void OGRArrowInitFieldSchema( struct ArrowSchema* schema,
+                                     const OGRFieldDefn* poFieldDefn )
+{
+    const char* pszFormat = "u";
+    const OGRFieldSubType eSubType = poFieldDefn->GetSubType();
+    switch( poFieldDefn->GetType() )
+    {
+        case OFTInteger:
+            pszFormat = eSubType == OFSTBoolean ? "b" :
+                        eSubType == OFSTInt16 ? "s" : "i";
+            break;
+        case OFTInteger64:
+            pszFormat = "l";
+            break;
+        case OFTReal:
+            pszFormat = eSubType == OFSTFloat32 ? "f" : "g";
+            break;
+        case OFTBinary:
+            pszFormat = "z";
+            break;
+        case OFTDate:
+            pszFormat = "tdD";
+            break;
+        case OFTTime:
+            pszFormat = "ttm";
+            break;
+        case OFTDateTime:
+            pszFormat = "tsm:";
+            break;
+        case OFTIntegerList:
+        case OFTInteger64List:
+        case OFTRealList:
+        case OFTStringList:
+            pszFormat = "+l";
+            break;
+        default:
+            break;
+    }
+    OGRArrowInitSchema(schema, pszFormat, poFieldDefn->GetNameRef(),
+                       CPL_TO_BOOL(poFieldDefn->IsNullable()));
+    if( strcmp(pszFormat, "+l") == 0 )
+    {
+        OGRArrowAllocChildren(schema, 1);
+        OGRArrowInitSchema(schema->children[0],
+                           OGRArrowGetListItemFormat(poFieldDefn->GetType()),
+                           "item", true);
+    }
+}
+
+static const char* OGRArrowGetGeomFieldName( OGRLayer* poLayer,
+                                             const OGRGeomFieldDefn* poGeomFieldDefn )
+{
+    const char* pszName = poGeomFieldDefn->GetNameRef();
+    if( pszName[0] == '\0' )
+    {
+        pszName = poLayer->GetGeometryColumn();
+        if( pszName[0] == '\0' )
+            pszName = "wkb_geometry";
+    }
+    return pszName;
+}
+
+/************************************************************************/
+/*                           Array management                           */
+/************************************************************************/
+
+static void OGRArrowReleaseArray( struct ArrowArray* array )
+{
+    for( int64_t i = 0; i < array->n_buffers; i++ )
+        VSIFreeAligned(const_cast<void*>(array->buffers[i]));
+    CPLFree(array->buffers);
+    for( int64_t i = 0; i < array->n_children; i++ )
+    {
+        if( array->children[i]->release )
+            array->children[i]->release(array->children[i]);
+        CPLFree(array->children[i]);
+    }
+    CPLFree(array->children);
+    array->release = nullptr;
+}
+
+static void OGRArrowInitArray( struct ArrowArray* array, int64_t nLength,
+                               int nBuffers, int nChildren )
+{
+    memset(array, 0, sizeof(*array));
+    array->length = nLength;
+    array->n_buffers = nBuffers;
+    array->buffers = static_cast<const void**>(
+        CPLCalloc(nBuffers, sizeof(void*)));
+    array->n_children = nChildren;
+    if( nChildren > 0 )
+    {
+        array->children = static_cast<struct ArrowArray**>(
+            CPLCalloc(nChildren, sizeof(struct ArrowArray*)));
+        for( int i = 0; i < nChildren; i++ )
+        {
+            array->children[i] = static_cast<struct ArrowArray*>(
+                CPLCalloc(1, sizeof(struct ArrowArray)));
+        }
+    }
+    array->release = OGRArrowReleaseArray;
+}
+
+static void* OGRArrowAllocBuffer( struct ArrowArray* array, int iBuffer,
+                                  size_t nSize )
+{
+    void* pBuffer = VSIMallocAligned(ARROW_BUFFER_ALIGNMENT,
+                                     std::max(nSize, static_cast<size_t>(1)));
+    if( pBuffer == nullptr )
+    {
+        CPLError(CE_Failure, CPLE_OutOfMemory,
+                 "Cannot allocate " CPL_FRMT_GUIB " bytes",
+                 static_cast<GUIntBig>(nSize));
+        return nullptr;
+    }
+    memset(pBuffer, 0, nSize);
+    array->buffers[iBuffer] = pBuffer;
+    return pBuffer;
+}
+
+template<class T> static T* OGRArrowAllocValues( struct ArrowArray* array,
+                                                 int iBuffer, size_t nCount )
+{
+    return static_cast<T*>(OGRArrowAllocBuffer(array, iBuffer,
+                                               nCount * sizeof(T)));
+}
+
+static inline void OGRArrowSetBit( GByte* pabyBitmap, size_t i )
+{
+    pabyBitmap[i / 8] |= static_cast<GByte>(1 << (i % 8));
+}
+
+/* Sets the validity bitmap of array (buffer 0) from the result of */
+/* bIsValid(i) for each element. */
+template<class F> static bool OGRArrowFillValidity( struct ArrowArray* array,
+                                                    size_t nLength,
+                                                    F bIsValid )
+{
+    GByte* pabyValidity = static_cast<GByte*>(
+        OGRArrowAllocBuffer(array, 0, (nLength + 7) / 8));
+    if( pabyValidity == nullptr )
+        return false;
+    for( size_t i = 0; i < nLength; i++ )
+    {
+        if( bIsValid(i) )
+            OGRArrowSetBit(pabyValidity, i);
+        else
+            array->null_count++;
+    }
+    if( array->null_count == 0 )
+    {
+        // A missing validity bitmap means that all values are valid
+        VSIFreeAligned(pabyValidity);
+        array->buffers[0] = nullptr;
+    }
+    return true;
+}
+
+static bool OGRArrowCheckOffsetOverflow( size_t nOffset )
+{
+    if( nOffset > static_cast<size_t>(std::numeric_limits<int32_t>::max()) )
+    {
+        CPLError(CE_Failure, CPLE_NotSupported,
+                 "Too large batch: more than 2 GB of data in a column. "
+                 "Use a smaller MAX_FEATURES_IN_BATCH value");
+        return false;
+    }
+    return true;
+}
+
+/* Fills a string or binary array. GetValue(i, nLen) returns a pointer to */
+/* the bytes of the i-th value, and sets nLen, or returns null. */
+template<class F> static bool OGRArrowFillBinary( struct ArrowArray* array,
+                                                  size_t nLength,
+                                                  F GetValue )
+{
+    OGRArrowInitArray(array, nLength, 3, 0);
+    if( !OGRArrowFillValidity(array, nLength, [&GetValue](size_t i)
+                              { size_t nLen = 0;
+                                return GetValue(i, nLen) != nullptr; }) )
+    {
+        return false;
+    }
+    int32_t* panOffsets = OGRArrowAllocValues<int32_t>(array, 1, nLength + 1);
+    if( panOffsets == nullptr )
+        return false;
+    size_t nTotal = 0;
+    for( size_t i = 0; i < nLength; i++ )
+    {
+        size_t nLen = 0;
+        GetValue(i, nLen);
+        nTotal += nLen;
+        if( !OGRArrowCheckOffsetOverflow(nTotal) )
+            return false;
+        panOffsets[i + 1] = static_cast<int32_t>(nTotal);
+    }
+    GByte* pabyData = static_cast<GByte*>(
+        OGRArrowAllocBuffer(array, 2, nTotal));
+    if( pabyData == nullptr )
+        return false;
+    for( size_t i = 0; i < nLength; i++ )
+    {
+        size_t nLen = 0;
+        const void* pValue = GetValue(i, nLen);
+        if( nLen )
+            memcpy(pabyData + panOffsets[i], pValue, nLen);
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                         OGRArrowFillField()                          */
+/************************************************************************/
+
+static GIntBig OGRArrowGetUnixTime( const OGRField* psField )
+{
+    struct tm brokendowntime;
+    memset(&brokendowntime, 0, sizeof(brokendowntime));
+    brokendowntime.tm_year = psField->Date.Year - 1900;
+    brokendowntime.tm_mon = psField->Date.Month - 1;
+    brokendowntime.tm_mday = psField->Date.Day;
+    brokendowntime.tm_hour = psField->Date.Hour;
+    brokendowntime.tm_min = psField->Date.Minute;
+    brokendowntime.tm_sec = static_cast<int>(psField->Date.Second);
+    return CPLYMDHMSToUnixTime(&brokendowntime);
+}
+
+static int OGRArrowGetMilliseconds( const OGRField* psField )
+{
+    const double dfSecond = psField->Date.Second;
+    return static_cast<int>(
+        std::round((dfSecond - std::floor(dfSecond)) * 1000));
+}
+
+static bool OGRArrowFillList( struct ArrowArray* array,
+                              const std::vector<std::unique_ptr<OGRFeature>>& apoFeatures,
+                              int iField, OGRFieldType eType )
+{
+    const size_t nLength = apoFeatures.size();
+    OGRArrowInitArray(array, nLength, 2, 1);
+    if( !OGRArrowFillValidity(array, nLength, [&apoFeatures, iField](size_t i)
+            { return CPL_TO_BOOL(apoFeatures[i]->IsFieldSetAndNotNull(iField)); }) )
+    {
+        return false;
+    }
+    int32_t* panOffsets = OGRArrowAllocValues<int32_t>(array, 1, nLength + 1);
+    if( panOffsets == nullptr )
+        return false;
+
+    // Collect the list items
+    std::vector<const OGRField*> apsFields(nLength);
+    size_t nItems = 0;
+    for( size_t i = 0; i < nLength; i++ )
+    {
+        if( apoFeatures[i]->IsFieldSetAndNotNull(iField) )
+        {
+            apsFields[i] = apoFeatures[i]->GetRawFieldRef(iField);
+            // Count has the same offset in all the list members of OGRField
+            nItems += apsFields[i]->IntegerList.nCount;
+        }
+        if( !OGRArrowCheckOffsetOverflow(nItems) )
+            return false;
+        panOffsets[i + 1] = static_cast<int32_t>(nItems);
+    }
+
+    struct ArrowArray* child = array->children[0];
+    if( eType == OFTStringList )
+    {
+        std::vector<const char*> apszItems;
+        apszItems.reserve(nItems);
+        for( const OGRField* psField: apsFields )
+        {
+            for( int j = 0; psField && j < psField->StringList.nCount; j++ )
+                apszItems.push_back(psField->StringList.paList[j]);
+        }
+        return OGRArrowFillBinary(child, nItems,
+            [&apszItems](size_t i, size_t& nLen) -> const void*
+            {
+                const char* pszItem = apszItems[i];
+                nLen = pszItem ? strlen(pszItem) : 0;
+                return pszItem;
+            });
+    }
+
+    OGRArrowInitArray(child, nItems, 2, 0);
+    const size_t nItemSize =
+        eType == OFTIntegerList ? sizeof(int) :
+        eType == OFTInteger64List ? sizeof(GIntBig) : sizeof(double);
+    GByte* pabyValues = static_cast<GByte*>(
+        OGRArrowAllocBuffer(child, 1, nItems * nItemSize));
+    if( pabyValues == nullptr )
+        return false;
+    for( size_t i = 0; i < nLength; i++ )
+    {
+        const OGRField* psField = apsFields[i];
+        if( psField == nullptr || psField->IntegerList.nCount == 0 )
+            continue;
+        const void* pSrc =
+            eType == OFTIntegerList ?
+                static_cast<const void*>(psField->IntegerList.paList) :
+            eType == OFTInteger64List ?
+                static_cast<const void*>(psField->Integer64List.paList) :
+                static_cast<const void*>(psField->RealList.paList);
+        memcpy(pabyValues + panOffsets[i] * nItemSize, pSrc,
+               psField->IntegerList.nCount * nItemSize);
+    }
+    return true;
+}
+
+static bool OGRArrowFillField( struct ArrowArray* array,
+                               const std::vector<std::unique_ptr<OGRFeature>>& apoFeatures,
+                               int iField, const OGRFieldDefn* poFieldDefn )
+{
+    const size_t nLength = apoFeatures.size();
+    const OGRFieldType eType = poFieldDefn->GetType();
+    const OGRFieldSubType eSubType = poFieldDefn->GetSubType();
+
+    const auto IsValid = [&apoFeatures, iField](size_t i)
+        { return CPL_TO_BOOL(apoFeatures[i]->IsFieldSetAndNotNull(iField)); };
+    const auto RawField = [&apoFeatures, iField](size_t i)
+        { return apoFeatures[i]->GetRawFieldRef(iField); };
+
+    switch( eType )
+    {
+        case OFTInteger:
+        case OFTInteger64:
+        case OFTReal:
+        case OFTDate:
+        case OFTTime:
+        case OFTDateTime:
+            break;
+
+        case OFTIntegerList:
+        case OFTInteger64List:
+        case OFTRealList:
+        case OFTStringList:
+            return OGRArrowFillList(array, apoFeatures, iField, eType);
+
+        case OFTBinary:
+            return OGRArrowFillBinary(array, nLength,
+                [&IsValid, &RawField](size_t i, size_t& nLen) -> const void*
+                {
+                    if( !IsValid(i) )
+                        return nullptr;
+                    const OGRField* psField = RawField(i);
+                    nLen = static_cast<size_t>(psField->Binary.nCount);
+                    return psField->Binary.paData;
+                });
+
+        default:
+            return OGRArrowFillBinary(array, nLength,
+                [&apoFeatures, &IsValid, iField](size_t i, size_t& nLen) -> const void*
+                {
+                    if( !IsValid(i) )
+                        return nullptr;
+                    const char* pszValue = apoFeatures[i]->GetFieldAsString(iField);
+                    nLen = strlen(pszValue);
+                    return pszValue;
+                });
+    }
+
+    OGRArrowInitArray(array, nLength, 2, 0);
+    if( !OGRArrowFillValidity(array, nLength, IsValid) )
+        return false;
+
+    if( eType == OFTInteger && eSubType == OFSTBoolean )
+    {
+        GByte* pabyValues = static_cast<GByte*>(
+            OGRArrowAllocBuffer(array, 1, (nLength + 7) / 8));
+        if( pabyValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) && RawField(i)->Integer != 0 )
+                OGRArrowSetBit(pabyValues, i);
+        }
+    }
+    else if( eType == OFTInteger && eSubType == OFSTInt16 )
+    {
+        int16_t* panValues = OGRArrowAllocValues<int16_t>(array, 1, nLength);
+        if( panValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) )
+                panValues[i] = static_cast<int16_t>(RawField(i)->Integer);
+        }
+    }
+    else if( eType == OFTInteger )
+    {
+        int32_t* panValues = OGRArrowAllocValues<int32_t>(array, 1, nLength);
+        if( panValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) )
+                panValues[i] = RawField(i)->Integer;
+        }
+    }
+    else if( eType == OFTInteger64 )
+    {
+        int64_t* panValues = OGRArrowAllocValues<int64_t>(array, 1, nLength);
+        if( panValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) )
+                panValues[i] = RawField(i)->Integer64;
+        }
+    }
+    else if( eType == OFTReal && eSubType == OFSTFloat32 )
+    {
+        float* pafValues = OGRArrowAllocValues<float>(array, 1, nLength);
+        if( pafValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) )
+                pafValues[i] = static_cast<float>(RawField(i)->Real);
+        }
+    }
+    else if( eType == OFTReal )
+    {
+        double* padfValues = OGRArrowAllocValues<double>(array, 1, nLength);
+        if( padfValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) )
+                padfValues[i] = RawField(i)->Real;
+        }
+    }
+    else if( eType == OFTDate )
+    {
+        // Number of days since Epoch
+        int32_t* panValues = OGRArrowAllocValues<int32_t>(array, 1, nLength);
+        if( panValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) )
+            {
+                const GIntBig nUnixTime = OGRArrowGetUnixTime(RawField(i));
+                panValues[i] = static_cast<int32_t>(
+                    (nUnixTime - (nUnixTime < 0 ? 86399 : 0)) / 86400);
+            }
+        }
+    }
+    else if( eType == OFTTime )
+    {
+        // Number of milliseconds since midnight
+        int32_t* panValues = OGRArrowAllocValues<int32_t>(array, 1, nLength);
+        if( panValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) )
+            {
+                const OGRField* psField = RawField(i);
+                panValues[i] = psField->Date.Hour * 3600000 +
+                               psField->Date.Minute * 60000 +
+                               static_cast<int>(psField->Date.Second) * 1000 +
+                               OGRArrowGetMilliseconds(psField);
+            }
+        }
+    }
+    else
+    {
+        // Number of milliseconds since Epoch. Values with a known time zone
+        // are converted to UTC, the other ones are taken as they are.
+        int64_t* panValues = OGRArrowAllocValues<int64_t>(array, 1, nLength);
+        if( panValues == nullptr )
+            return false;
+        for( size_t i = 0; i < nLength; i++ )
+        {
+            if( IsValid(i) )
+            {
+                const OGRField* psField = RawField(i);
+                GIntBig nUnixTime = OGRArrowGetUnixTime(psField);
+                if( psField->Date.TZFlag > 1 )
+                    nUnixTime -= (psField->Date.TZFlag - 100) * 15 * 60;
+                panValues[i] = nUnixTime * 1000 + OGRArrowGetMilliseconds(psField);
+            }
+        }
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                       OGRArrowFillGeomField()                        */
+/************************************************************************/
+
+static bool OGRArrowFillGeomField( struct ArrowArray* array,
+                                   const std::vector<std::unique_ptr<OGRFeature>>& apoFeatures,
+                                   int iGeomField )
+{
+    const size_t nLength = apoFeatures.size();
+    OGRArrowInitArray(array, nLength, 3, 0);
+    if( !OGRArrowFillValidity(array, nLength, [&apoFeatures, iGeomField](size_t i)
+            { return apoFeatures[i]->GetGeomFieldRef(iGeomField) != nullptr; }) )
+    {
+        return false;
+    }
+    int32_t* panOffsets = OGRArrowAllocValues<int32_t>(array, 1, nLength + 1);
+    if( panOffsets == nullptr )
+        return false;
+    size_t nTotal = 0;
+    for( size_t i = 0; i < nLength; i++ )
+    {
+        const OGRGeometry* poGeom = apoFeatures[i]->GetGeomFieldRef(iGeomField);
+        if( poGeom )
+            nTotal += poGeom->WkbSize();
+        if( !OGRArrowCheckOffsetOverflow(nTotal) )
+            return false;
+        panOffsets[i + 1] = static_cast<int32_t>(nTotal);
+    }
+    GByte* pabyData = static_cast<GByte*>(OGRArrowAllocBuffer(array, 2, nTotal));
+    if( pabyData == nullptr )
+        return false;
+    for( size_t i = 0; i < nLength; i++ )
+    {
+        const OGRGeometry* poGeom = apoFeatures[i]->GetGeomFieldRef(iGeomField);
+        if( poGeom )
+        {
+            poGeom->exportToWkb(wkbNDR, pabyData + panOffsets[i],
+                                wkbVariantIso);
+        }
+    }
+    return true;
+}
+
+/************************************************************************/
+/*                         Stream callbacks                             */
+/************************************************************************/
+
+static int OGRLayerArrowStreamGetSchema( struct ArrowArrayStream* stream,
+                                         struct ArrowSchema* out_schema )
+{
+    auto psPrivate =
+        static_cast<OGRLayerArrowStreamPrivate*>(stream->private_data);
+    if( !IsLayerAlive(psPrivate) )
+        return EIO;
+    OGRLayer* poLayer = psPrivate->poLayer;
+    OGRFeatureDefn* poDefn = poLayer->GetLayerDefn();
+
+    OGRArrowInitSchema(out_schema, "+s", "", false);
+    const int nChildren = (psPrivate->bIncludeFID ? 1 : 0) +
+                          static_cast<int>(psPrivate->anFields.size() +
+                                           psPrivate->anGeomFields.size());
+    OGRArrowAllocChildren(out_schema, nChildren);
+
+    int iChild = 0;
+    if( psPrivate->bIncludeFID )
+    {
+        OGRArrowInitSchema(out_schema->children[iChild++], "l",
+                           psPrivate->osFIDName.c_str(), false);
+    }
+    for( int iField: psPrivate->anFields )
+    {
+        OGRArrowInitFieldSchema(out_schema->children[iChild++],
+                                poDefn->GetFieldDefn(iField));
+    }
+    for( int iGeomField: psPrivate->anGeomFields )
+    {
+        struct ArrowSchema* child = out_schema->children[iChild++];
+        OGRArrowInitSchema(child, "z",
+            OGRArrowGetGeomFieldName(poLayer, poDefn->GetGeomFieldDefn(iGeomField)),
+            true);
+        child->metadata = OGRArrowEncodeMetadata("ARROW:extension:name",
+                                                 "ogc.wkb");
+    }
+    return 0;
+}
+
+static int OGRLayerArrowStreamGetNext( struct ArrowArrayStream* stream,
+                                       struct ArrowArray* out_array )
+{
+    auto psPrivate =
+        static_cast<OGRLayerArrowStreamPrivate*>(stream->private_data);
+    if( !IsLayerAlive(psPrivate) )
+        return EIO;
+    OGRLayer* poLayer = psPrivate->poLayer;
+    OGRFeatureDefn* poDefn = poLayer->GetLayerDefn();
+
+    // A released array signals the end of the stream
+    memset(out_array, 0, sizeof(*out_array));
+
+    std::vector<std::unique_ptr<OGRFeature>> apoFeatures;
+    while( static_cast<int>(apoFeatures.size()) < psPrivate->nMaxFeaturesInBatch )
+    {
+        OGRFeature* poFeature = poLayer->GetNextFeature();
+        if( poFeature == nullptr )
+            break;
+        apoFeatures.emplace_back(poFeature);
+    }
+    if( apoFeatures.empty() )
+        return 0;
+
+    const size_t nLength = apoFeatures.size();
+    const int nChildren = (psPrivate->bIncludeFID ? 1 : 0) +
+                          static_cast<int>(psPrivate->anFields.size() +
+                                           psPrivate->anGeomFields.size());
+    OGRArrowInitArray(out_array, nLength, 1, nChildren);
+
+    CPLErrorReset();
+    bool bOK = true;
+    int iChild = 0;
+    if( psPrivate->bIncludeFID )
+    {
+        struct ArrowArray* child = out_array->children[iChild++];
+        OGRArrowInitArray(child, nLength, 2, 0);
+        int64_t* panFIDs = OGRArrowAllocValues<int64_t>(child, 1, nLength);
+        bOK = panFIDs != nullptr;
+        for( size_t i = 0; bOK && i < nLength; i++ )
+            panFIDs[i] = apoFeatures[i]->GetFID();
+    }
+    for( size_t i = 0; bOK && i < psPrivate->anFields.size(); i++ )
+    {
+        const int iField = psPrivate->anFields[i];
+        bOK = OGRArrowFillField(out_array->children[iChild++], apoFeatures,
+                                iField, poDefn->GetFieldDefn(iField));
+    }
+    for( size_t i = 0; bOK && i < psPrivate->anGeomFields.size(); i++ )
+    {
+        bOK = OGRArrowFillGeomField(out_array->children[iChild++], apoFeatures,
+                                    psPrivate->anGeomFields[i]);
+    }
+    if( !bOK )
+    {
+        out_array->release(out_array);
+        psPrivate->osLastError = CPLGetLastErrorMsg();
+        return CPLGetLastErrorNo() == CPLE_OutOfMemory ? ENOMEM : EIO;
+    }
+    return 0;
+}
+
+static const char* OGRLayerArrowStreamGetLastError( struct ArrowArrayStream* stream )
+{
+    auto psPrivate =
+        static_cast<OGRLayerArrowStreamPrivate*>(stream->private_data);
+    return psPrivate->osLastError.empty() ? nullptr :
+                                            psPrivate->osLastError.c_str();
+}
+
+static void OGRLayerArrowStreamRelease( struct ArrowArrayStream* stream )
+{
+    delete static_cast<OGRLayerArrowStreamPrivate*>(stream->private_data);
+    stream->private_data = nullptr;
+    stream->release = nullptr;
+}
+
+/************************************************************************/
+/*                          GetArrowStream()                            */
+/************************************************************************/
+
+/**
+ \brief Get a batched stream of the features of the layer, as an Arrow C stream.
+
+ The stream returns Arrow struct arrays, with one child per field, with the
+ following mapping of the OGR field types: OFTInteger as int32 (or bool for
+ OFSTBoolean, int16 for OFSTInt16), OFTInteger64 as int64, OFTReal as float64
+ (or float32 for OFSTFloat32), OFTString as utf8, OFTBinary as binary, OFTDate
+ as date32, OFTTime as time32[ms], OFTDateTime as timestamp[ms] (values with
+ a known time zone are converted to UTC), and list types as lists of int32,
+ int64, float64 or utf8. Geometry fields are returned as ISO WKB binary
+ columns with an "ARROW:extension:name" metadata item set to "ogc.wkb".
+
+ Fields and geometry fields set as ignored with SetIgnoredFields() are not
+ returned, and the attribute and spatial filters are honoured. ResetReading()
+ is called when the stream is created, and the stream then uses the
+ sequential reading of the layer, so GetNextFeature() must not be called on
+ the layer while the stream is in use. The stream should be released before
+ the dataset owning the layer is closed. Otherwise, get_schema() and
+ get_next() of the stream fail with EIO once the layer has been destroyed,
+ and only release() may be called.
+
+ The default implementation reads features with GetNextFeature(). Drivers
+ may override it with a more efficient implementation.
+
+ This method is the same as the C function OGR_L_GetArrowStream().
+
+ @param out_stream Pointer to an uninitialized ArrowArrayStream structure.
+ @param papszOptions NULL terminated list of options, or NULL. Supported
+ options are MAX_FEATURES_IN_BATCH=integer (maximum number of features in each
+ array returned by get_next(), defaults to 65536) and INCLUDE_FID=YES/NO
+ (whether to include the FID column, named after GetFIDColumn(), or "OGC_FID"
+ if it is empty. Defaults to YES).
+ @return true in case of success.
+ @since GDAL 3.2
+ */
+
+bool OGRLayer::GetArrowStream( struct ArrowArrayStream* out_stream,
+                               CSLConstList papszOptions )
+{
+    memset(out_stream, 0, sizeof(*out_stream));
+
+    const int nMaxFeaturesInBatch = atoi(CSLFetchNameValueDef(
+        papszOptions, "MAX_FEATURES_IN_BATCH",
+        CPLSPrintf("%d", DEFAULT_MAX_FEATURES_IN_BATCH)));
+    if( nMaxFeaturesInBatch <= 0 )
+    {
+        CPLError(CE_Failure, CPLE_IllegalArg,
+                 "Invalid value for MAX_FEATURES_IN_BATCH");
+        return false;
+    }
+
+    auto psPrivate = new OGRLayerArrowStreamPrivate();
+    psPrivate->poLayer = this;
+    psPrivate->poLayerLifetime = GetLifetimeToken();
+    psPrivate->nMaxFeaturesInBatch = nMaxFeaturesInBatch;
+    psPrivate->bIncludeFID = CPLTestBool(
+        CSLFetchNameValueDef(papszOptions, "INCLUDE_FID", "YES"));
+    psPrivate->osFIDName = GetFIDColumn();
+    if( psPrivate->osFIDName.empty() )
+        psPrivate->osFIDName = "OGC_FID";
+
+    OGRFeatureDefn* poDefn = GetLayerDefn();
+    for( int i = 0; i < poDefn->GetFieldCount(); i++ )
+    {
+        if( !poDefn->GetFieldDefn(i)->IsIgnored() )
+            psPrivate->anFields.push_back(i);
+    }
+    for( int i = 0; i < poDefn->GetGeomFieldCount(); i++ )
+    {
+        if( !poDefn->GetGeomFieldDefn(i)->IsIgnored() )
+            psPrivate->anGeomFields.push_back(i);
+    }
+
+    ResetReading();
+
+    out_stream->get_schema = OGRLayerArrowStreamGetSchema;
+    out_stream->get_next = OGRLayerArrowStreamGetNext;
+    out_stream->get_last_error = OGRLayerArrowStreamGetLastError;
+    out_stream->release = OGRLayerArrowStreamRelease;
+    out_stream->private_data = psPrivate;
+    return true;
+}
+
+/************************************************************************/
+/*                       OGR_L_GetArrowStream()                         */
+/************************************************************************/
+
+/**
+ \brief Get a batched stream of the features of the layer, as an Arrow C stream.
+
+ This function is the same as the C++ method OGRLayer::GetArrowStream().
+
+ @param hLayer Layer.
+ @param out_stream Pointer to an uninitialized ArrowArrayStream structure.
+ @param papszOptions NULL terminated list of options, or NULL.
+ @return TRUE in case of success.
+ @since GDAL 3.2
+ */
+
+int OGR_L_GetArrowStream( OGRLayerH hLayer,
+                          struct ArrowArrayStream* out_stream,
+                          char** papszOptions )
+{
+    VALIDATE_POINTER1( hLayer, "OGR_L_GetArrowStream", FALSE );
+    VALIDATE_POINTER1( out_stream, "OGR_L_GetArrowStream", FALSE );
+
+    return OGRLayer::FromHandle(hLayer)->GetArrowStream(out_stream,
+                                                         papszOptions);
+}
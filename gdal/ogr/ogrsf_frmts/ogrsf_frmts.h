@@ -53,6 +53,7 @@
 //! @endcond
 
 class OGRLayerAttrIndex;
+struct ArrowArrayStream;
 class OGRSFDriver;
 
 /************************************************************************/
@@ -75,6 +76,9 @@ class CPL_DLL OGRLayer : public GDALMajorObject
 
     void         ConvertGeomsIfNecessary( OGRFeature *poFeature );
 
+    // Expires when the layer is destroyed. Used by Arrow streams.
+    std::weak_ptr<bool> GetLifetimeToken() const;
+
     class CPL_DLL FeatureIterator
     {
             struct Private;
@@ -192,6 +196,9 @@ class CPL_DLL OGRLayer : public GDALMajorObject
 
     virtual OGRErr      SetIgnoredFields( const char **papszFields );
 
+    virtual bool        GetArrowStream( struct ArrowArrayStream* out_stream,
+                                        CSLConstList papszOptions = nullptr );
+
     OGRErr              Intersection( OGRLayer *pLayerMethod,
                                       OGRLayer *pLayerResult,
                                       char** papszOptions = nullptr,
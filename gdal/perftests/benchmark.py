@@ -0,0 +1,468 @@
+# SPDX-License-Identifier: MIT
+
+# Benchmark suite for hot code paths of GDAL, with regression tracking.
+#
+# The data is synthetic and generated in /vsimem/ (or in a temporary directory
+# for gdal2tiles, whose input and output must be real files), so the suite runs
+# offline. Each benchmark is run a number of warm-up times, and then timed a
+# number of repeat times. Results can be saved as JSON, and compared to a
+# previously saved baseline: a benchmark regresses when its median time exceeds
+# the baseline median by more than the threshold.
+#
+# Examples:
+#   python benchmark.py -o baseline.json
+#   python benchmark.py -baseline baseline.json -threshold 10 -threshold warp=20
+
+import json
+import math
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+from osgeo import gdal
+from osgeo import ogr
+from osgeo import osr
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', 'swig', 'python', 'scripts')
+
+
+class BenchmarkCase(object):
+    """
+    What a benchmark function returns: run() is the timed part, prepare() is
+    called (untimed) before each run, and cleanup() once at the end
+    """
+
+    def __init__(self, run, prepare=None, cleanup=None):
+        self.run = run
+        self.prepare = prepare
+        self.cleanup = cleanup
+
+
+class BenchmarkSkipped(Exception):
+    pass
+
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name):
+    """Decorator registering a function(size) returning a BenchmarkCase"""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+###############################################################################
+# Synthetic data
+
+
+def create_raster(filename, xsize, ysize, nbands=3, datatype=gdal.GDT_Byte,
+                  options=None, epsg=4326):
+    """Create a raster with a gradient pattern, georeferenced over Europe"""
+    ds = gdal.GetDriverByName('GTiff').Create(filename, xsize, ysize, nbands, datatype,
+                                              options=options or ['TILED=YES'])
+    ds.SetGeoTransform([-10, 40.0 / xsize, 0, 70, 0, -30.0 / ysize])
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(epsg)
+    ds.SetSpatialRef(srs)
+    line = bytearray(xsize)
+    for i in range(xsize):
+        line[i] = (i * 255) // max(1, xsize - 1)
+    for i in range(nbands):
+        band = ds.GetRasterBand(i + 1)
+        band.Fill(0)
+        # A few non constant lines, so that compression does not degenerate
+        for y in range(0, ysize, max(1, ysize // 64)):
+            band.WriteRaster(0, y, xsize, 1, bytes(line), buf_type=gdal.GDT_Byte)
+    ds = None
+
+
+def create_vector_layer(nfeatures):
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test', geom_type=ogr.wkbPoint)
+    lyr.CreateField(ogr.FieldDefn('int', ogr.OFTInteger))
+    lyr.CreateField(ogr.FieldDefn('real', ogr.OFTReal))
+    lyr.CreateField(ogr.FieldDefn('str', ogr.OFTString))
+    for i in range(nfeatures):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        f['int'] = i
+        f['real'] = i * 0.5
+        f['str'] = 'value %d' % i
+        f.SetGeometry(ogr.CreateGeometryFromWkt('POINT(%d %d)' % (i % 360, i % 180)))
+        lyr.CreateFeature(f)
+    return ds, lyr
+
+###############################################################################
+# Benchmarks
+
+
+@benchmark('cog_translate')
+def bench_cog_translate(size):
+    src_filename = '/vsimem/bench_cog_src.tif'
+    dst_filename = '/vsimem/bench_cog_dst.tif'
+    create_raster(src_filename, 4096 * size, 4096 * size)
+
+    def run():
+        gdal.Translate(dst_filename, src_filename, format='COG',
+                       creationOptions=['COMPRESS=DEFLATE'])
+        gdal.Unlink(dst_filename)
+
+    def cleanup():
+        gdal.Unlink(src_filename)
+
+    return BenchmarkCase(run, cleanup=cleanup)
+
+
+@benchmark('overview')
+def bench_overview(size):
+    src_filename = '/vsimem/bench_ovr_src.tif'
+    filename = '/vsimem/bench_ovr.tif'
+    create_raster(src_filename, 4096 * size, 4096 * size)
+
+    def prepare():
+        gdal.Unlink(filename + '.ovr')
+        gdal.Translate(filename, src_filename)
+
+    def run():
+        ds = gdal.Open(filename, gdal.GA_Update)
+        ds.BuildOverviews('AVERAGE', [2, 4, 8, 16])
+        ds = None
+
+    def cleanup():
+        gdal.Unlink(src_filename)
+        gdal.Unlink(filename)
+
+    return BenchmarkCase(run, prepare=prepare, cleanup=cleanup)
+
+
+@benchmark('warp')
+def bench_warp(size):
+    src_filename = '/vsimem/bench_warp_src.tif'
+    dst_filename = '/vsimem/bench_warp_dst.tif'
+    create_raster(src_filename, 2048 * size, 2048 * size)
+
+    def run():
+        gdal.Warp(dst_filename, src_filename, dstSRS='EPSG:3857', resampleAlg='bilinear')
+        gdal.Unlink(dst_filename)
+
+    def cleanup():
+        gdal.Unlink(src_filename)
+
+    return BenchmarkCase(run, cleanup=cleanup)
+
+
+@benchmark('gdal_array_read')
+def bench_gdal_array_read(size):
+    try:
+        from osgeo import gdal_array
+        del gdal_array
+    except ImportError:
+        raise BenchmarkSkipped('gdal_array not available')
+
+    filename = '/vsimem/bench_array.tif'
+    create_raster(filename, 4096 * size, 4096 * size, nbands=1, datatype=gdal.GDT_Float32)
+    ds = gdal.Open(filename)
+
+    def run():
+        ds.GetRasterBand(1).ReadAsArray()
+        # Avoid measuring the block cache only
+        ds.FlushCache()
+
+    def cleanup():
+        gdal.Unlink(filename)
+
+    return BenchmarkCase(run, cleanup=cleanup)
+
+
+@benchmark('ogr_iteration')
+def bench_ogr_iteration(size):
+    ds, lyr = create_vector_layer(200000 * size)
+
+    def run():
+        lyr.ResetReading()
+        for f in lyr:
+            f.GetField(0)
+            f.GetField(1)
+            f.GetField(2)
+            f.GetGeometryRef().ExportToWkb()
+
+    def cleanup():
+        ds.Release()
+
+    return BenchmarkCase(run, cleanup=cleanup)
+
+
+@benchmark('gdal2tiles')
+def bench_gdal2tiles(size):
+    sys.path.insert(0, SCRIPTS_DIR)
+    try:
+        import gdal2tiles
+    finally:
+        sys.path.pop(0)
+
+    tmpdir = tempfile.mkdtemp(prefix='bench_gdal2tiles')
+    src_filename = os.path.join(tmpdir, 'src.tif')
+    out_dir = os.path.join(tmpdir, 'tiles')
+    create_raster(src_filename, 2048 * size, 2048 * size)
+
+    def prepare():
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    def run():
+        input_file, output_folder, options = gdal2tiles.process_args(
+            ['-q', '-z', '3-6', src_filename, out_dir])
+        gdal2tiles.single_threaded_tiling(input_file, output_folder, options)
+
+    def cleanup():
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    return BenchmarkCase(run, prepare=prepare, cleanup=cleanup)
+
+
+@benchmark('gdal_calc')
+def bench_gdal_calc(size):
+    sys.path.insert(0, SCRIPTS_DIR)
+    try:
+        import gdal_calc
+    except ImportError:
+        raise BenchmarkSkipped('gdal_calc requires numpy')
+    finally:
+        sys.path.pop(0)
+
+    src_filename = '/vsimem/bench_calc_src.tif'
+    dst_filename = '/vsimem/bench_calc_dst.tif'
+    create_raster(src_filename, 4096 * size, 4096 * size, nbands=1)
+
+    def run():
+        gdal_calc.Calc('A * 0.5 + 1', dst_filename, type='Float32', overwrite=True,
+                       quiet=True, A=src_filename)
+        gdal.Unlink(dst_filename)
+
+    def cleanup():
+        gdal.Unlink(src_filename)
+
+    return BenchmarkCase(run, cleanup=cleanup)
+
+
+@benchmark('vrt_python_pixelfunc')
+def bench_vrt_python_pixelfunc(size):
+    try:
+        import numpy
+        del numpy
+    except ImportError:
+        raise BenchmarkSkipped('Python pixel functions require numpy')
+
+    src_filename = '/vsimem/bench_vrt_python_src.tif'
+    create_raster(src_filename, 1024 * size, 1024 * size, nbands=1)
+    vrt = """<VRTDataset rasterXSize="%d" rasterYSize="%d">
+  <VRTRasterBand dataType="Float32" band="1" subClass="VRTDerivedRasterBand">
+    <PixelFunctionType>scale</PixelFunctionType>
+    <PixelFunctionLanguage>Python</PixelFunctionLanguage>
+    <PixelFunctionCode><![CDATA[
+def scale(in_ar, out_ar, xoff, yoff, xsize, ysize, raster_xsize, raster_ysize, r, gt, **kwargs):
+    out_ar[:] = in_ar[0] * 0.5
+]]>
+    </PixelFunctionCode>
+    <SimpleSource>
+      <SourceFilename>%s</SourceFilename>
+      <SourceBand>1</SourceBand>
+    </SimpleSource>
+  </VRTRasterBand>
+</VRTDataset>""" % (1024 * size, 1024 * size, src_filename)
+
+    def run():
+        old_val = gdal.GetConfigOption('GDAL_VRT_ENABLE_PYTHON')
+        gdal.SetConfigOption('GDAL_VRT_ENABLE_PYTHON', 'YES')
+        try:
+            ds = gdal.Open(vrt)
+        finally:
+            gdal.SetConfigOption('GDAL_VRT_ENABLE_PYTHON', old_val)
+        band = ds.GetRasterBand(1)
+        # Many small requests, so that the per-call overhead dominates
+        for y in range(0, ds.RasterYSize, 32):
+            for x in range(0, ds.RasterXSize, 32):
+                band.ReadRaster(x, y, 32, 32)
+
+    def cleanup():
+        gdal.Unlink(src_filename)
+
+    return BenchmarkCase(run, cleanup=cleanup)
+
+###############################################################################
+# Running and comparing
+
+
+def run_benchmark(name, size, warmup, repeat):
+    """Run a benchmark and return its statistics, or None if it is skipped"""
+    try:
+        case = BENCHMARKS[name](size)
+    except BenchmarkSkipped as e:
+        print('%s: skipped (%s)' % (name, str(e)))
+        return None
+
+    times = []
+    try:
+        for i in range(warmup + repeat):
+            if case.prepare:
+                case.prepare()
+            start = time.time()
+            case.run()
+            end = time.time()
+            if i >= warmup:
+                times.append(end - start)
+    finally:
+        if case.cleanup:
+            case.cleanup()
+
+    return compute_stats(times)
+
+
+def compute_stats(times):
+    sorted_times = sorted(times)
+    n = len(times)
+    mean = sum(times) / n
+    if n % 2:
+        median = sorted_times[n // 2]
+    else:
+        median = (sorted_times[n // 2 - 1] + sorted_times[n // 2]) / 2
+    stdev = math.sqrt(sum((t - mean) ** 2 for t in times) / (n - 1)) if n > 1 else 0.0
+    return OrderedDict([('min', sorted_times[0]),
+                        ('median', median),
+                        ('mean', mean),
+                        ('max', sorted_times[-1]),
+                        ('stdev', stdev),
+                        ('times', times)])
+
+
+def compare_to_baseline(results, baseline, default_threshold, thresholds):
+    """
+    Print the comparison of results with baseline, and return the names of the
+    benchmarks whose median time regressed by more than their threshold (in %)
+    """
+    regressions = []
+    print('')
+    print('%-20s %12s %12s %9s' % ('Benchmark', 'Baseline (s)', 'Current (s)', 'Change'))
+    for name, stats in results.items():
+        if name not in baseline:
+            print('%-20s %12s %12.3f %9s' % (name, '-', stats['median'], 'new'))
+            continue
+        ref = baseline[name]['median']
+        change = (stats['median'] - ref) / ref * 100 if ref > 0 else 0.0
+        threshold = thresholds.get(name, default_threshold)
+        status = ''
+        if change > threshold:
+            status = '  REGRESSION (threshold %g%%)' % threshold
+            regressions.append(name)
+        print('%-20s %12.3f %12.3f %+8.1f%%%s' % (name, ref, stats['median'], change, status))
+    return regressions
+
+
+def Usage():
+    print('Usage: benchmark.py [-list] [-b name]* [-warmup n] [-repeat n] [-size factor]')
+    print('                    [-o results.json] [-baseline baseline.json]')
+    print('                    [-threshold pct] [-threshold name=pct]*')
+    print('')
+    print('Benchmarks: ' + ', '.join(BENCHMARKS.keys()))
+    return 1
+
+
+def main(argv):
+    argv = gdal.GeneralCmdLineProcessor(argv)
+    if argv is None:
+        return 0
+
+    names = []
+    warmup = 1
+    repeat = 5
+    size = 1
+    output_filename = None
+    baseline_filename = None
+    default_threshold = 10.0
+    thresholds = {}
+
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '-list':
+            for name in BENCHMARKS:
+                print(name)
+            return 0
+        elif arg == '-b' and i + 1 < len(argv):
+            i += 1
+            if argv[i] not in BENCHMARKS:
+                print('Unknown benchmark: %s' % argv[i])
+                return Usage()
+            names.append(argv[i])
+        elif arg == '-warmup' and i + 1 < len(argv):
+            i += 1
+            warmup = int(argv[i])
+        elif arg == '-repeat' and i + 1 < len(argv):
+            i += 1
+            repeat = int(argv[i])
+        elif arg == '-size' and i + 1 < len(argv):
+            i += 1
+            size = int(argv[i])
+        elif arg == '-o' and i + 1 < len(argv):
+            i += 1
+            output_filename = argv[i]
+        elif arg == '-baseline' and i + 1 < len(argv):
+            i += 1
+            baseline_filename = argv[i]
+        elif arg == '-threshold' and i + 1 < len(argv):
+            i += 1
+            if '=' in argv[i]:
+                name, value = argv[i].split('=', 1)
+                thresholds[name] = float(value)
+            else:
+                default_threshold = float(argv[i])
+        else:
+            return Usage()
+        i += 1
+
+    if repeat < 1 or warmup < 0 or size < 1:
+        return Usage()
+
+    baseline = None
+    if baseline_filename:
+        with open(baseline_filename) as f:
+            baseline = json.load(f)['results']
+
+    results = OrderedDict()
+    for name in names or BENCHMARKS.keys():
+        stats = run_benchmark(name, size, warmup, repeat)
+        if stats is None:
+            continue
+        results[name] = stats
+        print('%s: median %.3f s, min %.3f s, stdev %.3f s (%d runs)' % (
+            name, stats['median'], stats['min'], stats['stdev'], repeat))
+
+    if output_filename:
+        doc = OrderedDict([
+            ('gdal_version', gdal.VersionInfo('RELEASE_NAME')),
+            ('python_version', platform.python_version()),
+            ('platform', platform.platform()),
+            ('date', time.strftime('%Y-%m-%dT%H:%M:%S')),
+            ('warmup', warmup),
+            ('repeat', repeat),
+            ('size', size),
+            ('results', results)])
+        with open(output_filename, 'w') as f:
+            json.dump(doc, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare_to_baseline(results, baseline, default_threshold, thresholds)
+        if regressions:
+            print('')
+            print('Regressions: ' + ', '.join(regressions))
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
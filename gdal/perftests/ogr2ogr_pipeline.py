@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: MIT
+
+# Compares the sequential and pipelined (-pipeline) modes of the ogr2ogr.py
+# sample on a Shapefile to GeoPackage conversion with reprojection.
+
+import os
+import sys
+import time
+
+from osgeo import gdal
+from osgeo import ogr
+from osgeo import osr
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'swig', 'python', 'samples'))
+import ogr2ogr  # noqa: E402
+
+
+def create_source(filename, nfeatures):
+
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(32631)
+    ds = ogr.GetDriverByName('ESRI Shapefile').CreateDataSource(filename)
+    lyr = ds.CreateLayer('test', srs=srs, geom_type=ogr.wkbPolygon)
+    lyr.CreateField(ogr.FieldDefn('id', ogr.OFTInteger))
+    lyr.CreateField(ogr.FieldDefn('name', ogr.OFTString))
+    lyr.StartTransaction()
+    for i in range(nfeatures):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        f['id'] = i
+        f['name'] = 'feature %d' % i
+        x = 400000 + (i % 1000) * 100
+        y = 5000000 + (i // 1000) * 100
+        f.SetGeometry(ogr.CreateGeometryFromWkt(
+            'POLYGON((%d %d,%d %d,%d %d,%d %d,%d %d))' % (
+                x, y, x, y + 90, x + 90, y + 90, x + 90, y, x, y)))
+        lyr.CreateFeature(f)
+    lyr.CommitTransaction()
+    ds = None
+
+
+def doit(src_filename, extra_args):
+
+    dst_filename = '/vsimem/out.gpkg'
+    gdal.Unlink(dst_filename)
+    start = time.time()
+    ogr2ogr.main(['ogr2ogr.py', '-f', 'GPKG', '-t_srs', 'EPSG:4326', '-gt', '65536'] +
+                 extra_args + [dst_filename, src_filename], progress_func=None)
+    end = time.time()
+    print('%s: %.2f' % (' '.join(extra_args) if extra_args else 'sequential', end - start))
+    gdal.Unlink(dst_filename)
+
+
+def main():
+    src_filename = '/vsimem/src.shp'
+    create_source(src_filename, 200000)
+    doit(src_filename, [])
+    doit(src_filename, ['-pipeline', '1'])
+    doit(src_filename, ['-pipeline', '2'])
+    doit(src_filename, ['-pipeline', '4'])
+    doit(src_filename, ['-pipeline', '4', '-preserve_fid'])
+    ogr.GetDriverByName('ESRI Shapefile').DeleteDataSource(src_filename)
+
+
+if __name__ == '__main__':
+    main()
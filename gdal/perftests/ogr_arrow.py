@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: MIT
+
+from osgeo import ogr
+import time
+
+def create_layer(nfeatures):
+
+    ds = ogr.GetDriverByName('Memory').CreateDataSource('')
+    lyr = ds.CreateLayer('test', geom_type=ogr.wkbPoint)
+    lyr.CreateField(ogr.FieldDefn('int', ogr.OFTInteger))
+    lyr.CreateField(ogr.FieldDefn('real', ogr.OFTReal))
+    lyr.CreateField(ogr.FieldDefn('str', ogr.OFTString))
+    for i in range(nfeatures):
+        f = ogr.Feature(lyr.GetLayerDefn())
+        f['int'] = i
+        f['real'] = i * 0.5
+        f['str'] = 'value %d' % i
+        f.SetGeometry(ogr.CreateGeometryFromWkt('POINT(%d %d)' % (i % 360, i % 180)))
+        lyr.CreateFeature(f)
+    return ds, lyr
+
+def doit_features(lyr):
+
+    start = time.time()
+    count = 0
+    for f in lyr:
+        f.GetField(0)
+        f.GetField(1)
+        f.GetField(2)
+        f.GetGeometryRef().ExportToWkb()
+        count += 1
+    end = time.time()
+    print('Feature iteration: %d features, %.2f' % (count, end - start))
+
+def doit_arrow(lyr, batch_size):
+
+    start = time.time()
+    count = 0
+    reader = lyr.GetArrowStreamAsPyArrow(['MAX_FEATURES_IN_BATCH=%d' % batch_size])
+    for batch in reader:
+        count += batch.num_rows
+    end = time.time()
+    print('GetArrowStream(MAX_FEATURES_IN_BATCH=%d): %d features, %.2f' % (batch_size, count, end - start))
+
+ds, lyr = create_layer(1000000)
+doit_features(lyr)
+doit_arrow(lyr, 1000)
+doit_arrow(lyr, 65536)
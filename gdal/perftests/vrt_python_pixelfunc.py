@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: MIT
+
+# Measures the number of Python pixel function calls per second of a
+# VRTDerivedRasterBand read by many small windows, with and without the reuse
+# of the numpy arrays wrapping the source buffers between calls
+# (GDAL_VRT_PYTHON_CACHE_ARRAYS configuration option).
+#
+# Usage: python vrt_python_pixelfunc.py [-size n] [-window n] [-radius n]
+#                                       [-sources n]
+
+import sys
+import time
+
+from osgeo import gdal
+
+
+def create_vrt(src_filename, size, radius, nsources):
+    sources = ''.join("""
+    <SimpleSource>
+      <SourceFilename>%s</SourceFilename>
+      <SourceBand>1</SourceBand>
+    </SimpleSource>""" % src_filename for _ in range(nsources))
+    return """<VRTDataset rasterXSize="%d" rasterYSize="%d">
+  <VRTRasterBand dataType="Float32" band="1" subClass="VRTDerivedRasterBand">
+    <PixelFunctionType>mean</PixelFunctionType>
+    <PixelFunctionLanguage>Python</PixelFunctionLanguage>
+    <BufferRadius>%d</BufferRadius>
+    <PixelFunctionCode><![CDATA[
+import numpy
+def mean(in_ar, out_ar, xoff, yoff, xsize, ysize, raster_xsize, raster_ysize, r, gt, **kwargs):
+    out_ar[:] = numpy.mean(in_ar, axis=0)
+]]>
+    </PixelFunctionCode>%s
+  </VRTRasterBand>
+</VRTDataset>""" % (size, size, radius, sources)
+
+
+def doit(vrt, window, cache_arrays):
+    gdal.SetConfigOption('GDAL_VRT_PYTHON_CACHE_ARRAYS', cache_arrays)
+    ds = gdal.Open(vrt)
+    gdal.SetConfigOption('GDAL_VRT_PYTHON_CACHE_ARRAYS', None)
+    band = ds.GetRasterBand(1)
+    start = time.time()
+    for y in range(0, ds.RasterYSize - window + 1, window):
+        for x in range(0, ds.RasterXSize - window + 1, window):
+            band.ReadRaster(x, y, window, window)
+    end = time.time()
+
+    calls = int(band.GetMetadataItem('PYTHON_CALLS', '_DEBUG_'))
+    print('cache arrays=%s: %d calls in %.3f s (%.0f calls/s, %.3f s in pixel function), '
+          'array cache: %s hits, %s misses' % (
+              cache_arrays, calls, end - start, calls / (end - start),
+              float(band.GetMetadataItem('PYTHON_CALL_TIME', '_DEBUG_')),
+              band.GetMetadataItem('PYTHON_ARRAY_CACHE_HITS', '_DEBUG_'),
+              band.GetMetadataItem('PYTHON_ARRAY_CACHE_MISSES', '_DEBUG_')))
+
+
+def main(argv):
+    size = 2048
+    window = 16
+    radius = 0
+    nsources = 2
+    i = 1
+    while i < len(argv):
+        if argv[i] == '-size' and i + 1 < len(argv):
+            i += 1
+            size = int(argv[i])
+        elif argv[i] == '-window' and i + 1 < len(argv):
+            i += 1
+            window = int(argv[i])
+        elif argv[i] == '-radius' and i + 1 < len(argv):
+            i += 1
+            radius = int(argv[i])
+        elif argv[i] == '-sources' and i + 1 < len(argv):
+            i += 1
+            nsources = int(argv[i])
+        else:
+            print('Usage: vrt_python_pixelfunc.py [-size n] [-window n] [-radius n] [-sources n]')
+            return 1
+        i += 1
+
+    src_filename = '/vsimem/vrt_python_pixelfunc.tif'
+    src_ds = gdal.GetDriverByName('GTiff').Create(src_filename, size, size)
+    src_ds.GetRasterBand(1).Fill(1)
+    src_ds = None
+    vrt = create_vrt(src_filename, size, radius, nsources)
+
+    gdal.SetConfigOption('GDAL_VRT_ENABLE_PYTHON', 'YES')
+    try:
+        for cache_arrays in ('NO', 'YES'):
+            doit(vrt, window, cache_arrays)
+    finally:
+        gdal.SetConfigOption('GDAL_VRT_ENABLE_PYTHON', None)
+        gdal.Unlink(src_filename)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
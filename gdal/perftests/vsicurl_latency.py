@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: MIT
+
+# Measures the number of HTTP requests, the number of bytes transferred and
+# the elapsed time of typical /vsicurl/ accesses to a COG, served by the local
+# range server of the test suite with simulated network latency and bandwidth.
+#
+# Usage: python vsicurl_latency.py [-size n] [-latency ms]* [-jitter ms]
+#                                  [-bandwidth MB/s]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from osgeo import gdal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'autotest', 'pymod'))
+import webserver
+
+
+def create_cog(filename, size):
+    src_filename = '/vsimem/vsicurl_latency_src.tif'
+    ds = gdal.GetDriverByName('GTiff').Create(src_filename, size, size, 3)
+    ds.SetGeoTransform([2, 0.001, 0, 49, 0, -0.001])
+    ds.SetProjection('EPSG:4326')
+    for i in range(3):
+        ds.GetRasterBand(i + 1).Fill(50 * (i + 1))
+    ds = None
+    gdal.Translate(filename, src_filename, format='COG',
+                   creationOptions=['COMPRESS=DEFLATE', 'BLOCKSIZE=512'])
+    gdal.Unlink(src_filename)
+
+
+def scenario_gdalinfo(url):
+    gdal.Info(url)
+
+
+def scenario_first_pixel(url):
+    ds = gdal.Open(url)
+    ds.GetRasterBand(1).ReadRaster(0, 0, 1, 1)
+
+
+def scenario_overview(url):
+    ds = gdal.Open(url)
+    ovr = ds.GetRasterBand(1).GetOverview(ds.GetRasterBand(1).GetOverviewCount() - 1)
+    ovr.ReadRaster(0, 0, ovr.XSize, ovr.YSize)
+
+
+def scenario_window(url):
+    ds = gdal.Open(url)
+    ds.ReadRaster(ds.RasterXSize // 4, ds.RasterYSize // 4,
+                  ds.RasterXSize // 2, ds.RasterYSize // 2)
+
+
+scenarios = [('gdalinfo', scenario_gdalinfo),
+             ('first pixel', scenario_first_pixel),
+             ('smallest overview', scenario_overview),
+             ('central window', scenario_window)]
+
+
+def doit(tmpdir, latency, jitter, bandwidth):
+
+    with webserver.range_server(tmpdir, latency=latency, jitter=jitter,
+                                bandwidth=bandwidth) as (handler, port):
+        url = '/vsicurl/http://127.0.0.1:%d/cog.tif' % port
+        for name, func in scenarios:
+            gdal.VSICurlClearCache()
+            handler.reset_counters()
+            start = time.time()
+            func(url)
+            end = time.time()
+            stats = handler.stats()
+            print('latency=%d ms, %s: %.3f s, %d requests, %d bytes' % (
+                latency * 1000, name, end - start, stats['request_count'], stats['bytes_sent']))
+        gdal.VSICurlClearCache()
+
+
+def main(argv):
+    size = 8192
+    latencies = []
+    jitter = 0
+    bandwidth = None
+    i = 1
+    while i < len(argv):
+        if argv[i] == '-size' and i + 1 < len(argv):
+            i += 1
+            size = int(argv[i])
+        elif argv[i] == '-latency' and i + 1 < len(argv):
+            i += 1
+            latencies.append(float(argv[i]) / 1000)
+        elif argv[i] == '-jitter' and i + 1 < len(argv):
+            i += 1
+            jitter = float(argv[i]) / 1000
+        elif argv[i] == '-bandwidth' and i + 1 < len(argv):
+            i += 1
+            bandwidth = float(argv[i]) * 1e6
+        else:
+            print('Usage: vsicurl_latency.py [-size n] [-latency ms]* [-jitter ms] [-bandwidth MB/s]')
+            return 1
+        i += 1
+
+    tmpdir = tempfile.mkdtemp(prefix='vsicurl_latency')
+    try:
+        create_cog(os.path.join(tmpdir, 'cog.tif'), size)
+        # Do not list the server directory when opening the file
+        gdal.SetConfigOption('GDAL_DISABLE_READDIR_ON_OPEN', 'EMPTY_DIR')
+        for latency in latencies or [0, 0.02, 0.1]:
+            doit(tmpdir, latency, jitter, bandwidth)
+    finally:
+        gdal.SetConfigOption('GDAL_DISABLE_READDIR_ON_OPEN', None)
+        shutil.rmtree(tmpdir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
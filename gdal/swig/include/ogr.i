@@ -897,6 +897,102 @@ public:
 /*                               OGRLayer                               */
 /************************************************************************/
 
+#ifdef SWIGPYTHON
+%{
+/* Concatenation of the ISO WKB of several geometries, with the offsets */
+/* of their start and end. A NULL geometry is an empty range. */
+typedef struct
+{
+    GByte   *pabyWkb;
+    size_t   nWkbSize;
+    size_t   nWkbCapacity;
+    GIntBig *panOffsets;
+    size_t   nOffsets;
+    size_t   nOffsetsCapacity;
+} OGRWkbBatch;
+
+static int OGRWkbBatchAddOffset( OGRWkbBatch *psBatch )
+{
+    if( psBatch->nOffsets == psBatch->nOffsetsCapacity )
+    {
+        const size_t nNewCapacity = psBatch->nOffsetsCapacity * 2 + 64;
+        GIntBig* panNew = static_cast<GIntBig*>(VSI_REALLOC_VERBOSE(
+            psBatch->panOffsets, nNewCapacity * sizeof(GIntBig)));
+        if( panNew == NULL )
+            return FALSE;
+        psBatch->panOffsets = panNew;
+        psBatch->nOffsetsCapacity = nNewCapacity;
+    }
+    psBatch->panOffsets[psBatch->nOffsets++] =
+        static_cast<GIntBig>(psBatch->nWkbSize);
+    return TRUE;
+}
+
+static int OGRWkbBatchAppend( OGRWkbBatch *psBatch, OGRGeometryH hGeom,
+                              OGRwkbByteOrder eByteOrder )
+{
+    const size_t nSize = hGeom ? static_cast<size_t>(OGR_G_WkbSize(hGeom)) : 0;
+    if( psBatch->nWkbSize + nSize > psBatch->nWkbCapacity )
+    {
+        size_t nNewCapacity = psBatch->nWkbCapacity * 2;
+        if( nNewCapacity < psBatch->nWkbSize + nSize + 4096 )
+            nNewCapacity = psBatch->nWkbSize + nSize + 4096;
+        GByte* pabyNew = static_cast<GByte*>(VSI_REALLOC_VERBOSE(
+            psBatch->pabyWkb, nNewCapacity));
+        if( pabyNew == NULL )
+            return FALSE;
+        psBatch->pabyWkb = pabyNew;
+        psBatch->nWkbCapacity = nNewCapacity;
+    }
+    if( hGeom != NULL &&
+        OGR_G_ExportToIsoWkb(hGeom, eByteOrder,
+                             psBatch->pabyWkb + psBatch->nWkbSize) != OGRERR_NONE )
+    {
+        return FALSE;
+    }
+    psBatch->nWkbSize += nSize;
+    return OGRWkbBatchAddOffset(psBatch);
+}
+
+static int OGRWkbBatchCheckOffsets( int nLen, int nOffsets,
+                                    const GIntBig *panOffsets )
+{
+    if( nOffsets == 0 )
+    {
+        CPLError(CE_Failure, CPLE_IllegalArg,
+                 "Offsets should contain at least one value");
+        return FALSE;
+    }
+    for( int i = 0; i < nOffsets; i++ )
+    {
+        if( panOffsets[i] < 0 || panOffsets[i] > nLen ||
+            (i > 0 && panOffsets[i] < panOffsets[i-1]) )
+        {
+            CPLError(CE_Failure, CPLE_IllegalArg,
+                     "Invalid offset at index %d: " CPL_FRMT_GIB,
+                     i, panOffsets[i]);
+            return FALSE;
+        }
+    }
+    return TRUE;
+}
+
+#include "ogr_recordbatch.h"
+
+/* Destructor of the PyCapsule returned by Layer.GetArrowStream() */
+static void OGRArrowArrayStreamCapsuleDestructor( PyObject* capsule )
+{
+    struct ArrowArrayStream* stream = static_cast<struct ArrowArrayStream*>(
+        PyCapsule_GetPointer(capsule, "arrow_array_stream"));
+    if( stream == NULL )
+        return;
+    if( stream->release != NULL )
+        stream->release(stream);
+    CPLFree(stream);
+}
+%}
+#endif
+
 %rename (Layer) OGRLayerShadow;
 #ifdef SWIGCSHARP
 /* Because of issue with CSharp to handle different inheritance from class in different namespaces  */
@@ -1207,6 +1303,98 @@ public:
         OGR_L_SetStyleTable(self, (OGRStyleTableH) table);
   }
 
+#ifdef SWIGPYTHON
+  /* Returns the ISO WKB of the geometries of all the features of the */
+  /* layer as a single buffer, and the offsets of each of them. */
+  %feature( "kwargs" ) ExportGeometriesToWkb;
+  OGRErr ExportGeometriesToWkb( OGRWkbBatch *psBatchOut,
+                                OGRwkbByteOrder byte_order = wkbNDR,
+                                int geom_field = 0 ) {
+    OGRFeatureDefnH hDefn = OGR_L_GetLayerDefn(self);
+    if( geom_field < 0 || geom_field >= OGR_FD_GetGeomFieldCount(hDefn) )
+    {
+      CPLError(CE_Failure, CPLE_IllegalArg,
+               "Invalid geometry field index: %d", geom_field);
+      return OGRERR_FAILURE;
+    }
+    if( !OGRWkbBatchAddOffset(psBatchOut) )
+      return OGRERR_NOT_ENOUGH_MEMORY;
+    OGR_L_ResetReading(self);
+    OGRFeatureH hFeat;
+    while( (hFeat = OGR_L_GetNextFeature(self)) != NULL )
+    {
+      const int bOK = OGRWkbBatchAppend(psBatchOut,
+                                        OGR_F_GetGeomFieldRef(hFeat, geom_field),
+                                        byte_order);
+      OGR_F_Destroy(hFeat);
+      if( !bOK )
+        return OGRERR_FAILURE;
+    }
+    return OGRERR_NONE;
+  }
+
+  /* Returns the features of the layer as an Arrow C stream, in a */
+  /* PyCapsule named "arrow_array_stream". */
+  %feature( "kwargs" ) GetArrowStream;
+  void GetArrowStream( struct ArrowArrayStream** ppStreamOut,
+                       char** options = NULL ) {
+    struct ArrowArrayStream* stream = static_cast<struct ArrowArrayStream*>(
+        CPLMalloc(sizeof(struct ArrowArrayStream)));
+    if( OGR_L_GetArrowStream(self, stream, options) )
+      *ppStreamOut = stream;
+    else
+      CPLFree(stream);
+  }
+
+  /* Creates one feature, without attributes, per geometry of a buffer */
+  /* of concatenated WKB geometries. */
+  %apply (int nLen, char *pBuf ) { (int len, char *bin_string)};
+  %apply (int nList, GIntBig* pList) { (int nOffsets, GIntBig *panOffsets) };
+  %feature( "kwargs" ) CreateFeaturesFromWkb;
+  OGRErr CreateFeaturesFromWkb( int len, char *bin_string,
+                                int nOffsets, GIntBig *panOffsets,
+                                int geom_field = 0 ) {
+    OGRFeatureDefnH hDefn = OGR_L_GetLayerDefn(self);
+    if( geom_field < 0 || geom_field >= OGR_FD_GetGeomFieldCount(hDefn) )
+    {
+      CPLError(CE_Failure, CPLE_IllegalArg,
+               "Invalid geometry field index: %d", geom_field);
+      return OGRERR_FAILURE;
+    }
+    if( !OGRWkbBatchCheckOffsets(len, nOffsets, panOffsets) )
+      return OGRERR_FAILURE;
+    OGRSpatialReferenceH hSRS = OGR_GFld_GetSpatialRef(
+        OGR_FD_GetGeomFieldDefn(hDefn, geom_field));
+    for( int i = 0; i < nOffsets - 1; i++ )
+    {
+      OGRFeatureH hFeat = OGR_F_Create(hDefn);
+      const int nSize = static_cast<int>(panOffsets[i+1] - panOffsets[i]);
+      if( nSize > 0 )
+      {
+        OGRGeometryH hGeom = NULL;
+        OGRErr eErr = OGR_G_CreateFromWkb(bin_string + panOffsets[i], hSRS,
+                                          &hGeom, nSize);
+        if( eErr != OGRERR_NONE )
+        {
+          CPLError(CE_Failure, CPLE_AppDefined,
+                   "Invalid WKB geometry at index %d: %s",
+                   i, OGRErrMessages(eErr));
+          OGR_F_Destroy(hFeat);
+          return eErr;
+        }
+        OGR_F_SetGeomFieldDirectly(hFeat, geom_field, hGeom);
+      }
+      OGRErr eErr = OGR_L_CreateFeature(self, hFeat);
+      OGR_F_Destroy(hFeat);
+      if( eErr != OGRERR_NONE )
+        return eErr;
+    }
+    return OGRERR_NONE;
+  }
+  %clear (int len, char *bin_string);
+  %clear (int nOffsets, GIntBig *panOffsets);
+#endif
+
 } /* %extend */
 
 
@@ -2440,6 +2628,68 @@ OGRGeometryShadow* CreateGeometryFromWkb(int nLen, unsigned char *pBuf,
 }
 #endif
 
+#ifdef SWIGPYTHON
+/* Batch versions of CreateGeometryFromWkb() and Geometry.ExportToIsoWkb(), */
+/* working on a buffer of concatenated WKB geometries and the offsets of */
+/* their start and end. */
+%feature( "kwargs" ) CreateGeometriesFromWkb;
+%apply (int nLen, char *pBuf ) { (int len, char *bin_string)};
+%apply (int nList, GIntBig* pList) { (int nOffsets, GIntBig *panOffsets) };
+%inline %{
+  OGRErr CreateGeometriesFromWkb( OGRGeometryShadow*** pgeoms, size_t* pnCount,
+                                  int len, char *bin_string,
+                                  int nOffsets, GIntBig *panOffsets,
+                                  OSRSpatialReferenceShadow *reference=NULL ) {
+    if( !OGRWkbBatchCheckOffsets(len, nOffsets, panOffsets) )
+      return OGRERR_FAILURE;
+    const size_t nCount = static_cast<size_t>(nOffsets - 1);
+    OGRGeometryH* pahGeoms = static_cast<OGRGeometryH*>(
+        VSI_CALLOC_VERBOSE(nCount ? nCount : 1, sizeof(OGRGeometryH)));
+    if( pahGeoms == NULL )
+      return OGRERR_NOT_ENOUGH_MEMORY;
+    for( size_t i = 0; i < nCount; i++ )
+    {
+      const int nSize = static_cast<int>(panOffsets[i+1] - panOffsets[i]);
+      if( nSize == 0 )
+        continue;
+      OGRErr eErr = OGR_G_CreateFromWkb(bin_string + panOffsets[i], reference,
+                                        &pahGeoms[i], nSize);
+      if( eErr != OGRERR_NONE )
+      {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "Invalid WKB geometry at index %d: %s",
+                 static_cast<int>(i), OGRErrMessages(eErr));
+        for( size_t j = 0; j < i; j++ )
+          OGR_G_DestroyGeometry(pahGeoms[j]);
+        CPLFree(pahGeoms);
+        return eErr;
+      }
+    }
+    *pgeoms = reinterpret_cast<OGRGeometryShadow**>(pahGeoms);
+    *pnCount = nCount;
+    return OGRERR_NONE;
+  }
+%}
+%clear (int len, char *bin_string);
+%clear (int nOffsets, GIntBig *panOffsets);
+
+%feature( "kwargs" ) ExportGeometriesToWkb;
+%inline %{
+  OGRErr ExportGeometriesToWkb( OGRWkbBatch *psBatchOut,
+                                int nGeometries, OGRGeometryShadow **pahGeometries,
+                                OGRwkbByteOrder byte_order=wkbNDR ) {
+    if( !OGRWkbBatchAddOffset(psBatchOut) )
+      return OGRERR_NOT_ENOUGH_MEMORY;
+    for( int i = 0; i < nGeometries; i++ )
+    {
+      if( !OGRWkbBatchAppend(psBatchOut, pahGeometries[i], byte_order) )
+        return OGRERR_FAILURE;
+    }
+    return OGRERR_NONE;
+  }
+%}
+#endif
+
 #ifndef SWIGJAVA
 %feature( "kwargs" ) CreateGeometryFromWkt;
 #endif
@@ -2866,6 +3116,48 @@ public:
 #endif
 #endif
 
+#ifdef SWIGPYTHON
+  /* Assigns all points of a point or a simple curve from a buffer of */
+  /* interleaved X,Y[,Z][,M] doubles */
+  %feature("kwargs") SetPointsFromBuffer;
+  OGRErr SetPointsFromBuffer(int nLen, char *pBuf, int bHasZ = FALSE, int bHasM = FALSE)
+  {
+    const int nStride = static_cast<int>(sizeof(double)) *
+                        (2 + (bHasZ ? 1 : 0) + (bHasM ? 1 : 0));
+    if( nLen % nStride != 0 )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "Buffer size should be a multiple of %d bytes", nStride);
+        return OGRERR_FAILURE;
+    }
+    const OGRwkbGeometryType eType = wkbFlatten(OGR_G_GetGeometryType(self));
+    const int nPoints = nLen / nStride;
+    if( (eType != wkbPoint && eType != wkbLineString &&
+         eType != wkbCircularString) ||
+        (eType == wkbPoint && nPoints > 1) )
+    {
+        CPLError(CE_Failure, CPLE_NotSupported,
+                 "SetPointsFromBuffer() only supports a Point with at most one "
+                 "point, or a LineString, LinearRing or CircularString");
+        return OGRERR_UNSUPPORTED_GEOMETRY_TYPE;
+    }
+    OGR_G_Set3D(self, bHasZ);
+    OGR_G_SetMeasured(self, bHasM);
+    if( nPoints == 0 )
+    {
+        OGR_G_Empty(self);
+        return OGRERR_NONE;
+    }
+    OGR_G_SetPointsZM(self, nPoints,
+                      pBuf, nStride,
+                      pBuf + sizeof(double), nStride,
+                      bHasZ ? pBuf + 2 * sizeof(double) : NULL, bHasZ ? nStride : 0,
+                      bHasM ? pBuf + (bHasZ ? 3 : 2) * sizeof(double) : NULL,
+                      bHasM ? nStride : 0);
+    return OGRERR_NONE;
+  }
+#endif
+
 #ifndef SWIGJAVA
   %feature("kwargs") GetX;
 #endif
@@ -555,7 +555,8 @@ void wrapper_VSIGetMemFileBuffer(const char *utf8_path, GByte **out, vsi_l_offse
                   buf_xsize=None, buf_ysize=None, buf_type=None, buf_obj=None,
                   resample_alg=gdalconst.GRIORA_NearestNeighbour,
                   callback=None,
-                  callback_data=None):
+                  callback_data=None,
+                  buf_pool=None):
       """ Reading a chunk of a GDAL band into a numpy array. The optional (buf_xsize,buf_ysize,buf_type)
       parameters should generally not be specified if buf_obj is specified. The array is returned"""
 
@@ -566,7 +567,8 @@ void wrapper_VSIGetMemFileBuffer(const char *utf8_path, GByte **out, vsi_l_offse
                                          buf_xsize, buf_ysize, buf_type, buf_obj,
                                          resample_alg=resample_alg,
                                          callback=callback,
-                                         callback_data=callback_data)
+                                         callback_data=callback_data,
+                                         buf_pool=buf_pool)
 
   def WriteArray(self, array, xoff=0, yoff=0,
                  resample_alg=gdalconst.GRIORA_NearestNeighbour,
@@ -785,7 +787,8 @@ CPLErr ReadRaster1(  int xoff, int yoff, int xsize, int ysize,
                     resample_alg=gdalconst.GRIORA_NearestNeighbour,
                     callback=None,
                     callback_data=None,
-                    interleave='band'):
+                    interleave='band',
+                    buf_pool=None):
         """ Reading a chunk of a GDAL band into a numpy array. The optional (buf_xsize,buf_ysize,buf_type)
         parameters should generally not be specified if buf_obj is specified. The array is returned"""
 
@@ -795,7 +798,8 @@ CPLErr ReadRaster1(  int xoff, int yoff, int xsize, int ysize,
                                               resample_alg=resample_alg,
                                               callback=callback,
                                               callback_data=callback_data,
-                                              interleave=interleave )
+                                              interleave=interleave,
+                                              buf_pool=buf_pool)
 
     def WriteRaster(self, xoff, yoff, xsize, ysize,
                     buf_string,
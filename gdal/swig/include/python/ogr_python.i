@@ -185,6 +185,131 @@
                 break
             yield feature
 
+    def iter(self, columns=None, geometry=True, fid=False, named=False, reuse=False):
+        """Iterate over the features of the layer, yielding rows of values
+        instead of Feature objects.
+
+        Each row contains the FID (if fid is True), the values of the
+        requested columns, and the geometry of the first geometry field (if
+        geometry is True), in that order.
+
+        columns is a sequence of field names or indices, defaulting to all
+        fields. The fields that are not requested (and the geometry, if not
+        requested) are set as ignored during the iteration, so that drivers
+        can skip reading them. The previously ignored fields are restored
+        when the iteration ends.
+
+        If named is True, rows are namedtuples, whose attribute names are
+        the field names (fid and geometry for the FID and the geometry).
+        Otherwise they are plain tuples.
+
+        If reuse is True, the same list object is updated in place and
+        yielded for each row, and the geometry is owned by the current
+        feature: it is only valid until the next row is read. Otherwise,
+        each row holds a copy of the geometry.
+        """
+        if named and reuse:
+            raise ValueError('named and reuse cannot be both set')
+
+        defn = self.GetLayerDefn()
+        field_count = defn.GetFieldCount()
+        if columns is None:
+            indices = list(range(field_count))
+        else:
+            indices = []
+            for col in columns:
+                if isinstance(col, (str, type(u''))):
+                    idx = defn.GetFieldIndex(col)
+                    if idx < 0:
+                        raise KeyError('Field %s does not exist' % col)
+                else:
+                    idx = col
+                    if idx < 0 or idx >= field_count:
+                        raise KeyError('Field index %d out of range' % idx)
+                indices.append(idx)
+
+        prev_ignored = []
+        for i in range(field_count):
+            fld_defn = defn.GetFieldDefn(i)
+            if fld_defn.IsIgnored():
+                prev_ignored.append(fld_defn.GetName())
+        for i in range(defn.GetGeomFieldCount()):
+            geom_fld_defn = defn.GetGeomFieldDefn(i)
+            if geom_fld_defn.IsIgnored() and geom_fld_defn.GetName() != '':
+                prev_ignored.append(geom_fld_defn.GetName())
+        if defn.IsGeometryIgnored():
+            prev_ignored.append('OGR_GEOMETRY')
+        if defn.IsStyleIgnored():
+            prev_ignored.append('OGR_STYLE')
+
+        requested = set(indices)
+        ignored = ['OGR_STYLE']
+        for i in range(field_count):
+            if i not in requested:
+                ignored.append(defn.GetFieldDefn(i).GetName())
+        for i in range(1, defn.GetGeomFieldCount()):
+            ignored.append(defn.GetGeomFieldDefn(i).GetName())
+        if not geometry:
+            ignored.append('OGR_GEOMETRY')
+
+        # Direct accessors for the most common types, to save the type
+        # dispatching of Feature.GetField() for each value
+        getters = []
+        for idx in indices:
+            fld_defn = defn.GetFieldDefn(idx)
+            fld_type = fld_defn.GetType()
+            if fld_type == OFTInteger:
+                getter = _ogr.Feature_GetFieldAsInteger
+            elif fld_type == OFTInteger64:
+                getter = _ogr.Feature_GetFieldAsInteger64
+            elif fld_type == OFTReal:
+                getter = _ogr.Feature_GetFieldAsDouble
+            else:
+                getter = Feature.GetField
+            getters.append((idx, getter))
+
+        row_class = None
+        if named:
+            import collections
+            names = []
+            if fid:
+                names.append('fid')
+            names += [defn.GetFieldDefn(idx).GetName() for idx in indices]
+            if geometry:
+                names.append('geometry')
+            row_class = collections.namedtuple('Row', names, rename=True)
+
+        self.SetIgnoredFields(ignored)
+        try:
+            self.ResetReading()
+            is_set = _ogr.Feature_IsFieldSetAndNotNull
+            get_next = _ogr.Layer_GetNextFeature
+            row = []
+            while True:
+                f = get_next(self)
+                if f is None:
+                    break
+                del row[:]
+                if fid:
+                    row.append(_ogr.Feature_GetFID(f))
+                for idx, getter in getters:
+                    row.append(getter(f, idx) if is_set(f, idx) else None)
+                if geometry:
+                    geom = _ogr.Feature_GetGeometryRef(f)
+                    if geom is not None and not reuse:
+                        geom = geom.Clone()
+                    row.append(geom)
+                if reuse:
+                    # f, which owns the geometry, is kept alive until the
+                    # next row is read
+                    yield row
+                elif row_class:
+                    yield row_class(*row)
+                else:
+                    yield tuple(row)
+        finally:
+            self.SetIgnoredFields(prev_ignored)
+
     def schema(self):
         output = []
         defn = self.GetLayerDefn()
@@ -193,6 +318,34 @@
         return output
     schema = property(schema)
 
+    def __arrow_c_stream__(self, requested_schema=None):
+        """Export the features of the layer as a PyCapsule containing an
+        Arrow C stream, as specified by the Arrow PyCapsule interface."""
+        if requested_schema is not None:
+            raise NotImplementedError("requested_schema != None not implemented")
+        return self.GetArrowStream()
+
+    def GetArrowStreamAsPyArrow(self, options=[]):
+        """Return a pyarrow.RecordBatchReader reading the features of the
+        layer by batches.
+
+        The layer (and its dataset) should be kept alive while the reader
+        is used: once the dataset is closed, reading fails with an error."""
+        import pyarrow
+        stream = self.GetArrowStream(options)
+        if stream is None:
+            raise RuntimeError('GetArrowStream() failed')
+        if hasattr(pyarrow.RecordBatchReader, '_import_from_c_capsule'):
+            return pyarrow.RecordBatchReader._import_from_c_capsule(stream)
+        import ctypes
+        PyCapsule_GetPointer = ctypes.pythonapi.PyCapsule_GetPointer
+        PyCapsule_GetPointer.restype = ctypes.c_void_p
+        PyCapsule_GetPointer.argtypes = [ctypes.py_object, ctypes.c_char_p]
+        # _import_from_c() moves the stream, so the capsule only frees
+        # the memory of the structure afterwards
+        return pyarrow.RecordBatchReader._import_from_c(
+            PyCapsule_GetPointer(stream, b'arrow_array_stream'))
+
   %}
 
 }
@@ -491,6 +644,168 @@
       for i in range(self.GetGeometryCount()):
           yield self.GetGeometryRef(i)
 
+  def GetFlatCoordinates(self):
+    """Return the coordinates of the geometry as NumPy arrays.
+
+    Supported geometries are Point, LineString, LinearRing, CircularString,
+    Polygon, MultiPoint, MultiLineString and MultiPolygon.
+
+    Returns a tuple (coords, ring_offsets, part_offsets), where coords is
+    a float64 array of shape (N, 2), (N, 3) or (N, 4) with the X, Y[, Z][, M]
+    values of all the points, ring_offsets an int64 array such that the points
+    of the i-th ring (or line string, or point) are
+    coords[ring_offsets[i]:ring_offsets[i+1]], and part_offsets an int64 array
+    such that the rings of the j-th part are in the range
+    [part_offsets[j], part_offsets[j+1]).
+
+    The geometry is exported once as ISO WKB, and the coordinates are read
+    from it without going through Python floats.
+    """
+    import struct
+    import numpy
+
+    geom = self
+    if self.GetGeometryName() == 'LINEARRING':
+      # LinearRing cannot be exported as WKB on its own
+      geom = Geometry(wkbPolygon)
+      geom.AddGeometry(self)
+    wkb = geom.ExportToIsoWkb(wkbNDR)
+
+    paths = []
+    ring_offsets = [0]
+    part_offsets = [0]
+    dims = [2]
+
+    def read_geometry(offset):
+      geom_type = struct.unpack_from('<I', wkb, offset + 1)[0]
+      offset += 5
+      flat_type = geom_type % 1000
+      has_z = geom_type // 1000 in (1, 3)
+      has_m = geom_type // 1000 in (2, 3)
+      ncoords = 2 + has_z + has_m
+      dims[0] = ncoords
+
+      if flat_type in (wkbMultiPoint, wkbMultiLineString, wkbMultiPolygon):
+        ngeoms = struct.unpack_from('<I', wkb, offset)[0]
+        offset += 4
+        for _ in range(ngeoms):
+          offset = read_geometry(offset)
+        return offset
+
+      if flat_type == wkbPoint:
+        values = numpy.frombuffer(wkb, dtype='<f8', count=ncoords, offset=offset)
+        # Empty points are written with NaN coordinates
+        npoints = 0 if numpy.isnan(values).all() else 1
+        paths.append(values.reshape(1, ncoords)[:npoints])
+        ring_offsets.append(ring_offsets[-1] + npoints)
+        offset += 8 * ncoords
+      elif flat_type in (wkbLineString, wkbCircularString, wkbPolygon):
+        nrings = 1
+        if flat_type == wkbPolygon:
+          nrings = struct.unpack_from('<I', wkb, offset)[0]
+          offset += 4
+        for _ in range(nrings):
+          npoints = struct.unpack_from('<I', wkb, offset)[0]
+          offset += 4
+          values = numpy.frombuffer(wkb, dtype='<f8', count=npoints * ncoords, offset=offset)
+          paths.append(values.reshape(npoints, ncoords))
+          ring_offsets.append(ring_offsets[-1] + npoints)
+          offset += 8 * npoints * ncoords
+      else:
+        raise ValueError('GetFlatCoordinates() does not support %s geometries' % self.GetGeometryName())
+
+      part_offsets.append(len(ring_offsets) - 1)
+      return offset
+
+    read_geometry(0)
+
+    if paths:
+      coords = numpy.concatenate(paths).astype(numpy.float64)
+    else:
+      coords = numpy.empty((0, dims[0]), dtype=numpy.float64)
+    return (coords,
+            numpy.array(ring_offsets, dtype=numpy.int64),
+            numpy.array(part_offsets, dtype=numpy.int64))
+
+  def GetPointsAsArray(self):
+    """Return the points of a Point, LineString, LinearRing or
+    CircularString as a float64 NumPy array of shape (N, 2), (N, 3) or (N, 4)
+    with the X, Y[, Z][, M] values."""
+    if self.GetGeometryName() != 'LINEARRING' and \
+       GT_Flatten(self.GetGeometryType()) not in (wkbPoint, wkbLineString, wkbCircularString):
+      raise ValueError('GetPointsAsArray() does not support %s geometries' % self.GetGeometryName())
+    return self.GetFlatCoordinates()[0]
+
+  def _GetArrayDimensionality(self, coords):
+    if coords.ndim != 2 or coords.shape[1] not in (2, 3, 4):
+      raise ValueError('coordinates should be an array of shape (N, 2), (N, 3) or (N, 4)')
+    if coords.shape[1] == 4:
+      return True, True
+    if coords.shape[1] == 3:
+      # X,Y,M if the geometry is already measured without Z, X,Y,Z otherwise
+      has_m = self.IsMeasured() and not self.Is3D()
+      return not has_m, has_m
+    return False, False
+
+  def SetPointsFromArray(self, coords):
+    """Assign all the points of a Point, LineString, LinearRing or
+    CircularString from an array of shape (N, 2), (N, 3) or (N, 4) with the
+    X, Y[, Z][, M] values. Columns of a (N, 3) array are considered as
+    X, Y, M if the geometry is measured and has no Z, and X, Y, Z otherwise.
+
+    The values are passed as a single buffer, instead of one call per point."""
+    import numpy
+    coords = numpy.ascontiguousarray(coords, dtype=numpy.float64)
+    has_z, has_m = self._GetArrayDimensionality(coords)
+    return self.SetPointsFromBuffer(coords, has_z, has_m)
+
+  def SetFlatCoordinates(self, coords, ring_offsets=None, part_offsets=None):
+    """Assign the coordinates of the geometry from arrays with the layout
+    returned by GetFlatCoordinates(). ring_offsets and part_offsets may be
+    omitted for geometries made of a single ring (or line string) and a
+    single part. Existing rings and parts are replaced."""
+    import numpy
+    coords = numpy.ascontiguousarray(coords, dtype=numpy.float64)
+    if ring_offsets is None:
+      ring_offsets = [0, coords.shape[0]]
+    if part_offsets is None:
+      part_offsets = [0, len(ring_offsets) - 1]
+
+    flat_type = GT_Flatten(self.GetGeometryType())
+    if self.GetGeometryName() == 'LINEARRING' or \
+       flat_type in (wkbPoint, wkbLineString, wkbCircularString):
+      if len(ring_offsets) != 2:
+        raise ValueError('%s geometries have a single path' % self.GetGeometryName())
+      return self.SetPointsFromArray(coords[ring_offsets[0]:ring_offsets[1]])
+
+    part_types = {wkbPolygon: None,
+                  wkbMultiPoint: wkbPoint,
+                  wkbMultiLineString: wkbLineString,
+                  wkbMultiPolygon: wkbPolygon}
+    if flat_type not in part_types:
+      raise ValueError('SetFlatCoordinates() does not support %s geometries' % self.GetGeometryName())
+    if flat_type == wkbPolygon and len(part_offsets) != 2:
+      raise ValueError('Polygon geometries have a single part')
+
+    has_z, has_m = self._GetArrayDimensionality(coords)
+    self.Empty()
+    self.Set3D(has_z)
+    self.SetMeasured(has_m)
+    part_type = part_types[flat_type]
+    for ipart in range(len(part_offsets) - 1):
+      part = self if part_type is None else Geometry(part_type)
+      for iring in range(part_offsets[ipart], part_offsets[ipart + 1]):
+        path = coords[ring_offsets[iring]:ring_offsets[iring + 1]]
+        if part_type in (None, wkbPolygon):
+          ring = Geometry(wkbLinearRing)
+          ring.SetPointsFromBuffer(path, has_z, has_m)
+          part.AddGeometryDirectly(ring)
+        else:
+          part.SetPointsFromBuffer(path, has_z, has_m)
+      if part_type is not None:
+        self.AddGeometryDirectly(part)
+    return 0
+
 %}
 }
 
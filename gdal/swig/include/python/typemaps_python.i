@@ -2226,6 +2226,140 @@ DecomposeSequenceOf4DCoordinates( PyObject *seq, int nCount, double *x, double *
 }
 
 
+/*
+ * Typemaps for the batch WKB functions of ogr.i:
+ * CreateGeometriesFromWkb(), ExportGeometriesToWkb() and
+ * Layer.ExportGeometriesToWkb()
+ */
+%typemap(in,numinputs=0) (OGRGeometryShadow*** pgeoms, size_t* pnCount) ( OGRGeometryShadow** geoms=0, size_t nCount = 0 )
+{
+  /* %typemap(in,numinputs=0) (OGRGeometryShadow*** pgeoms, size_t* pnCount) */
+  $1 = &geoms;
+  $2 = &nCount;
+}
+%typemap(argout) (OGRGeometryShadow*** pgeoms, size_t* pnCount)
+{
+  /* %typemap(argout) (OGRGeometryShadow*** pgeoms, size_t* pnCount) */
+  PyObject *list = PyList_New( *$2 );
+  for( size_t i = 0; i < *$2; i++ ) {
+    PyList_SetItem(list, i,
+       SWIG_NewPointerObj((void*)(*$1)[i],SWIGTYPE_p_OGRGeometryShadow,SWIG_POINTER_OWN) );
+  }
+  Py_XDECREF($result);
+  $result = list;
+}
+%typemap(freearg) (OGRGeometryShadow*** pgeoms, size_t* pnCount)
+{
+  /* %typemap(freearg) (OGRGeometryShadow*** pgeoms, size_t* pnCount) */
+  CPLFree(*$1);
+}
+
+%typemap(in,numinputs=1) (int nGeometries, OGRGeometryShadow **pahGeometries)
+{
+  /* %typemap(in,numinputs=1) (int nGeometries, OGRGeometryShadow **pahGeometries) */
+  if ( !PySequence_Check($input) ) {
+    PyErr_SetString(PyExc_TypeError, "not a sequence");
+    SWIG_fail;
+  }
+  Py_ssize_t size = PySequence_Size($input);
+  if( size != (int)size ) {
+    PyErr_SetString(PyExc_TypeError, "too big sequence");
+    SWIG_fail;
+  }
+  $1 = (int)size;
+  $2 = (OGRGeometryShadow**) CPLMalloc(($1 ? $1 : 1)*sizeof(OGRGeometryShadow*));
+  for( int i = 0; i<$1; i++ ) {
+    PyObject *o = PySequence_GetItem($input,i);
+    OGRGeometryShadow* geom = NULL;
+    if( o != Py_None &&
+        !SWIG_IsOK(SWIG_ConvertPtr( o, (void**)&geom, SWIGTYPE_p_OGRGeometryShadow, 0 )) ) {
+      Py_DECREF(o);
+      PyErr_SetString(PyExc_TypeError, "not a Geometry or None");
+      SWIG_fail;
+    }
+    $2[i] = geom;
+    Py_DECREF(o);
+  }
+}
+%typemap(freearg) (int nGeometries, OGRGeometryShadow **pahGeometries)
+{
+  /* %typemap(freearg) (int nGeometries, OGRGeometryShadow **pahGeometries) */
+  CPLFree( $2 );
+}
+
+%typemap(in,numinputs=0) (OGRWkbBatch *psBatchOut) ( OGRWkbBatch sBatch )
+{
+  /* %typemap(in,numinputs=0) (OGRWkbBatch *psBatchOut) */
+  memset(&sBatch, 0, sizeof(sBatch));
+  $1 = &sBatch;
+}
+%typemap(argout) (OGRWkbBatch *psBatchOut)
+{
+  /* %typemap(argout) (OGRWkbBatch *psBatchOut) */
+  Py_XDECREF($result);
+  if( result != 0 ) {
+    /* Do not return a partial batch */
+    $result = Py_None;
+    Py_INCREF($result);
+  }
+  else {
+    PyObject *offsets = PyList_New( $1->nOffsets );
+    for( size_t i = 0; i < $1->nOffsets; i++ ) {
+      PyList_SetItem(offsets, i, PyLong_FromLongLong( $1->panOffsets[i] ));
+    }
+    $result = PyTuple_New(2);
+%#if PY_VERSION_HEX >= 0x03000000
+    PyTuple_SetItem($result, 0, PyBytes_FromStringAndSize( (const char*)$1->pabyWkb, $1->nWkbSize ));
+%#else
+    PyTuple_SetItem($result, 0, PyString_FromStringAndSize( (const char*)$1->pabyWkb, $1->nWkbSize ));
+%#endif
+    PyTuple_SetItem($result, 1, offsets);
+  }
+}
+%typemap(ret) OGRErr ExportGeometriesToWkb
+{
+  /* %typemap(ret) OGRErr ExportGeometriesToWkb */
+  /* None is returned on error, instead of the error code */
+}
+%typemap(freearg) (OGRWkbBatch *psBatchOut)
+{
+  /* %typemap(freearg) (OGRWkbBatch *psBatchOut) */
+  VSIFree( $1->pabyWkb );
+  VSIFree( $1->panOffsets );
+}
+
+
+%typemap(in,numinputs=0) (struct ArrowArrayStream** ppStreamOut) ( struct ArrowArrayStream* pStream = NULL )
+{
+  /* %typemap(in,numinputs=0) (struct ArrowArrayStream** ppStreamOut) */
+  $1 = &pStream;
+}
+%typemap(argout) (struct ArrowArrayStream** ppStreamOut)
+{
+  /* %typemap(argout) (struct ArrowArrayStream** ppStreamOut) */
+  Py_XDECREF($result);
+  if( *$1 ) {
+    $result = PyCapsule_New( *$1, "arrow_array_stream",
+                             OGRArrowArrayStreamCapsuleDestructor );
+    /* The capsule now owns the stream */
+    *$1 = NULL;
+  }
+  else {
+    $result = Py_None;
+    Py_INCREF($result);
+  }
+}
+%typemap(freearg) (struct ArrowArrayStream** ppStreamOut)
+{
+  /* %typemap(freearg) (struct ArrowArrayStream** ppStreamOut) */
+  if( *$1 ) {
+    if( (*$1)->release )
+      (*$1)->release( *$1 );
+    CPLFree( *$1 );
+  }
+}
+
+
 %typemap(in,numinputs=0) (OSRSpatialReferenceShadow*** matches = NULL, int* nvalues = NULL, int** confidence_values = NULL) ( OGRSpatialReferenceH* pahSRS = NULL, int nvalues = 0, int* confidence_values = NULL )
 {
   /* %typemap(in) (OSRSpatialReferenceShadow***, int* nvalues, int** confidence_values)  */
@@ -4079,6 +4079,99 @@ SWIGINTERN OGRErr OGRDataSourceShadow_CommitTransaction(OGRDataSourceShadow *sel
 SWIGINTERN OGRErr OGRDataSourceShadow_RollbackTransaction(OGRDataSourceShadow *self){
     return GDALDatasetRollbackTransaction(self);
   }
+
+/* Concatenation of the ISO WKB of several geometries, with the offsets */
+/* of their start and end. A NULL geometry is an empty range. */
+typedef struct
+{
+    GByte   *pabyWkb;
+    size_t   nWkbSize;
+    size_t   nWkbCapacity;
+    GIntBig *panOffsets;
+    size_t   nOffsets;
+    size_t   nOffsetsCapacity;
+} OGRWkbBatch;
+
+static int OGRWkbBatchAddOffset( OGRWkbBatch *psBatch )
+{
+    if( psBatch->nOffsets == psBatch->nOffsetsCapacity )
+    {
+        const size_t nNewCapacity = psBatch->nOffsetsCapacity * 2 + 64;
+        GIntBig* panNew = static_cast<GIntBig*>(VSI_REALLOC_VERBOSE(
+            psBatch->panOffsets, nNewCapacity * sizeof(GIntBig)));
+        if( panNew == NULL )
+            return FALSE;
+        psBatch->panOffsets = panNew;
+        psBatch->nOffsetsCapacity = nNewCapacity;
+    }
+    psBatch->panOffsets[psBatch->nOffsets++] =
+        static_cast<GIntBig>(psBatch->nWkbSize);
+    return TRUE;
+}
+
+static int OGRWkbBatchAppend( OGRWkbBatch *psBatch, OGRGeometryH hGeom,
+                              OGRwkbByteOrder eByteOrder )
+{
+    const size_t nSize = hGeom ? static_cast<size_t>(OGR_G_WkbSize(hGeom)) : 0;
+    if( psBatch->nWkbSize + nSize > psBatch->nWkbCapacity )
+    {
+        size_t nNewCapacity = psBatch->nWkbCapacity * 2;
+        if( nNewCapacity < psBatch->nWkbSize + nSize + 4096 )
+            nNewCapacity = psBatch->nWkbSize + nSize + 4096;
+        GByte* pabyNew = static_cast<GByte*>(VSI_REALLOC_VERBOSE(
+            psBatch->pabyWkb, nNewCapacity));
+        if( pabyNew == NULL )
+            return FALSE;
+        psBatch->pabyWkb = pabyNew;
+        psBatch->nWkbCapacity = nNewCapacity;
+    }
+    if( hGeom != NULL &&
+        OGR_G_ExportToIsoWkb(hGeom, eByteOrder,
+                             psBatch->pabyWkb + psBatch->nWkbSize) != OGRERR_NONE )
+    {
+        return FALSE;
+    }
+    psBatch->nWkbSize += nSize;
+    return OGRWkbBatchAddOffset(psBatch);
+}
+
+static int OGRWkbBatchCheckOffsets( int nLen, int nOffsets,
+                                    const GIntBig *panOffsets )
+{
+    if( nOffsets == 0 )
+    {
+        CPLError(CE_Failure, CPLE_IllegalArg,
+                 "Offsets should contain at least one value");
+        return FALSE;
+    }
+    for( int i = 0; i < nOffsets; i++ )
+    {
+        if( panOffsets[i] < 0 || panOffsets[i] > nLen ||
+            (i > 0 && panOffsets[i] < panOffsets[i-1]) )
+        {
+            CPLError(CE_Failure, CPLE_IllegalArg,
+                     "Invalid offset at index %d: " CPL_FRMT_GIB,
+                     i, panOffsets[i]);
+            return FALSE;
+        }
+    }
+    return TRUE;
+}
+
+#include "ogr_recordbatch.h"
+
+/* Destructor of the PyCapsule returned by Layer.GetArrowStream() */
+static void OGRArrowArrayStreamCapsuleDestructor( PyObject* capsule )
+{
+    struct ArrowArrayStream* stream = static_cast<struct ArrowArrayStream*>(
+        PyCapsule_GetPointer(capsule, "arrow_array_stream"));
+    if( stream == NULL )
+        return;
+    if( stream->release != NULL )
+        stream->release(stream);
+    CPLFree(stream);
+}
+
 SWIGINTERN int OGRLayerShadow_GetRefCount(OGRLayerShadow *self){
     return OGR_L_GetRefCount(self);
   }
@@ -4261,6 +4354,75 @@ SWIGINTERN void OGRLayerShadow_SetStyleTable(OGRLayerShadow *self,OGRStyleTableS
     if( table != NULL )
         OGR_L_SetStyleTable(self, (OGRStyleTableH) table);
   }
+SWIGINTERN OGRErr OGRLayerShadow_ExportGeometriesToWkb(OGRLayerShadow *self,OGRWkbBatch *psBatchOut,OGRwkbByteOrder byte_order=wkbNDR,int geom_field=0){
+    OGRFeatureDefnH hDefn = OGR_L_GetLayerDefn(self);
+    if( geom_field < 0 || geom_field >= OGR_FD_GetGeomFieldCount(hDefn) )
+    {
+      CPLError(CE_Failure, CPLE_IllegalArg,
+               "Invalid geometry field index: %d", geom_field);
+      return OGRERR_FAILURE;
+    }
+    if( !OGRWkbBatchAddOffset(psBatchOut) )
+      return OGRERR_NOT_ENOUGH_MEMORY;
+    OGR_L_ResetReading(self);
+    OGRFeatureH hFeat;
+    while( (hFeat = OGR_L_GetNextFeature(self)) != NULL )
+    {
+      const int bOK = OGRWkbBatchAppend(psBatchOut,
+                                        OGR_F_GetGeomFieldRef(hFeat, geom_field),
+                                        byte_order);
+      OGR_F_Destroy(hFeat);
+      if( !bOK )
+        return OGRERR_FAILURE;
+    }
+    return OGRERR_NONE;
+  }
+SWIGINTERN void OGRLayerShadow_GetArrowStream(OGRLayerShadow *self,struct ArrowArrayStream **ppStreamOut,char **options=NULL){
+    struct ArrowArrayStream* stream = static_cast<struct ArrowArrayStream*>(
+        CPLMalloc(sizeof(struct ArrowArrayStream)));
+    if( OGR_L_GetArrowStream(self, stream, options) )
+      *ppStreamOut = stream;
+    else
+      CPLFree(stream);
+  }
+SWIGINTERN OGRErr OGRLayerShadow_CreateFeaturesFromWkb(OGRLayerShadow *self,int len,char *bin_string,int nOffsets,GIntBig *panOffsets,int geom_field=0){
+    OGRFeatureDefnH hDefn = OGR_L_GetLayerDefn(self);
+    if( geom_field < 0 || geom_field >= OGR_FD_GetGeomFieldCount(hDefn) )
+    {
+      CPLError(CE_Failure, CPLE_IllegalArg,
+               "Invalid geometry field index: %d", geom_field);
+      return OGRERR_FAILURE;
+    }
+    if( !OGRWkbBatchCheckOffsets(len, nOffsets, panOffsets) )
+      return OGRERR_FAILURE;
+    OGRSpatialReferenceH hSRS = OGR_GFld_GetSpatialRef(
+        OGR_FD_GetGeomFieldDefn(hDefn, geom_field));
+    for( int i = 0; i < nOffsets - 1; i++ )
+    {
+      OGRFeatureH hFeat = OGR_F_Create(hDefn);
+      const int nSize = static_cast<int>(panOffsets[i+1] - panOffsets[i]);
+      if( nSize > 0 )
+      {
+        OGRGeometryH hGeom = NULL;
+        OGRErr eErr = OGR_G_CreateFromWkb(bin_string + panOffsets[i], hSRS,
+                                          &hGeom, nSize);
+        if( eErr != OGRERR_NONE )
+        {
+          CPLError(CE_Failure, CPLE_AppDefined,
+                   "Invalid WKB geometry at index %d: %s",
+                   i, OGRErrMessages(eErr));
+          OGR_F_Destroy(hFeat);
+          return eErr;
+        }
+        OGR_F_SetGeomFieldDirectly(hFeat, geom_field, hGeom);
+      }
+      OGRErr eErr = OGR_L_CreateFeature(self, hFeat);
+      OGR_F_Destroy(hFeat);
+      if( eErr != OGRERR_NONE )
+        return eErr;
+    }
+    return OGRERR_NONE;
+  }
 SWIGINTERN void delete_OGRFeatureShadow(OGRFeatureShadow *self){
     OGR_F_Destroy(self);
   }
@@ -5057,6 +5219,55 @@ SWIGINTERN void OGRGeomFieldDefnShadow_SetNullable(OGRGeomFieldDefnShadow *self,
 
 
 
+  OGRErr CreateGeometriesFromWkb( OGRGeometryShadow*** pgeoms, size_t* pnCount,
+                                  int len, char *bin_string,
+                                  int nOffsets, GIntBig *panOffsets,
+                                  OSRSpatialReferenceShadow *reference=NULL ) {
+    if( !OGRWkbBatchCheckOffsets(len, nOffsets, panOffsets) )
+      return OGRERR_FAILURE;
+    const size_t nCount = static_cast<size_t>(nOffsets - 1);
+    OGRGeometryH* pahGeoms = static_cast<OGRGeometryH*>(
+        VSI_CALLOC_VERBOSE(nCount ? nCount : 1, sizeof(OGRGeometryH)));
+    if( pahGeoms == NULL )
+      return OGRERR_NOT_ENOUGH_MEMORY;
+    for( size_t i = 0; i < nCount; i++ )
+    {
+      const int nSize = static_cast<int>(panOffsets[i+1] - panOffsets[i]);
+      if( nSize == 0 )
+        continue;
+      OGRErr eErr = OGR_G_CreateFromWkb(bin_string + panOffsets[i], reference,
+                                        &pahGeoms[i], nSize);
+      if( eErr != OGRERR_NONE )
+      {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "Invalid WKB geometry at index %d: %s",
+                 static_cast<int>(i), OGRErrMessages(eErr));
+        for( size_t j = 0; j < i; j++ )
+          OGR_G_DestroyGeometry(pahGeoms[j]);
+        CPLFree(pahGeoms);
+        return eErr;
+      }
+    }
+    *pgeoms = reinterpret_cast<OGRGeometryShadow**>(pahGeoms);
+    *pnCount = nCount;
+    return OGRERR_NONE;
+  }
+
+
+  OGRErr ExportGeometriesToWkb( OGRWkbBatch *psBatchOut,
+                                int nGeometries, OGRGeometryShadow **pahGeometries,
+                                OGRwkbByteOrder byte_order=wkbNDR ) {
+    if( !OGRWkbBatchAddOffset(psBatchOut) )
+      return OGRERR_NOT_ENOUGH_MEMORY;
+    for( int i = 0; i < nGeometries; i++ )
+    {
+      if( !OGRWkbBatchAppend(psBatchOut, pahGeometries[i], byte_order) )
+        return OGRERR_FAILURE;
+    }
+    return OGRERR_NONE;
+  }
+
+
   OGRGeometryShadow* CreateGeometryFromWkt( char **val,
                                       OSRSpatialReferenceShadow *reference=NULL ) {
     OGRGeometryH geom = NULL;
@@ -5283,6 +5494,41 @@ SWIGINTERN void OGRGeometryShadow_GetPoints(OGRGeometryShadow *self,int *pnCount
                     (*ppadfXY) + 1, 2 * sizeof(double),
                     *ppadfZ, sizeof(double));
   }
+SWIGINTERN OGRErr OGRGeometryShadow_SetPointsFromBuffer(OGRGeometryShadow *self,int nLen,char *pBuf,int bHasZ=FALSE,int bHasM=FALSE){
+    const int nStride = static_cast<int>(sizeof(double)) *
+                        (2 + (bHasZ ? 1 : 0) + (bHasM ? 1 : 0));
+    if( nLen % nStride != 0 )
+    {
+        CPLError(CE_Failure, CPLE_AppDefined,
+                 "Buffer size should be a multiple of %d bytes", nStride);
+        return OGRERR_FAILURE;
+    }
+    const OGRwkbGeometryType eType = wkbFlatten(OGR_G_GetGeometryType(self));
+    const int nPoints = nLen / nStride;
+    if( (eType != wkbPoint && eType != wkbLineString &&
+         eType != wkbCircularString) ||
+        (eType == wkbPoint && nPoints > 1) )
+    {
+        CPLError(CE_Failure, CPLE_NotSupported,
+                 "SetPointsFromBuffer() only supports a Point with at most one "
+                 "point, or a LineString, LinearRing or CircularString");
+        return OGRERR_UNSUPPORTED_GEOMETRY_TYPE;
+    }
+    OGR_G_Set3D(self, bHasZ);
+    OGR_G_SetMeasured(self, bHasM);
+    if( nPoints == 0 )
+    {
+        OGR_G_Empty(self);
+        return OGRERR_NONE;
+    }
+    OGR_G_SetPointsZM(self, nPoints,
+                      pBuf, nStride,
+                      pBuf + sizeof(double), nStride,
+                      bHasZ ? pBuf + 2 * sizeof(double) : NULL, bHasZ ? nStride : 0,
+                      bHasM ? pBuf + (bHasZ ? 3 : 2) * sizeof(double) : NULL,
+                      bHasM ? nStride : 0);
+    return OGRERR_NONE;
+  }
 SWIGINTERN double OGRGeometryShadow_GetX(OGRGeometryShadow *self,int point=0){
     return OGR_G_GetX(self, point);
   }
@@ -12091,33 +12337,59 @@ fail:
 }
 
 
-SWIGINTERN PyObject *Layer_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_OGRLayerShadow, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *_wrap_delete_Feature(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Layer_ExportGeometriesToWkb(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
-  OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
+  OGRLayerShadow *arg1 = (OGRLayerShadow *) 0 ;
+  OGRWkbBatch *arg2 = (OGRWkbBatch *) 0 ;
+  OGRwkbByteOrder arg3 = (OGRwkbByteOrder) wkbNDR ;
+  int arg4 = (int) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  OGRWkbBatch sBatch2 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
   PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  char *  kwnames[] = {
+    (char *) "self",(char *) "byte_order",(char *) "geom_field", NULL 
+  };
+  OGRErr result;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:delete_Feature",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, SWIG_POINTER_DISOWN |  0 );
+  {
+    /* %typemap(in,numinputs=0) (OGRWkbBatch *psBatchOut) */
+    memset(&sBatch2, 0, sizeof(sBatch2));
+    arg2 = &sBatch2;
+  }
+  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O|OO:Layer_ExportGeometriesToWkb",kwnames,&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRLayerShadow, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Feature" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Layer_ExportGeometriesToWkb" "', argument " "1"" of type '" "OGRLayerShadow *""'"); 
+  }
+  arg1 = reinterpret_cast< OGRLayerShadow * >(argp1);
+  if (obj1) {
+    ecode3 = SWIG_AsVal_int(obj1, &val3);
+    if (!SWIG_IsOK(ecode3)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "F3AME" "', argument " "3"" of type '" "OGRwkbByteOrder""'");
+    } 
+    arg3 = static_cast< OGRwkbByteOrder >(val3);
+  }
+  if (obj2) {
+    ecode4 = SWIG_AsVal_int(obj2, &val4);
+    if (!SWIG_IsOK(ecode4)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "F4AME" "', argument " "4"" of type '" "int""'");
+    } 
+    arg4 = static_cast< int >(val4);
   }
-  arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
   {
     if ( bUseExceptions ) {
       ClearErrorState();
     }
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      delete_OGRFeatureShadow(arg1);
+      result = (OGRErr)OGRLayerShadow_ExportGeometriesToWkb(arg1,arg2,arg3,arg4);
       SWIG_PYTHON_THREAD_END_ALLOW;
     }
 #ifndef SED_HACKS
@@ -12129,34 +12401,93 @@ SWIGINTERN PyObject *_wrap_delete_Feature(PyObject *SWIGUNUSEDPARM(self), PyObje
     }
 #endif
   }
-  resultobj = SWIG_Py_Void();
+  {
+    /* %typemap(out) OGRErr */
+    if ( result != 0 && bUseExceptions) {
+      const char* pszMessage = CPLGetLastErrorMsg();
+      if( pszMessage[0] != '\0' )
+      PyErr_SetString( PyExc_RuntimeError, pszMessage );
+      else
+      PyErr_SetString( PyExc_RuntimeError, OGRErrMessages(result) );
+      SWIG_fail;
+    }
+  }
+  {
+    /* %typemap(argout) (OGRWkbBatch *psBatchOut) */
+    Py_XDECREF(resultobj);
+    if( result != 0 ) {
+      /* Do not return a partial batch */
+      resultobj = Py_None;
+      Py_INCREF(resultobj);
+    }
+    else {
+      PyObject *offsets = PyList_New( arg2->nOffsets );
+      for( size_t i = 0; i < arg2->nOffsets; i++ ) {
+        PyList_SetItem(offsets, i, PyLong_FromLongLong( arg2->panOffsets[i] ));
+      }
+      resultobj = PyTuple_New(2);
+#if PY_VERSION_HEX >= 0x03000000
+      PyTuple_SetItem(resultobj, 0, PyBytes_FromStringAndSize( (const char*)arg2->pabyWkb, arg2->nWkbSize ));
+#else
+      PyTuple_SetItem(resultobj, 0, PyString_FromStringAndSize( (const char*)arg2->pabyWkb, arg2->nWkbSize ));
+#endif
+      PyTuple_SetItem(resultobj, 1, offsets);
+    }
+  }
+  {
+    /* %typemap(freearg) (OGRWkbBatch *psBatchOut) */
+    VSIFree( arg2->pabyWkb );
+    VSIFree( arg2->panOffsets );
+  }
+  {
+    /* %typemap(ret) OGRErr ExportGeometriesToWkb */
+    /* None is returned on error, instead of the error code */
+  }
   if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
   return resultobj;
 fail:
+  {
+    /* %typemap(freearg) (OGRWkbBatch *psBatchOut) */
+    VSIFree( arg2->pabyWkb );
+    VSIFree( arg2->panOffsets );
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_Feature(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+SWIGINTERN PyObject *_wrap_Layer_GetArrowStream(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
-  OGRFeatureDefnShadow *arg1 = (OGRFeatureDefnShadow *) 0 ;
+  OGRLayerShadow *arg1 = (OGRLayerShadow *) 0 ;
+  struct ArrowArrayStream **arg2 = (struct ArrowArrayStream **) 0 ;
+  char **arg3 = (char **) NULL ;
   void *argp1 = 0 ;
   int res1 = 0 ;
+  struct ArrowArrayStream *pStream2 = NULL ;
   PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
   char *  kwnames[] = {
-    (char *) "feature_def", NULL 
+    (char *) "self",(char *) "options", NULL 
   };
-  OGRFeatureShadow *result = 0 ;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O:new_Feature",kwnames,&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureDefnShadow, 0 |  0 );
+  {
+    /* %typemap(in,numinputs=0) (struct ArrowArrayStream** ppStreamOut) */
+    arg2 = &pStream2;
+  }
+  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O|O:Layer_GetArrowStream",kwnames,&obj0,&obj1)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRLayerShadow, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_Feature" "', argument " "1"" of type '" "OGRFeatureDefnShadow *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Layer_GetArrowStream" "', argument " "1"" of type '" "OGRLayerShadow *""'"); 
   }
-  arg1 = reinterpret_cast< OGRFeatureDefnShadow * >(argp1);
-  {
-    if (!arg1) {
-      SWIG_exception(SWIG_ValueError,"Received a NULL pointer.");
+  arg1 = reinterpret_cast< OGRLayerShadow * >(argp1);
+  if (obj1) {
+    {
+      /* %typemap(in) char **options */
+      int bErr = FALSE;
+      arg3 = CSLFromPySequence(obj1, &bErr);
+      if( bErr )
+      {
+        SWIG_fail;
+      }
     }
   }
   {
@@ -12165,7 +12496,7 @@ SWIGINTERN PyObject *_wrap_new_Feature(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      result = (OGRFeatureShadow *)new_OGRFeatureShadow(arg1);
+      OGRLayerShadow_GetArrowStream(arg1,arg2,arg3);
       SWIG_PYTHON_THREAD_END_ALLOW;
     }
 #ifndef SED_HACKS
@@ -12177,90 +12508,190 @@ SWIGINTERN PyObject *_wrap_new_Feature(PyObject *SWIGUNUSEDPARM(self), PyObject
     }
 #endif
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_OGRFeatureShadow, SWIG_POINTER_NEW |  0 );
-  if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
-  return resultobj;
-fail:
-  return NULL;
-}
-
-
-SWIGINTERN PyObject *_wrap_Feature_GetDefnRef(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
-  OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
-  void *argp1 = 0 ;
-  int res1 = 0 ;
-  PyObject * obj0 = 0 ;
-  OGRFeatureDefnShadow *result = 0 ;
-  
-  if (!PyArg_ParseTuple(args,(char *)"O:Feature_GetDefnRef",&obj0)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
-  if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_GetDefnRef" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
-  }
-  arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
+  resultobj = SWIG_Py_Void();
   {
-    if ( bUseExceptions ) {
-      ClearErrorState();
+    /* %typemap(argout) (struct ArrowArrayStream** ppStreamOut) */
+    Py_XDECREF(resultobj);
+    if( *arg2 ) {
+      resultobj = PyCapsule_New( *arg2, "arrow_array_stream",
+        OGRArrowArrayStreamCapsuleDestructor );
+      /* The capsule now owns the stream */
+      *arg2 = NULL;
     }
-    {
-      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      result = (OGRFeatureDefnShadow *)OGRFeatureShadow_GetDefnRef(arg1);
-      SWIG_PYTHON_THREAD_END_ALLOW;
+    else {
+      resultobj = Py_None;
+      Py_INCREF(resultobj);
     }
-#ifndef SED_HACKS
-    if ( bUseExceptions ) {
-      CPLErr eclass = CPLGetLastErrorType();
-      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
-        SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
-      }
+  }
+  {
+    /* %typemap(freearg) (struct ArrowArrayStream** ppStreamOut) */
+    if( *arg2 ) {
+      if( (*arg2)->release )
+      (*arg2)->release( *arg2 );
+      CPLFree( *arg2 );
     }
-#endif
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_OGRFeatureDefnShadow, 0 |  0 );
+  {
+    /* %typemap(freearg) char **options */
+    CSLDestroy( arg3 );
+  }
   if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
   return resultobj;
 fail:
+  {
+    /* %typemap(freearg) (struct ArrowArrayStream** ppStreamOut) */
+    if( *arg2 ) {
+      if( (*arg2)->release )
+      (*arg2)->release( *arg2 );
+      CPLFree( *arg2 );
+    }
+  }
+  {
+    /* %typemap(freearg) char **options */
+    CSLDestroy( arg3 );
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Feature_SetGeometry(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Layer_CreateFeaturesFromWkb(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
-  OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
-  OGRGeometryShadow *arg2 = (OGRGeometryShadow *) 0 ;
+  OGRLayerShadow *arg1 = (OGRLayerShadow *) 0 ;
+  int arg2 ;
+  char *arg3 = (char *) 0 ;
+  int arg4 ;
+  GIntBig *arg5 = (GIntBig *) 0 ;
+  int arg6 = (int) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int alloc2 = 0 ;
+  int val6 ;
+  int ecode6 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  char *  kwnames[] = {
+    (char *) "self",(char *) "len",(char *) "nOffsets",(char *) "geom_field", NULL 
+  };
   OGRErr result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Feature_SetGeometry",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
+  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OOO|O:Layer_CreateFeaturesFromWkb",kwnames,&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRLayerShadow, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_SetGeometry" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
-  }
-  arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_OGRGeometryShadow, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Feature_SetGeometry" "', argument " "2"" of type '" "OGRGeometryShadow *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Layer_CreateFeaturesFromWkb" "', argument " "1"" of type '" "OGRLayerShadow *""'"); 
   }
-  arg2 = reinterpret_cast< OGRGeometryShadow * >(argp2);
+  arg1 = reinterpret_cast< OGRLayerShadow * >(argp1);
   {
-    if ( bUseExceptions ) {
-      ClearErrorState();
-    }
+    /* %typemap(in,numinputs=1) (int nLen, char *pBuf ) */
     {
-      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      result = (OGRErr)OGRFeatureShadow_SetGeometry(arg1,arg2);
-      SWIG_PYTHON_THREAD_END_ALLOW;
-    }
-#ifndef SED_HACKS
-    if ( bUseExceptions ) {
-      CPLErr eclass = CPLGetLastErrorType();
-      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
+      Py_ssize_t safeLen = 0;
+      const void *safeBuf = 0;
+      int res = PyObject_AsReadBuffer(obj1, &safeBuf, &safeLen);
+      if (res == 0) {
+        if( safeLen > INT_MAX ) {
+          SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+        }
+        arg2 = (int) safeLen;
+        arg3 = (char *) safeBuf;
+        goto ok;
+      } else {
+        PyErr_Clear();
+      }
+    }
+#if PY_VERSION_HEX>=0x03000000
+    if (PyUnicode_Check(obj1))
+    {
+      size_t safeLen = 0;
+      int ret = SWIG_AsCharPtrAndSize(obj1, (char**) &arg3, &safeLen, &alloc2);
+      if (!SWIG_IsOK(ret)) {
+        SWIG_exception( SWIG_RuntimeError, "invalid Unicode string" );
+      }
+      
+      if (safeLen) safeLen--;
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg2 = (int) safeLen;
+    }
+    else if (PyBytes_Check(obj1))
+    {
+      Py_ssize_t safeLen = 0;
+      PyBytes_AsStringAndSize(obj1, (char**) &arg3, &safeLen);
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg2 = (int) safeLen;
+    }
+    else
+    {
+      PyErr_SetString(PyExc_TypeError, "not a unicode string or a bytes");
+      SWIG_fail;
+    }
+#else
+    if (PyString_Check(obj1))
+    {
+      Py_ssize_t safeLen = 0;
+      PyString_AsStringAndSize(obj1, (char**) &arg3, &safeLen);
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg2 = (int) safeLen;
+    }
+    else
+    {
+      PyErr_SetString(PyExc_TypeError, "not a string");
+      SWIG_fail;
+    }
+#endif
+    ok: ;
+  }
+  {
+    /* %typemap(in,numinputs=1) (int nList, GIntBig* pList)*/
+    /* check if is List */
+    if ( !PySequence_Check(obj2) ) {
+      PyErr_SetString(PyExc_TypeError, "not a sequence");
+      SWIG_fail;
+    }
+    Py_ssize_t size = PySequence_Size(obj2);
+    if( size != (int)size ) {
+      PyErr_SetString(PyExc_TypeError, "too big sequence");
+      SWIG_fail;
+    }
+    arg4 = (int)size;
+    arg5 = (GIntBig*) malloc(arg4*sizeof(GIntBig));
+    for( int i = 0; i<arg4; i++ ) {
+      PyObject *o = PySequence_GetItem(obj2,i);
+      PY_LONG_LONG val;
+      if ( !PyArg_Parse(o,"L",&val) ) {
+        PyErr_SetString(PyExc_TypeError, "not an integer");
+        Py_DECREF(o);
+        SWIG_fail;
+      }
+      arg5[i] = (GIntBig)val;
+      Py_DECREF(o);
+    }
+  }
+  if (obj3) {
+    ecode6 = SWIG_AsVal_int(obj3, &val6);
+    if (!SWIG_IsOK(ecode6)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode6), "in method '" "F6AME" "', argument " "6"" of type '" "int""'");
+    } 
+    arg6 = static_cast< int >(val6);
+  }
+  {
+    if ( bUseExceptions ) {
+      ClearErrorState();
+    }
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (OGRErr)OGRLayerShadow_CreateFeaturesFromWkb(arg1,arg2,arg3,arg4,arg5,arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+#ifndef SED_HACKS
+    if ( bUseExceptions ) {
+      CPLErr eclass = CPLGetLastErrorType();
+      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
         SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
       }
     }
@@ -12277,6 +12708,18 @@ SWIGINTERN PyObject *_wrap_Feature_SetGeometry(PyObject *SWIGUNUSEDPARM(self), P
       SWIG_fail;
     }
   }
+  {
+    /* %typemap(freearg) (int *nLen, char *pBuf ) */
+    if (ReturnSame(alloc2) == SWIG_NEWOBJ ) {
+      delete[] arg3;
+    }
+  }
+  {
+    /* %typemap(freearg) (int nList, GIntBig* pList) */
+    if (arg5) {
+      free((void*) arg5);
+    }
+  }
   {
     /* %typemap(ret) OGRErr */
     if ( ReturnSame(resultobj == Py_None || resultobj == 0) ) {
@@ -12286,38 +12729,49 @@ SWIGINTERN PyObject *_wrap_Feature_SetGeometry(PyObject *SWIGUNUSEDPARM(self), P
   if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
   return resultobj;
 fail:
+  {
+    /* %typemap(freearg) (int *nLen, char *pBuf ) */
+    if (ReturnSame(alloc2) == SWIG_NEWOBJ ) {
+      delete[] arg3;
+    }
+  }
+  {
+    /* %typemap(freearg) (int nList, GIntBig* pList) */
+    if (arg5) {
+      free((void*) arg5);
+    }
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_Feature_SetGeometryDirectly(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *Layer_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!PyArg_ParseTuple(args,(char *)"O:swigregister", &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_OGRLayerShadow, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *_wrap_delete_Feature(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
   OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
-  OGRGeometryShadow *arg2 = (OGRGeometryShadow *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int res2 = 0 ;
   PyObject * obj0 = 0 ;
-  PyObject * obj1 = 0 ;
-  OGRErr result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OO:Feature_SetGeometryDirectly",&obj0,&obj1)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
+  if (!PyArg_ParseTuple(args,(char *)"O:delete_Feature",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, SWIG_POINTER_DISOWN |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_SetGeometryDirectly" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_Feature" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
   }
   arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
-  res2 = SWIG_ConvertPtr(obj1, SWIG_as_voidptrptr(&arg2), SWIGTYPE_p_OGRGeometryShadow, SWIG_POINTER_DISOWN |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Feature_SetGeometryDirectly" "', argument " "2"" of type '" "OGRGeometryShadow *""'");
-  }
   {
     if ( bUseExceptions ) {
       ClearErrorState();
     }
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      result = (OGRErr)OGRFeatureShadow_SetGeometryDirectly(arg1,arg2);
+      delete_OGRFeatureShadow(arg1);
       SWIG_PYTHON_THREAD_END_ALLOW;
     }
 #ifndef SED_HACKS
@@ -12329,23 +12783,55 @@ SWIGINTERN PyObject *_wrap_Feature_SetGeometryDirectly(PyObject *SWIGUNUSEDPARM(
     }
 #endif
   }
+  resultobj = SWIG_Py_Void();
+  if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_Feature(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
+  OGRFeatureDefnShadow *arg1 = (OGRFeatureDefnShadow *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  char *  kwnames[] = {
+    (char *) "feature_def", NULL 
+  };
+  OGRFeatureShadow *result = 0 ;
+  
+  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O:new_Feature",kwnames,&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureDefnShadow, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "new_Feature" "', argument " "1"" of type '" "OGRFeatureDefnShadow *""'"); 
+  }
+  arg1 = reinterpret_cast< OGRFeatureDefnShadow * >(argp1);
   {
-    /* %typemap(out) OGRErr */
-    if ( result != 0 && bUseExceptions) {
-      const char* pszMessage = CPLGetLastErrorMsg();
-      if( pszMessage[0] != '\0' )
-      PyErr_SetString( PyExc_RuntimeError, pszMessage );
-      else
-      PyErr_SetString( PyExc_RuntimeError, OGRErrMessages(result) );
-      SWIG_fail;
+    if (!arg1) {
+      SWIG_exception(SWIG_ValueError,"Received a NULL pointer.");
     }
   }
   {
-    /* %typemap(ret) OGRErr */
-    if ( ReturnSame(resultobj == Py_None || resultobj == 0) ) {
-      resultobj = PyInt_FromLong( result );
+    if ( bUseExceptions ) {
+      ClearErrorState();
+    }
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (OGRFeatureShadow *)new_OGRFeatureShadow(arg1);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+#ifndef SED_HACKS
+    if ( bUseExceptions ) {
+      CPLErr eclass = CPLGetLastErrorType();
+      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
+        SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
+      }
     }
+#endif
   }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_OGRFeatureShadow, SWIG_POINTER_NEW |  0 );
   if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
   return resultobj;
 fail:
@@ -12353,18 +12839,18 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Feature_GetGeometryRef(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Feature_GetDefnRef(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
   OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject * obj0 = 0 ;
-  OGRGeometryShadow *result = 0 ;
+  OGRFeatureDefnShadow *result = 0 ;
   
-  if (!PyArg_ParseTuple(args,(char *)"O:Feature_GetGeometryRef",&obj0)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"O:Feature_GetDefnRef",&obj0)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_GetGeometryRef" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_GetDefnRef" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
   }
   arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
   {
@@ -12373,7 +12859,7 @@ SWIGINTERN PyObject *_wrap_Feature_GetGeometryRef(PyObject *SWIGUNUSEDPARM(self)
     }
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      result = (OGRGeometryShadow *)OGRFeatureShadow_GetGeometryRef(arg1);
+      result = (OGRFeatureDefnShadow *)OGRFeatureShadow_GetDefnRef(arg1);
       SWIG_PYTHON_THREAD_END_ALLOW;
     }
 #ifndef SED_HACKS
@@ -12385,7 +12871,7 @@ SWIGINTERN PyObject *_wrap_Feature_GetGeometryRef(PyObject *SWIGUNUSEDPARM(self)
     }
 #endif
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_OGRGeometryShadow, 0 |  0 );
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_OGRFeatureDefnShadow, 0 |  0 );
   if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
   return resultobj;
 fail:
@@ -12393,45 +12879,36 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Feature_SetGeomField__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Feature_SetGeometry(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
   OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
-  int arg2 ;
-  OGRGeometryShadow *arg3 = (OGRGeometryShadow *) 0 ;
+  OGRGeometryShadow *arg2 = (OGRGeometryShadow *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int val2 ;
-  int ecode2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
   OGRErr result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Feature_SetGeomField",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:Feature_SetGeometry",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_SetGeomField" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_SetGeometry" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
   }
   arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
-  ecode2 = SWIG_AsVal_int(obj1, &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Feature_SetGeomField" "', argument " "2"" of type '" "int""'");
-  } 
-  arg2 = static_cast< int >(val2);
-  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_OGRGeometryShadow, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Feature_SetGeomField" "', argument " "3"" of type '" "OGRGeometryShadow *""'"); 
+  res2 = SWIG_ConvertPtr(obj1, &argp2,SWIGTYPE_p_OGRGeometryShadow, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Feature_SetGeometry" "', argument " "2"" of type '" "OGRGeometryShadow *""'"); 
   }
-  arg3 = reinterpret_cast< OGRGeometryShadow * >(argp3);
+  arg2 = reinterpret_cast< OGRGeometryShadow * >(argp2);
   {
     if ( bUseExceptions ) {
       ClearErrorState();
     }
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      result = (OGRErr)OGRFeatureShadow_SetGeomField__SWIG_0(arg1,arg2,arg3);
+      result = (OGRErr)OGRFeatureShadow_SetGeometry(arg1,arg2);
       SWIG_PYTHON_THREAD_END_ALLOW;
     }
 #ifndef SED_HACKS
@@ -12467,34 +12944,211 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_Feature_SetGeomField__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_Feature_SetGeometryDirectly(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
   OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
-  char *arg2 = (char *) 0 ;
-  OGRGeometryShadow *arg3 = (OGRGeometryShadow *) 0 ;
+  OGRGeometryShadow *arg2 = (OGRGeometryShadow *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  int bToFree2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
+  int res2 = 0 ;
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
-  PyObject * obj2 = 0 ;
   OGRErr result;
   
-  if (!PyArg_ParseTuple(args,(char *)"OOO:Feature_SetGeomField",&obj0,&obj1,&obj2)) SWIG_fail;
+  if (!PyArg_ParseTuple(args,(char *)"OO:Feature_SetGeometryDirectly",&obj0,&obj1)) SWIG_fail;
   res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_SetGeomField" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_SetGeometryDirectly" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
   }
   arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
+  res2 = SWIG_ConvertPtr(obj1, SWIG_as_voidptrptr(&arg2), SWIGTYPE_p_OGRGeometryShadow, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "Feature_SetGeometryDirectly" "', argument " "2"" of type '" "OGRGeometryShadow *""'");
+  }
   {
-    /* %typemap(in) (const char *utf8_path) */
-    arg2 = GDALPythonObjectToCStr( obj1, &bToFree2 );
-    if (arg2 == NULL)
+    if ( bUseExceptions ) {
+      ClearErrorState();
+    }
     {
-      PyErr_SetString( PyExc_RuntimeError, "not a string" );
-      SWIG_fail;
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (OGRErr)OGRFeatureShadow_SetGeometryDirectly(arg1,arg2);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+#ifndef SED_HACKS
+    if ( bUseExceptions ) {
+      CPLErr eclass = CPLGetLastErrorType();
+      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
+        SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
+      }
+    }
+#endif
+  }
+  {
+    /* %typemap(out) OGRErr */
+    if ( result != 0 && bUseExceptions) {
+      const char* pszMessage = CPLGetLastErrorMsg();
+      if( pszMessage[0] != '\0' )
+      PyErr_SetString( PyExc_RuntimeError, pszMessage );
+      else
+      PyErr_SetString( PyExc_RuntimeError, OGRErrMessages(result) );
+      SWIG_fail;
+    }
+  }
+  {
+    /* %typemap(ret) OGRErr */
+    if ( ReturnSame(resultobj == Py_None || resultobj == 0) ) {
+      resultobj = PyInt_FromLong( result );
+    }
+  }
+  if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Feature_GetGeometryRef(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
+  OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject * obj0 = 0 ;
+  OGRGeometryShadow *result = 0 ;
+  
+  if (!PyArg_ParseTuple(args,(char *)"O:Feature_GetGeometryRef",&obj0)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_GetGeometryRef" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
+  }
+  arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
+  {
+    if ( bUseExceptions ) {
+      ClearErrorState();
+    }
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (OGRGeometryShadow *)OGRFeatureShadow_GetGeometryRef(arg1);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+#ifndef SED_HACKS
+    if ( bUseExceptions ) {
+      CPLErr eclass = CPLGetLastErrorType();
+      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
+        SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
+      }
+    }
+#endif
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_OGRGeometryShadow, 0 |  0 );
+  if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Feature_SetGeomField__SWIG_0(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
+  OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
+  int arg2 ;
+  OGRGeometryShadow *arg3 = (OGRGeometryShadow *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  OGRErr result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Feature_SetGeomField",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_SetGeomField" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
+  }
+  arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
+  ecode2 = SWIG_AsVal_int(obj1, &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "Feature_SetGeomField" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = static_cast< int >(val2);
+  res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_OGRGeometryShadow, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "Feature_SetGeomField" "', argument " "3"" of type '" "OGRGeometryShadow *""'"); 
+  }
+  arg3 = reinterpret_cast< OGRGeometryShadow * >(argp3);
+  {
+    if ( bUseExceptions ) {
+      ClearErrorState();
+    }
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (OGRErr)OGRFeatureShadow_SetGeomField__SWIG_0(arg1,arg2,arg3);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+#ifndef SED_HACKS
+    if ( bUseExceptions ) {
+      CPLErr eclass = CPLGetLastErrorType();
+      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
+        SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
+      }
+    }
+#endif
+  }
+  {
+    /* %typemap(out) OGRErr */
+    if ( result != 0 && bUseExceptions) {
+      const char* pszMessage = CPLGetLastErrorMsg();
+      if( pszMessage[0] != '\0' )
+      PyErr_SetString( PyExc_RuntimeError, pszMessage );
+      else
+      PyErr_SetString( PyExc_RuntimeError, OGRErrMessages(result) );
+      SWIG_fail;
+    }
+  }
+  {
+    /* %typemap(ret) OGRErr */
+    if ( ReturnSame(resultobj == Py_None || resultobj == 0) ) {
+      resultobj = PyInt_FromLong( result );
+    }
+  }
+  if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_Feature_SetGeomField__SWIG_1(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
+  OGRFeatureShadow *arg1 = (OGRFeatureShadow *) 0 ;
+  char *arg2 = (char *) 0 ;
+  OGRGeometryShadow *arg3 = (OGRGeometryShadow *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int bToFree2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  OGRErr result;
+  
+  if (!PyArg_ParseTuple(args,(char *)"OOO:Feature_SetGeomField",&obj0,&obj1,&obj2)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRFeatureShadow, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Feature_SetGeomField" "', argument " "1"" of type '" "OGRFeatureShadow *""'"); 
+  }
+  arg1 = reinterpret_cast< OGRFeatureShadow * >(argp1);
+  {
+    /* %typemap(in) (const char *utf8_path) */
+    arg2 = GDALPythonObjectToCStr( obj1, &bToFree2 );
+    if (arg2 == NULL)
+    {
+      PyErr_SetString( PyExc_RuntimeError, "not a string" );
+      SWIG_fail;
     }
   }
   res3 = SWIG_ConvertPtr(obj2, &argp3,SWIGTYPE_p_OGRGeometryShadow, 0 |  0 );
@@ -21243,81 +21897,383 @@ SWIGINTERN PyObject *_wrap_CreateGeometryFromWkb(PyObject *SWIGUNUSEDPARM(self),
   PyObject * obj0 = 0 ;
   PyObject * obj1 = 0 ;
   char *  kwnames[] = {
-    (char *) "len",(char *) "reference", NULL 
+    (char *) "len",(char *) "reference", NULL 
+  };
+  OGRGeometryShadow *result = 0 ;
+  
+  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O|O:CreateGeometryFromWkb",kwnames,&obj0,&obj1)) SWIG_fail;
+  {
+    /* %typemap(in,numinputs=1) (int nLen, char *pBuf ) */
+    {
+      Py_ssize_t safeLen = 0;
+      const void *safeBuf = 0;
+      int res = PyObject_AsReadBuffer(obj0, &safeBuf, &safeLen);
+      if (res == 0) {
+        if( safeLen > INT_MAX ) {
+          SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+        }
+        arg1 = (int) safeLen;
+        arg2 = (char *) safeBuf;
+        goto ok;
+      } else {
+        PyErr_Clear();
+      }
+    }
+#if PY_VERSION_HEX>=0x03000000
+    if (PyUnicode_Check(obj0))
+    {
+      size_t safeLen = 0;
+      int ret = SWIG_AsCharPtrAndSize(obj0, (char**) &arg2, &safeLen, &alloc1);
+      if (!SWIG_IsOK(ret)) {
+        SWIG_exception( SWIG_RuntimeError, "invalid Unicode string" );
+      }
+      
+      if (safeLen) safeLen--;
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg1 = (int) safeLen;
+    }
+    else if (PyBytes_Check(obj0))
+    {
+      Py_ssize_t safeLen = 0;
+      PyBytes_AsStringAndSize(obj0, (char**) &arg2, &safeLen);
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg1 = (int) safeLen;
+    }
+    else
+    {
+      PyErr_SetString(PyExc_TypeError, "not a unicode string or a bytes");
+      SWIG_fail;
+    }
+#else
+    if (PyString_Check(obj0))
+    {
+      Py_ssize_t safeLen = 0;
+      PyString_AsStringAndSize(obj0, (char**) &arg2, &safeLen);
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg1 = (int) safeLen;
+    }
+    else
+    {
+      PyErr_SetString(PyExc_TypeError, "not a string");
+      SWIG_fail;
+    }
+#endif
+    ok: ;
+  }
+  if (obj1) {
+    res3 = SWIG_ConvertPtr(obj1, &argp3,SWIGTYPE_p_OSRSpatialReferenceShadow, 0 |  0 );
+    if (!SWIG_IsOK(res3)) {
+      SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "CreateGeometryFromWkb" "', argument " "3"" of type '" "OSRSpatialReferenceShadow *""'"); 
+    }
+    arg3 = reinterpret_cast< OSRSpatialReferenceShadow * >(argp3);
+  }
+  {
+    if ( bUseExceptions ) {
+      ClearErrorState();
+    }
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (OGRGeometryShadow *)CreateGeometryFromWkb(arg1,arg2,arg3);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+#ifndef SED_HACKS
+    if ( bUseExceptions ) {
+      CPLErr eclass = CPLGetLastErrorType();
+      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
+        SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
+      }
+    }
+#endif
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_OGRGeometryShadow, SWIG_POINTER_OWN |  0 );
+  {
+    /* %typemap(freearg) (int *nLen, char *pBuf ) */
+    if (ReturnSame(alloc1) == SWIG_NEWOBJ ) {
+      delete[] arg2;
+    }
+  }
+  if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
+  return resultobj;
+fail:
+  {
+    /* %typemap(freearg) (int *nLen, char *pBuf ) */
+    if (ReturnSame(alloc1) == SWIG_NEWOBJ ) {
+      delete[] arg2;
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_CreateGeometriesFromWkb(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
+  OGRGeometryShadow ***arg1 = (OGRGeometryShadow ***) 0 ;
+  size_t *arg2 = (size_t *) 0 ;
+  int arg3 ;
+  char *arg4 = (char *) 0 ;
+  int arg5 ;
+  GIntBig *arg6 = (GIntBig *) 0 ;
+  OSRSpatialReferenceShadow *arg7 = (OSRSpatialReferenceShadow *) NULL ;
+  OGRGeometryShadow **geoms1 = 0 ;
+  size_t nCount1 = 0 ;
+  int alloc3 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  char *  kwnames[] = {
+    (char *) "len",(char *) "nOffsets",(char *) "reference", NULL 
+  };
+  OGRErr result;
+  
+  {
+    /* %typemap(in,numinputs=0) (OGRGeometryShadow*** pgeoms, size_t* pnCount) */
+    arg1 = &geoms1;
+    arg2 = &nCount1;
+  }
+  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO|O:CreateGeometriesFromWkb",kwnames,&obj0,&obj1,&obj2)) SWIG_fail;
+  {
+    /* %typemap(in,numinputs=1) (int nLen, char *pBuf ) */
+    {
+      Py_ssize_t safeLen = 0;
+      const void *safeBuf = 0;
+      int res = PyObject_AsReadBuffer(obj0, &safeBuf, &safeLen);
+      if (res == 0) {
+        if( safeLen > INT_MAX ) {
+          SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+        }
+        arg3 = (int) safeLen;
+        arg4 = (char *) safeBuf;
+        goto ok;
+      } else {
+        PyErr_Clear();
+      }
+    }
+#if PY_VERSION_HEX>=0x03000000
+    if (PyUnicode_Check(obj0))
+    {
+      size_t safeLen = 0;
+      int ret = SWIG_AsCharPtrAndSize(obj0, (char**) &arg4, &safeLen, &alloc3);
+      if (!SWIG_IsOK(ret)) {
+        SWIG_exception( SWIG_RuntimeError, "invalid Unicode string" );
+      }
+      
+      if (safeLen) safeLen--;
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg3 = (int) safeLen;
+    }
+    else if (PyBytes_Check(obj0))
+    {
+      Py_ssize_t safeLen = 0;
+      PyBytes_AsStringAndSize(obj0, (char**) &arg4, &safeLen);
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg3 = (int) safeLen;
+    }
+    else
+    {
+      PyErr_SetString(PyExc_TypeError, "not a unicode string or a bytes");
+      SWIG_fail;
+    }
+#else
+    if (PyString_Check(obj0))
+    {
+      Py_ssize_t safeLen = 0;
+      PyString_AsStringAndSize(obj0, (char**) &arg4, &safeLen);
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg3 = (int) safeLen;
+    }
+    else
+    {
+      PyErr_SetString(PyExc_TypeError, "not a string");
+      SWIG_fail;
+    }
+#endif
+    ok: ;
+  }
+  {
+    /* %typemap(in,numinputs=1) (int nList, GIntBig* pList)*/
+    /* check if is List */
+    if ( !PySequence_Check(obj1) ) {
+      PyErr_SetString(PyExc_TypeError, "not a sequence");
+      SWIG_fail;
+    }
+    Py_ssize_t size = PySequence_Size(obj1);
+    if( size != (int)size ) {
+      PyErr_SetString(PyExc_TypeError, "too big sequence");
+      SWIG_fail;
+    }
+    arg5 = (int)size;
+    arg6 = (GIntBig*) malloc(arg5*sizeof(GIntBig));
+    for( int i = 0; i<arg5; i++ ) {
+      PyObject *o = PySequence_GetItem(obj1,i);
+      PY_LONG_LONG val;
+      if ( !PyArg_Parse(o,"L",&val) ) {
+        PyErr_SetString(PyExc_TypeError, "not an integer");
+        Py_DECREF(o);
+        SWIG_fail;
+      }
+      arg6[i] = (GIntBig)val;
+      Py_DECREF(o);
+    }
+  }
+  if (obj2) {
+    res7 = SWIG_ConvertPtr(obj2, &argp7,SWIGTYPE_p_OSRSpatialReferenceShadow, 0 |  0 );
+    if (!SWIG_IsOK(res7)) {
+      SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "CreateGeometriesFromWkb" "', argument " "7"" of type '" "OSRSpatialReferenceShadow *""'"); 
+    }
+    arg7 = reinterpret_cast< OSRSpatialReferenceShadow * >(argp7);
+  }
+  {
+    if ( bUseExceptions ) {
+      ClearErrorState();
+    }
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (OGRErr)CreateGeometriesFromWkb(arg1,arg2,arg3,arg4,arg5,arg6,arg7);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+#ifndef SED_HACKS
+    if ( bUseExceptions ) {
+      CPLErr eclass = CPLGetLastErrorType();
+      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
+        SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
+      }
+    }
+#endif
+  }
+  {
+    /* %typemap(out) OGRErr */
+    if ( result != 0 && bUseExceptions) {
+      const char* pszMessage = CPLGetLastErrorMsg();
+      if( pszMessage[0] != '\0' )
+      PyErr_SetString( PyExc_RuntimeError, pszMessage );
+      else
+      PyErr_SetString( PyExc_RuntimeError, OGRErrMessages(result) );
+      SWIG_fail;
+    }
+  }
+  {
+    /* %typemap(argout) (OGRGeometryShadow*** pgeoms, size_t* pnCount) */
+    PyObject *list = PyList_New( *arg2 );
+    for( size_t i = 0; i < *arg2; i++ ) {
+      PyList_SetItem(list, i,
+        SWIG_NewPointerObj((void*)(*arg1)[i],SWIGTYPE_p_OGRGeometryShadow,SWIG_POINTER_OWN) );
+    }
+    Py_XDECREF(resultobj);
+    resultobj = list;
+  }
+  {
+    /* %typemap(freearg) (OGRGeometryShadow*** pgeoms, size_t* pnCount) */
+    CPLFree(*arg1);
+  }
+  {
+    /* %typemap(freearg) (int *nLen, char *pBuf ) */
+    if (ReturnSame(alloc3) == SWIG_NEWOBJ ) {
+      delete[] arg4;
+    }
+  }
+  {
+    /* %typemap(freearg) (int nList, GIntBig* pList) */
+    if (arg6) {
+      free((void*) arg6);
+    }
+  }
+  {
+    /* %typemap(ret) OGRErr */
+    if ( ReturnSame(resultobj == Py_None || resultobj == 0) ) {
+      resultobj = PyInt_FromLong( result );
+    }
+  }
+  if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
+  return resultobj;
+fail:
+  {
+    /* %typemap(freearg) (OGRGeometryShadow*** pgeoms, size_t* pnCount) */
+    CPLFree(*arg1);
+  }
+  {
+    /* %typemap(freearg) (int *nLen, char *pBuf ) */
+    if (ReturnSame(alloc3) == SWIG_NEWOBJ ) {
+      delete[] arg4;
+    }
+  }
+  {
+    /* %typemap(freearg) (int nList, GIntBig* pList) */
+    if (arg6) {
+      free((void*) arg6);
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ExportGeometriesToWkb(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
+  OGRWkbBatch *arg1 = (OGRWkbBatch *) 0 ;
+  int arg2 ;
+  OGRGeometryShadow **arg3 = (OGRGeometryShadow **) 0 ;
+  OGRwkbByteOrder arg4 = (OGRwkbByteOrder) wkbNDR ;
+  OGRWkbBatch sBatch1 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  char *  kwnames[] = {
+    (char *) "nGeometries",(char *) "byte_order", NULL 
   };
-  OGRGeometryShadow *result = 0 ;
+  OGRErr result;
   
-  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O|O:CreateGeometryFromWkb",kwnames,&obj0,&obj1)) SWIG_fail;
   {
-    /* %typemap(in,numinputs=1) (int nLen, char *pBuf ) */
-    {
-      Py_ssize_t safeLen = 0;
-      const void *safeBuf = 0;
-      int res = PyObject_AsReadBuffer(obj0, &safeBuf, &safeLen);
-      if (res == 0) {
-        if( safeLen > INT_MAX ) {
-          SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
-        }
-        arg1 = (int) safeLen;
-        arg2 = (char *) safeBuf;
-        goto ok;
-      } else {
-        PyErr_Clear();
-      }
-    }
-#if PY_VERSION_HEX>=0x03000000
-    if (PyUnicode_Check(obj0))
-    {
-      size_t safeLen = 0;
-      int ret = SWIG_AsCharPtrAndSize(obj0, (char**) &arg2, &safeLen, &alloc1);
-      if (!SWIG_IsOK(ret)) {
-        SWIG_exception( SWIG_RuntimeError, "invalid Unicode string" );
-      }
-      
-      if (safeLen) safeLen--;
-      if( safeLen > INT_MAX ) {
-        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
-      }
-      arg1 = (int) safeLen;
-    }
-    else if (PyBytes_Check(obj0))
-    {
-      Py_ssize_t safeLen = 0;
-      PyBytes_AsStringAndSize(obj0, (char**) &arg2, &safeLen);
-      if( safeLen > INT_MAX ) {
-        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
-      }
-      arg1 = (int) safeLen;
+    /* %typemap(in,numinputs=0) (OGRWkbBatch *psBatchOut) */
+    memset(&sBatch1, 0, sizeof(sBatch1));
+    arg1 = &sBatch1;
+  }
+  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"O|O:ExportGeometriesToWkb",kwnames,&obj0,&obj1)) SWIG_fail;
+  {
+    /* %typemap(in,numinputs=1) (int nGeometries, OGRGeometryShadow **pahGeometries) */
+    if ( !PySequence_Check(obj0) ) {
+      PyErr_SetString(PyExc_TypeError, "not a sequence");
+      SWIG_fail;
     }
-    else
-    {
-      PyErr_SetString(PyExc_TypeError, "not a unicode string or a bytes");
+    Py_ssize_t size = PySequence_Size(obj0);
+    if( size != (int)size ) {
+      PyErr_SetString(PyExc_TypeError, "too big sequence");
       SWIG_fail;
     }
-#else
-    if (PyString_Check(obj0))
-    {
-      Py_ssize_t safeLen = 0;
-      PyString_AsStringAndSize(obj0, (char**) &arg2, &safeLen);
-      if( safeLen > INT_MAX ) {
-        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+    arg2 = (int)size;
+    arg3 = (OGRGeometryShadow**) CPLMalloc((arg2 ? arg2 : 1)*sizeof(OGRGeometryShadow*));
+    for( int i = 0; i<arg2; i++ ) {
+      PyObject *o = PySequence_GetItem(obj0,i);
+      OGRGeometryShadow* geom = NULL;
+      if( o != Py_None &&
+        !SWIG_IsOK(SWIG_ConvertPtr( o, (void**)&geom, SWIGTYPE_p_OGRGeometryShadow, 0 )) ) {
+        Py_DECREF(o);
+        PyErr_SetString(PyExc_TypeError, "not a Geometry or None");
+        SWIG_fail;
       }
-      arg1 = (int) safeLen;
-    }
-    else
-    {
-      PyErr_SetString(PyExc_TypeError, "not a string");
-      SWIG_fail;
+      arg3[i] = geom;
+      Py_DECREF(o);
     }
-#endif
-    ok: ;
   }
   if (obj1) {
-    res3 = SWIG_ConvertPtr(obj1, &argp3,SWIGTYPE_p_OSRSpatialReferenceShadow, 0 |  0 );
-    if (!SWIG_IsOK(res3)) {
-      SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "CreateGeometryFromWkb" "', argument " "3"" of type '" "OSRSpatialReferenceShadow *""'"); 
-    }
-    arg3 = reinterpret_cast< OSRSpatialReferenceShadow * >(argp3);
+    ecode4 = SWIG_AsVal_int(obj1, &val4);
+    if (!SWIG_IsOK(ecode4)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "F4AME" "', argument " "4"" of type '" "OGRwkbByteOrder""'");
+    } 
+    arg4 = static_cast< OGRwkbByteOrder >(val4);
   }
   {
     if ( bUseExceptions ) {
@@ -21325,7 +22281,7 @@ SWIGINTERN PyObject *_wrap_CreateGeometryFromWkb(PyObject *SWIGUNUSEDPARM(self),
     }
     {
       SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-      result = (OGRGeometryShadow *)CreateGeometryFromWkb(arg1,arg2,arg3);
+      result = (OGRErr)ExportGeometriesToWkb(arg1,arg2,arg3,arg4);
       SWIG_PYTHON_THREAD_END_ALLOW;
     }
 #ifndef SED_HACKS
@@ -21337,21 +22293,63 @@ SWIGINTERN PyObject *_wrap_CreateGeometryFromWkb(PyObject *SWIGUNUSEDPARM(self),
     }
 #endif
   }
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_OGRGeometryShadow, SWIG_POINTER_OWN |  0 );
   {
-    /* %typemap(freearg) (int *nLen, char *pBuf ) */
-    if (ReturnSame(alloc1) == SWIG_NEWOBJ ) {
-      delete[] arg2;
+    /* %typemap(out) OGRErr */
+    if ( result != 0 && bUseExceptions) {
+      const char* pszMessage = CPLGetLastErrorMsg();
+      if( pszMessage[0] != '\0' )
+      PyErr_SetString( PyExc_RuntimeError, pszMessage );
+      else
+      PyErr_SetString( PyExc_RuntimeError, OGRErrMessages(result) );
+      SWIG_fail;
+    }
+  }
+  {
+    /* %typemap(argout) (OGRWkbBatch *psBatchOut) */
+    Py_XDECREF(resultobj);
+    if( result != 0 ) {
+      /* Do not return a partial batch */
+      resultobj = Py_None;
+      Py_INCREF(resultobj);
     }
+    else {
+      PyObject *offsets = PyList_New( arg1->nOffsets );
+      for( size_t i = 0; i < arg1->nOffsets; i++ ) {
+        PyList_SetItem(offsets, i, PyLong_FromLongLong( arg1->panOffsets[i] ));
+      }
+      resultobj = PyTuple_New(2);
+#if PY_VERSION_HEX >= 0x03000000
+      PyTuple_SetItem(resultobj, 0, PyBytes_FromStringAndSize( (const char*)arg1->pabyWkb, arg1->nWkbSize ));
+#else
+      PyTuple_SetItem(resultobj, 0, PyString_FromStringAndSize( (const char*)arg1->pabyWkb, arg1->nWkbSize ));
+#endif
+      PyTuple_SetItem(resultobj, 1, offsets);
+    }
+  }
+  {
+    /* %typemap(freearg) (OGRWkbBatch *psBatchOut) */
+    VSIFree( arg1->pabyWkb );
+    VSIFree( arg1->panOffsets );
+  }
+  {
+    /* %typemap(freearg) (int nGeometries, OGRGeometryShadow **pahGeometries) */
+    CPLFree( arg3 );
+  }
+  {
+    /* %typemap(ret) OGRErr ExportGeometriesToWkb */
+    /* None is returned on error, instead of the error code */
   }
   if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
   return resultobj;
 fail:
   {
-    /* %typemap(freearg) (int *nLen, char *pBuf ) */
-    if (ReturnSame(alloc1) == SWIG_NEWOBJ ) {
-      delete[] arg2;
-    }
+    /* %typemap(freearg) (OGRWkbBatch *psBatchOut) */
+    VSIFree( arg1->pabyWkb );
+    VSIFree( arg1->panOffsets );
+  }
+  {
+    /* %typemap(freearg) (int nGeometries, OGRGeometryShadow **pahGeometries) */
+    CPLFree( arg3 );
   }
   return NULL;
 }
@@ -23642,6 +24640,167 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_Geometry_SetPointsFromBuffer(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
+  PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
+  OGRGeometryShadow *arg1 = (OGRGeometryShadow *) 0 ;
+  int arg2 ;
+  char *arg3 = (char *) 0 ;
+  int arg4 = (int) FALSE ;
+  int arg5 = (int) FALSE ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int alloc2 = 0 ;
+  int val4 ;
+  int ecode4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  PyObject * obj0 = 0 ;
+  PyObject * obj1 = 0 ;
+  PyObject * obj2 = 0 ;
+  PyObject * obj3 = 0 ;
+  char *  kwnames[] = {
+    (char *) "self",(char *) "nLen",(char *) "bHasZ",(char *) "bHasM", NULL 
+  };
+  OGRErr result;
+  
+  if (!PyArg_ParseTupleAndKeywords(args,kwargs,(char *)"OO|OO:Geometry_SetPointsFromBuffer",kwnames,&obj0,&obj1,&obj2,&obj3)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(obj0, &argp1,SWIGTYPE_p_OGRGeometryShadow, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "Geometry_SetPointsFromBuffer" "', argument " "1"" of type '" "OGRGeometryShadow *""'"); 
+  }
+  arg1 = reinterpret_cast< OGRGeometryShadow * >(argp1);
+  {
+    /* %typemap(in,numinputs=1) (int nLen, char *pBuf ) */
+    {
+      Py_ssize_t safeLen = 0;
+      const void *safeBuf = 0;
+      int res = PyObject_AsReadBuffer(obj1, &safeBuf, &safeLen);
+      if (res == 0) {
+        if( safeLen > INT_MAX ) {
+          SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+        }
+        arg2 = (int) safeLen;
+        arg3 = (char *) safeBuf;
+        goto ok;
+      } else {
+        PyErr_Clear();
+      }
+    }
+#if PY_VERSION_HEX>=0x03000000
+    if (PyUnicode_Check(obj1))
+    {
+      size_t safeLen = 0;
+      int ret = SWIG_AsCharPtrAndSize(obj1, (char**) &arg3, &safeLen, &alloc2);
+      if (!SWIG_IsOK(ret)) {
+        SWIG_exception( SWIG_RuntimeError, "invalid Unicode string" );
+      }
+      
+      if (safeLen) safeLen--;
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg2 = (int) safeLen;
+    }
+    else if (PyBytes_Check(obj1))
+    {
+      Py_ssize_t safeLen = 0;
+      PyBytes_AsStringAndSize(obj1, (char**) &arg3, &safeLen);
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg2 = (int) safeLen;
+    }
+    else
+    {
+      PyErr_SetString(PyExc_TypeError, "not a unicode string or a bytes");
+      SWIG_fail;
+    }
+#else
+    if (PyString_Check(obj1))
+    {
+      Py_ssize_t safeLen = 0;
+      PyString_AsStringAndSize(obj1, (char**) &arg3, &safeLen);
+      if( safeLen > INT_MAX ) {
+        SWIG_exception( SWIG_RuntimeError, "too large buffer (>2GB)" );
+      }
+      arg2 = (int) safeLen;
+    }
+    else
+    {
+      PyErr_SetString(PyExc_TypeError, "not a string");
+      SWIG_fail;
+    }
+#endif
+    ok: ;
+  }
+  if (obj2) {
+    ecode4 = SWIG_AsVal_int(obj2, &val4);
+    if (!SWIG_IsOK(ecode4)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode4), "in method '" "Geometry_SetPointsFromBuffer" "', argument " "4"" of type '" "int""'");
+    } 
+    arg4 = static_cast< int >(val4);
+  }
+  if (obj3) {
+    ecode5 = SWIG_AsVal_int(obj3, &val5);
+    if (!SWIG_IsOK(ecode5)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "Geometry_SetPointsFromBuffer" "', argument " "5"" of type '" "int""'");
+    } 
+    arg5 = static_cast< int >(val5);
+  }
+  {
+    if ( bUseExceptions ) {
+      ClearErrorState();
+    }
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      result = (OGRErr)OGRGeometryShadow_SetPointsFromBuffer(arg1,arg2,arg3,arg4,arg5);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+#ifndef SED_HACKS
+    if ( bUseExceptions ) {
+      CPLErr eclass = CPLGetLastErrorType();
+      if ( eclass == CE_Failure || eclass == CE_Fatal ) {
+        SWIG_exception( SWIG_RuntimeError, CPLGetLastErrorMsg() );
+      }
+    }
+#endif
+  }
+  {
+    /* %typemap(out) OGRErr */
+    if ( result != 0 && bUseExceptions) {
+      const char* pszMessage = CPLGetLastErrorMsg();
+      if( pszMessage[0] != '\0' )
+      PyErr_SetString( PyExc_RuntimeError, pszMessage );
+      else
+      PyErr_SetString( PyExc_RuntimeError, OGRErrMessages(result) );
+      SWIG_fail;
+    }
+  }
+  {
+    /* %typemap(freearg) (int *nLen, char *pBuf ) */
+    if (ReturnSame(alloc2) == SWIG_NEWOBJ ) {
+      delete[] arg3;
+    }
+  }
+  {
+    /* %typemap(ret) OGRErr */
+    if ( ReturnSame(resultobj == Py_None || resultobj == 0) ) {
+      resultobj = PyInt_FromLong( result );
+    }
+  }
+  if ( ReturnSame(bLocalUseExceptionsCode) ) { CPLErr eclass = CPLGetLastErrorType(); if ( eclass == CE_Failure || eclass == CE_Fatal ) { Py_XDECREF(resultobj); SWIG_Error( SWIG_RuntimeError, CPLGetLastErrorMsg() ); return NULL; } }
+  return resultobj;
+fail:
+  {
+    /* %typemap(freearg) (int *nLen, char *pBuf ) */
+    if (ReturnSame(alloc2) == SWIG_NEWOBJ ) {
+      delete[] arg3;
+    }
+  }
+  return NULL;
+}
+
+
 SWIGINTERN PyObject *_wrap_Geometry_GetX(PyObject *SWIGUNUSEDPARM(self), PyObject *args, PyObject *kwargs) {
   PyObject *resultobj = 0; int bLocalUseExceptionsCode = bUseExceptions;
   OGRGeometryShadow *arg1 = (OGRGeometryShadow *) 0 ;
@@ -30782,6 +31941,9 @@ static PyMethodDef SwigMethods[] = {
 		"\n"
 		"Set style table. \n"
 		""},
+	 { (char *)"Layer_ExportGeometriesToWkb", (PyCFunction) _wrap_Layer_ExportGeometriesToWkb, METH_VARARGS | METH_KEYWORDS, (char *)"Layer_ExportGeometriesToWkb(Layer self, OGRwkbByteOrder byte_order=wkbNDR, int geom_field=0) -> OGRErr"},
+	 { (char *)"Layer_GetArrowStream", (PyCFunction) _wrap_Layer_GetArrowStream, METH_VARARGS | METH_KEYWORDS, (char *)"Layer_GetArrowStream(Layer self, char ** options=None)"},
+	 { (char *)"Layer_CreateFeaturesFromWkb", (PyCFunction) _wrap_Layer_CreateFeaturesFromWkb, METH_VARARGS | METH_KEYWORDS, (char *)"Layer_CreateFeaturesFromWkb(Layer self, int len, int nOffsets, int geom_field=0) -> OGRErr"},
 	 { (char *)"Layer_swigregister", Layer_swigregister, METH_VARARGS, NULL},
 	 { (char *)"delete_Feature", _wrap_delete_Feature, METH_VARARGS, (char *)"delete_Feature(Feature self)"},
 	 { (char *)"new_Feature", (PyCFunction) _wrap_new_Feature, METH_VARARGS | METH_KEYWORDS, (char *)"new_Feature(FeatureDefn feature_def) -> Feature"},
@@ -33041,6 +34203,8 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"GeomFieldDefn_SetNullable", _wrap_GeomFieldDefn_SetNullable, METH_VARARGS, (char *)"GeomFieldDefn_SetNullable(GeomFieldDefn self, int bNullable)"},
 	 { (char *)"GeomFieldDefn_swigregister", GeomFieldDefn_swigregister, METH_VARARGS, NULL},
 	 { (char *)"CreateGeometryFromWkb", (PyCFunction) _wrap_CreateGeometryFromWkb, METH_VARARGS | METH_KEYWORDS, (char *)"CreateGeometryFromWkb(int len, SpatialReference reference=None) -> Geometry"},
+	 { (char *)"CreateGeometriesFromWkb", (PyCFunction) _wrap_CreateGeometriesFromWkb, METH_VARARGS | METH_KEYWORDS, (char *)"CreateGeometriesFromWkb(int len, int nOffsets, SpatialReference reference=None) -> OGRErr"},
+	 { (char *)"ExportGeometriesToWkb", (PyCFunction) _wrap_ExportGeometriesToWkb, METH_VARARGS | METH_KEYWORDS, (char *)"ExportGeometriesToWkb(int nGeometries, OGRwkbByteOrder byte_order=wkbNDR) -> OGRErr"},
 	 { (char *)"CreateGeometryFromWkt", (PyCFunction) _wrap_CreateGeometryFromWkt, METH_VARARGS | METH_KEYWORDS, (char *)"CreateGeometryFromWkt(char ** val, SpatialReference reference=None) -> Geometry"},
 	 { (char *)"CreateGeometryFromGML", _wrap_CreateGeometryFromGML, METH_VARARGS, (char *)"CreateGeometryFromGML(char const * input_string) -> Geometry"},
 	 { (char *)"CreateGeometryFromJson", _wrap_CreateGeometryFromJson, METH_VARARGS, (char *)"CreateGeometryFromJson(char const * input_string) -> Geometry"},
@@ -33258,6 +34422,7 @@ static PyMethodDef SwigMethods[] = {
 	 { (char *)"Geometry_GetArea", _wrap_Geometry_GetArea, METH_VARARGS, (char *)"Geometry_GetArea(Geometry self) -> double"},
 	 { (char *)"Geometry_GetPointCount", _wrap_Geometry_GetPointCount, METH_VARARGS, (char *)"Geometry_GetPointCount(Geometry self) -> int"},
 	 { (char *)"Geometry_GetPoints", (PyCFunction) _wrap_Geometry_GetPoints, METH_VARARGS | METH_KEYWORDS, (char *)"Geometry_GetPoints(Geometry self, int nCoordDimension=0)"},
+	 { (char *)"Geometry_SetPointsFromBuffer", (PyCFunction) _wrap_Geometry_SetPointsFromBuffer, METH_VARARGS | METH_KEYWORDS, (char *)"Geometry_SetPointsFromBuffer(Geometry self, int nLen, int bHasZ=False, int bHasM=False) -> OGRErr"},
 	 { (char *)"Geometry_GetX", (PyCFunction) _wrap_Geometry_GetX, METH_VARARGS | METH_KEYWORDS, (char *)"Geometry_GetX(Geometry self, int point=0) -> double"},
 	 { (char *)"Geometry_GetY", (PyCFunction) _wrap_Geometry_GetY, METH_VARARGS | METH_KEYWORDS, (char *)"Geometry_GetY(Geometry self, int point=0) -> double"},
 	 { (char *)"Geometry_GetZ", (PyCFunction) _wrap_Geometry_GetZ, METH_VARARGS | METH_KEYWORDS, (char *)"Geometry_GetZ(Geometry self, int point=0) -> double"},
@@ -2457,7 +2457,8 @@ class Dataset(MajorObject):
                     resample_alg=gdalconst.GRIORA_NearestNeighbour,
                     callback=None,
                     callback_data=None,
-                    interleave='band'):
+                    interleave='band',
+                    buf_pool=None):
         """ Reading a chunk of a GDAL band into a numpy array. The optional (buf_xsize,buf_ysize,buf_type)
         parameters should generally not be specified if buf_obj is specified. The array is returned"""
 
@@ -2467,7 +2468,8 @@ class Dataset(MajorObject):
                                               resample_alg=resample_alg,
                                               callback=callback,
                                               callback_data=callback_data,
-                                              interleave=interleave )
+                                              interleave=interleave,
+                                              buf_pool=buf_pool)
 
     def WriteRaster(self, xoff, yoff, xsize, ysize,
                     buf_string,
@@ -3778,7 +3780,8 @@ class Band(MajorObject):
                     buf_xsize=None, buf_ysize=None, buf_type=None, buf_obj=None,
                     resample_alg=gdalconst.GRIORA_NearestNeighbour,
                     callback=None,
-                    callback_data=None):
+                    callback_data=None,
+                    buf_pool=None):
         """ Reading a chunk of a GDAL band into a numpy array. The optional (buf_xsize,buf_ysize,buf_type)
         parameters should generally not be specified if buf_obj is specified. The array is returned"""
 
@@ -3789,7 +3792,8 @@ class Band(MajorObject):
                                            buf_xsize, buf_ysize, buf_type, buf_obj,
                                            resample_alg=resample_alg,
                                            callback=callback,
-                                           callback_data=callback_data)
+                                           callback_data=callback_data,
+                                           buf_pool=buf_pool)
 
     def WriteArray(self, array, xoff=0, yoff=0,
                    resample_alg=gdalconst.GRIORA_NearestNeighbour,
@@ -266,12 +266,100 @@ def SaveArray(src_array, filename, format="GTiff", prototype=None, interleave='b
     return driver.CreateCopy(filename, OpenArray(src_array, prototype, interleave))
 
 
+def _ReadBufTypeAndTypeCode(ds_or_band, buf_type=None):
+    """Return the (GDAL data type, numpy typecode) pair used to read
+    ds_or_band when no buf_obj is provided.
+
+    As the data type of a band cannot change, the pair resolved from the data
+    types of the bands is cached on the ds_or_band object, keyed by the band
+    count of datasets, which AddBand() changes. The PIXELTYPE metadata item,
+    which may be changed at any time, is checked at each call for Byte."""
+
+    is_dataset = isinstance(ds_or_band, gdal.Dataset)
+    key = (buf_type, ds_or_band.RasterCount if is_dataset else 1)
+    try:
+        cache = ds_or_band._gdal_array_read_types
+    except AttributeError:
+        cache = {}
+        ds_or_band._gdal_array_read_types = cache
+
+    try:
+        buf_type, typecode = cache[key]
+    except KeyError:
+        if buf_type is None:
+            if is_dataset:
+                buf_type = ds_or_band.GetRasterBand(1).DataType
+                for band_index in range(2, ds_or_band.RasterCount + 1):
+                    if buf_type != ds_or_band.GetRasterBand(band_index).DataType:
+                        buf_type = gdalconst.GDT_Float32
+            else:
+                buf_type = ds_or_band.DataType
+
+        typecode = GDALTypeCodeToNumericTypeCode(buf_type)
+        if typecode is None:
+            buf_type = gdalconst.GDT_Float32
+            typecode = numpy.float32
+        else:
+            buf_type = NumericTypeCodeToGDALTypeCode(typecode)
+        cache[key] = (buf_type, typecode)
+
+    if buf_type == gdalconst.GDT_Byte:
+        band = ds_or_band.GetRasterBand(1) if is_dataset else ds_or_band
+        if band.GetMetadataItem('PIXELTYPE', 'IMAGE_STRUCTURE') == 'SIGNEDBYTE':
+            typecode = numpy.int8
+
+    return buf_type, typecode
+
+class BufferPool(object):
+    """Pool of numpy arrays, that can be passed as the buf_pool argument of
+    the ReadAsArray() methods, so that arrays of recurring shapes are
+    reused rather than allocated at each call.
+
+    Arrays returned by acquire() or ReadAsArray() should be handed back with
+    release() once no longer used. At most max_arrays_per_shape unused arrays
+    are kept for each (shape, dtype) pair. Instances can be shared between
+    threads."""
+
+    def __init__(self, max_arrays_per_shape=4):
+        import threading
+        self.max_arrays_per_shape = max_arrays_per_shape
+        self._lock = threading.Lock()
+        self._free = {}
+
+    def acquire(self, shape, dtype):
+        """Return an uninitialized array of the specified shape and dtype."""
+        key = (tuple(shape), numpy.dtype(dtype))
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                return free.pop()
+        return numpy.empty(shape, dtype=dtype)
+
+    def release(self, array):
+        """Hand back an array to the pool. It must no longer be used by the caller."""
+        key = (array.shape, array.dtype)
+        with self._lock:
+            free = self._free.setdefault(key, [])
+            if len(free) < self.max_arrays_per_shape and \
+               not any(x is array for x in free):
+                free.append(array)
+
+    def clear(self):
+        """Drop all unused arrays."""
+        with self._lock:
+            self._free = {}
+
 def DatasetReadAsArray(ds, xoff=0, yoff=0, win_xsize=None, win_ysize=None, buf_obj=None,
                        buf_xsize=None, buf_ysize=None, buf_type=None,
                        resample_alg=gdal.GRIORA_NearestNeighbour,
-                       callback=None, callback_data=None, interleave='band'):
+                       callback=None, callback_data=None, interleave='band',
+                       buf_pool=None):
     """Pure python implementation of reading a chunk of a GDAL file
-    into a numpy array.  Used by the gdal.Dataset.ReadAsArray method."""
+    into a numpy array.  Used by the gdal.Dataset.ReadAsArray method.
+
+    If buf_pool is a BufferPool and buf_obj is not specified, the returned
+    array is taken from the pool, and may be handed back to it with
+    buf_pool.release() once no longer used."""
 
     if win_xsize is None:
         win_xsize = ds.RasterXSize
@@ -301,30 +389,23 @@ def DatasetReadAsArray(ds, xoff=0, yoff=0, win_xsize=None, win_ysize=None, buf_o
                                buf_obj=buf_obj,
                                resample_alg=resample_alg,
                                callback=callback,
-                               callback_data=callback_data)
+                               callback_data=callback_data,
+                               buf_pool=buf_pool)
 
+    from_pool = False
     if buf_obj is None:
         if buf_xsize is None:
             buf_xsize = win_xsize
         if buf_ysize is None:
             buf_ysize = win_ysize
-        if buf_type is None:
-            buf_type = ds.GetRasterBand(1).DataType
-            for band_index in range(2, ds.RasterCount + 1):
-                if buf_type != ds.GetRasterBand(band_index).DataType:
-                    buf_type = gdalconst.GDT_Float32
+        buf_type, typecode = _ReadBufTypeAndTypeCode(ds, buf_type)
 
-        typecode = GDALTypeCodeToNumericTypeCode(buf_type)
-        if typecode is None:
-            buf_type = gdalconst.GDT_Float32
-            typecode = numpy.float32
-        else:
-            buf_type = NumericTypeCodeToGDALTypeCode(typecode)
-
-        if buf_type == gdalconst.GDT_Byte and ds.GetRasterBand(1).GetMetadataItem('PIXELTYPE', 'IMAGE_STRUCTURE') == 'SIGNEDBYTE':
-            typecode = numpy.int8
         buf_shape = (ds.RasterCount, buf_ysize, buf_xsize) if interleave else (buf_ysize, buf_xsize, ds.RasterCount)
-        buf_obj = numpy.empty(buf_shape, dtype=typecode)
+        if buf_pool is not None:
+            buf_obj = buf_pool.acquire(buf_shape, typecode)
+            from_pool = True
+        else:
+            buf_obj = numpy.empty(buf_shape, dtype=typecode)
 
     else:
         if len(buf_obj.shape) != 3:
@@ -348,6 +429,8 @@ def DatasetReadAsArray(ds, xoff=0, yoff=0, win_xsize=None, win_ysize=None, buf_o
 
     if DatasetIONumPy(ds, 0, xoff, yoff, win_xsize, win_ysize,
                       buf_obj, buf_type, resample_alg, callback, callback_data, interleave) != 0:
+        if from_pool:
+            buf_pool.release(buf_obj)
         _RaiseException()
         return None
 
@@ -356,33 +439,32 @@ def DatasetReadAsArray(ds, xoff=0, yoff=0, win_xsize=None, win_ysize=None, buf_o
 def BandReadAsArray(band, xoff=0, yoff=0, win_xsize=None, win_ysize=None,
                     buf_xsize=None, buf_ysize=None, buf_type=None, buf_obj=None,
                     resample_alg=gdal.GRIORA_NearestNeighbour,
-                    callback=None, callback_data=None):
+                    callback=None, callback_data=None, buf_pool=None):
     """Pure python implementation of reading a chunk of a GDAL file
-    into a numpy array.  Used by the gdal.Band.ReadAsArray method."""
+    into a numpy array.  Used by the gdal.Band.ReadAsArray method.
+
+    If buf_pool is a BufferPool and buf_obj is not specified, the returned
+    array is taken from the pool, and may be handed back to it with
+    buf_pool.release() once no longer used."""
 
     if win_xsize is None:
         win_xsize = band.XSize
     if win_ysize is None:
         win_ysize = band.YSize
 
+    from_pool = False
     if buf_obj is None:
         if buf_xsize is None:
             buf_xsize = win_xsize
         if buf_ysize is None:
             buf_ysize = win_ysize
-        if buf_type is None:
-            buf_type = band.DataType
+        buf_type, typecode = _ReadBufTypeAndTypeCode(band, buf_type)
 
-        typecode = GDALTypeCodeToNumericTypeCode(buf_type)
-        if typecode is None:
-            buf_type = gdalconst.GDT_Float32
-            typecode = numpy.float32
+        if buf_pool is not None:
+            buf_obj = buf_pool.acquire((buf_ysize, buf_xsize), typecode)
+            from_pool = True
         else:
-            buf_type = NumericTypeCodeToGDALTypeCode(typecode)
-
-        if buf_type == gdalconst.GDT_Byte and band.GetMetadataItem('PIXELTYPE', 'IMAGE_STRUCTURE') == 'SIGNEDBYTE':
-            typecode = numpy.int8
-        buf_obj = numpy.empty([buf_ysize, buf_xsize], dtype=typecode)
+            buf_obj = numpy.empty([buf_ysize, buf_xsize], dtype=typecode)
 
     else:
         if len(buf_obj.shape) == 2:
@@ -405,6 +487,8 @@ def BandReadAsArray(band, xoff=0, yoff=0, win_xsize=None, win_ysize=None,
 
     if BandRasterIONumPy(band, 0, xoff, yoff, win_xsize, win_ysize,
                          buf_obj, buf_type, resample_alg, callback, callback_data) != 0:
+        if from_pool:
+            buf_pool.release(buf_obj)
         _RaiseException()
         return None
 
@@ -443,6 +527,132 @@ def BandWriteArray(band, array, xoff=0, yoff=0,
         _RaiseException()
     return ret
 
+def _SplitRange(off, size, step, block):
+    """Cut [off, off+size[ into (start, length) chunks of at most step, a
+    multiple of block. Chunk boundaries fall on multiples of block in
+    absolute coordinates, only the first and last chunks being clipped."""
+    origin = off // block * block
+    end = off + size
+    start = off
+    while start < end:
+        stop = min(origin + ((start - origin) // step + 1) * step, end)
+        yield start, stop - start
+        start = stop
+
+def iter_windows(ds_or_band, window=None, max_bytes=64 * 1024 * 1024,
+                 align_to_blocks=True, overlap=0, buf_obj_reuse=True,
+                 buf_type=None, interleave='band', prefetch=False):
+    """Iterate over a dataset or a band by windows, yielding
+    (window, array) pairs, where window is the (xoff, yoff, xsize, ysize)
+    tuple of the area read.
+
+    window: (xoff, yoff, xsize, ysize) area to iterate over. Defaults to the
+            whole raster.
+    max_bytes: maximum size of the array of a window, overlap excluded.
+    align_to_blocks: whether windows should be made of whole blocks of the
+                     raster (the first band of a dataset).
+    overlap: number of pixels by which each window is extended on each side,
+             within the limits of the iterated area.
+    buf_obj_reuse: if True, yielded arrays are views of a single buffer
+                   allocated once, and are overwritten at the next step.
+                   They must be copied if they need to outlive it.
+    buf_type: GDAL data type of the arrays. Defaults to the one of
+              ReadAsArray().
+    interleave: 'band' or 'pixel', for datasets.
+    prefetch: if True, AdviseRead() is issued on the next window before
+              yielding the current one.
+    """
+
+    is_dataset = isinstance(ds_or_band, gdal.Dataset)
+    if is_dataset:
+        if ds_or_band.RasterCount == 0:
+            return
+        band = ds_or_band.GetRasterBand(1)
+        nbands = ds_or_band.RasterCount
+        xsize = ds_or_band.RasterXSize
+        ysize = ds_or_band.RasterYSize
+        interleave = interleave.lower()
+        if interleave not in ('band', 'pixel'):
+            raise ValueError('Interleave should be band or pixel')
+        if nbands == 1:
+# Like DatasetReadAsArray(), return 2D arrays
+            is_dataset = False
+    else:
+        band = ds_or_band
+        nbands = 1
+        xsize = band.XSize
+        ysize = band.YSize
+
+    if window is None:
+        window = (0, 0, xsize, ysize)
+    region_xoff, region_yoff, region_xsize, region_ysize = [int(v) for v in window]
+    if region_xoff < 0 or region_yoff < 0 or region_xsize <= 0 or region_ysize <= 0 or \
+       region_xoff + region_xsize > xsize or region_yoff + region_ysize > ysize:
+        raise ValueError('window is not within the raster extent')
+    if overlap < 0:
+        raise ValueError('overlap should be positive or zero')
+
+    buf_type, typecode = _ReadBufTypeAndTypeCode(ds_or_band, buf_type)
+    max_pixels = max(1, max_bytes // (numpy.dtype(typecode).itemsize * nbands))
+
+    if align_to_blocks:
+        blockxsize, blockysize = band.GetBlockSize()
+    else:
+        blockxsize, blockysize = 1, 1
+    if region_xsize * blockysize <= max_pixels:
+# Full width strips, made of as many block rows as possible. The step is
+# the width of the blocks intersecting the region.
+        win_xsize = -(-(region_xoff + region_xsize) // blockxsize) * blockxsize - \
+            region_xoff // blockxsize * blockxsize
+        win_ysize = max(blockysize, max_pixels // region_xsize // blockysize * blockysize)
+    else:
+        win_ysize = blockysize
+        win_xsize = max(blockxsize, max_pixels // blockysize // blockxsize * blockxsize)
+
+    windows = []
+    for core_yoff, core_ysize in _SplitRange(region_yoff, region_ysize, win_ysize, blockysize):
+        for core_xoff, core_xsize in _SplitRange(region_xoff, region_xsize, win_xsize, blockxsize):
+            xoff = max(region_xoff, core_xoff - overlap)
+            yoff = max(region_yoff, core_yoff - overlap)
+            xend = min(region_xoff + region_xsize, core_xoff + core_xsize + overlap)
+            yend = min(region_yoff + region_ysize, core_yoff + core_ysize + overlap)
+            windows.append((xoff, yoff, xend - xoff, yend - yoff))
+
+    buf = None
+    if buf_obj_reuse:
+        buf_xsize = min(region_xsize, win_xsize + 2 * overlap)
+        buf_ysize = min(region_ysize, win_ysize + 2 * overlap)
+        if not is_dataset:
+            buf_shape = (buf_ysize, buf_xsize)
+        elif interleave == 'band':
+            buf_shape = (nbands, buf_ysize, buf_xsize)
+        else:
+            buf_shape = (buf_ysize, buf_xsize, nbands)
+        buf = numpy.empty(buf_shape, dtype=typecode)
+
+    for idx, (xoff, yoff, win_xsize, win_ysize) in enumerate(windows):
+        if prefetch and idx + 1 < len(windows):
+            ds_or_band.AdviseRead(*windows[idx + 1])
+
+        buf_obj = None
+        if buf is not None:
+            if is_dataset and interleave == 'pixel':
+                buf_obj = buf[0:win_ysize, 0:win_xsize, :]
+            else:
+                buf_obj = buf[..., 0:win_ysize, 0:win_xsize]
+
+        if is_dataset:
+            array = DatasetReadAsArray(ds_or_band, xoff, yoff, win_xsize, win_ysize,
+                                       buf_obj=buf_obj, buf_type=buf_type,
+                                       interleave=interleave)
+        else:
+            array = BandReadAsArray(band, xoff, yoff, win_xsize, win_ysize,
+                                    buf_obj=buf_obj, buf_type=buf_type)
+        if array is None:
+            raise RuntimeError(gdal.GetLastErrorMsg())
+
+        yield (xoff, yoff, win_xsize, win_ysize), array
+
 def ExtendedDataTypeToNumPyDataType(dt):
     klass = dt.GetClass()
 
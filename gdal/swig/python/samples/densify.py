@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 
-import math
+import collections
+import functools
+import multiprocessing
 import os
 import sys
 
+import numpy as np
+
 from osgeo import osr
 from osgeo import ogr
 ogr.UseExceptions()
@@ -44,6 +48,12 @@ class Translator(object):
         g.add_option("-q", "--quiet",
                      action="store_false", dest="verbose", default=False,
                      help="don't print status messages to stdout")
+        g.add_option('-j', '--jobs', dest='jobs', type=int,
+                     help="""Number of worker processes transforming the geometries. Defaults to 1 (no worker process)""")
+        g.add_option('--batch-size', dest='batch_size', type=int,
+                     help="""Number of geometries sent at once to a worker process""")
+        g.add_option('--transaction-size', dest='transaction_size', type=int,
+                     help="""Number of features written in each transaction""")
         parser.add_option_group(g)
 
         if self.opts:
@@ -52,7 +62,8 @@ class Translator(object):
                 g.add_option(o)
             parser.add_option_group(g)
 
-        parser.set_defaults(verbose=True, driver="ESRI Shapefile", overwrite=True)
+        parser.set_defaults(verbose=True, driver="ESRI Shapefile", overwrite=True,
+                            jobs=1, batch_size=1000, transaction_size=100000)
 
         self.parser = parser
 
@@ -151,202 +162,227 @@ class Translator(object):
                 self.output.CreateField(fld)
 
     def translate(self, geometry_callback=None, attribute_callback=None):
+        """Copy the features of the input layer to the output layer, after
+        reprojection and application of geometry_callback to their
+        geometries. When geometry_callback returns None, the output feature
+        has no geometry.
+
+        With --jobs greater than 1, the geometries are processed by worker
+        processes, by batches of WKB geometries. geometry_callback must then
+        be picklable (a module level function, or a functools.partial() of
+        it). The features are written by the main process only, in their
+        input order, with one transaction every --transaction-size features.
+        On error, the workers are stopped and the pending transaction is
+        rolled back.
+        """
         # pylint: disable=unused-argument
-        f = self.input.GetNextFeature()
-        trans = None
-        if self.options.t_srs:
-            trans = osr.CoordinateTransformation(self.in_srs, self.out_srs)
-        while f:
-            geom = f.GetGeometryRef().Clone()
-
-            if trans:
-                geom.Transform(trans)
-
-            if geometry_callback:
-                geom = geometry_callback(geom)
-
-            f.SetGeometry(geom)
-            d = ogr.Feature(feature_def=self.output.GetLayerDefn())
-            d.SetFrom(f)
-            self.output.CreateFeature(d)
-            f = self.input.GetNextFeature()
+        in_srs_wkt = self.in_srs.ExportToWkt() if self.in_srs and self.options.t_srs else None
+        out_srs_wkt = self.out_srs.ExportToWkt() if self.out_srs else None
+        srs_args = (in_srs_wkt, self.in_srs.GetDataAxisToSRSAxisMapping() if in_srs_wkt else None,
+                    out_srs_wkt, self.out_srs.GetDataAxisToSRSAxisMapping() if out_srs_wkt else None)
+
+        out_defn = self.output.GetLayerDefn()
+        written = [0]
+
+        def write(features, geometries):
+            for f, geom in zip(features, geometries):
+                d = ogr.Feature(feature_def=out_defn)
+                d.SetFrom(f)
+                # Also when geom is None (e.g. returned by geometry_callback),
+                # to not keep the source geometry copied by SetFrom()
+                d.SetGeometryDirectly(geom)
+                self.output.CreateFeature(d)
+                written[0] += 1
+                if written[0] % self.options.transaction_size == 0:
+                    self.output.CommitTransaction()
+                    self.output.StartTransaction()
+
+        self.output.StartTransaction()
+        pool = multiprocessing.Pool(self.options.jobs) if self.options.jobs > 1 else None
+        try:
+            if pool is not None:
+                # Bound the number of batches in flight, so that the reader
+                # does not get too far ahead of the writer
+                pending = collections.deque()
+                for features in self.read_batches():
+                    wkb, offsets = ogr.ExportGeometriesToWkb([f.GetGeometryRef() for f in features])
+                    pending.append((features, pool.apply_async(
+                        transform_batch, (wkb, offsets) + srs_args + (geometry_callback,))))
+                    if len(pending) >= 2 * self.options.jobs:
+                        features, result = pending.popleft()
+                        write(features, ogr.CreateGeometriesFromWkb(*result.get()))
+                while pending:
+                    features, result = pending.popleft()
+                    write(features, ogr.CreateGeometriesFromWkb(*result.get()))
+                pool.close()
+                pool.join()
+            else:
+                trans = get_transformation(*srs_args)
+                for features in self.read_batches():
+                    write(features, [transform_geometry(f.GetGeometryRef(), trans, geometry_callback)
+                                     for f in features])
+        except BaseException:
+            # e.g. an exception raised by a worker, and re-raised by result.get()
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            self.output.RollbackTransaction()
+            raise
+        self.output.CommitTransaction()
+
+    def read_batches(self):
+        """Yield the features of the input layer by lists of --batch-size features."""
+        batch = []
+        for f in self.input:
+            batch.append(f)
+            if len(batch) == self.options.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
     def __del__(self):
         if self.output:
             self.output.SyncToDisk()
 
 
-class Densify(Translator):
-
-    def calcpoint(self, x0, x1, y0, y1, d):
-        a = x1 - x0
-        b = y1 - y0
-
-        if a == 0:
-            xn = x1
-
-            if b > 0:
-                yn = y0 + d
-            else:
-                yn = y0 - d
-            return (xn, yn)
-
-        theta = math.degrees(math.atan(abs(b) / abs(a)))
-
-        if a > 0 and b > 0:
-            omega = theta
-        if a < 0 and b > 0:
-            omega = 180 - theta
-        if a < 0 and b < 0:
-            omega = 180 + theta
-        if a > 0 and b < 0:
-            omega = 360 - theta
-
-        if b == 0:
-            yn = y1
-            if a > 0:
-                xn = x0 + d
-            else:
-                xn = x0 - d
+def get_transformation(in_srs_wkt, in_axis_mapping, out_srs_wkt, out_axis_mapping):
+    if not in_srs_wkt or not out_srs_wkt:
+        return None
+    in_srs = osr.SpatialReference()
+    in_srs.ImportFromWkt(in_srs_wkt)
+    in_srs.SetDataAxisToSRSAxisMapping(in_axis_mapping)
+    out_srs = osr.SpatialReference()
+    out_srs.ImportFromWkt(out_srs_wkt)
+    out_srs.SetDataAxisToSRSAxisMapping(out_axis_mapping)
+    return osr.CoordinateTransformation(in_srs, out_srs)
+
+
+def transform_geometry(geom, trans, geometry_callback):
+    if geom is None:
+        return None
+    geom = geom.Clone()
+    if trans:
+        geom.Transform(trans)
+    if geometry_callback:
+        geom = geometry_callback(geom)
+    return geom
+
+
+def transform_batch(wkb, offsets, in_srs_wkt, in_axis_mapping,
+                    out_srs_wkt, out_axis_mapping, geometry_callback):
+    """Worker process function: transform a batch of WKB geometries, and
+    return the resulting WKB geometries and their offsets."""
+    trans = get_transformation(in_srs_wkt, in_axis_mapping, out_srs_wkt, out_axis_mapping)
+    geoms = [transform_geometry(geom, trans, geometry_callback)
+             for geom in ogr.CreateGeometriesFromWkb(wkb, offsets)]
+    return ogr.ExportGeometriesToWkb(geoms)
+
+
+def _segments(coords, ring_offsets):
+    """Return the XY length of the segments joining consecutive points, and
+    a mask of the segments that are within a ring."""
+    seg_length = np.hypot(np.diff(coords[:, 0]), np.diff(coords[:, 1]))
+    in_ring = np.ones(seg_length.shape[0], dtype=bool)
+    boundaries = ring_offsets[1:-1]
+    boundaries = boundaries[(boundaries > 0) & (boundaries < coords.shape[0])]
+    in_ring[boundaries - 1] = False
+    return seg_length, in_ring
+
+
+def densify_coords(coords, ring_offsets, threshold, remainder='end'):
+    """Densify the rings (or line strings) of an array of coordinates, with
+    the layout returned by ogr.Geometry.GetFlatCoordinates().
+
+    With remainder='uniform', segments longer than threshold are split in
+    equal parts no longer than threshold, and repeated points are removed.
+    With remainder='end', points are inserted every threshold distance from
+    the start of the segment. With remainder='begin', points are inserted
+    every threshold distance from the end of the segment.
+
+    Return the new coordinates and ring offsets. Z and M values are
+    linearly interpolated.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    ring_offsets = np.asarray(ring_offsets, dtype=np.int64)
+    seg_length, in_ring = _segments(coords, ring_offsets)
+
+    if remainder == 'uniform':
+        duplicate = np.zeros(coords.shape[0], dtype=bool)
+        duplicate[1:] = in_ring & (seg_length == 0)
+        if duplicate.any():
+            kept_before = np.concatenate(([0], np.cumsum(~duplicate)))
+            ring_offsets = kept_before[ring_offsets]
+            coords = coords[~duplicate]
+            seg_length, in_ring = _segments(coords, ring_offsets)
+
+    # For each segment, number of inserted points, and position of the
+    # first one and step between them, as fractions of the segment length
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = seg_length / threshold
+        if remainder == 'uniform':
+            count = np.ceil(ratio) - 1
+            step = 1 / np.ceil(ratio)
+            first = step
+        elif remainder == 'end':
+            count = np.floor(ratio) - 1
+            step = threshold / seg_length
+            first = step
         else:
-            xn = x0 + d * math.cos(math.radians(omega))
-            yn = y0 + d * math.sin(math.radians(omega))
+            count = np.floor(ratio)
+            step = threshold / seg_length
+            first = np.fmod(seg_length, threshold) / seg_length
+    count = np.where(in_ring & (seg_length > threshold), np.maximum(count, 0), 0).astype(np.int64)
+
+    total = int(count.sum())
+    seg_idx = np.repeat(np.arange(count.shape[0]), count)
+    cum_count = np.cumsum(count)
+    rank = np.arange(total) - np.repeat(cum_count - count, count)
+    frac = first[seg_idx] + rank * step[seg_idx]
+    inserted = coords[seg_idx] + frac[:, np.newaxis] * (coords[seg_idx + 1] - coords[seg_idx])
+
+    # Original points are shifted by the number of points inserted before them
+    npoints = coords.shape[0]
+    shift = np.zeros(npoints, dtype=np.int64)
+    shift[1:] = cum_count
+    new_pos = np.arange(npoints) + shift
+    out = np.empty((npoints + total, coords.shape[1]), dtype=np.float64)
+    out[new_pos] = coords
+    out[new_pos[seg_idx] + 1 + rank] = inserted
+    return out, np.append(new_pos, npoints + total)[ring_offsets]
+
+
+def densify_geometry(geometry, threshold, remainder='end'):
+    gtype = ogr.GT_Flatten(geometry.GetGeometryType())
+    if not (gtype == ogr.wkbLineString or gtype == ogr.wkbMultiLineString):
+        raise Exception("The densify function only works on linestring or multilinestring geometries")
+
+    coords, ring_offsets, part_offsets = geometry.GetFlatCoordinates()
+    coords, ring_offsets = densify_coords(coords, ring_offsets, threshold, remainder)
+    g = ogr.Geometry(geometry.GetGeometryType())
+    g.SetFlatCoordinates(coords, ring_offsets, part_offsets)
+    g.AssignSpatialReference(geometry.GetSpatialReference())
+    return g
 
-        return (xn, yn)
 
-    def distance(self, x0, x1, y0, y1):
-        deltax = x0 - x1
-        deltay = y0 - y1
-        d2 = (deltax)**2 + (deltay)**2
-        d = math.sqrt(d2)
-        return d
+class Densify(Translator):
 
     def densify(self, geometry):
-        gtype = geometry.GetGeometryType()
-        if not (gtype == ogr.wkbLineString or gtype == ogr.wkbMultiLineString):
-            raise Exception("The densify function only works on linestring or multilinestring geometries")
-
-        g = ogr.Geometry(ogr.wkbLineString)
-
-        # add the first point
-        x0 = geometry.GetX(0)
-        y0 = geometry.GetY(0)
-        g.AddPoint(x0, y0)
-
-        for i in range(1, geometry.GetPointCount()):
-            threshold = self.options.distance
-            x1 = geometry.GetX(i)
-            y1 = geometry.GetY(i)
-            if not x0 or not y0:
-                raise Exception("First point is null")
-            d = self.distance(x0, x1, y0, y1)
-
-            if self.options.remainder.upper() == "UNIFORM":
-                if d != 0.0:
-                    threshold = float(d) / math.ceil(d / threshold)
-                else:
-                    # duplicate point... throw it out
-                    continue
-            if d > threshold:
-                if self.options.remainder.upper() == "UNIFORM":
-                    segcount = int(math.ceil(d / threshold))
-
-                    dx = (x1 - x0) / segcount
-                    dy = (y1 - y0) / segcount
-
-                    x = x0
-                    y = y0
-                    for _ in range(1, segcount):
-                        x = x + dx
-                        y = y + dy
-                        g.AddPoint(x, y)
-
-                elif self.options.remainder.upper() == "END":
-                    segcount = int(math.floor(d / threshold))
-                    xa = None
-                    ya = None
-                    for _ in range(1, segcount):
-                        if not xa:
-                            xn, yn = self.calcpoint(x0, x1, y0, y1, threshold)
-                            d = self.distance(x0, xn, y0, yn)
-                            xa = xn
-                            ya = yn
-                            g.AddPoint(xa, ya)
-                            continue
-                        xn, yn = self.calcpoint(xa, x1, ya, y1, threshold)
-                        xa = xn
-                        ya = yn
-                        g.AddPoint(xa, ya)
-
-                elif self.options.remainder.upper() == "BEGIN":
-
-                    # I think this might put an extra point in at the end of the
-                    # first segment
-                    segcount = int(math.floor(d / threshold))
-                    xa = None
-                    ya = None
-                    # xb = x0
-                    # yb = y0
-                    remainder = d % threshold
-                    for _ in range(segcount):
-                        if not xa:
-                            xn, yn = self.calcpoint(x0, x1, y0, y1, remainder)
-
-                            d = self.distance(x0, xn, y0, yn)
-                            xa = xn
-                            ya = yn
-                            g.AddPoint(xa, ya)
-                            continue
-                        xn, yn = self.calcpoint(xa, x1, ya, y1, threshold)
-                        xa = xn
-                        ya = yn
-                        g.AddPoint(xa, ya)
-
-            g.AddPoint(x1, y1)
-            x0 = x1
-            y0 = y1
-
-        return g
+        return densify_geometry(geometry, self.options.distance,
+                                self.options.remainder.lower())
 
     def process(self):
         self.open()
         self.make_fields()
-        self.translate(geometry_callback=self.densify)
+        self.translate(geometry_callback=functools.partial(
+            densify_geometry, threshold=self.options.distance,
+            remainder=self.options.remainder.lower()))
 
 
 def GetLength(geometry):
-
-    def get_distance(x1, y1, x2, y2):
-        """Return the euclidean distance between this point and another."""
-        deltax = x1 - x2
-        deltay = y1 - y2
-        d2 = (deltax**2) + (deltay**2)
-        distance = math.sqrt(d2)
-        return distance
-
-    def cumulate(single):
-        cumulative = 0.0
-        g = single
-        pt_count = g.GetPointCount()
-        x1, y1 = g.GetX(0), g.GetY(0)
-        for pi in range(1, pt_count):
-            x2, y2 = g.GetX(pi), g.GetY(pi)
-            length = get_distance(x1, y1, x2, y2)
-            cumulative = cumulative + length
-            x1 = x2
-            y1 = y2
-        return cumulative
-
-    cumulative = 0.0
-    geom_count = geometry.GetGeometryCount()
-
-    if geom_count:
-        for gi in range(geom_count):
-            g = geometry.GetGeometryRef(gi)
-            cumulative = cumulative + cumulate(g)
-    else:
-        cumulative = cumulate(geometry)
-    return cumulative
+    coords, ring_offsets, _ = geometry.GetFlatCoordinates()
+    seg_length, in_ring = _segments(coords, ring_offsets)
+    return float(seg_length[in_ring].sum())
 
 
 def main():
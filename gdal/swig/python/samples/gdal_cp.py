@@ -28,10 +28,13 @@
 #  DEALINGS IN THE SOFTWARE.
 ###############################################################################
 
+import collections
 import fnmatch
 import os
 import stat
 import sys
+import threading
+import time
 
 from osgeo import gdal
 
@@ -41,7 +44,12 @@ def needsVSICurl(filename):
 
 
 def Usage():
-    print('Usage: gdal_cp [-progress] [-r] [-skipfailures] source_file target_file')
+    print('Usage: gdal_cp [-progress] [-r] [-skipfailures] [-j num_threads]')
+    print('               [-part_size bytes] source_file target_file')
+    print('')
+    print('  -j: copy files concurrently with num_threads threads, and split the')
+    print('      files larger than -part_size (default 8 MB) in byte ranges copied')
+    print('      concurrently. The aggregate throughput is reported at the end.')
     return -1
 
 
@@ -188,6 +196,241 @@ def gdal_cp_recurse(srcdir, targetdir, progress, skip_failure):
     return 0
 
 
+class ParallelCopier(object):
+    """ Copies files on a pool of threads. Small files are copied as a whole by
+    a worker thread. Large files are split in byte ranges read concurrently,
+    each with its own file handle, and written in order by the calling thread,
+    so that the target does not need to support random writes. """
+
+    def __init__(self, num_threads, part_size, progress, skip_failure):
+        from concurrent.futures import ThreadPoolExecutor
+        self.executor = ThreadPoolExecutor(max_workers=num_threads)
+        self.num_threads = num_threads
+        self.part_size = part_size
+        self.buf_size = min(part_size, 1024 * 1024)
+        self.progress = progress
+        self.skip_failure = skip_failure
+        self.lock = threading.Lock()
+        self.total_size = 0
+        self.copied = 0
+        self.file_count = 0
+        self.stopped = False
+
+    def add_copied(self, nbytes):
+        with self.lock:
+            self.copied += nbytes
+            if self.progress is not None and self.total_size != 0 and not self.stopped:
+                if not self.progress.Progress(min(1.0, self.copied * 1.0 / self.total_size), ''):
+                    print('Copy stopped by user')
+                    self.stopped = True
+            return not self.stopped
+
+    def copy_whole_file(self, srcfile, targetfile):
+        if self.stopped:
+            return -2
+        fin = gdal.VSIFOpenL(srcfile, "rb")
+        if fin is None:
+            print('Cannot open %s' % srcfile)
+            return -1
+        fout = gdal.VSIFOpenL(targetfile, "wb")
+        if fout is None:
+            print('Cannot create %s' % targetfile)
+            gdal.VSIFCloseL(fin)
+            return -1
+        ret = 0
+        while True:
+            buf = gdal.VSIFReadL(1, self.buf_size, fin)
+            if not buf:
+                break
+            if gdal.VSIFWriteL(buf, 1, len(buf), fout) != len(buf):
+                print('Error writing %d bytes in %s' % (len(buf), targetfile))
+                ret = -1
+                break
+            if not self.add_copied(len(buf)):
+                ret = -2
+                break
+            if len(buf) != self.buf_size:
+                break
+        gdal.VSIFCloseL(fin)
+        if gdal.VSIFCloseL(fout) != 0 and ret == 0:
+            print('Error writing %s' % targetfile)
+            ret = -1
+        return ret
+
+    def read_range(self, srcfile, offset, size):
+        if self.stopped:
+            return None
+        fin = gdal.VSIFOpenL(srcfile, "rb")
+        if fin is None:
+            return None
+        gdal.VSIFSeekL(fin, offset, 0)
+        buf = gdal.VSIFReadL(1, size, fin)
+        gdal.VSIFCloseL(fin)
+        if buf is None or len(buf) != size:
+            return None
+        return buf
+
+    def copy_by_parts(self, srcfile, targetfile, size):
+        fout = gdal.VSIFOpenL(targetfile, "wb")
+        if fout is None:
+            print('Cannot create %s' % targetfile)
+            return -1
+
+        # Keep a bounded number of parts in flight
+        offsets = iter(range(0, size, self.part_size))
+        pending = collections.deque()
+
+        def submit_next():
+            for offset in offsets:
+                part_size = min(self.part_size, size - offset)
+                pending.append((offset, self.executor.submit(
+                    self.read_range, srcfile, offset, part_size)))
+                return
+
+        for _ in range(2 * self.num_threads):
+            submit_next()
+
+        ret = 0
+        while pending:
+            offset, future = pending.popleft()
+            buf = future.result()
+            if buf is None:
+                if self.stopped:
+                    ret = -2
+                else:
+                    print('Cannot read %d bytes at offset %d in %s' % (
+                        min(self.part_size, size - offset), offset, srcfile))
+                    ret = -1
+                break
+            if gdal.VSIFWriteL(buf, 1, len(buf), fout) != len(buf):
+                print('Error writing %d bytes in %s' % (len(buf), targetfile))
+                ret = -1
+                break
+            if not self.add_copied(len(buf)):
+                ret = -2
+                break
+            submit_next()
+
+        for _, future in pending:
+            future.cancel()
+        if gdal.VSIFCloseL(fout) != 0 and ret == 0:
+            print('Error writing %s' % targetfile)
+            ret = -1
+        return ret
+
+    def run(self, jobs):
+        """ Copy a list of (srcfile, targetfile, size) """
+        self.total_size = sum(size for (_, _, size) in jobs)
+        start = time.time()
+        if self.progress is not None:
+            self.progress.Progress(0.0, '')
+
+        ret = 0
+        futures = []
+        large_files = []
+        for (srcfile, targetfile, size) in jobs:
+            if size > self.part_size:
+                large_files.append((srcfile, targetfile, size))
+            else:
+                futures.append(self.executor.submit(self.copy_whole_file, srcfile, targetfile))
+
+        # The parts of large files are queued after the small files
+        for (srcfile, targetfile, size) in large_files:
+            file_ret = self.copy_by_parts(srcfile, targetfile, size)
+            if file_ret == 0:
+                self.file_count += 1
+            elif file_ret == -2 or not self.skip_failure:
+                ret = file_ret
+                self.stopped = True
+                break
+
+        for future in futures:
+            file_ret = future.result()
+            if file_ret == 0:
+                self.file_count += 1
+            elif ret == 0 and (file_ret == -2 or not self.skip_failure):
+                ret = file_ret
+                self.stopped = True
+
+        self.executor.shutdown()
+        elapsed = time.time() - start
+        if self.progress is not None and ret == 0 and self.total_size == 0:
+            self.progress.Progress(1.0, '')
+        print('Copied %d file(s), %d bytes in %.3f s (%.2f MB/s)' % (
+            self.file_count, self.copied, elapsed,
+            self.copied / 1e6 / elapsed if elapsed > 0 else 0))
+        return ret
+
+
+def get_file_size(filename):
+    stat_res = gdal.VSIStatL(filename, gdal.VSI_STAT_SIZE_FLAG)
+    if stat_res is None:
+        return 0
+    return stat_res.size
+
+
+def gdal_cp_recurse_parallel(srcdir, targetdir, copier):
+
+    if srcdir[-1] == '/':
+        srcdir = srcdir[0:len(srcdir) - 1]
+
+    # A single (recursive) listing of the source, which also gives the file
+    # sizes on most file systems, instead of one ReadDir() per directory
+    d = gdal.OpenDir(srcdir)
+    if d is None:
+        print('%s is not a directory' % srcdir)
+        return -1
+
+    created_dirs = set()
+
+    def mkdir(dirname):
+        if not dirname or dirname in created_dirs or dirname == os.path.dirname(dirname):
+            return
+        if gdal.VSIStatL(dirname) is None:
+            mkdir(os.path.dirname(dirname))
+            gdal.Mkdir(dirname, int('0755', 8))
+        created_dirs.add(dirname)
+
+    mkdir(targetdir)
+    jobs = []
+    try:
+        while True:
+            entry = gdal.GetNextDirEntry(d)
+            if entry is None:
+                break
+            fullsrcfile = srcdir + '/' + entry.name
+            fulltargetfile = targetdir + '/' + entry.name
+            if entry.IsDirectory():
+                mkdir(fulltargetfile)
+            else:
+                mkdir(os.path.dirname(fulltargetfile))
+                size = entry.size if entry.sizeKnown else get_file_size(fullsrcfile)
+                jobs.append((fullsrcfile, fulltargetfile, size))
+    finally:
+        gdal.CloseDir(d)
+
+    return copier.run(jobs)
+
+
+def gdal_cp_parallel(srcfiles, targetfile, copier):
+    """ Copy a list of files to targetfile, which must be a directory if there
+    are several files """
+    if targetfile.endswith('/'):
+        stat_res = gdal.VSIStatL(targetfile)
+    else:
+        stat_res = gdal.VSIStatL(targetfile + '/')
+    target_is_dir = (stat_res is None and targetfile.endswith('/')) or \
+                    (stat_res is not None and stat.S_ISDIR(stat_res.mode))
+
+    jobs = []
+    for srcfile in srcfiles:
+        target = targetfile
+        if target_is_dir:
+            target = targetfile.rstrip('/') + '/' + os.path.split(srcfile)[1]
+        jobs.append((srcfile, target, get_file_size(srcfile)))
+    return copier.run(jobs)
+
+
 def gdal_cp_pattern_match(srcdir, pattern, targetfile, progress, skip_failure):
 
     if srcdir == '':
@@ -255,13 +498,32 @@ def gdal_cp(argv, progress=None):
     targetfile = None
     recurse = False
     skip_failure = False
+    num_threads = 0
+    part_size = 8 * 1024 * 1024
 
     argv = gdal.GeneralCmdLineProcessor(argv)
     if argv is None:
         return -1
 
-    for i in range(1, len(argv)):
-        if argv[i] == '-progress':
+    i = 1
+    while i < len(argv):
+        if argv[i] == '-j' and i + 1 < len(argv):
+            i += 1
+            num_threads = int(argv[i])
+            if num_threads <= 0:
+                print('ERROR: -j value must be strictly positive')
+                return -1
+            version_num = int(gdal.VersionInfo('VERSION_NUM'))
+            if version_num < 3000000:
+                print('ERROR: Python bindings of GDAL 3.0 or later required for -j option')
+                return -1
+        elif argv[i] == '-part_size' and i + 1 < len(argv):
+            i += 1
+            part_size = int(argv[i])
+            if part_size <= 0:
+                print('ERROR: -part_size value must be strictly positive')
+                return -1
+        elif argv[i] == '-progress':
             progress = TermProgress()
         elif argv[i] == '-r':
             version_num = int(gdal.VersionInfo('VERSION_NUM'))
@@ -281,6 +543,7 @@ def gdal_cp(argv, progress=None):
         else:
             print('Unexpected option : %s' % argv[i])
             return Usage()
+        i += 1
 
     if srcfile is None or targetfile is None:
         return Usage()
@@ -308,11 +571,27 @@ def gdal_cp(argv, progress=None):
             if gdal.VSIStatL(targetfile) is None:
                 gdal.Mkdir(targetfile, int('0755', 8))
 
+        if num_threads:
+            copier = ParallelCopier(num_threads, part_size, progress, skip_failure)
+            return gdal_cp_recurse_parallel(srcfile, targetfile, copier)
         return gdal_cp_recurse(srcfile, targetfile, progress, skip_failure)
 
     (srcdir, pattern) = os.path.split(srcfile)
     if pattern.find('*') != -1 or pattern.find('?') != -1:
+        if num_threads:
+            lst = gdal.ReadDir(srcdir if srcdir else '.')
+            if lst is None:
+                print('Cannot read directory %s' % srcdir)
+                return -1
+            srcfiles = [srcdir + '/' + filename if srcdir else filename
+                        for filename in lst if filename not in ('.', '..')]
+            srcfiles = [f for f in srcfiles if fnmatch.fnmatch(f, pattern)]
+            copier = ParallelCopier(num_threads, part_size, progress, skip_failure)
+            return gdal_cp_parallel(srcfiles, targetfile, copier)
         return gdal_cp_pattern_match(srcdir, pattern, targetfile, progress, skip_failure)
+    if num_threads:
+        copier = ParallelCopier(num_threads, part_size, progress, skip_failure)
+        return gdal_cp_parallel([srcfile], targetfile, copier)
     return gdal_cp_single(srcfile, targetfile, progress)
 
 
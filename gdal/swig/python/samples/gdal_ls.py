@@ -29,8 +29,12 @@
 #  DEALINGS IN THE SOFTWARE.
 ###############################################################################
 
+import collections
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from osgeo import gdal
 
@@ -48,103 +52,185 @@ def istgz(filename):
         filename.endswith('.tar.gz') or filename.endswith('.TAR.GZ')
 
 
-def display_file(fout, dirname, prefix, filename, longformat, check_open=False):
+# One listed file or directory. display_name is the name to display (with a
+# trailing slash for directories), depth is the recursion level (0 for the
+# content of the listed directory), and size and mtime are None when unknown.
+ListEntry = collections.namedtuple('ListEntry',
+                                   ['path', 'display_name', 'is_dir', 'size', 'mtime', 'depth'])
 
-    statBuf = None
-    filename_displayed = prefix + filename
 
-    if dirname.endswith('/'):
-        dirname_with_slash = dirname
-    else:
-        dirname_with_slash = dirname + '/'
+class _Deferred(object):
+    """ Minimal stand-in for a Future, when listings are not run concurrently """
 
-    version_num = int(gdal.VersionInfo('VERSION_NUM'))
-    if longformat:
-        if version_num >= 1900:
-            statBuf = gdal.VSIStatL(dirname_with_slash + filename, gdal.VSI_STAT_EXISTS_FLAG | gdal.VSI_STAT_NATURE_FLAG | gdal.VSI_STAT_SIZE_FLAG)
-    else:
-        if version_num >= 1900:
-            statBuf = gdal.VSIStatL(dirname_with_slash + filename, gdal.VSI_STAT_EXISTS_FLAG | gdal.VSI_STAT_NATURE_FLAG)
-
-    if statBuf is None and check_open:
-        if version_num >= 1900:
-            f = None
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def result(self):
+        return self.func(*self.args)
+
+
+class DirLister(object):
+    """ Listing engine. Each directory is listed in a single pass with
+    gdal.OpenDir(), which returns the nature, size and modification time of
+    the entries when the file system knows them (VSIStatL() is only called for
+    entries for which it does not). When num_threads > 1, the subdirectories of
+    a directory are listed concurrently as soon as it has been listed, while
+    entries are still produced in the same order as a sequential listing. """
+
+    def __init__(self, recurse=False, depth=1024, recurseInZip=False,
+                 recurseInTGZ=False, longformat=True, num_threads=1):
+        self.recurse = recurse
+        self.depth = depth
+        self.recurseInZip = recurseInZip
+        self.recurseInTGZ = recurseInTGZ
+        self.longformat = longformat
+        self.num_threads = num_threads
+
+    def list_entries(self, dirname, prefix, depth):
+        """ Returns the list of ListEntry of dirname, or None if it is not a
+        directory """
+        d = gdal.OpenDir(dirname, 0)
+        if d is None:
+            return None
+
+        if dirname.endswith('/'):
+            dirname_with_slash = dirname
         else:
-            f = gdal.VSIFOpenL(dirname_with_slash + filename, "rb")
-        if f is None:
-            sys.stderr.write('Cannot open %s\n' % (dirname_with_slash + filename))
+            dirname_with_slash = dirname + '/'
+
+        entries = []
+        try:
+            while True:
+                entry = gdal.GetNextDirEntry(d)
+                if entry is None:
+                    break
+                if entry.name == '.' or entry.name == '..':
+                    continue
+                path = dirname_with_slash + entry.name
+                if entry.modeKnown and (not self.longformat or (entry.sizeKnown and entry.mtimeKnown)):
+                    is_dir = entry.IsDirectory()
+                    size = entry.size if entry.sizeKnown else None
+                    mtime = entry.mtime if entry.mtimeKnown else None
+                else:
+                    flags = gdal.VSI_STAT_EXISTS_FLAG | gdal.VSI_STAT_NATURE_FLAG
+                    if self.longformat:
+                        flags |= gdal.VSI_STAT_SIZE_FLAG
+                    statBuf = gdal.VSIStatL(path, flags)
+                    if statBuf is None:
+                        is_dir, size, mtime = False, None, None
+                    else:
+                        is_dir, size, mtime = statBuf.IsDirectory(), statBuf.size, statBuf.mtime
+                display_name = prefix + entry.name
+                if is_dir and not display_name.endswith('/'):
+                    display_name += '/'
+                entries.append(ListEntry(path, display_name, is_dir, size, mtime, depth))
+        finally:
+            gdal.CloseDir(d)
+        return entries
+
+    def _container(self, dirname, prefix):
+        """ Returns the (dirname, prefix) to list for a directory or archive """
+        if self.recurseInZip and iszip(dirname) and not dirname.startswith('/vsizip'):
+            return '/vsizip/' + dirname, '/vsizip/' + prefix
+        if self.recurseInTGZ and istgz(dirname) and not dirname.startswith('/vsitar'):
+            return '/vsitar/' + dirname, '/vsitar/' + prefix
+        return dirname, prefix
+
+    def _child(self, entry):
+        prefix = entry.display_name
+        if not prefix.endswith('/'):
+            prefix += '/'
+        dirname, prefix = self._container(entry.path, prefix)
+        if entry.is_dir or dirname != entry.path:
+            return dirname, prefix
+        return None
+
+    def _walk(self, listing, depth, submit):
+        entries = listing.result()
+        if entries is None:
+            return
+
+        children = [None] * len(entries)
+        if self.recurse and depth + 1 < self.depth:
+            # Start listing all the subdirectories before returning the entries
+            for i, entry in enumerate(entries):
+                child = self._child(entry)
+                if child is not None:
+                    children[i] = submit(self.list_entries, child[0], child[1], depth + 1)
+
+        for entry, child in zip(entries, children):
+            yield entry
+            if child is not None:
+                for sub_entry in self._walk(child, depth + 1, submit):
+                    yield sub_entry
+
+    def list_dir(self, dirname, prefix=''):
+        """ Generator of the ListEntry of dirname (and of its subdirectories
+        if recursing). If dirname is a file, its own entry is returned. """
+
+        if self.depth <= 0:
             return
-        gdal.VSIFCloseL(f)
 
-    if statBuf is not None and statBuf.IsDirectory() and not filename_displayed.endswith('/'):
-        filename_displayed = filename_displayed + "/"
+        dirname, prefix = self._container(dirname, prefix)
+        entries = self.list_entries(dirname, prefix, 0)
+        if entries is None:
+            statBuf = gdal.VSIStatL(dirname, gdal.VSI_STAT_EXISTS_FLAG | gdal.VSI_STAT_NATURE_FLAG | gdal.VSI_STAT_SIZE_FLAG)
+            if statBuf is None:
+                sys.stderr.write('Cannot open %s\n' % dirname)
+                return
+            (parent, filename) = os.path.split(dirname)
+            display_name = filename if parent == '' else parent + '/' + filename
+            if statBuf.IsDirectory():
+                display_name += '/'
+            yield ListEntry(dirname, display_name, statBuf.IsDirectory(),
+                            statBuf.size, statBuf.mtime, 0)
+            return
 
-    if longformat and statBuf is not None:
-        import time
-        bdt = time.gmtime(statBuf.mtime)
-        if statBuf.IsDirectory():
+        executor = None
+        if self.num_threads > 1 and self.recurse:
+            executor = ThreadPoolExecutor(max_workers=self.num_threads)
+            submit = executor.submit
+        else:
+            submit = _Deferred
+        try:
+            for entry in self._walk(_Deferred(lambda: entries), 0, submit):
+                yield entry
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+
+def format_entry(entry, longformat):
+    if longformat and entry.size is not None:
+        bdt = time.gmtime(entry.mtime or 0)
+        if entry.is_dir:
             permissions = "dr-xr-xr-x"
         else:
             permissions = "-r--r--r--"
-        line = "%s  1 unknown unknown %12d %04d-%02d-%02d %02d:%02d %s\n" % \
-            (permissions, statBuf.size, bdt.tm_year, bdt.tm_mon, bdt.tm_mday, bdt.tm_hour, bdt.tm_min, filename_displayed)
-    else:
-        line = filename_displayed + "\n"
+        return "%s  1 unknown unknown %12d %04d-%02d-%02d %02d:%02d %s\n" % \
+            (permissions, entry.size, bdt.tm_year, bdt.tm_mon, bdt.tm_mday, bdt.tm_hour, bdt.tm_min, entry.display_name)
+    return entry.display_name + "\n"
 
+
+def format_entry_json(entry):
+    return json.dumps({'name': entry.display_name,
+                       'type': 'directory' if entry.is_dir else 'file',
+                       'size': entry.size,
+                       'mtime': entry.mtime,
+                       'depth': entry.depth}) + "\n"
+
+
+def write_line(fout, line):
     try:
         fout.write(line.encode('utf-8'))
     except (TypeError, UnicodeEncodeError):
         fout.write(line)
 
 
-def readDir(fout, dirname, prefix, longformat, recurse, depth, recurseInZip, recurseInTGZ, first=False):
-
-    if depth <= 0:
-        return
-
-    if needsVSICurl(dirname):
-        dirname = '/vsicurl/' + dirname
-        prefix = '/vsicurl/' + prefix
-
-    if recurseInZip and iszip(dirname) and not dirname.startswith('/vsizip'):
-        dirname = '/vsizip/' + dirname
-        prefix = '/vsizip/' + prefix
-
-    if recurseInTGZ and istgz(dirname) and not dirname.startswith('/vsitar'):
-        dirname = '/vsitar/' + dirname
-        prefix = '/vsitar/' + prefix
-
-    lst = gdal.ReadDir(dirname)
-    if lst is None:
-        if first:
-            original_dirname = dirname
-            (dirname, filename) = os.path.split(dirname)
-            if gdal.ReadDir(dirname) is None:
-                sys.stderr.write('Cannot open %s\n' % original_dirname)
-                return
-            if dirname == '':
-                dirname = '.'
-                prefix = ''
-            else:
-                prefix = dirname + '/'
-            display_file(fout, dirname, prefix, filename, longformat, True)
-    else:
-        for filename in lst:
-            if filename == '.' or filename == '..':
-                continue
-
-            display_file(fout, dirname, prefix, filename, longformat)
-
-            if recurse:
-                new_prefix = prefix + filename
-                if not new_prefix.endswith('/'):
-                    new_prefix += '/'
-                readDir(fout, dirname + '/' + filename, new_prefix,
-                        longformat, recurse, depth - 1, recurseInZip, recurseInTGZ)
-
-
 def Usage():
-    print('Usage: gdal_ls [-l] [-r] [-depth d] [-Rzip] [-Rtgz] name_of_virtual_directory')
+    print('Usage: gdal_ls [-l] [-r] [-depth d] [-Rzip] [-Rtgz] [-json] [-j num_threads]')
+    print('               name_of_virtual_directory')
     print('')
     print('Display the list of files in a virtual directory, like /vsicurl or /vsizip')
     print('')
@@ -154,6 +240,8 @@ def Usage():
     print(' -depth d : recurse until depth d')
     print(' -Rzip : list content of .zip archives')
     print(' -Rtgz : list content of .tar.gz/.tgz archives (potentially slow on /vsicurl/)')
+    print(' -json : output one JSON object per file (name, type, size, mtime, depth)')
+    print(' -j num_threads : list sibling subdirectories concurrently with num_threads threads')
     return -1
 
 
@@ -165,6 +253,8 @@ def gdal_ls(argv, fout=sys.stdout):
     display_prefix = True
     dirname = None
     depth = 1024
+    jsonformat = False
+    num_threads = 1
 
     argv = gdal.GeneralCmdLineProcessor(argv)
     if argv is None:
@@ -186,6 +276,11 @@ def gdal_ls(argv, fout=sys.stdout):
             recurseInTGZ = True
         elif argv[i] == '-noprefix':
             display_prefix = False
+        elif argv[i] == '-json':
+            jsonformat = True
+        elif argv[i] == '-j' and i < len(argv) - 1:
+            num_threads = int(argv[i + 1])
+            i = i + 1
         elif argv[i] == '-depth' and i < len(argv) - 1:
             depth = int(argv[i + 1])
             i = i + 1
@@ -219,14 +314,21 @@ def gdal_ls(argv, fout=sys.stdout):
     prefix = ''
     if display_prefix:
         prefix = dirname + '/'
-    readDir(fout, dirname, prefix, longformat, recurse, depth, recurseInZip, recurseInTGZ, True)
+    lister = DirLister(recurse=recurse, depth=depth, recurseInZip=recurseInZip,
+                       recurseInTGZ=recurseInTGZ, longformat=longformat or jsonformat,
+                       num_threads=num_threads)
+    for entry in lister.list_dir(dirname, prefix):
+        if jsonformat:
+            write_line(fout, format_entry_json(entry))
+        else:
+            write_line(fout, format_entry(entry, longformat))
     return 0
 
 
 if __name__ == '__main__':
     version_num = int(gdal.VersionInfo('VERSION_NUM'))
-    if version_num < 1800:
-        sys.stderr.write('ERROR: Python bindings of GDAL 1.8.0 or later required\n')
+    if version_num < 3000000:
+        sys.stderr.write('ERROR: Python bindings of GDAL 3.0 or later required\n')
         sys.exit(1)
 
     sys.exit(gdal_ls(sys.argv))
@@ -29,19 +29,38 @@
 # DEALINGS IN THE SOFTWARE.
 # ***************************************************************************/
 
-# WARNING: only Python 2 compatible for now
-
+# This server requires Python 3.
+#
+# By default, requests are processed one at a time, in the order they are
+# received, and responses are written in the same order.
+#
+# With -multiplex, each request is prefixed by a 32-bit request identifier,
+# and each response is framed as: request identifier (int32), length of the
+# response (int64), and the response itself. Pixel read requests
+# (IRasterIO_Read, Band_IRasterIO_Read and Band_IReadBlock) are then served
+# concurrently by a pool of -threads worker threads, each of them using its own
+# dataset handle, and their responses may be written out of order. Other
+# requests wait for the pending pixel reads to complete before being processed.
+
+import io
 import os
 import struct
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from osgeo import gdal
 
 
 class GDALPythonServerRasterBand(object):
 
-    def __init__(self, gdal_band):
+    def __init__(self, gdal_band, path):
         self.gdal_band = gdal_band
+        # (band number, step, ...) where step is an overview index, or -1
+        # for the mask band. Used to find the same band in the dataset
+        # handles of the worker threads.
+        self.path = path
         self.XSize = gdal_band.XSize
         self.YSize = gdal_band.YSize
         self.Band = gdal_band.GetBand()
@@ -84,7 +103,7 @@ class GDALPythonServerRasterBand(object):
         if self.mask_band is None:
             gdal_mask_band = self.gdal_band.GetMaskBand()
             if gdal_mask_band is not None:
-                self.mask_band = GDALPythonServerRasterBand(gdal_mask_band)
+                self.mask_band = GDALPythonServerRasterBand(gdal_mask_band, self.path + (-1,))
         return self.mask_band
 
     def GetOverview(self, iovr):
@@ -93,7 +112,7 @@ class GDALPythonServerRasterBand(object):
         if self.ovr_bands[iovr] is None:
             gdal_ovr_band = self.gdal_band.GetOverview(iovr)
             if gdal_ovr_band is not None:
-                self.ovr_bands[iovr] = GDALPythonServerRasterBand(gdal_ovr_band)
+                self.ovr_bands[iovr] = GDALPythonServerRasterBand(gdal_ovr_band, self.path + (iovr,))
         return self.ovr_bands[iovr]
 
     def GetMetadata(self, domain):
@@ -141,7 +160,7 @@ class GDALPythonServerDataset(object):
         self.bands = []
         for i in range(self.RasterCount):
             gdal_band = self.gdal_ds.GetRasterBand(i + 1)
-            self.bands.append(GDALPythonServerRasterBand(gdal_band))
+            self.bands.append(GDALPythonServerRasterBand(gdal_band, (i + 1,)))
 
     def __del__(self):
         self.gdal_ds = None
@@ -152,6 +171,15 @@ class GDALPythonServerDataset(object):
     def GetRasterBand(self, i):
         return self.bands[i - 1]
 
+    def GetBandFromPath(self, path):
+        band = self.GetRasterBand(path[0])
+        for step in path[1:]:
+            if step < 0:
+                band = band.GetMaskBand()
+            else:
+                band = band.GetOverview(step)
+        return band
+
     def GetDescription(self):
         return self.gdal_ds.GetDescription()
 
@@ -353,146 +381,332 @@ CE_Failure = 3
 VERBOSE = 0
 
 
-def read_int():
-    if sys.version_info >= (3, 0, 0):
-        return struct.unpack('i', sys.stdin.read(4).encode('latin1'))[0]
-    return struct.unpack('i', sys.stdin.read(4))[0]
-
-
-def read_bigint():
-    if sys.version_info >= (3, 0, 0):
-        return struct.unpack('q', sys.stdin.read(8).encode('latin1'))[0]
-    return struct.unpack('q', sys.stdin.read(8))[0]
-
-
-def read_double():
-    if sys.version_info >= (3, 0, 0):
-        return struct.unpack('d', sys.stdin.read(8).encode('latin1'))[0]
-    return struct.unpack('d', sys.stdin.read(8))[0]
-
-
-def read_str():
-    length = read_int()
-    if length <= 0:
-        return None
-    line = sys.stdin.read(length)
-    if line and line[-1] == '\0':
-        line = line[:-1]
-    return str
-
-
-def read_strlist():
-    count = read_int()
-    strlist = []
-    for _ in range(count):
-        strlist.append(read_str())
-    return strlist
-
-
-def write_int(i):
-    if i is True:
-        v = struct.pack('i', 1)
-    elif i is False or i is None:
-        v = struct.pack('i', 0)
-    else:
-        v = struct.pack('i', i)
-    if sys.version_info >= (3, 0, 0):
-        sys.stdout.write(v.decode('latin1'))
-    else:
-        sys.stdout.write(v)
-
-
-def write_uint64(i):
-    v = struct.pack('Q', i)
-    if sys.version_info >= (3, 0, 0):
-        sys.stdout.write(v.decode('latin1'))
-    else:
-        sys.stdout.write(v)
-
-
-def write_double(d):
-    if sys.version_info >= (3, 0, 0):
-        sys.stdout.write(struct.pack('d', d).decode('latin1'))
-    else:
-        sys.stdout.write(struct.pack('d', d))
-
-
-def write_str(s):
-    if s is None:
-        write_int(0)
-    else:
-        write_int(len(s) + 1)
-        sys.stdout.write(s)
-        sys.stdout.write('\x00')
-
-
-def write_band(band, isrv_num):
-    if band is not None:
-        write_int(isrv_num)  # srv band count
-        write_int(band.Band)  # band number
-        write_int(0)  # access
-        write_int(band.XSize)  # X
-        write_int(band.YSize)  # Y
-        write_int(band.DataType)  # data type
-        write_int(band.BlockXSize)  # block x size
-        write_int(band.BlockYSize)  # block y size
-        write_str('')  # band description
-    else:
-        write_int(-1)
-
+_int_struct = struct.Struct('i')
+_bigint_struct = struct.Struct('q')
+_uint64_struct = struct.Struct('Q')
+_double_struct = struct.Struct('d')
+_frame_header_struct = struct.Struct('iq')
+
+MARKER = b'\xDE\xAD\xBE\xEF'
+
+
+class RequestReader(object):
+    """ Decodes the fields of requests from a binary stream, reading them
+        into preallocated buffers. """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.scalar_buf = bytearray(8)
+        self.scalar_view = memoryview(self.scalar_buf)
+        self.str_buf = bytearray(1024)
+        self.str_view = memoryview(self.str_buf)
+
+    def _readinto(self, view):
+        pos = 0
+        size = len(view)
+        while pos < size:
+            n = self.stream.readinto(view[pos:])
+            if not n:
+                raise EOFError('unexpected end of request stream')
+            pos += n
+
+    def read_byte(self):
+        self._readinto(self.scalar_view[0:1])
+        return self.scalar_buf[0]
+
+    def read_int(self):
+        self._readinto(self.scalar_view[0:4])
+        return _int_struct.unpack_from(self.scalar_buf)[0]
+
+    def read_bigint(self):
+        self._readinto(self.scalar_view)
+        return _bigint_struct.unpack_from(self.scalar_buf)[0]
+
+    def read_double(self):
+        self._readinto(self.scalar_view)
+        return _double_struct.unpack_from(self.scalar_buf)[0]
+
+    def read_str(self):
+        length = self.read_int()
+        if length <= 0:
+            return None
+        if length > len(self.str_buf):
+            self.str_buf = bytearray(length)
+            self.str_view = memoryview(self.str_buf)
+        self._readinto(self.str_view[0:length])
+        if self.str_buf[length - 1] == 0:
+            length -= 1
+        return str(self.str_view[0:length], 'utf-8')
+
+    def read_strlist(self):
+        count = self.read_int()
+        strlist = []
+        for _ in range(count):
+            strlist.append(self.read_str())
+        return strlist
+
+
+class Response(object):
+    """ Response to a request. It is accumulated in memory so that responses
+        computed concurrently are written as a whole. Pixel payloads are
+        kept as separate chunks, so as not to be copied. """
+
+    def __init__(self):
+        self.chunks = []
+        self.buf = bytearray()
+
+    def write_bytes(self, b):
+        self.buf += b
+
+    def write_payload(self, data):
+        if self.buf:
+            self.chunks.append(self.buf)
+            self.buf = bytearray()
+        self.chunks.append(data)
+
+    def write_int(self, i):
+        if i is True:
+            i = 1
+        elif i is False or i is None:
+            i = 0
+        self.buf += _int_struct.pack(i)
+
+    def write_uint64(self, i):
+        self.buf += _uint64_struct.pack(i)
+
+    def write_double(self, d):
+        self.buf += _double_struct.pack(d)
+
+    def write_str(self, s):
+        if s is None:
+            self.write_int(0)
+        else:
+            b = s.encode('utf-8')
+            self.write_int(len(b) + 1)
+            self.buf += b
+            self.buf += b'\x00'
+
+    def write_band(self, band, isrv_num):
+        if band is not None:
+            self.write_int(isrv_num)  # srv band count
+            self.write_int(band.Band)  # band number
+            self.write_int(0)  # access
+            self.write_int(band.XSize)  # X
+            self.write_int(band.YSize)  # Y
+            self.write_int(band.DataType)  # data type
+            self.write_int(band.BlockXSize)  # block x size
+            self.write_int(band.BlockYSize)  # block y size
+            self.write_str('')  # band description
+        else:
+            self.write_int(-1)
 
-def write_ct(ct):
-    if ct is None:
-        write_int(-1)
+    def write_ct(self, ct):
+        if ct is None:
+            self.write_int(-1)
+        else:
+            self.write_int(ct.GetPaletteInterpretation())
+            nCount = ct.GetCount()
+            self.write_int(nCount)
+            for i in range(nCount):
+                entry = ct.GetColorEntry(i)
+                self.write_int(entry[0])
+                self.write_int(entry[1])
+                self.write_int(entry[2])
+                self.write_int(entry[3])
+
+    def write_marker(self):
+        self.buf += MARKER
+
+    def write_zero_error(self):
+        self.write_int(0)
+
+    def get_chunks(self):
+        if self.buf:
+            self.chunks.append(self.buf)
+            self.buf = bytearray()
+        return self.chunks
+
+
+def _write_optional_double(resp, val, default=0):
+    if val is None:
+        resp.write_int(0)
+        resp.write_double(default)
     else:
-        write_int(ct.GetPaletteInterpretation())
-        nCount = ct.GetCount()
-        write_int(nCount)
-        for i in range(nCount):
-            entry = ct.GetColorEntry(i)
-            write_int(entry[0])
-            write_int(entry[1])
-            write_int(entry[2])
-            write_int(entry[3])
-
-
-def write_marker():
-    sys.stdout.write('\xDE\xAD\xBE\xEF')
-
-
-def write_zero_error():
-    write_int(0)
-
-
-def main_loop():
-
-    server_ds = None
-    server_bands = []
-    gdal.SetConfigOption('GDAL_API_PROXY', 'NO')
-
-    while 1:
-        sys.stdout.flush()
-
-        instr = read_int()
-        if VERBOSE:
-            sys.stderr.write('instr=%d\n' % instr)
+        resp.write_int(1)
+        resp.write_double(val)
+
+
+def _write_metadata(resp, md):
+    resp.write_int(len(md))
+    for key in md:
+        resp.write_str('%s=%s' % (key, md[key]))
+
+
+class GDALPythonServer(object):
+
+    def __init__(self, instream, outstream, multiplex=False, num_threads=1):
+        self.reader = RequestReader(instream)
+        self.outstream = outstream
+        self.out_lock = threading.Lock()
+        self.multiplex = multiplex
+        self.executor = None
+        if multiplex and num_threads > 1:
+            self.executor = ThreadPoolExecutor(max_workers=num_threads)
+        self.pending = []
+        self.server_ds = None
+        self.server_bands = []
+        self.open_args = None
+        self.worker_datasets = {}
+        self.worker_lock = threading.Lock()
+
+    def send(self, request_id, resp):
+        chunks = resp.get_chunks()
+        with self.out_lock:
+            if self.multiplex:
+                size = sum(len(chunk) for chunk in chunks)
+                self.outstream.write(_frame_header_struct.pack(request_id, size))
+            for chunk in chunks:
+                self.outstream.write(chunk)
+            self.outstream.flush()
+
+    def wait_pending(self):
+        pending = self.pending
+        self.pending = []
+        for future in pending:
+            # Propagates exceptions raised by the jobs
+            future.result()
+
+    def reset(self):
+        self.wait_pending()
+        self.server_ds = None
+        self.server_bands = []
+        self.open_args = None
+        self.worker_datasets = {}
+
+    def worker_dataset(self):
+        """ Returns the dataset handle of the current worker thread. """
+        key = threading.current_thread().ident
+        with self.worker_lock:
+            ds = self.worker_datasets.get(key)
+        if ds is None:
+            ds = GDALPythonServerDataset(*self.open_args)
+            with self.worker_lock:
+                self.worker_datasets[key] = ds
+        return ds
+
+    def read_job(self, request_id, read_func, failure_size):
+        try:
+            # Opening the dataset of the worker may fail (file removed,
+            # too many open files...): this is a failure of the request
+            if self.executor is not None:
+                ds = self.worker_dataset()
+            else:
+                ds = self.server_ds
+            val = read_func(ds)
+        except Exception:
+            val = None
+        resp = Response()
+        resp.write_marker()
+        if val is None:
+            resp.write_int(CE_Failure)
+            resp.write_int(failure_size)
+            if failure_size:
+                resp.write_payload(bytes(failure_size))
+        else:
+            resp.write_int(CE_None)
+            resp.write_int(len(val))
+            resp.write_payload(val)
+        resp.write_zero_error()
+        self.send(request_id, resp)
+
+    def submit_read(self, request_id, read_func, failure_size=0):
+        if self.executor is not None:
+            self.pending.append(self.executor.submit(
+                self.read_job, request_id, read_func, failure_size))
+        else:
+            self.read_job(request_id, read_func, failure_size)
+
+    def run(self):
+        """ Processes requests until INSTR_EXIT or INSTR_EXIT_FAIL, and
+            returns the exit code. """
+        try:
+            while True:
+                try:
+                    request_id = self.reader.read_int() if self.multiplex else 0
+                    instr = self.reader.read_int()
+                except EOFError:
+                    return 1
+                if VERBOSE:
+                    sys.stderr.write('request_id=%d instr=%d\n' % (request_id, instr))
+                ret = self.process(request_id, instr)
+                if ret is not None:
+                    return ret
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True)
+            self.reset()
+
+    def process(self, request_id, instr):
+        reader = self.reader
 
         band = None
         if instr >= INSTR_Band_First and instr <= INSTR_Band_End:
-            srv_band = read_int()
-            band = server_bands[srv_band]
+            srv_band = reader.read_int()
+            band = self.server_bands[srv_band]
+
+        # Pixel reads, possibly concurrent
+        if instr == INSTR_IRasterIO_Read:
+            nXOff = reader.read_int()
+            nYOff = reader.read_int()
+            nXSize = reader.read_int()
+            nYSize = reader.read_int()
+            nBufXSize = reader.read_int()
+            nBufYSize = reader.read_int()
+            nBufType = reader.read_int()
+            nBandCount = reader.read_int()
+            reader.read_int()  # size =
+            panBandMap = [reader.read_int() for i in range(nBandCount)]
+            nPixelSpace = reader.read_bigint()
+            nLineSpace = reader.read_bigint()
+            nBandSpace = reader.read_bigint()
+            self.submit_read(request_id, lambda ds: ds.IRasterIO_Read(
+                nXOff, nYOff, nXSize, nYSize, nBufXSize, nBufYSize, nBufType,
+                panBandMap, nPixelSpace, nLineSpace, nBandSpace))
+            return None
+        if instr == INSTR_Band_IRasterIO_Read:
+            nXOff = reader.read_int()
+            nYOff = reader.read_int()
+            nXSize = reader.read_int()
+            nYSize = reader.read_int()
+            nBufXSize = reader.read_int()
+            nBufYSize = reader.read_int()
+            nBufType = reader.read_int()
+            path = band.path
+            self.submit_read(request_id, lambda ds: ds.GetBandFromPath(path).IRasterIO_Read(
+                nXOff, nYOff, nXSize, nYSize, nBufXSize, nBufYSize, nBufType))
+            return None
+        if instr == INSTR_Band_IReadBlock:
+            nXBlockOff = reader.read_int()
+            nYBlockOff = reader.read_int()
+            path = band.path
+            length = band.BlockXSize * band.BlockYSize * (gdal.GetDataTypeSize(band.DataType) // 8)
+            self.submit_read(request_id, lambda ds: ds.GetBandFromPath(path).IReadBlock(
+                nXBlockOff, nYBlockOff), length)
+            return None
+
+        # Other requests are processed once the pending reads are completed
+        self.wait_pending()
+        server_ds = self.server_ds
+        resp = Response()
 
         if instr == INSTR_GetGDALVersion:
-            if sys.version_info >= (3, 0, 0):
-                lsb = struct.unpack('B', sys.stdin.read(1).encode('latin1'))[0]
-            else:
-                lsb = struct.unpack('B', sys.stdin.read(1))[0]
-            ver = read_str()
-            vmajor = read_int()
-            vminor = read_int()
-            protovmajor = read_int()
-            protovminor = read_int()
-            extra_bytes = read_int()
+            lsb = reader.read_byte()
+            ver = reader.read_str()
+            vmajor = reader.read_int()
+            vminor = reader.read_int()
+            protovmajor = reader.read_int()
+            protovminor = reader.read_int()
+            extra_bytes = reader.read_int()
             if VERBOSE:
                 sys.stderr.write('lsb=%d\n' % lsb)
                 sys.stderr.write('ver=%s\n' % ver)
@@ -502,45 +716,37 @@ def main_loop():
                 sys.stderr.write('protovminor=%d\n' % protovminor)
                 sys.stderr.write('extra_bytes=%d\n' % extra_bytes)
 
-            write_str('2.1dev')
-            write_int(2)  # vmajor
-            write_int(1)  # vminor
-            write_int(3)  # protovmajor
-            write_int(0)  # protovminor
-            write_int(0)  # extra bytes
-            continue
-        elif instr == INSTR_EXIT:
-            server_ds = None
-            server_bands = []
-            write_marker()
-            write_int(1)
-            sys.exit(0)
-        elif instr == INSTR_EXIT_FAIL:
-            server_ds = None
-            server_bands = []
-            write_marker()
-            write_int(1)
-            sys.exit(1)
+            resp.write_str('2.1dev')
+            resp.write_int(2)  # vmajor
+            resp.write_int(1)  # vminor
+            resp.write_int(3)  # protovmajor
+            resp.write_int(0)  # protovminor
+            resp.write_int(0)  # extra bytes
+            self.send(request_id, resp)
+            return None
+        elif instr == INSTR_EXIT or instr == INSTR_EXIT_FAIL:
+            self.reset()
+            resp.write_marker()
+            resp.write_int(1)
+            self.send(request_id, resp)
+            return 0 if instr == INSTR_EXIT else 1
         elif instr == INSTR_SetConfigOption:
-            key = read_str()
-            val = read_str()
+            key = reader.read_str()
+            val = reader.read_str()
             gdal.SetConfigOption(key, val)
             if VERBOSE:
                 sys.stderr.write('key=%s\n' % key)
                 sys.stderr.write('val=%s\n' % val)
-            continue
+            return None
         elif instr == INSTR_Reset:
-            # if server_ds is not None:
-            #    sys.stderr.write('Reset(%s)\n' % server_ds.GetDescription())
-            server_ds = None
-            server_bands = []
-            write_marker()
-            write_int(1)
+            self.reset()
+            resp.write_marker()
+            resp.write_int(1)
         elif instr == INSTR_Open:
-            access = read_int()
-            filename = read_str()
-            cwd = read_str()
-            open_options = read_strlist()
+            access = reader.read_int()
+            filename = reader.read_str()
+            cwd = reader.read_str()
+            open_options = reader.read_strlist()
             if cwd is not None:
                 os.chdir(cwd)
             if VERBOSE:
@@ -548,320 +754,351 @@ def main_loop():
                 sys.stderr.write('filename=%s\n' % filename)
                 sys.stderr.write('cwd=%s\n' % cwd)
                 sys.stderr.write('open_options=%s\n' % str(open_options))
-            # sys.stderr.write('Open(%s)\n' % filename)
+            self.reset()
             try:
                 server_ds = GDALPythonServerDataset(filename, access, open_options)
-            except:
+                self.open_args = (filename, access, open_options)
+            except Exception:
                 server_ds = None
+            self.server_ds = server_ds
 
-            write_marker()
+            resp.write_marker()
             if server_ds is None:
-                write_int(0)  # Failure
+                resp.write_int(0)  # Failure
             else:
-                write_int(1)  # Success
-                write_int(16)  # caps length
-                caps = [0 for i in range(16)]
+                resp.write_int(1)  # Success
+                resp.write_int(16)  # caps length
+                caps = bytearray(16)
                 for cap in caps_list:
-                    caps[int(cap / 8)] = caps[int(cap / 8)] | (1 << (cap % 8))
-                for i in range(16):
-                    sys.stdout.write(struct.pack('B', caps[i]))  # caps
-                write_str(server_ds.GetDescription())
+                    caps[cap // 8] |= (1 << (cap % 8))
+                resp.write_bytes(caps)
+                resp.write_str(server_ds.GetDescription())
                 drv = server_ds.GetDriver()
                 if drv is not None:
-                    write_str(drv.GetDescription())
-                    write_int(0)  # End of driver metadata
+                    resp.write_str(drv.GetDescription())
+                    resp.write_int(0)  # End of driver metadata
                 else:
-                    write_str(None)
-                write_int(server_ds.RasterXSize)  # X
-                write_int(server_ds.RasterYSize)  # Y
-                write_int(server_ds.RasterCount)  # Band count
-                write_int(1)  # All bands are identical
+                    resp.write_str(None)
+                resp.write_int(server_ds.RasterXSize)  # X
+                resp.write_int(server_ds.RasterYSize)  # Y
+                resp.write_int(server_ds.RasterCount)  # Band count
+                resp.write_int(1)  # All bands are identical
 
                 if server_ds.RasterCount > 0:
-                    write_band(server_ds.GetRasterBand(1), len(server_bands))
+                    resp.write_band(server_ds.GetRasterBand(1), len(self.server_bands))
                     for i in range(server_ds.RasterCount):
-                        server_bands.append(server_ds.GetRasterBand(i + 1))
+                        self.server_bands.append(server_ds.GetRasterBand(i + 1))
         elif instr == INSTR_Identify:
-            filename = read_str()
-            cwd = read_str()
+            filename = reader.read_str()
+            reader.read_str()  # cwd =
             dr = gdal.IdentifyDriver(filename)
-            write_marker()
-            if dr is None:
-                write_int(0)
-            else:
-                write_int(1)
+            resp.write_marker()
+            resp.write_int(dr is not None)
         elif instr == INSTR_Create:
-            filename = read_str()
-            cwd = read_str()
-            read_int()  # xsize =
-            read_int()  # ysize =
-            read_int()  # bands =
-            read_int()  # datatype =
-            read_strlist()  # options =
-            write_marker()
+            reader.read_str()  # filename =
+            reader.read_str()  # cwd =
+            reader.read_int()  # xsize =
+            reader.read_int()  # ysize =
+            reader.read_int()  # bands =
+            reader.read_int()  # datatype =
+            reader.read_strlist()  # options =
+            resp.write_marker()
             # FIXME
-            write_int(0)
+            resp.write_int(0)
         elif instr == INSTR_CreateCopy:
-            filename = read_str()
-            read_str()  # src_description =
-            cwd = read_str()
-            read_int()  # strict =
-            read_strlist()  # options =
+            reader.read_str()  # filename =
+            reader.read_str()  # src_description =
+            reader.read_str()  # cwd =
+            reader.read_int()  # strict =
+            reader.read_strlist()  # options =
             # FIXME
-            write_int(0)
+            resp.write_int(0)
         elif instr == INSTR_QuietDelete:
-            filename = read_str()
-            cwd = read_str()
-            write_marker()
+            reader.read_str()  # filename =
+            reader.read_str()  # cwd =
+            resp.write_marker()
             # FIXME
         elif instr == INSTR_GetGeoTransform:
             gt = server_ds.GetGeoTransform()
-            write_marker()
+            resp.write_marker()
             if gt is not None:
-                write_int(CE_None)
-                write_int(6 * 8)
+                resp.write_int(CE_None)
+                resp.write_int(6 * 8)
                 for i in range(6):
-                    write_double(gt[i])
+                    resp.write_double(gt[i])
             else:
-                write_int(CE_Failure)
+                resp.write_int(CE_Failure)
         elif instr == INSTR_GetProjectionRef:
-            write_marker()
-            write_str(server_ds.GetProjectionRef())
+            resp.write_marker()
+            resp.write_str(server_ds.GetProjectionRef())
         elif instr == INSTR_GetGCPCount:
-            write_marker()
-            write_int(server_ds.GetGCPCount())
+            resp.write_marker()
+            resp.write_int(server_ds.GetGCPCount())
         elif instr == INSTR_GetFileList:
-            write_marker()
+            resp.write_marker()
             fl = server_ds.GetFileList()
-            write_int(len(fl))
+            resp.write_int(len(fl))
             for f in fl:
-                write_str(f)
+                resp.write_str(f)
         elif instr == INSTR_GetMetadata:
-            domain = read_str()
+            domain = reader.read_str()
             md = server_ds.GetMetadata(domain)
-            write_marker()
-            write_int(len(md))
-            for key in md:
-                write_str('%s=%s' % (key, md[key]))
+            resp.write_marker()
+            _write_metadata(resp, md)
         elif instr == INSTR_GetMetadataItem:
-            key = read_str()
-            domain = read_str()
+            key = reader.read_str()
+            domain = reader.read_str()
             val = server_ds.GetMetadataItem(key, domain)
-            write_marker()
-            write_str(val)
-        elif instr == INSTR_IRasterIO_Read:
-            nXOff = read_int()
-            nYOff = read_int()
-            nXSize = read_int()
-            nYSize = read_int()
-            nBufXSize = read_int()
-            nBufYSize = read_int()
-            nBufType = read_int()
-            nBandCount = read_int()
-            panBandMap = []
-            read_int()  # size =
-            for i in range(nBandCount):
-                panBandMap.append(read_int())
-            nPixelSpace = read_bigint()
-            nLineSpace = read_bigint()
-            nBandSpace = read_bigint()
-            val = server_ds.IRasterIO_Read(nXOff, nYOff, nXSize, nYSize, nBufXSize, nBufYSize, nBufType, panBandMap, nPixelSpace, nLineSpace, nBandSpace)
-            write_marker()
-            if val is None:
-                write_int(CE_Failure)
-                write_int(0)
-            else:
-                write_int(CE_None)
-                write_int(len(val))
-                sys.stdout.write(val)
+            resp.write_marker()
+            resp.write_str(val)
         elif instr == INSTR_FlushCache:
             if server_ds is not None:
                 server_ds.FlushCache()
-            write_marker()
+            resp.write_marker()
         elif instr == INSTR_Band_FlushCache:
             val = band.FlushCache()
-            write_marker()
-            write_int(val)
+            resp.write_marker()
+            resp.write_int(val)
         elif instr == INSTR_Band_GetCategoryNames:
-            write_marker()
+            resp.write_marker()
             # FIXME
-            write_int(-1)
+            resp.write_int(-1)
         elif instr == INSTR_Band_GetMetadata:
-            domain = read_str()
+            domain = reader.read_str()
             md = band.GetMetadata(domain)
-            write_marker()
-            write_int(len(md))
-            for key in md:
-                write_str('%s=%s' % (key, md[key]))
+            resp.write_marker()
+            _write_metadata(resp, md)
         elif instr == INSTR_Band_GetMetadataItem:
-            key = read_str()
-            domain = read_str()
+            key = reader.read_str()
+            domain = reader.read_str()
             val = band.GetMetadataItem(key, domain)
-            write_marker()
-            write_str(val)
+            resp.write_marker()
+            resp.write_str(val)
         elif instr == INSTR_Band_GetColorInterpretation:
             val = band.GetColorInterpretation()
-            write_marker()
-            write_int(val)
+            resp.write_marker()
+            resp.write_int(val)
         elif instr == INSTR_Band_GetNoDataValue:
             val = band.GetNoDataValue()
-            write_marker()
-            if val is None:
-                write_int(0)
-                write_double(0)
-            else:
-                write_int(1)
-                write_double(val)
+            resp.write_marker()
+            _write_optional_double(resp, val)
         elif instr == INSTR_Band_GetMinimum:
             val = band.GetMinimum()
-            write_marker()
-            if val is None:
-                write_int(0)
-                write_double(0)
-            else:
-                write_int(1)
-                write_double(val)
+            resp.write_marker()
+            _write_optional_double(resp, val)
         elif instr == INSTR_Band_GetMaximum:
             val = band.GetMaximum()
-            write_marker()
-            if val is None:
-                write_int(0)
-                write_double(0)
-            else:
-                write_int(1)
-                write_double(val)
+            resp.write_marker()
+            _write_optional_double(resp, val)
         elif instr == INSTR_Band_GetOffset:
             val = band.GetOffset()
-            write_marker()
-            if val is None:
-                write_int(0)
-                write_double(0)
-            else:
-                write_int(1)
-                write_double(val)
+            resp.write_marker()
+            _write_optional_double(resp, val)
         elif instr == INSTR_Band_GetScale:
             val = band.GetScale()
-            write_marker()
-            if val is None:
-                write_int(0)
-                write_double(1)  # default value is 1
-            else:
-                write_int(1)
-                write_double(val)
-        elif instr == INSTR_Band_IReadBlock:
-            nXBlockOff = read_int()
-            nYBlockOff = read_int()
-            val = band.IReadBlock(nXBlockOff, nYBlockOff)
-            write_marker()
-            if val is None:
-                write_int(CE_Failure)
-                length = band.BlockXSize * band.BlockYSize * (gdal.GetDataTypeSize(band.DataType) / 8)
-                write_int(length)
-                sys.stdout.write(''.join('\0' for i in range(length)))
-            else:
-                write_int(CE_None)
-                write_int(len(val))
-                sys.stdout.write(val)
-        elif instr == INSTR_Band_IRasterIO_Read:
-            nXOff = read_int()
-            nYOff = read_int()
-            nXSize = read_int()
-            nYSize = read_int()
-            nBufXSize = read_int()
-            nBufYSize = read_int()
-            nBufType = read_int()
-            val = band.IRasterIO_Read(nXOff, nYOff, nXSize, nYSize, nBufXSize, nBufYSize, nBufType)
-            write_marker()
-            if val is None:
-                write_int(CE_Failure)
-                write_int(0)
-            else:
-                write_int(CE_None)
-                write_int(len(val))
-                sys.stdout.write(val)
+            resp.write_marker()
+            _write_optional_double(resp, val, default=1)  # default value is 1
         elif instr == INSTR_Band_GetStatistics:
-            approx_ok = read_int()
-            force = read_int()
+            approx_ok = reader.read_int()
+            force = reader.read_int()
             val = band.GetStatistics(approx_ok, force)
-            write_marker()
+            resp.write_marker()
             if val is None or val[3] < 0:
-                write_int(CE_Failure)
+                resp.write_int(CE_Failure)
             else:
-                write_int(CE_None)
-                write_double(val[0])
-                write_double(val[1])
-                write_double(val[2])
-                write_double(val[3])
+                resp.write_int(CE_None)
+                for v in val[0:4]:
+                    resp.write_double(v)
         elif instr == INSTR_Band_ComputeRasterMinMax:
-            approx_ok = read_int()
+            approx_ok = reader.read_int()
             val = band.ComputeRasterMinMax(approx_ok)
-            write_marker()
+            resp.write_marker()
             if val is None:
-                write_int(CE_Failure)
+                resp.write_int(CE_Failure)
             else:
-                write_int(CE_None)
-                write_double(val[0])
-                write_double(val[1])
+                resp.write_int(CE_None)
+                resp.write_double(val[0])
+                resp.write_double(val[1])
         elif instr == INSTR_Band_GetHistogram:
-            dfMin = read_double()
-            dfMax = read_double()
-            nBuckets = read_int()
-            bIncludeOutOfRange = read_int()
-            bApproxOK = read_int()
+            dfMin = reader.read_double()
+            dfMax = reader.read_double()
+            nBuckets = reader.read_int()
+            bIncludeOutOfRange = reader.read_int()
+            bApproxOK = reader.read_int()
             val = band.GetHistogram(dfMin, dfMax, nBuckets, bIncludeOutOfRange, bApproxOK)
-            write_marker()
+            resp.write_marker()
             if val is None:
-                write_int(CE_Failure)
+                resp.write_int(CE_Failure)
             else:
-                write_int(CE_None)
-                write_int(len(val) * 8)
+                resp.write_int(CE_None)
+                resp.write_int(len(val) * 8)
                 for v in val:
-                    write_uint64(v)
-        # elif instr == INSTR_Band_GetDefaultHistogram:
-        #    bForce = read_int()
-        #    write_marker()
-        #    write_int(CE_Failure)
+                    resp.write_uint64(v)
         elif instr == INSTR_Band_HasArbitraryOverviews:
             val = band.HasArbitraryOverviews()
-            write_marker()
-            write_int(val)
+            resp.write_marker()
+            resp.write_int(val)
         elif instr == INSTR_Band_GetOverviewCount:
             val = band.GetOverviewCount()
-            write_marker()
-            write_int(val)
+            resp.write_marker()
+            resp.write_int(val)
         elif instr == INSTR_Band_GetOverview:
-            iovr = read_int()
+            iovr = reader.read_int()
             ovr_band = band.GetOverview(iovr)
-            write_marker()
-            write_band(ovr_band, len(server_bands))
+            resp.write_marker()
+            resp.write_band(ovr_band, len(self.server_bands))
             if ovr_band is not None:
-                server_bands.append(ovr_band)
+                self.server_bands.append(ovr_band)
         elif instr == INSTR_Band_GetMaskBand:
             msk_band = band.GetMaskBand()
-            write_marker()
-            write_band(msk_band, len(server_bands))
+            resp.write_marker()
+            resp.write_band(msk_band, len(self.server_bands))
             if msk_band is not None:
-                server_bands.append(msk_band)
+                self.server_bands.append(msk_band)
         elif instr == INSTR_Band_GetMaskFlags:
             val = band.GetMaskFlags()
-            write_marker()
-            write_int(val)
+            resp.write_marker()
+            resp.write_int(val)
         elif instr == INSTR_Band_GetColorTable:
             ct = band.GetColorTable()
-            write_marker()
-            write_ct(ct)
+            resp.write_marker()
+            resp.write_ct(ct)
         elif instr == INSTR_Band_GetUnitType:
             val = band.GetUnitType()
-            write_marker()
-            write_str(val)
-        # elif instr == INSTR_Band_GetDefaultRAT:
-        #    write_marker()
-        #    # FIXME
-        #    write_int(0)
+            resp.write_marker()
+            resp.write_str(val)
+        else:
+            return 1
+
+        resp.write_zero_error()
+        self.send(request_id, resp)
+        return None
+
+
+###############################################################################
+# Benchmark
+
+
+class _NullOutput(object):
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, b):
+        self.size += len(b)
+
+    def flush(self):
+        pass
+
+
+def _encode_requests(filename, windows, multiplex):
+    """ Encodes the requests of a client opening filename and reading the
+        windows of its first band. """
+    out = bytearray()
+
+    def add_int(i):
+        out.extend(_int_struct.pack(i))
+
+    def add_str(s):
+        b = s.encode('utf-8')
+        add_int(len(b) + 1)
+        out.extend(b)
+        out.extend(b'\x00')
+
+    request_id = 0
+    if multiplex:
+        add_int(request_id)
+    add_int(INSTR_Open)
+    add_int(gdal.GA_ReadOnly)
+    add_str(filename)
+    add_str(os.getcwd())
+    add_int(0)  # no open options
+    for (xoff, yoff, xsize, ysize) in windows:
+        request_id += 1
+        if multiplex:
+            add_int(request_id)
+        add_int(INSTR_Band_IRasterIO_Read)
+        add_int(0)  # server band
+        for v in (xoff, yoff, xsize, ysize, xsize, ysize, gdal.GDT_Byte):
+            add_int(v)
+    if multiplex:
+        add_int(request_id + 1)
+    add_int(INSTR_EXIT)
+    return out
+
+
+def benchmark(filename, num_threads, window_size, passes):
+    ds = gdal.Open(filename)
+    if ds is None:
+        return 1
+    windows = []
+    for yoff in range(0, ds.RasterYSize, window_size):
+        for xoff in range(0, ds.RasterXSize, window_size):
+            windows.append((xoff, yoff,
+                            min(window_size, ds.RasterXSize - xoff),
+                            min(window_size, ds.RasterYSize - yoff)))
+    ds = None
+    windows = windows * passes
+
+    configs = [('serial', False, 1)]
+    if num_threads > 1:
+        configs.append(('multiplex, %d threads' % num_threads, True, num_threads))
+    for (name, multiplex, threads) in configs:
+        requests = _encode_requests(filename, windows, multiplex)
+        output = _NullOutput()
+        start = time.time()
+        GDALPythonServer(io.BytesIO(requests), output,
+                         multiplex=multiplex, num_threads=threads).run()
+        elapsed = time.time() - start
+        print('%s: %d requests in %.3f s: %.1f requests/s, %.1f MB/s' % (
+            name, len(windows), elapsed, len(windows) / elapsed,
+            output.size / elapsed / 1e6))
+    return 0
+
+
+def Usage():
+    print('Usage: gdalpythonserver.py [-multiplex] [-threads N]')
+    print('       gdalpythonserver.py -benchmark filename [-threads N] [-window_size N] [-passes N]')
+    return 1
+
+
+def main(argv):
+    multiplex = False
+    num_threads = None
+    benchmark_filename = None
+    window_size = 256
+    passes = 1
+
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '-multiplex':
+            multiplex = True
+        elif arg == '-threads' and i + 1 < len(argv):
+            num_threads = int(argv[i + 1])
+            i += 1
+        elif arg == '-benchmark' and i + 1 < len(argv):
+            benchmark_filename = argv[i + 1]
+            i += 1
+        elif arg == '-window_size' and i + 1 < len(argv):
+            window_size = int(argv[i + 1])
+            i += 1
+        elif arg == '-passes' and i + 1 < len(argv):
+            passes = int(argv[i + 1])
+            i += 1
         else:
-            break
+            return Usage()
+        i += 1
+
+    if num_threads is None:
+        num_threads = os.cpu_count() or 1
+
+    if benchmark_filename is not None:
+        return benchmark(benchmark_filename, num_threads, window_size, passes)
 
-        write_zero_error()
+    return GDALPythonServer(sys.stdin.buffer, sys.stdout.buffer,
+                            multiplex=multiplex, num_threads=num_threads).run()
 
 
-main_loop()
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
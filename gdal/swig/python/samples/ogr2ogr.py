@@ -37,7 +37,9 @@
 
 import sys
 import os
+import queue
 import stat
+import threading
 
 from osgeo import gdal
 from osgeo import ogr
@@ -115,6 +117,9 @@ class TargetLayerInfo(object):
         # self.papszTransformOptions = None
         self.panMap = None
         self.iSrcZField = None
+        # Used to create a transformation per thread with -pipeline
+        self.poSourceSRS = None
+        self.poTargetSRS = None
 
 
 class AssociatedLayers(object):
@@ -131,6 +136,7 @@ bSkipFailures = False
 nGroupTransactions = 200
 bPreserveFID = False
 nFIDToFetch = ogr.NullFID
+nPipelineThreads = 0
 
 
 class Enum(set):
@@ -149,6 +155,7 @@ def main(args=None, progress_func=TermProgress, progress_data=None):
     global nGroupTransactions
     global bPreserveFID
     global nFIDToFetch
+    global nPipelineThreads
 
     pszFormat = "ESRI Shapefile"
     pszDataSource = None
@@ -312,6 +319,10 @@ def main(args=None, progress_func=TermProgress, progress_data=None):
             iArg = iArg + 1
             nGroupTransactions = int(args[iArg])
 
+        elif EQUAL(args[iArg], "-pipeline") and iArg < nArgc - 1:
+            iArg = iArg + 1
+            nPipelineThreads = int(args[iArg])
+
         elif EQUAL(args[iArg], "-s_srs") and iArg < nArgc - 1:
             iArg = iArg + 1
             pszSourceSRSDef = args[iArg]
@@ -1040,7 +1051,7 @@ def main(args=None, progress_func=TermProgress, progress_data=None):
 
 def Usage():
 
-    print("Usage: ogr2ogr [--help-general] [-skipfailures] [-append] [-update] [-gt n]\n" +
+    print("Usage: ogr2ogr [--help-general] [-skipfailures] [-append] [-update] [-gt n] [-pipeline n]\n" +
           "               [-select field_list] [-where restricted_where] \n" +
           "               [-progress] [-sql <sql statement>] \n" +
           "               [-spat xmin ymin xmax ymax] [-preserve_fid] [-fid FID]\n" +
@@ -1070,6 +1081,9 @@ def Usage():
           " -sql statement: Execute given SQL statement and save result.\n" +
           " -skipfailures: skip features or layers that fail to convert\n" +
           " -gt n: group n features per transaction (default 200)\n" +
+          " -pipeline n: read, translate and write features concurrently, with n\n" +
+          "              translation threads. Features are written in their input\n" +
+          "              order only with -preserve_fid\n" +
           " -spat xmin ymin xmax ymax: spatial query extents\n" +
           " -simplify tolerance: distance tolerance for simplification.\n" + \
           # //" -segmentize max_dist: maximum distance between 2 nodes.\n" + \
@@ -1493,12 +1507,145 @@ def SetupTargetLayer(poSrcDS, poSrcLayer, poDstDS, papszLCO, pszNewLayerName,
     psInfo = TargetLayerInfo()
     psInfo.poDstLayer = poDstLayer
     psInfo.poCT = poCT
+    if poCT is not None:
+        psInfo.poSourceSRS = poSourceSRS
+        psInfo.poTargetSRS = poOutputSRS
     # psInfo.papszTransformOptions = papszTransformOptions
     psInfo.panMap = panMap
     psInfo.iSrcZField = iSrcZField
 
     return psInfo
 
+class TranslateError(Exception):
+    pass
+
+
+class TranslateContext(object):
+    """Settings of the translation of the features of a layer, that do not
+    change from one feature to another."""
+
+    def __init__(self, poDstDefn, panMap, iSrcZField, poOutputSRS,
+                 eGType, bPromoteToMulti, nCoordDim, eGeomOp, dfGeomOpParam,
+                 bExplodeCollections):
+        self.poDstDefn = poDstDefn
+        self.panMap = panMap
+        self.iSrcZField = iSrcZField
+        self.poOutputSRS = poOutputSRS
+        self.bPromoteToMulti = bPromoteToMulti
+        self.nCoordDim = nCoordDim
+        self.eGeomOp = eGeomOp
+        self.dfGeomOpParam = dfGeomOpParam
+        self.bExplodeCollections = bExplodeCollections
+        self.bForceToPolygon = wkbFlatten(eGType) == ogr.wkbPolygon
+        self.bForceToMultiPolygon = wkbFlatten(eGType) == ogr.wkbMultiPolygon
+        self.bForceToMultiLineString = wkbFlatten(eGType) == ogr.wkbMultiLineString
+
+# **********************************************************************
+#                           TranslateFeature()
+# **********************************************************************
+
+
+def TranslateFeature(ctx, poFeature, poCT, poClipSrc, poClipDst):
+    """Return the list of the destination features built from a source
+    feature (several ones with -explodecollections). Features whose geometry
+    is clipped out are not returned. Raise TranslateError on failure."""
+
+    nParts = 0
+    nIters = 1
+    if ctx.bExplodeCollections:
+        poSrcGeometry = poFeature.GetGeometryRef()
+        if poSrcGeometry is not None:
+            eSrcType = wkbFlatten(poSrcGeometry.GetGeometryType())
+            if eSrcType == ogr.wkbMultiPoint or \
+               eSrcType == ogr.wkbMultiLineString or \
+               eSrcType == ogr.wkbMultiPolygon or \
+               eSrcType == ogr.wkbGeometryCollection:
+                nParts = poSrcGeometry.GetGeometryCount()
+                nIters = nParts
+                if nIters == 0:
+                    nIters = 1
+
+    apoDstFeatures = []
+    for iPart in range(nIters):
+        poDstFeature = ogr.Feature(ctx.poDstDefn)
+
+        if poDstFeature.SetFromWithMap(poFeature, 1, ctx.panMap) != 0:
+            raise TranslateError("Unable to translate feature %d" % poFeature.GetFID())
+
+        if bPreserveFID:
+            poDstFeature.SetFID(poFeature.GetFID())
+
+        poDstGeometry = poDstFeature.GetGeometryRef()
+        if poDstGeometry is not None:
+
+            if nParts > 0:
+                # For -explodecollections, extract the iPart(th) of the geometry
+                poPart = poDstGeometry.GetGeometryRef(iPart).Clone()
+                poDstFeature.SetGeometryDirectly(poPart)
+                poDstGeometry = poPart
+
+            if ctx.iSrcZField != -1:
+                SetZ(poDstGeometry, poFeature.GetFieldAsDouble(ctx.iSrcZField))
+                # This will correct the coordinate dimension to 3
+                poDupGeometry = poDstGeometry.Clone()
+                poDstFeature.SetGeometryDirectly(poDupGeometry)
+                poDstGeometry = poDupGeometry
+
+            if ctx.nCoordDim == 2 or ctx.nCoordDim == 3:
+                poDstGeometry.SetCoordinateDimension(ctx.nCoordDim)
+
+            if ctx.eGeomOp == GeomOperation.SEGMENTIZE:
+                pass
+                # if (poDstFeature.GetGeometryRef() is not None and dfGeomOpParam > 0)
+                #    poDstFeature.GetGeometryRef().segmentize(dfGeomOpParam);
+            elif ctx.eGeomOp == GeomOperation.SIMPLIFY_PRESERVE_TOPOLOGY and ctx.dfGeomOpParam > 0:
+                poNewGeom = poDstGeometry.SimplifyPreserveTopology(ctx.dfGeomOpParam)
+                if poNewGeom is not None:
+                    poDstFeature.SetGeometryDirectly(poNewGeom)
+                    poDstGeometry = poNewGeom
+
+            if poClipSrc is not None:
+                poClipped = poDstGeometry.Intersection(poClipSrc)
+                if poClipped is None or poClipped.IsEmpty():
+                    continue
+
+                poDstFeature.SetGeometryDirectly(poClipped)
+                poDstGeometry = poClipped
+
+            if poCT is not None:
+                eErr = poDstGeometry.Transform(poCT)
+                if eErr != 0:
+                    pszMsg = "Failed to reproject feature %d (geometry probably out of source or destination SRS)." % poFeature.GetFID()
+                    if not bSkipFailures:
+                        raise TranslateError(pszMsg)
+                    print(pszMsg)
+
+            elif ctx.poOutputSRS is not None:
+                poDstGeometry.AssignSpatialReference(ctx.poOutputSRS)
+
+            if poClipDst is not None:
+                poClipped = poDstGeometry.Intersection(poClipDst)
+                if poClipped is None or poClipped.IsEmpty():
+                    continue
+
+                poDstFeature.SetGeometryDirectly(poClipped)
+                poDstGeometry = poClipped
+
+            if ctx.bForceToPolygon:
+                poDstFeature.SetGeometryDirectly(ogr.ForceToPolygon(poDstGeometry))
+
+            elif ctx.bForceToMultiPolygon or \
+                    (ctx.bPromoteToMulti and wkbFlatten(poDstGeometry.GetGeometryType()) == ogr.wkbPolygon):
+                poDstFeature.SetGeometryDirectly(ogr.ForceToMultiPolygon(poDstGeometry))
+
+            elif ctx.bForceToMultiLineString or \
+                    (ctx.bPromoteToMulti and wkbFlatten(poDstGeometry.GetGeometryType()) == ogr.wkbLineString):
+                poDstFeature.SetGeometryDirectly(ogr.ForceToMultiLineString(poDstGeometry))
+
+        apoDstFeatures.append(poDstFeature)
+
+    return apoDstFeatures
+
 # **********************************************************************
 #                           TranslateLayer()
 # **********************************************************************
@@ -1511,25 +1658,22 @@ def TranslateLayer(psInfo, poSrcDS, poSrcLayer, poDstDS,
                    poClipSrc, poClipDst, bExplodeCollections, nSrcFileSize,
                    pnReadFeatureCount, pfnProgress, pProgressArg):
     # pylint: disable=unused-argument
-    bForceToPolygon = False
-    bForceToMultiPolygon = False
-    bForceToMultiLineString = False
-
     poDstLayer = psInfo.poDstLayer
     # papszTransformOptions = psInfo.papszTransformOptions
     poCT = psInfo.poCT
-    panMap = psInfo.panMap
-    iSrcZField = psInfo.iSrcZField
 
     if poOutputSRS is None and not bNullifyOutputSRS:
         poOutputSRS = poSrcLayer.GetSpatialRef()
 
-    if wkbFlatten(eGType) == ogr.wkbPolygon:
-        bForceToPolygon = True
-    elif wkbFlatten(eGType) == ogr.wkbMultiPolygon:
-        bForceToMultiPolygon = True
-    elif wkbFlatten(eGType) == ogr.wkbMultiLineString:
-        bForceToMultiLineString = True
+    ctx = TranslateContext(poDstLayer.GetLayerDefn(), psInfo.panMap,
+                           psInfo.iSrcZField, poOutputSRS,
+                           eGType, bPromoteToMulti, nCoordDim, eGeomOp,
+                           dfGeomOpParam, bExplodeCollections)
+
+    if nPipelineThreads > 0 and nFIDToFetch == ogr.NullFID:
+        return TranslateLayerPipelined(ctx, psInfo, poSrcLayer, nCountLayerFeatures,
+                                       poClipSrc, poClipDst,
+                                       pnReadFeatureCount, pfnProgress, pProgressArg)
 
 # --------------------------------------------------------------------
 #      Transfer features.
@@ -1541,12 +1685,10 @@ def TranslateLayer(psInfo, poSrcDS, poSrcLayer, poDstDS,
         poDstLayer.StartTransaction()
 
     while True:
-        poDstFeature = None
-
         if nFIDToFetch != ogr.NullFID:
 
             # // Only fetch feature on first pass.
-            if nFeaturesInTransaction == 0:
+            if nCount == 0:
                 poFeature = poSrcLayer.GetFeature(nFIDToFetch)
             else:
                 poFeature = None
@@ -1557,116 +1699,24 @@ def TranslateLayer(psInfo, poSrcDS, poSrcLayer, poDstDS,
         if poFeature is None:
             break
 
-        nParts = 0
-        nIters = 1
-        if bExplodeCollections:
-            poSrcGeometry = poFeature.GetGeometryRef()
-            if poSrcGeometry is not None:
-                eSrcType = wkbFlatten(poSrcGeometry.GetGeometryType())
-                if eSrcType == ogr.wkbMultiPoint or \
-                   eSrcType == ogr.wkbMultiLineString or \
-                   eSrcType == ogr.wkbMultiPolygon or \
-                   eSrcType == ogr.wkbGeometryCollection:
-                    nParts = poSrcGeometry.GetGeometryCount()
-                    nIters = nParts
-                    if nIters == 0:
-                        nIters = 1
-
-        for iPart in range(nIters):
+        gdal.ErrorReset()
+        try:
+            apoDstFeatures = TranslateFeature(ctx, poFeature, poCT, poClipSrc, poClipDst)
+        except TranslateError as e:
+            if nGroupTransactions > 0:
+                poDstLayer.CommitTransaction()
+
+            print("%s from layer %s" % (str(e), poSrcLayer.GetName()))
+
+            return False
+
+        for poDstFeature in apoDstFeatures:
             nFeaturesInTransaction = nFeaturesInTransaction + 1
             if nFeaturesInTransaction == nGroupTransactions:
                 poDstLayer.CommitTransaction()
                 poDstLayer.StartTransaction()
                 nFeaturesInTransaction = 0
 
-            gdal.ErrorReset()
-            poDstFeature = ogr.Feature(poDstLayer.GetLayerDefn())
-
-            if poDstFeature.SetFromWithMap(poFeature, 1, panMap) != 0:
-
-                if nGroupTransactions > 0:
-                    poDstLayer.CommitTransaction()
-
-                print("Unable to translate feature %d from layer %s" % (poFeature.GetFID(), poSrcLayer.GetName()))
-
-                return False
-
-            if bPreserveFID:
-                poDstFeature.SetFID(poFeature.GetFID())
-
-            poDstGeometry = poDstFeature.GetGeometryRef()
-            if poDstGeometry is not None:
-
-                if nParts > 0:
-                    # For -explodecollections, extract the iPart(th) of the geometry
-                    poPart = poDstGeometry.GetGeometryRef(iPart).Clone()
-                    poDstFeature.SetGeometryDirectly(poPart)
-                    poDstGeometry = poPart
-
-                if iSrcZField != -1:
-                    SetZ(poDstGeometry, poFeature.GetFieldAsDouble(iSrcZField))
-                    # This will correct the coordinate dimension to 3
-                    poDupGeometry = poDstGeometry.Clone()
-                    poDstFeature.SetGeometryDirectly(poDupGeometry)
-                    poDstGeometry = poDupGeometry
-
-                if nCoordDim == 2 or nCoordDim == 3:
-                    poDstGeometry.SetCoordinateDimension(nCoordDim)
-
-                if eGeomOp == GeomOperation.SEGMENTIZE:
-                    pass
-                    # if (poDstFeature.GetGeometryRef() is not None and dfGeomOpParam > 0)
-                    #    poDstFeature.GetGeometryRef().segmentize(dfGeomOpParam);
-                elif eGeomOp == GeomOperation.SIMPLIFY_PRESERVE_TOPOLOGY and dfGeomOpParam > 0:
-                    poNewGeom = poDstGeometry.SimplifyPreserveTopology(dfGeomOpParam)
-                    if poNewGeom is not None:
-                        poDstFeature.SetGeometryDirectly(poNewGeom)
-                        poDstGeometry = poNewGeom
-
-                if poClipSrc is not None:
-                    poClipped = poDstGeometry.Intersection(poClipSrc)
-                    if poClipped is None or poClipped.IsEmpty():
-                        # Report progress
-                        nCount = nCount + 1
-                        if pfnProgress is not None:
-                            pfnProgress(nCount * 1.0 / nCountLayerFeatures, "", pProgressArg)
-                        continue
-
-                    poDstFeature.SetGeometryDirectly(poClipped)
-                    poDstGeometry = poClipped
-
-                if poCT is not None:
-                    eErr = poDstGeometry.Transform(poCT)
-                    if eErr != 0:
-                        if nGroupTransactions > 0:
-                            poDstLayer.CommitTransaction()
-
-                        print("Failed to reproject feature %d (geometry probably out of source or destination SRS)." % poFeature.GetFID())
-                        if not bSkipFailures:
-                            return False
-
-                elif poOutputSRS is not None:
-                    poDstGeometry.AssignSpatialReference(poOutputSRS)
-
-                if poClipDst is not None:
-                    poClipped = poDstGeometry.Intersection(poClipDst)
-                    if poClipped is None or poClipped.IsEmpty():
-                        continue
-
-                    poDstFeature.SetGeometryDirectly(poClipped)
-                    poDstGeometry = poClipped
-
-                if bForceToPolygon:
-                    poDstFeature.SetGeometryDirectly(ogr.ForceToPolygon(poDstGeometry))
-
-                elif bForceToMultiPolygon or \
-                        (bPromoteToMulti and wkbFlatten(poDstGeometry.GetGeometryType()) == ogr.wkbPolygon):
-                    poDstFeature.SetGeometryDirectly(ogr.ForceToMultiPolygon(poDstGeometry))
-
-                elif bForceToMultiLineString or \
-                        (bPromoteToMulti and wkbFlatten(poDstGeometry.GetGeometryType()) == ogr.wkbLineString):
-                    poDstFeature.SetGeometryDirectly(ogr.ForceToMultiLineString(poDstGeometry))
-
             gdal.ErrorReset()
             if poDstLayer.CreateFeature(poDstFeature) != 0 and not bSkipFailures:
                 if nGroupTransactions > 0:
@@ -1698,6 +1748,185 @@ def TranslateLayer(psInfo, poSrcDS, poSrcLayer, poDstDS,
 
     return True
 
+# **********************************************************************
+#                       TranslateLayerPipelined()
+# **********************************************************************
+
+
+PIPELINE_BATCH_SIZE = 256
+
+
+def _PutUnlessAborted(q, item, abort):
+    while not abort.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _GetUnlessAborted(q, abort):
+    while not abort.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    return None
+
+
+def TranslateLayerPipelined(ctx, psInfo, poSrcLayer, nCountLayerFeatures,
+                            poClipSrc, poClipDst,
+                            pnReadFeatureCount, pfnProgress, pProgressArg):
+    """Same as the loop of TranslateLayer(), with the reading of the source
+    features, their translation and the writing of the destination features
+    running concurrently, in a reader thread, -pipeline worker threads and
+    the calling thread.
+
+    The stages exchange batches of features through bounded queues, so that
+    at most a few batches are in memory. The GDAL calls release the Python
+    Global Interpreter Lock, which lets the stages overlap. With
+    -preserve_fid, the batches are written in their reading order. Otherwise,
+    they are written as soon as they are translated."""
+
+    poDstLayer = psInfo.poDstLayer
+    abort = threading.Event()
+    read_queue = queue.Queue(maxsize=2 * nPipelineThreads)
+    write_queue = queue.Queue(maxsize=2 * nPipelineThreads)
+
+    def reader():
+        iBatch = 0
+        batch = []
+        try:
+            while not abort.is_set():
+                poFeature = poSrcLayer.GetNextFeature()
+                if poFeature is not None:
+                    batch.append(poFeature)
+                if batch and (poFeature is None or len(batch) == PIPELINE_BATCH_SIZE):
+                    if not _PutUnlessAborted(read_queue, (iBatch, batch), abort):
+                        return
+                    iBatch += 1
+                    batch = []
+                if poFeature is None:
+                    break
+        except Exception as e:  # for example with ogr.UseExceptions()
+            # Report the error as a result, so that the writer stops
+            _PutUnlessAborted(write_queue, (iBatch, 0, None, str(e)), abort)
+        finally:
+            for _ in range(nPipelineThreads):
+                _PutUnlessAborted(read_queue, None, abort)
+
+    def transformer():
+        try:
+            # Objects that are not safe to use from several threads are
+            # specific to each worker
+            poCT = None
+            if psInfo.poCT is not None:
+                poCT = osr.CoordinateTransformation(psInfo.poSourceSRS, psInfo.poTargetSRS)
+            poLocalClipSrc = poClipSrc.Clone() if poClipSrc is not None else None
+            poLocalClipDst = poClipDst.Clone() if poClipDst is not None else None
+            while True:
+                item = _GetUnlessAborted(read_queue, abort)
+                if item is None:
+                    return
+                iBatch, batch = item
+                try:
+                    apoDstFeatures = []
+                    for poFeature in batch:
+                        apoDstFeatures += TranslateFeature(ctx, poFeature, poCT,
+                                                           poLocalClipSrc, poLocalClipDst)
+                    result = (iBatch, len(batch), apoDstFeatures, None)
+                except Exception as e:  # TranslateError, or errors of the bindings
+                    result = (iBatch, len(batch), None, str(e))
+                if not _PutUnlessAborted(write_queue, result, abort):
+                    return
+        except Exception as e:
+            _PutUnlessAborted(write_queue, (-1, 0, None, str(e)), abort)
+        finally:
+            # Always tell the writer that this worker is done
+            _PutUnlessAborted(write_queue, None, abort)
+
+    threads = [threading.Thread(target=reader)]
+    threads += [threading.Thread(target=transformer) for _ in range(nPipelineThreads)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+
+    nFeaturesInTransaction = 0
+    nCount = 0
+    nWorkersDone = 0
+    iNextBatch = 0
+    pending = {}
+    bRet = True
+    bRollback = False
+
+    if nGroupTransactions > 0:
+        poDstLayer.StartTransaction()
+
+    try:
+        while nWorkersDone < nPipelineThreads:
+            item = write_queue.get()
+            if item is None:
+                nWorkersDone += 1
+                continue
+
+            if bPreserveFID and item[3] is None:
+                # Write the batches in their reading order. Errors are handled
+                # right away.
+                pending[item[0]] = item
+                ready = []
+                while iNextBatch in pending:
+                    ready.append(pending.pop(iNextBatch))
+                    iNextBatch += 1
+            else:
+                ready = [item]
+
+            for _, nSrcFeatures, apoDstFeatures, pszError in ready:
+                if pszError is not None:
+                    print("%s from layer %s" % (pszError, poSrcLayer.GetName()))
+                    bRet = False
+                    break
+
+                for poDstFeature in apoDstFeatures:
+                    nFeaturesInTransaction = nFeaturesInTransaction + 1
+                    if nFeaturesInTransaction == nGroupTransactions:
+                        poDstLayer.CommitTransaction()
+                        poDstLayer.StartTransaction()
+                        nFeaturesInTransaction = 0
+
+                    gdal.ErrorReset()
+                    if poDstLayer.CreateFeature(poDstFeature) != 0 and not bSkipFailures:
+                        bRet = False
+                        bRollback = True
+                        break
+                if not bRet:
+                    break
+
+                # Report progress
+                nCount = nCount + nSrcFeatures
+                if pfnProgress is not None and nCountLayerFeatures > 0:
+                    pfnProgress(nCount * 1.0 / nCountLayerFeatures, "", pProgressArg)
+
+                if pnReadFeatureCount is not None:
+                    pnReadFeatureCount[0] = nCount
+
+            if not bRet:
+                break
+    finally:
+        # Stop the other threads if the writer stopped early, including on
+        # exception
+        abort.set()
+        for t in threads:
+            t.join()
+
+    if nGroupTransactions > 0:
+        if bRollback:
+            poDstLayer.RollbackTransaction()
+        else:
+            poDstLayer.CommitTransaction()
+
+    return bRet
+
 
 if __name__ == '__main__':
     version_num = int(gdal.VersionInfo('VERSION_NUM'))
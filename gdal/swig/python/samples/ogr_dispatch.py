@@ -31,6 +31,7 @@
 ###############################################################################
 
 import sys
+import time
 from osgeo import ogr
 from osgeo import osr
 
@@ -44,6 +45,7 @@ def Usage():
     print('                [-remove_dispatch_fields] [-prefix_with_layer_name]')
     print('                [-dsco KEY=VALUE]* [-lco KEY=VALUE]* [-a_srs srs_def]')
     print('                [-style_as_field] [-where restricted_where] [-gt n] [-quiet]')
+    print('                [-buffer_size n] [-buffer_mem MB] [-batch_size n] [-stats]')
     print('')
     print('Dispatch features into layers according to the value of some fields or the')
     print('geometry type.')
@@ -65,7 +67,14 @@ def Usage():
     print(' -a_srs srs_def: assign a SRS to the target layers. Source layer SRS is otherwise used.')
     print(' -style_as_field: add a OGR_STYLE field with the content of the feature style string.')
     print(' -where restricted_where: where clause to filter source features.')
-    print(' -gt n: group n features per transaction (default 200).')
+    print(' -gt n: group n features per transaction (default 200). Features are buffered')
+    print('        per target layer, and each buffer is written in a single transaction.')
+    print(' -buffer_size n: number of features buffered per target layer before they are')
+    print('                 written in a single transaction (default: the -gt value).')
+    print(' -buffer_mem MB: memory budget for the buffers of all target layers (default 100).')
+    print(' -batch_size n: number of source features whose target layer is computed at once')
+    print('                (default 1000).')
+    print(' -stats: print per target layer write statistics.')
     print('')
     print('Example :')
     print('  ogr_dispatch.py -src in.dxf -dst out -field Layer -field OGR_GEOMETRY')
@@ -101,6 +110,10 @@ class Options(object):
         self.bPrefixWithLayerName = False
         self.bStyleAsField = False
         self.nGroupTransactions = 200
+        self.nBufferSize = None
+        self.nBufferMemory = 100 * 1024 * 1024
+        self.nBatchSize = 1000
+        self.bStats = False
         self.bQuiet = False
 
 ###############################################################
@@ -144,34 +157,171 @@ def GeometryTypeToName(eGeomType, options):
     return 'UNKNOWN'
 
 ###############################################################
-# get_out_lyr_name()
+# get_out_lyr_names()
 
 
-def get_out_lyr_name(src_lyr, feat, options):
+def _join_dispatch_values(vals):
+    out_lyr_name = ''
+    for val in vals:
+        if out_lyr_name == '':
+            out_lyr_name = val
+        else:
+            out_lyr_name = out_lyr_name + '_' + val
+    return out_lyr_name
+
+
+def get_out_lyr_names(src_lyr, feats, options):
+    """Compute the target layer names of a batch of features of src_lyr.
+
+    The values are computed one dispatch field at a time, for all the
+    features of the batch: the field index is looked up once, and the name
+    of each geometry type is computed once."""
+
+    columns = []
     if options.bPrefixWithLayerName:
-        out_lyr_name = src_lyr.GetName()
-    else:
-        out_lyr_name = ''
+        columns.append([src_lyr.GetName()] * len(feats))
 
+    lyr_defn = src_lyr.GetLayerDefn()
     for dispatch_field in options.dispatch_fields:
         if EQUAL(dispatch_field, 'OGR_GEOMETRY'):
-            geom = feat.GetGeometryRef()
-            if geom is None:
-                val = 'NONE'
-            else:
-                val = GeometryTypeToName(geom.GetGeometryType(), options)
+            geom_type_names = {}
+            vals = []
+            for feat in feats:
+                geom = feat.GetGeometryRef()
+                if geom is None:
+                    vals.append('NONE')
+                    continue
+                eGeomType = geom.GetGeometryType()
+                if eGeomType not in geom_type_names:
+                    geom_type_names[eGeomType] = \
+                        GeometryTypeToName(eGeomType, options)
+                vals.append(geom_type_names[eGeomType])
         else:
-            if feat.IsFieldSet(dispatch_field):
-                val = feat.GetFieldAsString(dispatch_field)
+            idx = lyr_defn.GetFieldIndex(dispatch_field)
+            if idx < 0:
+                vals = ['null'] * len(feats)
             else:
-                val = 'null'
+                vals = [feat.GetFieldAsString(idx) if feat.IsFieldSet(idx)
+                        else 'null' for feat in feats]
+        columns.append(vals)
 
-        if out_lyr_name == '':
-            out_lyr_name = val
-        else:
-            out_lyr_name = out_lyr_name + '_' + val
+    if not columns:
+        return [''] * len(feats)
+    return [_join_dispatch_values(vals) for vals in zip(*columns)]
 
-    return out_lyr_name
+###############################################################
+# get_out_lyr_name()
+
+
+def get_out_lyr_name(src_lyr, feat, options):
+    return get_out_lyr_names(src_lyr, [feat], options)[0]
+
+###############################################################
+# DispatchTarget
+
+
+class DispatchTarget(object):
+    """Target layer of the dispatch, with its buffer of features waiting to
+    be written, and its write statistics."""
+
+    def __init__(self, name, out_lyr, panMap):
+        self.name = name
+        self.out_lyr = out_lyr
+        self.panMap = panMap
+        self.features = []
+        self.nBufferedBytes = 0
+        self.nWrittenFeatures = 0
+        self.nFlushes = 0
+        self.dfWriteTime = 0.0
+
+    def flush(self, options):
+        """Write the buffered features, in a single transaction."""
+
+        if not self.features:
+            return 0
+
+        ret = 0
+        t0 = time.time()
+        if options.nGroupTransactions > 0:
+            self.out_lyr.StartTransaction()
+        for out_feat in self.features:
+            self.out_lyr.CreateFeature(out_feat)
+        if options.nGroupTransactions > 0:
+            if self.out_lyr.CommitTransaction() != 0:
+                ret = 1
+        self.dfWriteTime += time.time() - t0
+
+        self.nWrittenFeatures += len(self.features)
+        self.nFlushes += 1
+        self.features = []
+        self.nBufferedBytes = 0
+        return ret
+
+###############################################################
+# Dispatcher
+
+
+class Dispatcher(object):
+    """Buffer the dispatched features per target layer.
+
+    A target buffer is flushed when it reaches the buffer size. When the
+    features buffered for all targets exceed the memory budget, the target
+    with the largest buffer is flushed."""
+
+    def __init__(self, dst_ds, options):
+        self.dst_ds = dst_ds
+        self.options = options
+        self.layerMap = {}
+        self.nBufferedBytes = 0
+
+    def get_target(self, out_lyr_name, src_lyr, geom_type):
+        target = self.layerMap.get(out_lyr_name)
+        if target is None:
+            target = get_layer_and_map(out_lyr_name, src_lyr, self.dst_ds,
+                                       self.layerMap, geom_type, self.options)
+        return target
+
+    def add(self, target, out_feat):
+        # Approximate memory footprint of the feature
+        nBytes = 64 + 16 * out_feat.GetFieldCount()
+        geom = out_feat.GetGeometryRef()
+        if geom is not None:
+            nBytes += geom.WkbSize()
+
+        target.features.append(out_feat)
+        target.nBufferedBytes += nBytes
+        self.nBufferedBytes += nBytes
+
+        if len(target.features) >= self.options.nBufferSize:
+            return self.flush(target)
+        if self.nBufferedBytes > self.options.nBufferMemory:
+            largest = max(self.layerMap.values(),
+                          key=lambda t: t.nBufferedBytes)
+            return self.flush(largest)
+        return 0
+
+    def flush(self, target):
+        self.nBufferedBytes -= target.nBufferedBytes
+        return target.flush(self.options)
+
+    def flush_all(self):
+        ret = 0
+        for target in self.layerMap.values():
+            if self.flush(target) != 0:
+                ret = 1
+        return ret
+
+    def print_stats(self):
+        print('%-30s %12s %8s %10s %12s' % ('Layer', 'Features', 'Flushes',
+                                          'Time (s)', 'Features/s'))
+        for name in sorted(self.layerMap):
+            target = self.layerMap[name]
+            rate = target.nWrittenFeatures / target.dfWriteTime \
+                if target.dfWriteTime > 0 else 0
+            print('%-30s %12d %8d %10.3f %12.0f' % (name,
+                                                  target.nWrittenFeatures,
+                                                  target.nFlushes,
+                                                  target.dfWriteTime, rate))
 
 ###############################################################
 # get_layer_and_map()
@@ -191,7 +341,7 @@ def get_layer_and_map(out_lyr_name, src_lyr, dst_ds, layerMap, geom_type, option
             out_lyr = dst_ds.CreateLayer(out_lyr_name, srs=srs,
                                          geom_type=geom_type, options=options.lco)
             if out_lyr is None:
-                return 1
+                return None
             src_field_count = src_lyr.GetLayerDefn().GetFieldCount()
             panMap = [-1 for i in range(src_field_count)]
             for i in range(src_field_count):
@@ -213,25 +363,19 @@ def get_layer_and_map(out_lyr_name, src_lyr, dst_ds, layerMap, geom_type, option
                 out_lyr.CreateField(ogr.FieldDefn('OGR_STYLE', ogr.OFTString))
         else:
             panMap = None
-        layerMap[out_lyr_name] = [out_lyr, panMap]
-    else:
-        out_lyr = layerMap[out_lyr_name][0]
-        panMap = layerMap[out_lyr_name][1]
+        layerMap[out_lyr_name] = DispatchTarget(out_lyr_name, out_lyr, panMap)
 
-    return (out_lyr, panMap)
+    return layerMap[out_lyr_name]
 
 ###############################################################
 # convert_layer()
 
 
-def convert_layer(src_lyr, dst_ds, layerMap, options):
+def dispatch_features(src_lyr, feats, dispatcher, options):
 
-    current_out_lyr = None
-    nFeaturesInTransaction = 0
-
-    for feat in src_lyr:
+    out_lyr_names = get_out_lyr_names(src_lyr, feats, options)
 
-        out_lyr_name = get_out_lyr_name(src_lyr, feat, options)
+    for feat, out_lyr_name in zip(feats, out_lyr_names):
 
         geom = feat.GetGeometryRef()
         if geom is not None:
@@ -239,40 +383,39 @@ def convert_layer(src_lyr, dst_ds, layerMap, options):
         else:
             geom_type = ogr.wkbUnknown
 
-        (out_lyr, panMap) = get_layer_and_map(out_lyr_name, src_lyr, dst_ds,
-                                              layerMap, geom_type, options)
-
-        if options.nGroupTransactions > 0:
-            if out_lyr != current_out_lyr:
-                if current_out_lyr is not None:
-                    current_out_lyr.CommitTransaction()
-                current_out_lyr = out_lyr
-                current_out_lyr.StartTransaction()
-                nFeaturesInTransaction = 0
-
-            if nFeaturesInTransaction == options.nGroupTransactions:
-                current_out_lyr.CommitTransaction()
-                current_out_lyr.StartTransaction()
-        else:
-            current_out_lyr = out_lyr
+        target = dispatcher.get_target(out_lyr_name, src_lyr, geom_type)
+        if target is None:
+            print('Cannot create layer %s' % out_lyr_name)
+            return 1
 
-        out_feat = ogr.Feature(out_lyr.GetLayerDefn())
-        if panMap is not None:
-            out_feat.SetFromWithMap(feat, 1, panMap)
+        out_feat = ogr.Feature(target.out_lyr.GetLayerDefn())
+        if target.panMap is not None:
+            out_feat.SetFromWithMap(feat, 1, target.panMap)
         else:
             out_feat.SetFrom(feat)
         if options.bStyleAsField:
             style = feat.GetStyleString()
             if style is not None:
                 out_feat.SetField('OGR_STYLE', style)
-        out_lyr.CreateFeature(out_feat)
+        if dispatcher.add(target, out_feat) != 0:
+            return 1
 
-        nFeaturesInTransaction = nFeaturesInTransaction + 1
+    return 0
 
-    if options.nGroupTransactions > 0 and current_out_lyr is not None:
-        current_out_lyr.CommitTransaction()
 
-    return 1
+def convert_layer(src_lyr, dispatcher, options):
+
+    feats = []
+    for feat in src_lyr:
+        feats.append(feat)
+        if len(feats) == options.nBatchSize:
+            if dispatch_features(src_lyr, feats, dispatcher, options) != 0:
+                return 1
+            feats = []
+
+    if feats:
+        return dispatch_features(src_lyr, feats, dispatcher, options)
+    return 0
 
 ###############################################################
 # ogr_dispatch()
@@ -338,6 +481,17 @@ def ogr_dispatch(argv, progress=None, progress_arg=None):
                 EQUAL(arg, "-gt")) and i + 1 < len(argv):
             i = i + 1
             options.nGroupTransactions = int(argv[i])
+        elif EQUAL(arg, "-buffer_size") and i + 1 < len(argv):
+            i = i + 1
+            options.nBufferSize = max(1, int(argv[i]))
+        elif EQUAL(arg, "-buffer_mem") and i + 1 < len(argv):
+            i = i + 1
+            options.nBufferMemory = int(float(argv[i]) * 1024 * 1024)
+        elif EQUAL(arg, "-batch_size") and i + 1 < len(argv):
+            i = i + 1
+            options.nBatchSize = max(1, int(argv[i]))
+        elif EQUAL(arg, '-stats'):
+            options.bStats = True
         elif EQUAL(arg, "-where") and i + 1 < len(argv):
             i = i + 1
             pszWHERE = argv[i]
@@ -376,16 +530,29 @@ def ogr_dispatch(argv, progress=None, progress_arg=None):
         print('Cannot open or create target datasource %s' % dst_filename)
         return 1
 
-    layerMap = {}
+    if options.nBufferSize is None:
+        if options.nGroupTransactions > 0:
+            options.nBufferSize = options.nGroupTransactions
+        else:
+            options.nBufferSize = 200
+
+    dispatcher = Dispatcher(dst_ds, options)
 
+    ret = 0
     for src_lyr in src_ds:
         if pszWHERE is not None:
             src_lyr.SetAttributeFilter(pszWHERE)
-        ret = convert_layer(src_lyr, dst_ds, layerMap, options)
+        ret = convert_layer(src_lyr, dispatcher, options)
         if ret != 0:
-            return ret
+            break
 
-    return 0
+    if dispatcher.flush_all() != 0:
+        ret = 1
+
+    if options.bStats:
+        dispatcher.print_stats()
+
+    return ret
 
 ###############################################################
 # Entry point
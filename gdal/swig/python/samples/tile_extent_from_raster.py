@@ -31,10 +31,16 @@
 
 import os
 import sys
+import numpy as np
 from osgeo import gdal, ogr
 
 def Usage():
-    print('Usage:  tile_extent_from_raster.py [-f format] [-ovr level] in.tif out.shp')
+    print('Usage:  tile_extent_from_raster.py [-f format] [-ovr level] [-compact]')
+    print('                                   [-transaction_size size] in.tif out.shp')
+    print('')
+    print('-compact: write the block indices, and the pixel offset and size of the')
+    print('          blocks, instead of their extent as a polygon.')
+    print('-transaction_size: number of features written per transaction (default 100000).')
 
     return 1
 
@@ -86,12 +92,87 @@ def GetOutputDriverFor(filename):
     return drv_list[0]
 
 
+# Layout of a little-endian WKB polygon with a single ring of 5 points
+POLYGON_WKB_DTYPE = np.dtype([('byte_order', 'u1'), ('geom_type', '<u4'),
+                              ('num_rings', '<u4'), ('num_points', '<u4'),
+                              ('coords', '<f8', (5, 2))])
+
+
+def GetBlockEnvelopesWkb(gt, blockxsize, blockysize, nxblocks, nyblocks):
+    """Return the WKB polygons of the extent of all the blocks of a level, as
+    a single buffer, row by row, and the offsets of each polygon in it."""
+    xmin = gt[0] + np.arange(nxblocks) * blockxsize * gt[1]
+    xmax = xmin + blockxsize * gt[1]
+    ymax = gt[3] + np.arange(nyblocks) * blockysize * gt[5]
+    ymin = ymax + blockysize * gt[5]
+    xmin, ymin = np.meshgrid(xmin, ymin)
+    xmax, ymax = np.meshgrid(xmax, ymax)
+
+    polys = np.empty(nxblocks * nyblocks, dtype=POLYGON_WKB_DTYPE)
+    polys['byte_order'] = 1
+    polys['geom_type'] = ogr.wkbPolygon
+    polys['num_rings'] = 1
+    polys['num_points'] = 5
+    coords = polys['coords']
+    coords[:, 0, 0] = coords[:, 1, 0] = coords[:, 4, 0] = xmin.ravel()
+    coords[:, 2, 0] = coords[:, 3, 0] = xmax.ravel()
+    coords[:, 0, 1] = coords[:, 3, 1] = coords[:, 4, 1] = ymin.ravel()
+    coords[:, 1, 1] = coords[:, 2, 1] = ymax.ravel()
+    offsets = np.arange(polys.shape[0] + 1, dtype=np.int64) * POLYGON_WKB_DTYPE.itemsize
+    return polys.tobytes(), offsets
+
+
+def WriteBlockEnvelopes(out_lyr, gt, blockxsize, blockysize, nxblocks, nyblocks,
+                        transaction_size):
+    wkb, offsets = GetBlockEnvelopesWkb(gt, blockxsize, blockysize, nxblocks, nyblocks)
+    wkb = memoryview(wkb)
+    for start in range(0, offsets.shape[0] - 1, transaction_size):
+        end = min(start + transaction_size, offsets.shape[0] - 1)
+        out_lyr.StartTransaction()
+        # Offsets are relative to the start of the passed buffer
+        out_lyr.CreateFeaturesFromWkb(wkb[offsets[start]:offsets[end]],
+                                      (offsets[start:end + 1] - offsets[start]).tolist())
+        out_lyr.CommitTransaction()
+
+
+def WriteBlockWindows(out_lyr, xsize, ysize, blockxsize, blockysize, nxblocks, nyblocks,
+                      transaction_size):
+    fields = ['block_x', 'block_y', 'x_offset', 'y_offset', 'x_size', 'y_size']
+    for name in fields:
+        out_lyr.CreateField(ogr.FieldDefn(name, ogr.OFTInteger))
+    defn = out_lyr.GetLayerDefn()
+
+    block_y, block_x = np.mgrid[0:nyblocks, 0:nxblocks]
+    x_offset = block_x * blockxsize
+    y_offset = block_y * blockysize
+    # Right-most and bottom-most blocks may be partial
+    x_size = np.minimum(blockxsize, xsize - x_offset)
+    y_size = np.minimum(blockysize, ysize - y_offset)
+    rows = np.stack([a.ravel() for a in (block_x, block_y, x_offset, y_offset,
+                                          x_size, y_size)], axis=1).tolist()
+
+    count = 0
+    out_lyr.StartTransaction()
+    for row in rows:
+        f = ogr.Feature(defn)
+        for idx, val in enumerate(row):
+            f.SetField(idx, val)
+        out_lyr.CreateFeature(f)
+        count += 1
+        if count % transaction_size == 0:
+            out_lyr.CommitTransaction()
+            out_lyr.StartTransaction()
+    out_lyr.CommitTransaction()
+
+
 def main():
     i = 1
     output_format = None
     in_filename = None
     out_filename = None
     ovr_level = None
+    compact = False
+    transaction_size = 100000
     while i < len(sys.argv):
         if sys.argv[i] == "-f":
             output_format = sys.argv[i + 1]
@@ -99,6 +180,11 @@ def main():
         elif sys.argv[i] == "-ovr":
             ovr_level = int(sys.argv[i + 1])
             i = i + 1
+        elif sys.argv[i] == "-compact":
+            compact = True
+        elif sys.argv[i] == "-transaction_size":
+            transaction_size = int(sys.argv[i + 1])
+            i = i + 1
         elif sys.argv[i][0] == '-':
             return Usage()
         elif in_filename is None:
@@ -110,7 +196,7 @@ def main():
 
         i = i + 1
 
-    if out_filename is None:
+    if out_filename is None or transaction_size <= 0:
         return Usage()
     if output_format is None:
         output_format = GetOutputDriverFor(out_filename)
@@ -122,28 +208,22 @@ def main():
 
     for i in ([ovr_level] if ovr_level is not None else range(1+first_band.GetOverviewCount())):
         src_band = first_band if i == 0 else first_band.GetOverview(i-1)
-        out_lyr = out_ds.CreateLayer('main_image' if i == 0 else ('overview_%d' % i), geom_type = ogr.wkbPolygon, srs = src_ds.GetSpatialRef())
+        lyr_name = 'main_image' if i == 0 else ('overview_%d' % i)
         blockxsize, blockysize = src_band.GetBlockSize()
         nxblocks = (src_band.XSize + blockxsize - 1) // blockxsize
         nyblocks = (src_band.YSize + blockysize - 1) // blockysize
+        if compact:
+            out_lyr = out_ds.CreateLayer(lyr_name, geom_type = ogr.wkbNone)
+            WriteBlockWindows(out_lyr, src_band.XSize, src_band.YSize,
+                              blockxsize, blockysize, nxblocks, nyblocks,
+                              transaction_size)
+            continue
+        out_lyr = out_ds.CreateLayer(lyr_name, geom_type = ogr.wkbPolygon, srs = src_ds.GetSpatialRef())
         gt = [ main_gt[0], main_gt[1] * first_band.XSize / src_band.XSize, 0,
                main_gt[3], 0, main_gt[5] * first_band.YSize / src_band.YSize]
-        for y in range(nyblocks):
-            ymax = gt[3] + y * blockysize * gt[5]
-            ymin = ymax + blockysize * gt[5]
-            for x in range(nxblocks):
-                xmin = gt[0] + x * blockxsize * gt[1]
-                xmax = xmin + blockxsize * gt[1]
-                f = ogr.Feature(out_lyr.GetLayerDefn())
-                wkt = 'POLYGON((%.18g %.18g,%.18g %.18g,%.18g %.18g,%.18g %.18g,%.18g %.18g))' % (xmin, ymin,
-                                                                                                  xmin, ymax,
-                                                                                                  xmax, ymax,
-                                                                                                  xmax, ymin,
-                                                                                                  xmin, ymin)
-                f.SetGeometryDirectly(ogr.CreateGeometryFromWkt(wkt))
-                out_lyr.CreateFeature(f)
+        WriteBlockEnvelopes(out_lyr, gt, blockxsize, blockysize, nxblocks, nyblocks,
+                            transaction_size)
     out_ds = None
 
 if __name__ == '__main__':
     sys.exit(main())
-
@@ -30,42 +30,125 @@
 
 import sys
 
+import numpy as np
+
 from osgeo import ogr
 
+from vec_tr_util import CopyFeatures, CreateOutputLayer
+
 #############################################################################
 
 
-def TransformPoint(xyz):
+def TransformCoordinates(xyz):
+    """Transformation applied to the coordinates of all the geometries.
 
-    x = xyz[0]
-    y = xyz[1]
-    z = xyz[2]
+    xyz is a (N, 3) float64 array with the X, Y and Z values of N points
+    (Z is 0 for 2D geometries). The function must return an array of the
+    same shape, and may modify xyz in place."""
 
-    x = x + 1000
+    xyz[:, 0] += 1000
 
-    return (x, y, z)
+    return xyz
 
 #############################################################################
 
 
-def WalkAndTransform(geom):
+def _ToXYZ(coords, has_z):
+    xyz = np.zeros((coords.shape[0], 3))
+    xyz[:, 0:2] = coords[:, 0:2]
+    if has_z:
+        xyz[:, 2] = coords[:, 2]
+    return xyz
+
+
+def _FromXYZ(coords, xyz, has_z):
+    coords = coords.copy()
+    coords[:, 0:2] = xyz[:, 0:2]
+    if has_z:
+        coords[:, 2] = xyz[:, 2]
+    return coords
+
+
+def WalkAndTransform(geom, func):
+    """Apply func to the points of each simple part of geom, in place.
+
+    This is the fallback for geometry types not supported by
+    Geometry.GetFlatCoordinates(), such as geometry collections and curve
+    polygons."""
 
     if geom.GetGeometryCount() > 0:
         for i in range(geom.GetGeometryCount()):
-            old_geom = geom.GetGeometryRef(i)
-            new_geom = WalkAndTransform(old_geom)
-            if new_geom is not old_geom:
-                geom.SetGeometryDirectly(new_geom)
+            WalkAndTransform(geom.GetGeometryRef(i), func)
         return geom
 
-    for i in range(geom.GetPointCount()):
-        xyz = (geom.GetX(i), geom.GetY(i), geom.GetZ(i))
+    if geom.GetPointCount() > 0:
+        coords = geom.GetPointsAsArray()
+        has_z = geom.Is3D()
+        geom.SetPointsFromArray(_FromXYZ(coords, func(_ToXYZ(coords, has_z)), has_z))
 
-        xyz = TransformPoint(xyz)
+    return geom
 
-        geom.SetPoint(i, xyz[0], xyz[1], xyz[2])
 
-    return geom
+def TransformGeometries(geoms, func):
+    """Apply the vectorised coordinate function func to a list of geometries.
+
+    The coordinates of all the geometries are gathered into a single
+    (N, 3) array, so that func is called once for the whole list. Return a
+    list of new geometries (None for None input geometries). M values are
+    kept unchanged."""
+
+    flat = []
+    for geom in geoms:
+        if geom is None:
+            flat.append(None)
+            continue
+        try:
+            flat.append(geom.GetFlatCoordinates())
+        except ValueError:
+            flat.append(None)
+
+    xyz = [_ToXYZ(f[0], geom.Is3D()) for f, geom in zip(flat, geoms) if f is not None]
+    if xyz:
+        counts = [a.shape[0] for a in xyz]
+        xyz = func(np.concatenate(xyz))
+        xyz = np.split(xyz, np.cumsum(counts)[:-1])
+
+    out_geoms = []
+    i = 0
+    for f, geom in zip(flat, geoms):
+        if geom is None:
+            out_geoms.append(None)
+        elif f is None:
+            out_geoms.append(WalkAndTransform(geom.Clone(), func))
+        else:
+            coords, ring_offsets, part_offsets = f
+            has_z = geom.Is3D()
+            new_geom = ogr.Geometry(geom.GetGeometryType())
+            new_geom.SetFlatCoordinates(_FromXYZ(coords, xyz[i], has_z),
+                                        ring_offsets, part_offsets)
+            new_geom.AssignSpatialReference(geom.GetSpatialReference())
+            out_geoms.append(new_geom)
+            i += 1
+    return out_geoms
+
+
+def ApplyCoordinateFunction(in_layer, out_layer, func=None, filter_geom=None,
+                            batch_size=10000):
+    """Copy the features of in_layer to out_layer, applying the vectorised
+    coordinate function func (see TransformCoordinates()) to their
+    geometries.
+
+    Features are processed by batches of batch_size: func is called once per
+    batch, and each batch is written in a single transaction. If filter_geom
+    is set, only the features whose geometry intersects it are copied.
+    Return the number of features written."""
+
+    def transform_geoms(geoms):
+        return TransformGeometries(geoms, func)
+
+    return CopyFeatures(in_layer, out_layer,
+                        transform_geoms if func is not None else None,
+                        filter_geom, batch_size)
 
 #############################################################################
 
@@ -73,88 +156,60 @@ def WalkAndTransform(geom):
 def Usage():
     print('Usage: vec_tr.py infile outfile [layer]')
     print('')
-    sys.exit(1)
+    return 1
 
 #############################################################################
-# Argument processing.
 
 
-infile = None
-outfile = None
-layer_name = None
+def main(argv):
 
-for arg in sys.argv[1:]:
-    if infile is None:
-        infile = arg
+    infile = None
+    outfile = None
+    layer_name = None
 
-    elif outfile is None:
-        outfile = arg
+    for arg in argv[1:]:
+        if infile is None:
+            infile = arg
 
-    elif layer_name is None:
-        layer_name = arg
+        elif outfile is None:
+            outfile = arg
 
-    else:
-        Usage()
-
-if outfile is None:
-    Usage()
+        elif layer_name is None:
+            layer_name = arg
 
-#############################################################################
-# Open the datasource to operate on.
+        else:
+            return Usage()
 
-in_ds = ogr.Open(infile, update=0)
+    if outfile is None:
+        return Usage()
 
-if layer_name is not None:
-    in_layer = in_ds.GetLayerByName(layer_name)
-else:
-    in_layer = in_ds.GetLayer(0)
+    #########################################################################
+    # Open the datasource to operate on.
 
-in_defn = in_layer.GetLayerDefn()
+    in_ds = ogr.Open(infile, update=0)
 
-#############################################################################
-# Create output file with similar information.
-
-shp_driver = ogr.GetDriverByName('ESRI Shapefile')
-shp_driver.DeleteDataSource(outfile)
-
-shp_ds = shp_driver.CreateDataSource(outfile)
-
-shp_layer = shp_ds.CreateLayer(in_defn.GetName(),
-                               geom_type=in_defn.GetGeomType(),
-                               srs=in_layer.GetSpatialRef())
-
-in_field_count = in_defn.GetFieldCount()
-
-for fld_index in range(in_field_count):
-    src_fd = in_defn.GetFieldDefn(fld_index)
-
-    fd = ogr.FieldDefn(src_fd.GetName(), src_fd.GetType())
-    fd.SetWidth(src_fd.GetWidth())
-    fd.SetPrecision(src_fd.GetPrecision())
-    shp_layer.CreateField(fd)
-
-#############################################################################
-# Process all features in input layer.
+    if layer_name is not None:
+        in_layer = in_ds.GetLayerByName(layer_name)
+    else:
+        in_layer = in_ds.GetLayer(0)
 
-in_feat = in_layer.GetNextFeature()
-while in_feat is not None:
+    #########################################################################
+    # Create output file with similar information, and process all
+    # features of the input layer.
 
-    geom = in_feat.GetGeometryRef().Clone()
+    shp_ds, shp_layer = CreateOutputLayer(in_layer, outfile)
 
-    geom = WalkAndTransform(geom)
+    ApplyCoordinateFunction(in_layer, shp_layer, TransformCoordinates)
 
-    out_feat = ogr.Feature(feature_def=shp_layer.GetLayerDefn())
-    out_feat.SetFrom(in_feat)
-    out_feat.SetGeometryDirectly(geom)
+    #########################################################################
+    # Cleanup
 
-    shp_layer.CreateFeature(out_feat)
-    out_feat.Destroy()
+    shp_ds.FlushCache()
+    del shp_ds
+    in_ds = None
 
-    in_feat.Destroy()
-    in_feat = in_layer.GetNextFeature()
+    return 0
 
-#############################################################################
-# Cleanup
 
-shp_ds.Destroy()
-in_ds.Destroy()
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
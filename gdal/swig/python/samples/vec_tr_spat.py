@@ -32,122 +32,107 @@ import sys
 
 from osgeo import ogr
 
+from vec_tr_util import CopyFeatures, CreateOutputLayer
+
 #############################################################################
 
 
 def Usage():
     print('Usage: vec_tr_spat.py [-spat xmin ymin xmax ymax] infile outfile [layer]')
     print('')
-    sys.exit(1)
+    return 1
 
 #############################################################################
-# Argument processing.
-
-
-infile = None
-outfile = None
-layer_name = None
-
-i = 1
-while i < len(sys.argv):
-    arg = sys.argv[i]
-
-    if arg == '-spat':
-        s_minx = int(sys.argv[i + 1])
-        s_miny = int(sys.argv[i + 2])
-        s_maxx = int(sys.argv[i + 3])
-        s_maxy = int(sys.argv[i + 4])
-        i = i + 4
-
-    elif infile is None:
-        infile = arg
-
-    elif outfile is None:
-        outfile = arg
-
-    elif layer_name is None:
-        layer_name = arg
 
-    else:
-        Usage()
 
-    i = i + 1
+def main(argv):
 
-if outfile is None:
-    Usage()
+    infile = None
+    outfile = None
+    layer_name = None
+    spat = None
 
-#############################################################################
-# Open the datasource to operate on.
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
 
-in_ds = ogr.Open(infile, update=0)
+        if arg == '-spat':
+            if i + 4 >= len(argv):
+                print('-spat requires 4 values: xmin ymin xmax ymax')
+                return Usage()
+            try:
+                spat = [float(v) for v in argv[i + 1:i + 5]]
+            except ValueError:
+                print('Invalid -spat values: %s' % ' '.join(argv[i + 1:i + 5]))
+                return Usage()
+            i = i + 4
 
-if layer_name is not None:
-    in_layer = in_ds.GetLayerByName(layer_name)
-else:
-    in_layer = in_ds.GetLayer(0)
+        elif infile is None:
+            infile = arg
 
-in_defn = in_layer.GetLayerDefn()
+        elif outfile is None:
+            outfile = arg
 
-#############################################################################
-# Create output file with similar information.
+        elif layer_name is None:
+            layer_name = arg
 
-shp_driver = ogr.GetDriverByName('ESRI Shapefile')
-shp_driver.DeleteDataSource(outfile)
+        else:
+            return Usage()
 
-shp_ds = shp_driver.CreateDataSource(outfile)
+        i = i + 1
 
-shp_layer = shp_ds.CreateLayer(in_defn.GetName(),
-                               geom_type=in_defn.GetGeomType(),
-                               srs=in_layer.GetSpatialRef())
+    if outfile is None:
+        return Usage()
 
-in_field_count = in_defn.GetFieldCount()
+    #########################################################################
+    # Open the datasource to operate on.
 
-for fld_index in range(in_field_count):
-    src_fd = in_defn.GetFieldDefn(fld_index)
+    in_ds = ogr.Open(infile, update=0)
 
-    fd = ogr.FieldDefn(src_fd.GetName(), src_fd.GetType())
-    fd.SetWidth(src_fd.GetWidth())
-    fd.SetPrecision(src_fd.GetPrecision())
-    shp_layer.CreateField(fd)
+    if layer_name is not None:
+        in_layer = in_ds.GetLayerByName(layer_name)
+    else:
+        in_layer = in_ds.GetLayer(0)
 
-#############################################################################
-# Apply spatial query.
+    #########################################################################
+    # Create output file with similar information.
 
-in_layer.SetSpatialFilterRect(s_minx, s_miny, s_maxx, s_maxy)
+    shp_ds, shp_layer = CreateOutputLayer(in_layer, outfile)
 
-#############################################################################
-# Setup rect geometry to try intersect with.
+    #########################################################################
+    # Apply spatial query, and setup rect geometry to try intersect with.
 
-ring = ogr.Geometry(ogr.wkbLinearRing)
-ring.AddPoint_2D(s_minx, s_miny)
-ring.AddPoint_2D(s_maxx, s_miny)
-ring.AddPoint_2D(s_maxx, s_maxy)
-ring.AddPoint_2D(s_minx, s_maxy)
-ring.AddPoint_2D(s_minx, s_miny)
+    filt_geom = None
+    if spat is not None:
+        s_minx, s_miny, s_maxx, s_maxy = spat
+        in_layer.SetSpatialFilterRect(s_minx, s_miny, s_maxx, s_maxy)
 
-filt_geom = ogr.Geometry(ogr.wkbPolygon)
-filt_geom.AddGeometry(ring)
+        ring = ogr.Geometry(ogr.wkbLinearRing)
+        ring.AddPoint_2D(s_minx, s_miny)
+        ring.AddPoint_2D(s_maxx, s_miny)
+        ring.AddPoint_2D(s_maxx, s_maxy)
+        ring.AddPoint_2D(s_minx, s_maxy)
+        ring.AddPoint_2D(s_minx, s_miny)
 
-#############################################################################
-# Process all features in input layer.
+        filt_geom = ogr.Geometry(ogr.wkbPolygon)
+        filt_geom.AddGeometry(ring)
 
-in_feat = in_layer.GetNextFeature()
-while in_feat is not None:
+    #########################################################################
+    # Process all features in input layer. The geometries are copied
+    # unchanged: see vec_tr.ApplyCoordinateFunction() to transform them by
+    # batches.
 
-    geom = in_feat.GetGeometryRef()
+    CopyFeatures(in_layer, shp_layer, filter_geom=filt_geom)
 
-    if geom.Intersect(filt_geom) != 0:
-        out_feat = ogr.Feature(feature_def=shp_layer.GetLayerDefn())
-        out_feat.SetFrom(in_feat)
+    #########################################################################
+    # Cleanup
 
-        shp_layer.CreateFeature(out_feat)
-        out_feat.Destroy()
+    shp_ds.FlushCache()
+    del shp_ds
+    in_ds = None
 
-    in_feat.Destroy()
-    in_feat = in_layer.GetNextFeature()
+    return 0
 
-#############################################################################
-# Cleanup
 
-shp_ds.Destroy()
-in_ds.Destroy()
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+###############################################################################
+# $Id$
+#
+# Project:  OGR Python samples
+# Purpose:  Helpers shared by vec_tr.py and vec_tr_spat.py, which do not
+#           require numpy.
+#
+###############################################################################
+# SPDX-License-Identifier: MIT
+###############################################################################
+
+from osgeo import ogr
+
+#############################################################################
+
+
+def CopyFeatures(in_layer, out_layer, transform_geoms=None, filter_geom=None,
+                 batch_size=10000):
+    """Copy the features of in_layer to out_layer.
+
+    Features are processed by batches of batch_size, and each batch is
+    written in a single transaction. If transform_geoms is set, it is called
+    once per batch with the list of the geometries of the batch, and must
+    return the list of the new geometries. If filter_geom is set, only the
+    features whose geometry intersects it are copied. Return the number of
+    features written."""
+
+    out_defn = out_layer.GetLayerDefn()
+    written = 0
+    batch = []
+
+    def flush(batch):
+        geoms = [f.GetGeometryRef() for f in batch]
+        if transform_geoms is not None:
+            geoms = transform_geoms(geoms)
+        out_layer.StartTransaction()
+        for in_feat, geom in zip(batch, geoms):
+            out_feat = ogr.Feature(feature_def=out_defn)
+            out_feat.SetFrom(in_feat)
+            if transform_geoms is not None:
+                out_feat.SetGeometryDirectly(geom)
+            out_layer.CreateFeature(out_feat)
+        out_layer.CommitTransaction()
+        return len(batch)
+
+    for in_feat in in_layer:
+        if filter_geom is not None:
+            geom = in_feat.GetGeometryRef()
+            if geom is None or not geom.Intersects(filter_geom):
+                continue
+        batch.append(in_feat)
+        if len(batch) == batch_size:
+            written += flush(batch)
+            batch = []
+    if batch:
+        written += flush(batch)
+    return written
+
+#############################################################################
+
+
+def CreateOutputLayer(in_layer, outfile):
+    """Create a shapefile with the same layer definition as in_layer."""
+
+    in_defn = in_layer.GetLayerDefn()
+
+    shp_driver = ogr.GetDriverByName('ESRI Shapefile')
+    shp_driver.DeleteDataSource(outfile)
+
+    shp_ds = shp_driver.CreateDataSource(outfile)
+
+    shp_layer = shp_ds.CreateLayer(in_defn.GetName(),
+                                   geom_type=in_defn.GetGeomType(),
+                                   srs=in_layer.GetSpatialRef())
+
+    for fld_index in range(in_defn.GetFieldCount()):
+        src_fd = in_defn.GetFieldDefn(fld_index)
+
+        fd = ogr.FieldDefn(src_fd.GetName(), src_fd.GetType())
+        fd.SetWidth(src_fd.GetWidth())
+        fd.SetPrecision(src_fd.GetPrecision())
+        shp_layer.CreateField(fd)
+
+    return shp_ds, shp_layer
@@ -39,7 +39,9 @@
 
 from __future__ import print_function, division
 
+import array
 import math
+from collections import OrderedDict
 from multiprocessing import Pool
 from functools import partial
 import glob
@@ -57,12 +59,10 @@ from osgeo import osr
 
 try:
     from PIL import Image
-    import numpy
-    import osgeo.gdal_array as gdalarray
-    numpy_available = True
+    pil_available = True
 except ImportError:
     # 'antialias' resampling is not available
-    numpy_available = False
+    pil_available = False
 
 __version__ = "$Id$"
 
@@ -71,6 +71,11 @@ resampling_list = (
     'antialias', 'mode', 'max', 'min', 'med', 'q1', 'q3')
 webviewer_list = ('all', 'google', 'openlayers', 'leaflet', 'mapml', 'none')
 
+# Margin, in tile pixels, read around metatiles for the resampling methods
+# whose kernel extends beyond the source pixels of a target pixel
+metatile_margin_resampling = {'bilinear': 8, 'cubic': 8, 'cubicspline': 8,
+                              'lanczos': 8, 'antialias': 8}
+
 class UnsupportedTileMatrixSet(Exception):
     pass
 
@@ -737,6 +742,15 @@ def generate_kml(tx, ty, tz, tileext, tile_size, tileswne, options, children=Non
     return s
 
 
+def read_pixel_interleaved(ds, xsize, ysize):
+    """Read all the bands of a Byte dataset in a single pixel-interleaved buffer"""
+    nbands = ds.RasterCount
+    return ds.ReadRaster(0, 0, xsize, ysize,
+                         buf_pixel_space=nbands,
+                         buf_line_space=nbands * xsize,
+                         buf_band_space=1)
+
+
 def scale_query_to_tile(dsquery, dstile, tiledriver, options, tilefilename=''):
     """Scales down query dataset to the tile dataset"""
 
@@ -755,19 +769,27 @@ def scale_query_to_tile(dsquery, dstile, tiledriver, options, tilefilename=''):
                 exit_with_error("RegenerateOverview() failed on %s, error %d" % (
                     tilefilename, res))
 
-    elif options.resampling == 'antialias' and numpy_available:
+    elif options.resampling == 'antialias' and pil_available:
 
-        # Scaling by PIL (Python Imaging Library) - improved Lanczos
-        array = numpy.zeros((querysize, querysize, tilebands), numpy.uint8)
-        for i in range(tilebands):
-            array[:, :, i] = gdalarray.BandReadAsArray(dsquery.GetRasterBand(i + 1),
-                                                       0, 0, querysize, querysize)
-        im = Image.fromarray(array, 'RGBA')     # Always four bands
-        im1 = im.resize((tile_size, tile_size), Image.ANTIALIAS)
+        # Scaling by PIL (Python Imaging Library) - improved Lanczos, on the
+        # pixel-interleaved content of the query dataset. The result is written
+        # to dstile, and encoded by the caller as with the other methods.
+        mode = 'RGBA' if tilebands == 4 else 'LA'
+        im = Image.frombytes(mode, (querysize, querysize),
+                             read_pixel_interleaved(dsquery, querysize, querysize))
+        im1 = im.resize((tile_size, tile_size), Image.LANCZOS)
         if os.path.exists(tilefilename):
-            im0 = Image.open(tilefilename)
-            im1 = Image.composite(im1, im0, im1)
-        im1.save(tilefilename, tiledriver)
+            # Composite over the existing tile
+            ds0 = gdal.Open(tilefilename)
+            if ds0 is not None and ds0.RasterCount == tilebands:
+                im0 = Image.frombytes(mode, (tile_size, tile_size),
+                                      read_pixel_interleaved(ds0, tile_size, tile_size))
+                im1 = Image.composite(im1, im0, im1.split()[-1])
+            ds0 = None
+        dstile.WriteRaster(0, 0, tile_size, tile_size, im1.tobytes(),
+                           buf_pixel_space=tilebands,
+                           buf_line_space=tilebands * tile_size,
+                           buf_band_space=1)
 
     else:
 
@@ -1064,7 +1086,39 @@ def nb_data_bands(dataset):
         return dataset.RasterCount - 1
     return dataset.RasterCount
 
+def get_tile_source_dataset(tile_job_info):
+    """Return the dataset from which base tiles are read, opened once per thread"""
+    cached_ds = getattr(threadLocal, 'cached_ds', None)
+    if cached_ds and cached_ds.GetDescription() == tile_job_info.src_file:
+        return cached_ds
+    ds = gdal.Open(tile_job_info.src_file, gdal.GA_ReadOnly)
+    threadLocal.cached_ds = ds
+    return ds
+
+
+def write_base_tile_kml(tile_job_info, tx, ty, tz, swne):
+    """Write the KML file of a base tile, whose bounds were computed by get_tiles_swne()"""
+    options = tile_job_info.options
+    if swne is not None:
+        kmlfilename = os.path.join(tile_job_info.output_file_path, str(tz), str(tx),
+                                   '%d.kml' % GDAL2Tiles.getYTile(ty, tz, options))
+        if not options.resume or not os.path.exists(kmlfilename):
+            with open(kmlfilename, 'wb') as f:
+                f.write(generate_kml(
+                    tx, ty, tz, tile_job_info.tile_extension, tile_job_info.tile_size,
+                    lambda x, y, z: swne, tile_job_info.options
+                ).encode('utf-8'))
+
+
 def create_base_tile(tile_job_info, tile_detail):
+    """
+    Generate a base tile (or the tiles of a metatile) from the input raster, and return the
+    list of (tz, tx, ty) of the processed tiles: the written tiles, and the fully transparent
+    tiles skipped with --exclude.
+    """
+
+    if tile_detail.tiles is not None:
+        return create_base_metatile(tile_job_info, tile_detail)
 
     dataBandsCount = tile_job_info.nb_data_bands
     output = tile_job_info.output_file_path
@@ -1074,12 +1128,7 @@ def create_base_tile(tile_job_info, tile_detail):
 
     tilebands = dataBandsCount + 1
 
-    cached_ds = getattr(threadLocal, 'cached_ds', None)
-    if cached_ds and cached_ds.GetDescription() == tile_job_info.src_file:
-        ds = cached_ds
-    else:
-        ds = gdal.Open(tile_job_info.src_file, gdal.GA_ReadOnly)
-        threadLocal.cached_ds = ds
+    ds = get_tile_source_dataset(tile_job_info)
 
     mem_drv = gdal.GetDriverByName('MEM')
     out_drv = gdal.GetDriverByName(tile_job_info.tile_driver)
@@ -1117,7 +1166,7 @@ def create_base_tile(tile_job_info, tile_detail):
 
         # Detect totally transparent tile and skip its creation
         if tile_job_info.exclude_transparent and len(alpha) == alpha.count('\x00'.encode('ascii')):
-            return
+            return [(tz, tx, ty)]
 
         data = ds.ReadRaster(rx, ry, rxsize, rysize, wxsize, wysize,
                              band_list=list(range(1, dataBandsCount + 1)))
@@ -1151,28 +1200,115 @@ def create_base_tile(tile_job_info, tile_detail):
 
     del data
 
-    if options.resampling != 'antialias':
-        # Write a copy of tile to png/jpg
-        out_drv.CreateCopy(tilefilename, dstile, strict=0)
+    # Write a copy of tile to png/jpg
+    out_drv.CreateCopy(tilefilename, dstile, strict=0)
 
     del dstile
 
     # Create a KML file for this tile.
     if tile_job_info.kml:
-        swne = get_tile_swne(tile_job_info, options)
-        if swne is not None:
-            kmlfilename = os.path.join(output, str(tz), str(tx), '%d.kml' % GDAL2Tiles.getYTile(ty, tz, options))
-            if not options.resume or not os.path.exists(kmlfilename):
-                with open(kmlfilename, 'wb') as f:
-                    f.write(generate_kml(
-                        tx, ty, tz, tile_job_info.tile_extension, tile_job_info.tile_size,
-                        swne, tile_job_info.options
-                    ).encode('utf-8'))
+        write_base_tile_kml(tile_job_info, tx, ty, tz, tile_detail.swne)
+
+    return [(tz, tx, ty)]
+
+
+def create_base_metatile(tile_job_info, tile_detail):
+    """
+    Same as create_base_tile(), for a metatile: the block of tiles listed in tile_detail.tiles
+    is read and scaled at once, with a margin of tile_detail.margin pixels around it, and
+    then cut into tiles.
+    """
 
+    dataBandsCount = tile_job_info.nb_data_bands
+    output = tile_job_info.output_file_path
+    tileext = tile_job_info.tile_extension
+    tile_size = tile_job_info.tile_size
+    options = tile_job_info.options
 
+    tilebands = dataBandsCount + 1
+
+    ds = get_tile_source_dataset(tile_job_info)
+
+    mem_drv = gdal.GetDriverByName('MEM')
+    out_drv = gdal.GetDriverByName(tile_job_info.tile_driver)
+    alphaband = ds.GetRasterBand(1).GetMaskBand()
+
+    rx, ry = tile_detail.rx, tile_detail.ry
+    rxsize, rysize = tile_detail.rxsize, tile_detail.rysize
+    wx, wy = tile_detail.wx, tile_detail.wy
+    wxsize, wysize = tile_detail.wxsize, tile_detail.wysize
+    querysize = tile_detail.querysize
+    metasize = tile_detail.metasize
+    margin = tile_detail.margin
+
+    if options.verbose:
+        print("\tReadRaster Extent of metatile: ",
+              (rx, ry, rxsize, rysize), (wx, wy, wxsize, wysize))
+
+    dsmeta = mem_drv.Create('', metasize, metasize, tilebands)
+
+    if rxsize != 0 and rysize != 0 and wxsize != 0 and wysize != 0:
+        alpha = alphaband.ReadRaster(rx, ry, rxsize, rysize, wxsize, wysize)
+
+        # Detect totally transparent metatile and skip the creation of its tiles
+        if tile_job_info.exclude_transparent and len(alpha) == alpha.count('\x00'.encode('ascii')):
+            return [(tile_detail.tz, tx, ty) for tx, ty, _, _, _ in tile_detail.tiles]
+
+        data = ds.ReadRaster(rx, ry, rxsize, rysize, wxsize, wysize,
+                             band_list=list(range(1, dataBandsCount + 1)))
+
+        if metasize == querysize:
+            dsmeta.WriteRaster(wx, wy, wxsize, wysize, data,
+                               band_list=list(range(1, dataBandsCount + 1)))
+            dsmeta.WriteRaster(wx, wy, wxsize, wysize, alpha, band_list=[tilebands])
+        else:
+            dsquery = mem_drv.Create('', querysize, querysize, tilebands)
+            dsquery.WriteRaster(wx, wy, wxsize, wysize, data,
+                                band_list=list(range(1, dataBandsCount + 1)))
+            dsquery.WriteRaster(wx, wy, wxsize, wysize, alpha, band_list=[tilebands])
+
+            scale_query_to_tile(dsquery, dsmeta, tile_job_info.tile_driver, options,
+                                tilefilename='metatile %d/%d/%d' % (
+                                    tile_detail.tz, tile_detail.tx, tile_detail.ty))
+            del dsquery
 
-def create_overview_tiles(tile_job_info, output_folder, options):
-    """Generation of the overview tiles (higher in the pyramid) based on existing tiles"""
+        del data
+
+    processed = []
+    dstile = mem_drv.Create('', tile_size, tile_size, tilebands)
+    for tx, ty, col, row, swne in tile_detail.tiles:
+        xoff = margin + col * tile_size
+        yoff = margin + row * tile_size
+
+        if tile_job_info.exclude_transparent:
+            alpha = dsmeta.GetRasterBand(tilebands).ReadRaster(xoff, yoff, tile_size, tile_size)
+            if len(alpha) == alpha.count('\x00'.encode('ascii')):
+                processed.append((tile_detail.tz, tx, ty))
+                continue
+
+        dstile.WriteRaster(0, 0, tile_size, tile_size,
+                           dsmeta.ReadRaster(xoff, yoff, tile_size, tile_size))
+
+        tilefilename = os.path.join(
+            output, str(tile_detail.tz), str(tx), "%s.%s" % (ty, tileext))
+        out_drv.CreateCopy(tilefilename, dstile, strict=0)
+        processed.append((tile_detail.tz, tx, ty))
+
+        # Create a KML file for this tile.
+        if tile_job_info.kml:
+            write_base_tile_kml(tile_job_info, tx, ty, tile_detail.tz, swne)
+
+    del dstile
+    del dsmeta
+
+    return processed
+
+
+def create_overview_tiles(tile_job_info, output_folder, options, manifest=None):
+    """
+    Generation of the overview tiles (higher in the pyramid) based on existing tiles.
+    The processed tiles are recorded in manifest, if given (with --resume)
+    """
     mem_driver = gdal.GetDriverByName('MEM')
     tile_driver = tile_job_info.tile_driver
     out_driver = gdal.GetDriverByName(tile_driver)
@@ -1197,8 +1333,22 @@ def create_overview_tiles(tile_job_info, output_folder, options):
     progress_bar = ProgressBar(tcount)
     progress_bar.start()
 
+    # Tile bounds for KML, computed by rows of tiles. Only the current level
+    # and the level of the children are kept.
+    swne_grids = {}
+    # (tz, tx) of the tile directories known to exist
+    created_dirs = set()
+
+    def tile_swne(x, y, z):
+        return swne_grids[z](x, y, z)
+
     for tz in range(tile_job_info.tmaxz - 1, tile_job_info.tminz - 1, -1):
         tminx, tminy, tmaxx, tmaxy = tile_job_info.tminmax[tz]
+        if tile_job_info.kml:
+            swne_grids = {
+                tz: TileSwneGrid(tile_job_info, options, tz),
+                tz + 1: swne_grids.get(tz + 1) or TileSwneGrid(tile_job_info, options, tz + 1),
+            }
         for ty in range(tmaxy, tminy - 1, -1):
             for tx in range(tminx, tmaxx + 1):
 
@@ -1212,7 +1362,8 @@ def create_overview_tiles(tile_job_info, output_folder, options):
                 if options.verbose:
                     print(ti, '/', tcount, tilefilename)
 
-                if options.resume and os.path.exists(tilefilename):
+                if options.resume and (manifest.contains(tz, tx, ytile) if manifest is not None
+                                       else os.path.exists(tilefilename)):
                     if options.verbose:
                         print("Tile generation skipped because of --resume")
                     else:
@@ -1220,8 +1371,10 @@ def create_overview_tiles(tile_job_info, output_folder, options):
                     continue
 
                 # Create directories for the tile
-                if not os.path.exists(os.path.dirname(tilefilename)):
-                    os.makedirs(os.path.dirname(tilefilename))
+                if (tz, tx) not in created_dirs:
+                    if not os.path.exists(os.path.dirname(tilefilename)):
+                        os.makedirs(os.path.dirname(tilefilename))
+                    created_dirs.add((tz, tx))
 
                 dsquery = mem_driver.Create('', 2 * tile_job_info.tile_size,
                                             2 * tile_job_info.tile_size, tilebands)
@@ -1278,9 +1431,7 @@ def create_overview_tiles(tile_job_info, output_folder, options):
                     scale_query_to_tile(dsquery, dstile, tile_driver, options,
                                         tilefilename=tilefilename)
                     # Write a copy of tile to png/jpg
-                    if options.resampling != 'antialias':
-                        # Write a copy of tile to png/jpg
-                        out_driver.CreateCopy(tilefilename, dstile, strict=0)
+                    out_driver.CreateCopy(tilefilename, dstile, strict=0)
 
                     if options.verbose:
                         print("\tbuild from zoom", tz + 1,
@@ -1288,17 +1439,19 @@ def create_overview_tiles(tile_job_info, output_folder, options):
                               (2 * tx, 2 * ty + 1), (2 * tx + 1, 2 * ty + 1))
 
                     # Create a KML file for this tile.
-                    if tile_job_info.kml:
-                        swne = get_tile_swne(tile_job_info, options)
-                        if swne is not None:
-                            with open(os.path.join(
-                                output_folder,
-                                '%d/%d/%d.kml' % (tz, tx, ytile)
-                            ), 'wb') as f:
-                                f.write(generate_kml(
-                                    tx, ty, tz, tile_job_info.tile_extension, tile_job_info.tile_size,
-                                    swne, options, children
-                                ).encode('utf-8'))
+                    if tile_job_info.kml and swne_grids[tz].supported:
+                        with open(os.path.join(
+                            output_folder,
+                            '%d/%d/%d.kml' % (tz, tx, ytile)
+                        ), 'wb') as f:
+                            f.write(generate_kml(
+                                tx, ty, tz, tile_job_info.tile_extension, tile_job_info.tile_size,
+                                tile_swne, options, children
+                            ).encode('utf-8'))
+
+                # Also recorded without children, i.e. when the base tiles are fully transparent
+                if manifest is not None:
+                    manifest.add(tz, tx, ytile)
 
                 if not options.verbose and not options.quiet:
                     progress_bar.log_progress()
@@ -1347,6 +1500,10 @@ def optparse_init():
     p.add_option("--tilesize", dest="tilesize",  metavar="PIXELS", default=256,
                  type='int',
                  help="Width and height in pixel of a tile")
+    p.add_option("--metatile", dest="metatile", metavar="N", default=1,
+                 type='int',
+                 help=("Read and resample the base tiles by blocks of NxN tiles, "
+                       "and then cut them. Not used with the raster profile"))
 
     # KML options
     g = OptionGroup(p, "KML (Google Earth) options",
@@ -1440,9 +1597,12 @@ def options_post_processing(options, input_file, output_folder):
         options.url += os.path.basename(out_path) + '/'
 
     # Supported options
-    if options.resampling == 'antialias' and not numpy_available:
+    if options.metatile < 1:
+        exit_with_error("--metatile should be at least 1")
+
+    if options.resampling == 'antialias' and not pil_available:
         exit_with_error("'antialias' resampling algorithm is not available.",
-                        "Install PIL (Python Imaging Library) and numpy.")
+                        "Install PIL (Python Imaging Library).")
 
     try:
         os.path.basename(input_file).encode('ascii')
@@ -1484,6 +1644,13 @@ class TileDetail(object):
     wxsize = 0
     wysize = 0
     querysize = 0
+    # Bounds of the tile in EPSG:4326, for KML
+    swne = None
+    # Metatiles only: list of (tx, ty, column, row, swne) of the tiles, size of
+    # the scaled metatile, and margin around its tiles.
+    tiles = None
+    metasize = 0
+    margin = 0
 
     def __init__(self, **kwargs):
         for key in kwargs:
@@ -1536,6 +1703,116 @@ class TileJobInfo(object):
         return "TileJobInfo %s\n" % (self.src_file)
 
 
+class TileManifest(object):
+    """
+    Append-only record of the tiles processed in the output folder, written and used with
+    --resume instead of checking the existence of each tile file. The fully transparent tiles
+    skipped with --exclude are recorded too, so that they are not processed again.
+
+    The manifest file has one 'tz tx ty' line per tile, ty being the y number of the tile
+    file. It is flushed and fsynced every SYNC_INTERVAL tiles, so that an interrupted run
+    only regenerates the tiles processed since the last synchronization. At startup, its
+    content is loaded into one bitmap per zoom level. When resuming without a manifest,
+    it is rebuilt from a single walk of the output folder.
+    """
+    FILENAME = 'gdal2tiles.manifest'
+    SYNC_INTERVAL = 1000
+
+    def __init__(self, output_folder, tileext, tminmax, tminz, tmaxz, options):
+        self.filename = os.path.join(output_folder, self.FILENAME)
+
+        # tz -> (minx, miny, width, height, bitmap) over the tile range of the zoom level
+        self.bitmaps = {}
+        for tz in range(tminz, tmaxz + 1):
+            tminx, tminy, tmaxx, tmaxy = tminmax[tz]
+            y1 = GDAL2Tiles.getYTile(tminy, tz, options)
+            y2 = GDAL2Tiles.getYTile(tmaxy, tz, options)
+            width, height = tmaxx - tminx + 1, abs(y2 - y1) + 1
+            self.bitmaps[tz] = (tminx, min(y1, y2), width, height,
+                                bytearray((width * height + 7) // 8))
+
+        if not os.path.exists(output_folder):
+            os.makedirs(output_folder)
+
+        if os.path.exists(self.filename):
+            self._load()
+            self.fp = open(self.filename, 'a')
+        else:
+            tiles = self._scan(output_folder, tileext)
+            self.fp = open(self.filename, 'w')
+            for tile in tiles:
+                self.fp.write('%d %d %d\n' % tile)
+        self.nb_pending = 0
+        self.sync()
+
+    def _set(self, tz, tx, ty):
+        if tz not in self.bitmaps:
+            return
+        minx, miny, width, height, bitmap = self.bitmaps[tz]
+        if minx <= tx < minx + width and miny <= ty < miny + height:
+            i = (ty - miny) * width + tx - minx
+            bitmap[i >> 3] |= 1 << (i & 7)
+
+    def _load(self):
+        with open(self.filename, 'r') as f:
+            for line in f:
+                tile = line.split()
+                # Skip a last line truncated by an interrupted run
+                if len(tile) == 3 and line.endswith('\n'):
+                    self._set(int(tile[0]), int(tile[1]), int(tile[2]))
+
+    def _scan(self, output_folder, tileext):
+        """Find the existing tiles of the zoom levels being generated, and return them"""
+        tiles = []
+        suffix = '.' + tileext
+        for root, _, files in os.walk(output_folder):
+            dirs = os.path.relpath(root, output_folder).split(os.sep)
+            if len(dirs) != 2 or not (dirs[0].isdigit() and dirs[1].isdigit()):
+                continue
+            tz, tx = int(dirs[0]), int(dirs[1])
+            if tz not in self.bitmaps:
+                continue
+            for f in files:
+                if f.endswith(suffix) and f[:-len(suffix)].isdigit():
+                    tile = (tz, tx, int(f[:-len(suffix)]))
+                    self._set(*tile)
+                    tiles.append(tile)
+        return tiles
+
+    def contains(self, tz, tx, ty):
+        """Return whether the tile has already been processed"""
+        if tz not in self.bitmaps:
+            return False
+        minx, miny, width, height, bitmap = self.bitmaps[tz]
+        if not (minx <= tx < minx + width and miny <= ty < miny + height):
+            return False
+        i = (ty - miny) * width + tx - minx
+        return (bitmap[i >> 3] >> (i & 7)) & 1 == 1
+
+    def add(self, tz, tx, ty):
+        """Record a tile that has been processed"""
+        self._set(tz, tx, ty)
+        self.fp.write('%d %d %d\n' % (tz, tx, ty))
+        self.nb_pending += 1
+        if self.nb_pending >= self.SYNC_INTERVAL:
+            self.sync()
+
+    def add_tiles(self, tiles):
+        for tile in tiles:
+            self.add(*tile)
+
+    def sync(self):
+        self.fp.flush()
+        os.fsync(self.fp.fileno())
+        self.nb_pending = 0
+
+    def close(self):
+        if self.fp is not None:
+            self.sync()
+            self.fp.close()
+            self.fp = None
+
+
 class Gdal2TilesError(Exception):
     pass
 
@@ -1558,6 +1835,7 @@ class GDAL2Tiles(object):
         self.out_gt = None
         self.tileswne = None
         self.swne = None
+        self.manifest = None
         self.ominx = None
         self.omaxx = None
         self.omaxy = None
@@ -2066,6 +2344,17 @@ class GDAL2Tiles(object):
         ti = 0
 
         tile_details = []
+        # tx of the tile directories known to exist
+        created_dirs = set()
+
+        if not self.options.resume:
+            # A manifest left by a previous run would not be updated by this one
+            manifest_filename = os.path.join(self.output_folder, TileManifest.FILENAME)
+            if os.path.exists(manifest_filename):
+                os.unlink(manifest_filename)
+        elif self.manifest is None:
+            self.manifest = TileManifest(self.output_folder, self.tileext, self.tminmax,
+                                         self.tminz, self.tmaxz, self.options)
 
         tz = self.tmaxz
         for ty in range(tmaxy, tminy - 1, -1):
@@ -2078,14 +2367,16 @@ class GDAL2Tiles(object):
                 if self.options.verbose:
                     print(ti, '/', tcount, tilefilename)
 
-                if self.options.resume and os.path.exists(tilefilename):
+                if self.options.resume and self.manifest.contains(tz, tx, ytile):
                     if self.options.verbose:
                         print("Tile generation skipped because of --resume")
                     continue
 
                 # Create directories for the tile
-                if not os.path.exists(os.path.dirname(tilefilename)):
-                    os.makedirs(os.path.dirname(tilefilename))
+                if tx not in created_dirs:
+                    if not os.path.exists(os.path.dirname(tilefilename)):
+                        os.makedirs(os.path.dirname(tilefilename))
+                    created_dirs.add(tx)
 
                 if self.options.profile == 'mercator':
                     # Tile bounds in EPSG:3857
@@ -2170,8 +2461,81 @@ class GDAL2Tiles(object):
             exclude_transparent=self.options.exclude_transparent,
         )
 
+        # Compute the bounds of the tiles by chunks, instead of in each worker,
+        # so that the temporary lists do not grow with the number of tiles
+        if self.kml:
+            chunk_size = 4096
+            for start in range(0, len(tile_details), chunk_size):
+                chunk = tile_details[start:start + chunk_size]
+                tiles_swne = get_tiles_swne(conf, self.options, tz,
+                                            [(td.tx, td.ty) for td in chunk])
+                if tiles_swne is None:
+                    break
+                for tile_detail, swne in zip(chunk, tiles_swne):
+                    tile_detail.swne = swne
+
+        if self.options.metatile > 1 and self.options.profile != 'raster':
+            tile_details = self.group_into_metatiles(ds, tile_details, tz)
+
         return conf, tile_details
 
+    def tile_bounds(self, tx, ty, tz):
+        """Bounds of a tile (TMS numbering) in the output SRS, for non-raster profiles"""
+        if self.options.profile == 'mercator':
+            return self.mercator.TileBounds(tx, ty, tz)
+        if self.options.profile == 'geodetic':
+            return self.geodetic.TileBounds(tx, ty, tz)
+        return tmsMap[self.options.profile].TileBounds(tx, ty, tz, self.tile_size)
+
+    def group_into_metatiles(self, ds, tile_details, tz):
+        """
+        Group the tiles of tile_details into metatiles of --metatile x --metatile tiles, aligned
+        on multiples of --metatile, so that create_base_tile() reads each metatile at once
+        """
+        nb_tiles = self.options.metatile
+        margin = metatile_margin_resampling.get(self.options.resampling, 0)
+        metasize = nb_tiles * self.tile_size + 2 * margin
+        querysize = metasize * self.querysize // self.tile_size
+
+        blocks = OrderedDict()
+        for tile_detail in tile_details:
+            # Back to TMS numbering
+            ty = GDAL2Tiles.getYTile(tile_detail.ty, tz, self.options)
+            key = (tile_detail.tx // nb_tiles, ty // nb_tiles)
+            blocks.setdefault(key, []).append(
+                (tile_detail.tx, tile_detail.ty, ty, tile_detail.swne))
+
+        metatile_details = []
+        for (bx, by), tiles in blocks.items():
+            tx0, ty0 = bx * nb_tiles, by * nb_tiles
+            minx, miny = self.tile_bounds(tx0, ty0, tz)[0:2]
+            maxx, maxy = self.tile_bounds(tx0 + nb_tiles - 1, ty0 + nb_tiles - 1, tz)[2:4]
+            xmargin = margin * (maxx - minx) / (nb_tiles * self.tile_size)
+            ymargin = margin * (maxy - miny) / (nb_tiles * self.tile_size)
+
+            rb, wb = self.geo_query(ds, minx - xmargin, maxy + ymargin,
+                                    maxx + xmargin, miny - ymargin, querysize=querysize)
+            rx, ry, rxsize, rysize = rb
+            wx, wy, wxsize, wysize = wb
+
+            metatile_details.append(
+                TileDetail(
+                    tx=tx0, ty=GDAL2Tiles.getYTile(ty0 + nb_tiles - 1, tz, self.options), tz=tz,
+                    rx=rx, ry=ry, rxsize=rxsize, rysize=rysize,
+                    wx=wx, wy=wy, wxsize=wxsize, wysize=wysize, querysize=querysize,
+                    metasize=metasize, margin=margin,
+                    # Rows of the metatile go from north to south
+                    tiles=[(tx, ytile, tx - tx0, ty0 + nb_tiles - 1 - ty, swne)
+                           for tx, ytile, ty, swne in tiles],
+                )
+            )
+
+        if self.options.verbose:
+            print("%d tiles grouped into %d metatiles" % (len(tile_details),
+                                                          len(metatile_details)))
+
+        return metatile_details
+
     def geo_query(self, ds, ulx, uly, lrx, lry, querysize=0):
         """
         For given dataset and query in cartographic coordinates returns parameters for ReadRaster()
@@ -3048,7 +3412,7 @@ def worker_tile_details(input_file, output_folder, options):
     gdal2tiles.open_input()
     gdal2tiles.generate_metadata()
     tile_job_info, tile_details = gdal2tiles.generate_base_tiles()
-    return tile_job_info, tile_details
+    return tile_job_info, tile_details, gdal2tiles.manifest
 
 class ProgressBar(object):
 
@@ -3080,46 +3444,87 @@ class ProgressBar(object):
         sys.stdout.flush()
 
 
-def get_tile_swne(tile_job_info, options):
+def get_tiles_swne(tile_job_info, options, tz, tiles):
+    """
+    Return the (south, west, north, east) bounds in EPSG:4326 of the tiles of zoom level tz
+    given as a list of (tx, ty), or None if KML is not supported for the profile.
+    In the raster profile, the coordinate transformation is created once, and the corners of
+    all the tiles are transformed in a single call.
+    """
     if options.profile == 'mercator':
-        mercator = GlobalMercator()
-        tile_swne = mercator.TileLatLonBounds
-    elif options.profile == 'geodetic':
-        geodetic = GlobalGeodetic(options.tmscompatible)
-        tile_swne = geodetic.TileLatLonBounds
-    elif options.profile == 'raster':
+        tile_swne = GlobalMercator().TileLatLonBounds
+        return [tile_swne(tx, ty, tz) for tx, ty in tiles]
+    if options.profile == 'geodetic':
+        tile_swne = GlobalGeodetic(options.tmscompatible).TileLatLonBounds
+        return [tile_swne(tx, ty, tz) for tx, ty in tiles]
+    if options.profile != 'raster':
+        return None
+    if not (tile_job_info.kml and tile_job_info.in_srs_wkt):
+        return [(0, 0, 0, 0)] * len(tiles)
+
+    gt = tile_job_info.out_geo_trans
+    tile_size = tile_job_info.tile_size
+    pixelsizex = (2 ** (tile_job_info.tmaxz - tz) * gt[1])
+    # South-west and north-east corners of each tile
+    corners = []
+    for x, y in tiles:
+        west = gt[0] + x * tile_size * pixelsizex
+        east = west + tile_size * pixelsizex
+        if options.xyz:
+            north = gt[3] - y * tile_size * pixelsizex
+            south = north - tile_size * pixelsizex
+        else:
+            south = tile_job_info.ominy + y * tile_size * pixelsizex
+            north = south + tile_size * pixelsizex
+        corners.append((west, south))
+        corners.append((east, north))
+
+    if not tile_job_info.is_epsg_4326 and corners:
+        # Transformation to EPSG:4326 (WGS84 datum)
         srs4326 = osr.SpatialReference()
         srs4326.ImportFromEPSG(4326)
         srs4326.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-        if tile_job_info.kml and tile_job_info.in_srs_wkt:
-            in_srs = osr.SpatialReference()
-            in_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-            in_srs.ImportFromWkt(tile_job_info.in_srs_wkt)
-            ct = osr.CoordinateTransformation(in_srs, srs4326)
-
-            def rastertileswne(x, y, z):
-                pixelsizex = (2 ** (tile_job_info.tmaxz - z) * tile_job_info.out_geo_trans[1])
-                west = tile_job_info.out_geo_trans[0] + x * tile_job_info.tile_size * pixelsizex
-                east = west + tile_job_info.tile_size * pixelsizex
-                if options.xyz:
-                    north = tile_job_info.out_geo_trans[3] - y * tile_job_info.tile_size * pixelsizex
-                    south = north - tile_job_info.tile_size * pixelsizex
-                else:
-                    south = tile_job_info.ominy + y * tile_job_info.tile_size * pixelsizex
-                    north = south + tile_job_info.tile_size * pixelsizex
-                if not tile_job_info.is_epsg_4326:
-                    # Transformation to EPSG:4326 (WGS84 datum)
-                    west, south = ct.TransformPoint(west, south)[:2]
-                    east, north = ct.TransformPoint(east, north)[:2]
-                return south, west, north, east
-
-            tile_swne = rastertileswne
-        else:
-            tile_swne = lambda x, y, z: (0, 0, 0, 0)   # noqa
-    else:
-        tile_swne = None
+        in_srs = osr.SpatialReference()
+        in_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+        in_srs.ImportFromWkt(tile_job_info.in_srs_wkt)
+        ct = osr.CoordinateTransformation(in_srs, srs4326)
+        corners = ct.TransformPoints(corners)
 
-    return tile_swne
+    return [(corners[2 * i][1], corners[2 * i][0], corners[2 * i + 1][1], corners[2 * i + 1][0])
+            for i in range(len(tiles))]
+
+
+class TileSwneGrid(object):
+    """
+    Bounds in EPSG:4326 of the tiles of a zoom level, computed by get_tiles_swne() one row of tiles
+    at a time, when first requested. Only the last rows used are kept, so that memory does not grow
+    with the number of tiles of the level. Instances can be used as the tileswne argument of
+    generate_kml().
+    """
+
+    MAX_ROWS = 4
+
+    def __init__(self, tile_job_info, options, tz):
+        self.tile_job_info = tile_job_info
+        self.options = options
+        self.tz = tz
+        self.tminx, _, self.tmaxx, _ = tile_job_info.tminmax[tz]
+        self.supported = options.profile in ('mercator', 'geodetic', 'raster')
+        self.rows = OrderedDict()
+
+    def __call__(self, tx, ty, tz):
+        assert tz == self.tz
+        row = self.rows.get(ty)
+        if row is None:
+            row = array.array('d')
+            for swne in get_tiles_swne(self.tile_job_info, self.options, tz,
+                                       [(x, ty) for x in range(self.tminx, self.tmaxx + 1)]):
+                row.extend(swne)
+            if len(self.rows) == self.MAX_ROWS:
+                self.rows.popitem(last=False)
+            self.rows[ty] = row
+        i = 4 * (tx - self.tminx)
+        return tuple(row[i:i + 4])
 
 
 def single_threaded_tiling(input_file, output_folder, options):
@@ -3129,7 +3534,7 @@ def single_threaded_tiling(input_file, output_folder, options):
     """
     if options.verbose:
         print("Begin tiles details calc")
-    conf, tile_details = worker_tile_details(input_file, output_folder, options)
+    conf, tile_details, manifest = worker_tile_details(input_file, output_folder, options)
 
     if options.verbose:
         print("Tiles details calc complete.")
@@ -3139,7 +3544,9 @@ def single_threaded_tiling(input_file, output_folder, options):
         progress_bar.start()
 
     for tile_detail in tile_details:
-        create_base_tile(conf, tile_detail)
+        processed = create_base_tile(conf, tile_detail)
+        if manifest is not None:
+            manifest.add_tiles(processed)
 
         if not options.verbose and not options.quiet:
             progress_bar.log_progress()
@@ -3147,7 +3554,9 @@ def single_threaded_tiling(input_file, output_folder, options):
     if getattr(threadLocal, 'cached_ds', None):
         del threadLocal.cached_ds
 
-    create_overview_tiles(conf, output_folder, options)
+    create_overview_tiles(conf, output_folder, options, manifest)
+    if manifest is not None:
+        manifest.close()
 
     shutil.rmtree(os.path.dirname(conf.src_file))
 
@@ -3165,7 +3574,7 @@ def multi_threaded_tiling(input_file, output_folder, options):
     if options.verbose:
         print("Begin tiles details calc")
 
-    conf, tile_details = worker_tile_details(input_file, output_folder, options)
+    conf, tile_details, manifest = worker_tile_details(input_file, output_folder, options)
 
     if options.verbose:
         print("Tiles details calc complete.")
@@ -3176,7 +3585,10 @@ def multi_threaded_tiling(input_file, output_folder, options):
 
     # TODO: gbataille - check the confs for which each element is an array... one useless level?
     # TODO: gbataille - assign an ID to each job for print in verbose mode "ReadRaster Extent ..."
-    for _ in pool.imap_unordered(partial(create_base_tile, conf), tile_details, chunksize=128):
+    for processed in pool.imap_unordered(partial(create_base_tile, conf), tile_details,
+                                       chunksize=128):
+        if manifest is not None:
+            manifest.add_tiles(processed)
         if not options.verbose and not options.quiet:
             progress_bar.log_progress()
 
@@ -3186,7 +3598,9 @@ def multi_threaded_tiling(input_file, output_folder, options):
     # Set the maximum cache back to the original value
     set_cache_max(gdal_cache_max)
 
-    create_overview_tiles(conf, output_folder, options)
+    create_overview_tiles(conf, output_folder, options, manifest)
+    if manifest is not None:
+        manifest.close()
 
     shutil.rmtree(os.path.dirname(conf.src_file))
 
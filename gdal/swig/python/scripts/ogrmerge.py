@@ -30,12 +30,20 @@
 ###############################################################################
 
 import glob
+import multiprocessing
 import os
 import os.path
 import sys
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 from osgeo import gdal
 from osgeo import ogr
+from osgeo import osr
 
 ###############################################################
 # Usage()
@@ -49,6 +57,7 @@ def Usage():
     print('            [-dsco NAME=VALUE]* [-lco NAME=VALUE]*')
     print('            [-s_srs srs_def] [-t_srs srs_def | -a_srs srs_def]')
     print('            [-progress] [-skipfailures] [--help-general]')
+    print('            [-native [-j num_threads] [-gt n|unlimited]]')
     print('')
     print('Options specific to -single:')
     print('            [-field_strategy FirstLayer|Union|Intersection]')
@@ -191,6 +200,617 @@ class XMLWriter(object):
         _VSIFPrintfL(self.f, '%s</%s>\n' % (self._indent(), name))
 
 
+#############################################################################
+
+
+def _GetLayerName(template, src_dsname, src_ds_idx, src_lyr_name, src_lyr_idx,
+                  single_layer, skip_failures):
+    """Substitute the variables of a layer name template. Returns None
+    (after printing an error) if it cannot be done."""
+
+    layer_name = template
+    basename = None
+    if os.path.exists(src_dsname):
+        basename = os.path.basename(src_dsname)
+        if '.' in basename:
+            basename = '.'.join(basename.split(".")[0:-1])
+
+    if basename == src_lyr_name:
+        layer_name = layer_name.replace('{AUTO_NAME}', basename)
+    elif basename is None:
+        layer_name = layer_name.replace(
+            '{AUTO_NAME}',
+            'Dataset%d_%s' % (src_ds_idx, src_lyr_name))
+    else:
+        layer_name = layer_name.replace(
+            '{AUTO_NAME}', basename + '_' + src_lyr_name)
+
+    if basename is not None:
+        layer_name = layer_name.replace('{DS_BASENAME}', basename)
+    elif single_layer:
+        layer_name = layer_name.replace('{DS_BASENAME}', src_dsname)
+    elif '{DS_BASENAME}' in layer_name:
+        if skip_failures:
+            if '{DS_INDEX}' not in layer_name:
+                layer_name = layer_name.replace(
+                    '{DS_BASENAME}', 'Dataset%d' % src_ds_idx)
+        else:
+            print('ERROR: Layer name template %s '
+                  'includes {DS_BASENAME} '
+                  'but %s is not a file' %
+                  (template, src_dsname))
+            return None
+    layer_name = layer_name.replace('{DS_NAME}', '%s' %
+                                    src_dsname)
+    layer_name = layer_name.replace('{DS_INDEX}', '%d' %
+                                    src_ds_idx)
+    layer_name = layer_name.replace('{LAYER_NAME}',
+                                    src_lyr_name)
+    layer_name = layer_name.replace('{LAYER_INDEX}', '%d' %
+                                    src_lyr_idx)
+    return layer_name
+
+
+###############################################################
+# Native merge (-native)
+
+# Number of features sent at once from a worker to the writer
+NATIVE_BATCH_SIZE = 1000
+
+# Maximum number of source dataset handles kept open between the analysis of
+# the source layers and their reading, and between the reading of two layers
+# of the same source dataset
+NATIVE_MAX_KEPT_DATASETS = 100
+
+
+class _SourceLayer(object):
+    """Source layer of the native merge, and how its features are converted
+    to the ones of its target layer."""
+
+    def __init__(self, ds_idx, dsname, lyr_idx, lyr_name, out_name,
+                 src_field_value):
+        self.ds_idx = ds_idx
+        self.dsname = dsname
+        self.lyr_idx = lyr_idx
+        self.lyr_name = lyr_name
+        self.out_name = out_name
+        self.src_field_value = src_field_value
+        self.fields = []
+        # List of (name, geometry type, SRS or None)
+        self.geom_fields = []
+        self.feature_count = -1
+
+        # Set once the target layer is available
+        self.dst_lyr = None
+        self.dst_defn = None
+        self.field_map = None
+        self.src_field_idx = -1
+        # List of (source SRS, target SRS), or None, for each target
+        # geometry field
+        self.reprojections = []
+
+
+def _CloneFieldDefn(fld_defn):
+    new_fld_defn = ogr.FieldDefn(fld_defn.GetName(), fld_defn.GetType())
+    new_fld_defn.SetSubType(fld_defn.GetSubType())
+    new_fld_defn.SetWidth(fld_defn.GetWidth())
+    new_fld_defn.SetPrecision(fld_defn.GetPrecision())
+    return new_fld_defn
+
+
+def _FindFieldDefn(fields, name):
+    for i, fld_defn in enumerate(fields):
+        if EQUAL(fld_defn.GetName(), name):
+            return i
+    return -1
+
+
+def _MergeFieldDefn(fld_defn, src_fld_defn):
+    """Same rules as the OGRVRTUnionLayer to merge field definitions of the
+    same name."""
+
+    field_type = fld_defn.GetType()
+    src_field_type = src_fld_defn.GetType()
+    int_types = (ogr.OFTInteger, ogr.OFTInteger64)
+    if field_type != src_field_type:
+        if (field_type == ogr.OFTReal and src_field_type in int_types) or \
+           (src_field_type == ogr.OFTReal and field_type in int_types):
+            fld_defn.SetType(ogr.OFTReal)
+        elif field_type in int_types and src_field_type in int_types:
+            fld_defn.SetType(ogr.OFTInteger64)
+        else:
+            fld_defn.SetType(ogr.OFTString)
+        fld_defn.SetSubType(ogr.OFSTNone)
+
+    if fld_defn.GetWidth() != src_fld_defn.GetWidth() or \
+       fld_defn.GetPrecision() != src_fld_defn.GetPrecision():
+        fld_defn.SetWidth(0)
+        fld_defn.SetPrecision(0)
+
+
+def _MergeGeomFieldDefn(geom_field, src_geom_field):
+    name, geom_type, srs = geom_field
+    if not name:
+        name = src_geom_field[0]
+    if geom_type != src_geom_field[1]:
+        geom_type = ogr.wkbUnknown
+    if srs is None:
+        srs = src_geom_field[2]
+    return (name, geom_type, srs)
+
+
+def _BuildTargetSchema(src_layers, field_strategy, src_layer_field_name):
+    """Return the (fields, geom_fields) of the layer in which the src_layers
+    are merged, according to field_strategy."""
+
+    fields = []
+    if src_layer_field_name is not None:
+        fields.append(ogr.FieldDefn(src_layer_field_name, ogr.OFTString))
+    first_idx = len(fields)
+
+    if field_strategy is None:
+        field_strategy = 'Union'
+
+    if EQUAL(field_strategy, 'FirstLayer'):
+        fields += [_CloneFieldDefn(x) for x in src_layers[0].fields]
+        return fields, list(src_layers[0].geom_fields)
+
+    fields += [_CloneFieldDefn(x) for x in src_layers[0].fields]
+    for src_lyr in src_layers[1:]:
+        if EQUAL(field_strategy, 'Union'):
+            for src_fld_defn in src_lyr.fields:
+                idx = _FindFieldDefn(fields, src_fld_defn.GetName())
+                if idx < 0:
+                    fields.append(_CloneFieldDefn(src_fld_defn))
+                else:
+                    _MergeFieldDefn(fields[idx], src_fld_defn)
+        else:
+            i = first_idx
+            while i < len(fields):
+                idx = _FindFieldDefn(src_lyr.fields, fields[i].GetName())
+                if idx < 0:
+                    del fields[i]
+                else:
+                    _MergeFieldDefn(fields[i], src_lyr.fields[idx])
+                    i += 1
+
+    # Layers with a single geometry field are merged into a single geometry
+    # field, whatever its name. Otherwise, geometry fields are matched by name.
+    geom_fields = []
+    if max(len(src_lyr.geom_fields) for src_lyr in src_layers) <= 1:
+        for src_lyr in src_layers:
+            if src_lyr.geom_fields:
+                if geom_fields:
+                    geom_fields[0] = _MergeGeomFieldDefn(
+                        geom_fields[0], src_lyr.geom_fields[0])
+                else:
+                    geom_fields.append(src_lyr.geom_fields[0])
+    else:
+        geom_fields = list(src_layers[0].geom_fields)
+        for src_lyr in src_layers[1:]:
+            src_names = [x[0].lower() for x in src_lyr.geom_fields]
+            if EQUAL(field_strategy, 'Union'):
+                names = [x[0].lower() for x in geom_fields]
+                for src_geom_field in src_lyr.geom_fields:
+                    if src_geom_field[0].lower() in names:
+                        idx = names.index(src_geom_field[0].lower())
+                        geom_fields[idx] = _MergeGeomFieldDefn(
+                            geom_fields[idx], src_geom_field)
+                    else:
+                        geom_fields.append(src_geom_field)
+            else:
+                geom_fields = [x for x in geom_fields
+                               if x[0].lower() in src_names]
+
+    return fields, geom_fields
+
+
+def _CreateTargetLayer(dst_ds, name, fields, geom_fields, dst_srs, lco):
+    """Create a target layer. Return the layer and a dictionary with the
+    index of each of its fields, from their lower case requested name (which
+    the driver may have changed)."""
+
+    if len(geom_fields) > 1 and \
+       dst_ds.TestCapability(ogr.ODsCCreateGeomFieldAfterCreateLayer):
+        dst_lyr = dst_ds.CreateLayer(name, geom_type=ogr.wkbNone,
+                                     options=lco)
+        if dst_lyr is None:
+            return None, None
+        for geom_name, geom_type, srs in geom_fields:
+            geom_fld_defn = ogr.GeomFieldDefn(geom_name, geom_type)
+            geom_fld_defn.SetSpatialRef(dst_srs if dst_srs is not None else srs)
+            if dst_lyr.CreateGeomField(geom_fld_defn) != 0:
+                return None, None
+    else:
+        if geom_fields:
+            geom_type = geom_fields[0][1]
+            srs = dst_srs if dst_srs is not None else geom_fields[0][2]
+        else:
+            geom_type = ogr.wkbNone
+            srs = None
+        dst_lyr = dst_ds.CreateLayer(name, srs=srs, geom_type=geom_type,
+                                     options=lco)
+        if dst_lyr is None:
+            return None, None
+
+    field_indices = {}
+    for fld_defn in fields:
+        if dst_lyr.CreateField(fld_defn) != 0:
+            print('ERROR: Cannot create field %s in layer %s' %
+                  (fld_defn.GetName(), name))
+            return None, None
+        field_indices[fld_defn.GetName().lower()] = \
+            dst_lyr.GetLayerDefn().GetFieldCount() - 1
+    return dst_lyr, field_indices
+
+
+def _PutUnlessAborted(q, item, abort):
+    while not abort.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _MergeNative(dst_ds, src_datasets, single_layer, layer_name_template,
+                 src_geom_types, field_strategy, src_layer_field_name,
+                 src_layer_field_content, a_srs, s_srs, t_srs, lco,
+                 append, overwrite_layer, skip_failures, num_threads,
+                 group_transactions, progress, progress_arg):
+    """Merge the source layers directly into dst_ds, without an
+    intermediate VRT.
+
+    The source datasets are opened once to build the target schemas. Worker
+    threads then read the source layers concurrently, converting their
+    features to the target schema (field mapping, source layer field,
+    reprojection), and the calling thread writes the batches of converted
+    features, with transactions of group_transactions features. When the
+    output driver cannot write to several layers in random order, the
+    source layers are written one after the other, while the next ones are
+    read ahead."""
+
+    if field_strategy is not None and \
+       not any(EQUAL(field_strategy, x)
+               for x in ('FirstLayer', 'Union', 'Intersection')):
+        print('ERROR: Invalid value for -field_strategy: %s' % field_strategy)
+        return 1
+
+    # Collect the source layers
+    src_layers = []
+    kept_datasets = {}
+    for src_ds_idx, src_dsname in enumerate(src_datasets):
+        src_ds = gdal.OpenEx(src_dsname, gdal.OF_VECTOR)
+        if src_ds is None:
+            print('ERROR: Cannot open %s' % src_dsname)
+            if skip_failures:
+                continue
+            return 1
+        for src_lyr_idx in range(src_ds.GetLayerCount()):
+            src_lyr = src_ds.GetLayer(src_lyr_idx)
+            if src_geom_types:
+                gt = ogr.GT_Flatten(src_lyr.GetGeomType())
+                if gt not in src_geom_types:
+                    continue
+
+            src_lyr_name = src_lyr.GetName()
+            try:
+                src_lyr_name = src_lyr_name.decode('utf-8')
+            except AttributeError:
+                pass
+
+            if single_layer:
+                out_name = layer_name_template
+                src_field_value = _GetLayerName(src_layer_field_content,
+                                                src_dsname, src_ds_idx,
+                                                src_lyr_name, src_lyr_idx,
+                                                single_layer, skip_failures)
+            else:
+                out_name = _GetLayerName(layer_name_template,
+                                         src_dsname, src_ds_idx,
+                                         src_lyr_name, src_lyr_idx,
+                                         single_layer, skip_failures)
+                if out_name is None:
+                    return 1
+                src_field_value = None
+
+            src_layer = _SourceLayer(src_ds_idx, src_dsname, src_lyr_idx,
+                                     src_lyr_name, out_name, src_field_value)
+            src_defn = src_lyr.GetLayerDefn()
+            for i in range(src_defn.GetFieldCount()):
+                src_layer.fields.append(
+                    _CloneFieldDefn(src_defn.GetFieldDefn(i)))
+            for i in range(src_defn.GetGeomFieldCount()):
+                geom_fld_defn = src_defn.GetGeomFieldDefn(i)
+                srs = geom_fld_defn.GetSpatialRef()
+                if a_srs is not None:
+                    srs = a_srs
+                elif srs is not None:
+                    srs = srs.Clone()
+                src_layer.geom_fields.append((geom_fld_defn.GetName(),
+                                              geom_fld_defn.GetType(), srs))
+            if src_lyr.TestCapability(ogr.OLCFastFeatureCount):
+                src_layer.feature_count = src_lyr.GetFeatureCount()
+            src_layers.append(src_layer)
+
+        if src_layers and src_layers[-1].ds_idx == src_ds_idx and \
+           len(kept_datasets) < NATIVE_MAX_KEPT_DATASETS:
+            kept_datasets[src_ds_idx] = [src_ds]
+        src_ds = None
+
+    if not src_layers:
+        return 0
+
+    # Group the source layers by target layer, in their order of appearance
+    targets = []
+    sources_of_target = {}
+    for src_layer in src_layers:
+        if src_layer.out_name not in sources_of_target:
+            targets.append(src_layer.out_name)
+            sources_of_target[src_layer.out_name] = []
+        sources_of_target[src_layer.out_name].append(src_layer)
+
+    dst_srs = a_srs if a_srs is not None else t_srs
+
+    # Create (or open) the target layers, and set how the features of the
+    # source layers are converted
+    for out_name in targets:
+        sources = sources_of_target[out_name]
+
+        dst_lyr = dst_ds.GetLayerByName(out_name)
+        if dst_lyr is not None and overwrite_layer:
+            for i in range(dst_ds.GetLayerCount()):
+                if dst_ds.GetLayer(i).GetName() == dst_lyr.GetName():
+                    dst_lyr = None
+                    if dst_ds.DeleteLayer(i) != 0:
+                        print('ERROR: Cannot delete layer %s' % out_name)
+                        return 1
+                    break
+        if dst_lyr is not None:
+            if not append:
+                print('ERROR: Layer %s already exists, and -append not '
+                      'specified' % out_name)
+                return 1
+            dst_defn = dst_lyr.GetLayerDefn()
+            field_indices = {}
+            for i in range(dst_defn.GetFieldCount()):
+                field_indices[dst_defn.GetFieldDefn(i).GetName().lower()] = i
+        else:
+            if single_layer:
+                fields, geom_fields = _BuildTargetSchema(
+                    sources, field_strategy, src_layer_field_name)
+            else:
+                fields = sources[0].fields
+                geom_fields = sources[0].geom_fields
+            dst_lyr, field_indices = _CreateTargetLayer(
+                dst_ds, out_name, fields, geom_fields, dst_srs, lco)
+            if dst_lyr is None:
+                print('ERROR: Cannot create layer %s' % out_name)
+                return 1
+
+        dst_defn = dst_lyr.GetLayerDefn()
+        for src_layer in sources:
+            src_layer.dst_lyr = dst_lyr
+            src_layer.dst_defn = dst_defn
+            src_layer.field_map = [
+                field_indices.get(x.GetName().lower(), -1)
+                for x in src_layer.fields]
+            if single_layer and src_layer_field_name is not None:
+                src_layer.src_field_idx = field_indices.get(
+                    src_layer_field_name.lower(), -1)
+
+            # Same matching of geometry fields as OGRFeature::SetFrom()
+            src_geom_names = [x[0].lower() for x in src_layer.geom_fields]
+            for i in range(dst_defn.GetGeomFieldCount()):
+                reprojection = None
+                name = dst_defn.GetGeomFieldDefn(i).GetName().lower()
+                if name in src_geom_names:
+                    src_srs = src_layer.geom_fields[src_geom_names.index(name)][2]
+                elif dst_defn.GetGeomFieldCount() == 1 and src_geom_names:
+                    src_srs = src_layer.geom_fields[0][2]
+                else:
+                    src_srs = None
+                if s_srs is not None:
+                    src_srs = s_srs
+                if t_srs is not None and src_srs is not None:
+                    reprojection = (src_srs, t_srs)
+                src_layer.reprojections.append(reprojection)
+
+    # Read and convert the source layers in worker threads
+    if num_threads > len(src_layers):
+        num_threads = len(src_layers)
+    ordered = not single_layer and \
+        not dst_ds.TestCapability(ogr.ODsCRandomLayerWrite)
+
+    abort = threading.Event()
+    lock = threading.Lock()
+    task_queue = queue.Queue()
+    for task_idx in range(len(src_layers)):
+        task_queue.put(task_idx)
+    for _ in range(num_threads):
+        task_queue.put(None)
+
+    if ordered:
+        queues = [queue.Queue(maxsize=2) for _ in src_layers]
+        channels = [(q, 1) for q in queues]
+    else:
+        shared_queue = queue.Queue(maxsize=4 * num_threads)
+        queues = [shared_queue] * len(src_layers)
+        channels = [(shared_queue, len(src_layers))]
+
+    def acquire_dataset(src_layer):
+        with lock:
+            if kept_datasets.get(src_layer.ds_idx):
+                return kept_datasets[src_layer.ds_idx].pop()
+        return gdal.OpenEx(src_layer.dsname, gdal.OF_VECTOR)
+
+    # Number of layers not read yet, per source dataset
+    remaining_layers = {}
+    for src_layer in src_layers:
+        remaining_layers[src_layer.ds_idx] = \
+            remaining_layers.get(src_layer.ds_idx, 0) + 1
+
+    def release_dataset(src_layer, src_ds):
+        # The handle is kept for the next layers of the same dataset, within
+        # the limit of NATIVE_MAX_KEPT_DATASETS handles, and otherwise closed
+        # when the caller drops its reference
+        with lock:
+            remaining_layers[src_layer.ds_idx] -= 1
+            if remaining_layers[src_layer.ds_idx] == 0:
+                kept_datasets.pop(src_layer.ds_idx, None)
+            elif sum(len(x) for x in kept_datasets.values()) < \
+                    NATIVE_MAX_KEPT_DATASETS:
+                kept_datasets.setdefault(src_layer.ds_idx, []).append(src_ds)
+
+    def read_layer(task_idx, src_layer, src_ds, out_queue):
+        # Coordinate transformations are specific to each worker, and
+        # created one at a time, as the SRS objects are shared.
+        cts = []
+        with lock:
+            for reprojection in src_layer.reprojections:
+                if reprojection is None:
+                    cts.append(None)
+                    continue
+                ct = osr.CreateCoordinateTransformation(reprojection[0],
+                                                        reprojection[1])
+                if ct is None:
+                    return 'Cannot create coordinate transformation ' \
+                           'for layer %s of %s' % (src_layer.lyr_name,
+                                                   src_layer.dsname)
+                cts.append(ct)
+
+        src_lyr = src_ds.GetLayer(src_layer.lyr_idx)
+        src_lyr.ResetReading()
+        batch = []
+        nb_read = 0
+        while not abort.is_set():
+            src_feat = src_lyr.GetNextFeature()
+            if src_feat is not None:
+                nb_read += 1
+                dst_feat = ogr.Feature(src_layer.dst_defn)
+                dst_feat.SetFromWithMap(src_feat, 1, src_layer.field_map)
+                if src_layer.src_field_idx >= 0:
+                    dst_feat.SetField(src_layer.src_field_idx,
+                                      src_layer.src_field_value)
+                for i, ct in enumerate(cts):
+                    geom = dst_feat.GetGeomFieldRef(i)
+                    if ct is not None and geom is not None and \
+                       geom.Transform(ct) != 0:
+                        if not skip_failures:
+                            return 'Failed to reproject feature ' \
+                                   '%d of layer %s of %s' % \
+                                   (src_feat.GetFID(), src_layer.lyr_name,
+                                    src_layer.dsname)
+                        dst_feat = None
+                        break
+                if dst_feat is not None:
+                    batch.append(dst_feat)
+            if batch and (src_feat is None or
+                          len(batch) == NATIVE_BATCH_SIZE):
+                if not _PutUnlessAborted(out_queue,
+                                         (task_idx, batch, nb_read), abort):
+                    return None
+                batch = []
+                nb_read = 0
+            if src_feat is None:
+                break
+        return None
+
+    def worker():
+        while not abort.is_set():
+            task_idx = task_queue.get()
+            if task_idx is None:
+                return
+            src_layer = src_layers[task_idx]
+            src_ds = None
+            try:
+                src_ds = acquire_dataset(src_layer)
+                if src_ds is None:
+                    error = 'Cannot open %s' % src_layer.dsname
+                else:
+                    error = read_layer(task_idx, src_layer, src_ds,
+                                       queues[task_idx])
+            except Exception as e:  # for example with ogr.UseExceptions()
+                error = str(e)
+            finally:
+                if src_ds is not None:
+                    release_dataset(src_layer, src_ds)
+                    src_ds = None
+            # Always post the end marker, that the writer waits for
+            if not _PutUnlessAborted(queues[task_idx],
+                                     (task_idx, None, error), abort):
+                return
+
+    threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+
+    # Write the converted features
+    total_count = 0
+    if all(src_layer.feature_count >= 0 for src_layer in src_layers):
+        total_count = sum(src_layer.feature_count for src_layer in src_layers)
+    if skip_failures:
+        # So that a failed feature does not cancel the others
+        group_transactions = 1
+    use_transactions = group_transactions != 1 and \
+        dst_ds.TestCapability(ogr.ODsCTransactions)
+
+    ret = 0
+    rollback = False
+    count = 0
+    nb_in_transaction = 0
+    if use_transactions:
+        dst_ds.StartTransaction()
+    try:
+        for q, nb_ends in channels:
+            while nb_ends > 0 and ret == 0:
+                task_idx, batch, extra = q.get()
+                if batch is None:
+                    nb_ends -= 1
+                    if extra is not None:
+                        print('ERROR: %s' % extra)
+                        if not skip_failures:
+                            ret = 1
+                    continue
+
+                dst_lyr = src_layers[task_idx].dst_lyr
+                for dst_feat in batch:
+                    if use_transactions and nb_in_transaction == group_transactions:
+                        dst_ds.CommitTransaction()
+                        dst_ds.StartTransaction()
+                        nb_in_transaction = 0
+                    if dst_lyr.CreateFeature(dst_feat) != 0 and not skip_failures:
+                        ret = 1
+                        rollback = True
+                        break
+                    nb_in_transaction += 1
+
+                count += extra
+                if progress is not None and total_count > 0:
+                    progress(min(1.0, count * 1.0 / total_count), '',
+                             progress_arg)
+            if ret != 0:
+                break
+    finally:
+        # Stop the workers, including if writing raised an exception
+        abort.set()
+        for t in threads:
+            t.join()
+
+    if use_transactions:
+        if rollback:
+            dst_ds.RollbackTransaction()
+        elif dst_ds.CommitTransaction() != 0:
+            ret = 1
+
+    if ret == 0 and progress is not None:
+        progress(1.0, '', progress_arg)
+
+    return ret
+
+
 ###############################################################
 # process()
 
@@ -219,6 +839,9 @@ def process(argv, progress=None, progress_arg=None):
     t_srs = None
     dsco = []
     lco = []
+    native = False
+    num_threads = multiprocessing.cpu_count()
+    group_transactions = 100 * 1000
 
     i = 0
     while i < len(argv):
@@ -248,6 +871,18 @@ def process(argv, progress=None, progress_arg=None):
             update = True
         elif arg == '-single':
             single_layer = True
+        elif arg == '-native':
+            native = True
+        elif arg == '-j' and i + 1 < len(argv):
+            i = i + 1
+            native = True
+            num_threads = max(1, int(argv[i]))
+        elif arg == '-gt' and i + 1 < len(argv):
+            i = i + 1
+            if EQUAL(argv[i], 'unlimited'):
+                group_transactions = -1
+            else:
+                group_transactions = max(1, int(argv[i]))
         elif arg == '-a_srs' and i + 1 < len(argv):
             i = i + 1
             a_srs = argv[i]
@@ -335,6 +970,10 @@ def process(argv, progress=None, progress_arg=None):
         else:
             layer_name_template = '{AUTO_NAME}'
 
+    if native and EQUAL(output_format, 'VRT'):
+        print('ERROR: -native incompatible with VRT output')
+        return 1
+
     vrt_filename = None
     if not EQUAL(output_format, 'VRT'):
         dst_ds = gdal.OpenEx(dst_filename, gdal.OF_VECTOR | gdal.OF_UPDATE)
@@ -364,6 +1003,26 @@ def process(argv, progress=None, progress_arg=None):
             if dst_ds is None:
                 return 1
 
+        if native:
+            srs_defs = []
+            for srs_def in (a_srs, s_srs, t_srs):
+                srs = None
+                if srs_def is not None:
+                    srs = osr.SpatialReference()
+                    if srs.SetFromUserInput(srs_def) != 0:
+                        print('ERROR: Invalid SRS: %s' % srs_def)
+                        return 1
+                    srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+                srs_defs.append(srs)
+            return _MergeNative(dst_ds, src_datasets, single_layer,
+                                layer_name_template, src_geom_types,
+                                field_strategy, src_layer_field_name,
+                                src_layer_field_content,
+                                srs_defs[0], srs_defs[1], srs_defs[2], lco,
+                                append, overwrite_layer, skip_failures,
+                                num_threads, group_transactions,
+                                progress, progress_arg)
+
         vrt_filename = '/vsimem/_ogrmerge_.vrt'
     else:
         if gdal.VSIStatL(dst_filename) and not overwrite_ds:
@@ -412,43 +1071,16 @@ def process(argv, progress=None, progress_arg=None):
                         writer.write_element_value('FieldStrategy',
                                                    field_strategy)
 
-                layer_name = src_layer_field_content
-
                 src_lyr_name = src_lyr.GetName()
                 try:
                     src_lyr_name = src_lyr_name.decode('utf-8')
                 except AttributeError:
                     pass
 
-                basename = None
-                if os.path.exists(src_dsname):
-                    basename = os.path.basename(src_dsname)
-                    if '.' in basename:
-                        basename = '.'.join(basename.split(".")[0:-1])
-
-                if basename == src_lyr_name:
-                    layer_name = layer_name.replace('{AUTO_NAME}', basename)
-                elif basename is None:
-                    layer_name = layer_name.replace(
-                        '{AUTO_NAME}',
-                        'Dataset%d_%s' % (src_ds_idx, src_lyr_name))
-                else:
-                    layer_name = layer_name.replace(
-                        '{AUTO_NAME}', basename + '_' + src_lyr_name)
-
-                if basename is not None:
-                    layer_name = layer_name.replace('{DS_BASENAME}', basename)
-                else:
-                    layer_name = layer_name.replace('{DS_BASENAME}',
-                                                    src_dsname)
-                layer_name = layer_name.replace('{DS_NAME}', '%s' %
-                                                src_dsname)
-                layer_name = layer_name.replace('{DS_INDEX}', '%d' %
-                                                src_ds_idx)
-                layer_name = layer_name.replace('{LAYER_NAME}',
-                                                src_lyr_name)
-                layer_name = layer_name.replace('{LAYER_INDEX}', '%d' %
-                                                src_lyr_idx)
+                layer_name = _GetLayerName(src_layer_field_content,
+                                           src_dsname, src_ds_idx,
+                                           src_lyr_name, src_lyr_idx,
+                                           single_layer, skip_failures)
 
                 if t_srs is not None:
                     writer.open_element('OGRVRTWarpedLayer')
@@ -507,47 +1139,14 @@ def process(argv, progress=None, progress_arg=None):
                 except AttributeError:
                     pass
 
-                layer_name = layer_name_template
-                basename = None
-                if os.path.exists(src_dsname):
-                    basename = os.path.basename(src_dsname)
-                    if '.' in basename:
-                        basename = '.'.join(basename.split(".")[0:-1])
-
-                if basename == src_lyr_name:
-                    layer_name = layer_name.replace('{AUTO_NAME}', basename)
-                elif basename is None:
-                    layer_name = layer_name.replace(
-                        '{AUTO_NAME}',
-                        'Dataset%d_%s' % (src_ds_idx, src_lyr_name))
-                else:
-                    layer_name = layer_name.replace(
-                        '{AUTO_NAME}', basename + '_' + src_lyr_name)
-
-                if basename is not None:
-                    layer_name = layer_name.replace('{DS_BASENAME}', basename)
-                elif '{DS_BASENAME}' in layer_name:
-                    if skip_failures:
-                        if '{DS_INDEX}' not in layer_name:
-                            layer_name = layer_name.replace(
-                                '{DS_BASENAME}', 'Dataset%d' % src_ds_idx)
-                    else:
-                        print('ERROR: Layer name template %s '
-                              'includes {DS_BASENAME} '
-                              'but %s is not a file' %
-                              (layer_name_template, src_dsname))
-
-                        gdal.VSIFCloseL(f)
-                        gdal.Unlink(vrt_filename)
-                        return 1
-                layer_name = layer_name.replace('{DS_NAME}', '%s' %
-                                                src_dsname)
-                layer_name = layer_name.replace('{DS_INDEX}', '%d' %
-                                                src_ds_idx)
-                layer_name = layer_name.replace('{LAYER_NAME}',
-                                                src_lyr_name)
-                layer_name = layer_name.replace('{LAYER_INDEX}', '%d' %
-                                                src_lyr_idx)
+                layer_name = _GetLayerName(layer_name_template,
+                                           src_dsname, src_ds_idx,
+                                           src_lyr_name, src_lyr_idx,
+                                           single_layer, skip_failures)
+                if layer_name is None:
+                    gdal.VSIFCloseL(f)
+                    gdal.Unlink(vrt_filename)
+                    return 1
 
                 if t_srs is not None:
                     writer.open_element('OGRVRTWarpedLayer')